@@ -148,6 +148,12 @@ env:
     value: "${CHILD_FN_INFO}"
   - name: PREWARM
     value: "${PREWARM}"
+  {{- with .Values.serviceTemplate.artifactCache }}
+  - name: ARTIFACT_CACHE_DIR
+    value: "/artifact_cache"
+  - name: ARTIFACT_CACHE_MAX_BYTES
+    value: "{{ div (int64 .maxBytes) (int64 .maxOwnersPerNode) }}"
+  {{- end }}
   - name: ML_INFRA_SERVICES_CONFIG_PATH
   {{- if .Values.config.file }}
     value: "${BASE_PATH}/ml_infra_core/llm_engine.core/llm_engine.core/configs/{{ .Values.config.file.infra }}"
@@ -279,18 +285,24 @@ env:
 {{- include "llmEngine.serviceEnv" . }}
   - name: DD_SERVICE
     value: {{- printf " %s" (include "llmEngine.fullname" .) }}
+  - name: LLM_ENGINE_PROCESS_ROLE
+    value: gateway
 {{- end }}
 
 {{- define "llmEngine.builderEnv" }}
 {{- include "llmEngine.serviceEnv" . }}
   - name: DD_SERVICE
     value: {{- printf " %s" (include "llmEngine.buildername" .) }}
+  - name: LLM_ENGINE_PROCESS_ROLE
+    value: builder
 {{- end }}
 
 {{- define "llmEngine.cacherEnv" }}
 {{- include "llmEngine.serviceEnv" . }}
   - name: DD_SERVICE
     value: {{- printf " %s" (include "llmEngine.cachername" .) }}
+  - name: LLM_ENGINE_PROCESS_ROLE
+    value: cacher
 {{- end }}
 
 {{- define "llmEngine.volumes" }}
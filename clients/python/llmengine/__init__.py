@@ -19,6 +19,7 @@ from typing import Sequence
 from llmengine.completion import Completion
 from llmengine.data_types import (
     CancelFineTuneResponse,
+    CompletionBatchResult,
     CompletionOutput,
     CompletionStreamOutput,
     CompletionStreamResponse,
@@ -32,11 +33,13 @@ from llmengine.data_types import (
     ListLLMEndpointsResponse,
 )
 from llmengine.fine_tuning import FineTune
+from llmengine.http_client import HttpClient
 from llmengine.model import Model
 
 __all__: Sequence[str] = (
     "CancelFineTuneResponse",
     "Completion",
+    "CompletionBatchResult",
     "CompletionOutput",
     "CompletionStreamOutput",
     "CompletionStreamResponse",
@@ -47,6 +50,7 @@ __all__: Sequence[str] = (
     "FineTune",
     "GetFineTuneResponse",
     "GetLLMEndpointResponse",
+    "HttpClient",
     "ListFineTunesResponse",
     "ListLLMEndpointsResponse",
     "Model",
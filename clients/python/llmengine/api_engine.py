@@ -1,13 +1,12 @@
 # NOTICE - per Apache 2.0 license:
 # This file was copied and modified from the OpenAI Python client library: https://github.com/openai/openai-python
-import json
 import os
 from functools import wraps
 from typing import Any, AsyncIterable, Dict, Iterator, Optional
 
-import requests
-from aiohttp import ClientSession, ClientTimeout
 from llmengine.errors import parse_error
+from llmengine.http_client import HttpClient
+from llmengine.sse import aiter_sse_json, iter_sse_json
 
 SPELLBOOK_API_URL = "https://api.spellbook.scale.com"
 LLM_ENGINE_BASE_PATH = os.getenv("LLM_ENGINE_BASE_PATH", SPELLBOOK_API_URL)
@@ -30,6 +29,8 @@ def assert_self_hosted(func):
 
 
 class APIEngine:
+    http_client: HttpClient = HttpClient()
+
     @classmethod
     def validate_api_key(cls):
         if SPELLBOOK_API_URL == LLM_ENGINE_BASE_PATH and not get_api_key():
@@ -40,7 +41,8 @@ class APIEngine:
     @classmethod
     def _get(cls, resource_name: str, timeout: int) -> Dict[str, Any]:
         api_key = get_api_key()
-        response = requests.get(
+        response = cls.http_client.request(
+            "GET",
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             timeout=timeout,
             headers={"x-api-key": api_key},
@@ -55,7 +57,8 @@ class APIEngine:
         cls, resource_name: str, data: Optional[Dict[str, Any]], timeout: int
     ) -> Dict[str, Any]:
         api_key = get_api_key()
-        response = requests.put(
+        response = cls.http_client.request(
+            "PUT",
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             json=data,
             timeout=timeout,
@@ -69,7 +72,8 @@ class APIEngine:
     @classmethod
     def _delete(cls, resource_name: str, timeout: int) -> Dict[str, Any]:
         api_key = get_api_key()
-        response = requests.delete(
+        response = cls.http_client.request(
+            "DELETE",
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             timeout=timeout,
             headers={"x-api-key": api_key},
@@ -82,7 +86,8 @@ class APIEngine:
     @classmethod
     def post_sync(cls, resource_name: str, data: Dict[str, Any], timeout: int) -> Dict[str, Any]:
         api_key = get_api_key()
-        response = requests.post(
+        response = cls.http_client.request(
+            "POST",
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             json=data,
             timeout=timeout,
@@ -98,74 +103,50 @@ class APIEngine:
         cls, resource_name: str, data: Dict[str, Any], timeout: int
     ) -> Iterator[Dict[str, Any]]:
         api_key = get_api_key()
-        response = requests.post(
+        response = cls.http_client.request(
+            "POST",
             os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
             json=data,
             timeout=timeout,
             headers={"x-api-key": api_key},
             stream=True,
         )
-        if response.status_code != 200:
-            raise parse_error(response.status_code, response.content)
-        for byte_payload in response.iter_lines():
-            # Skip line
-            if byte_payload == b"\n":
-                continue
-
-            payload = byte_payload.decode("utf-8")
-
-            # Event data
-            if payload.startswith("data:"):
-                # Decode payload
-                payload_data = payload.lstrip("data:").rstrip("/n")
-                try:
-                    payload_json = json.loads(payload_data)
-                    yield payload_json
-                except json.JSONDecodeError:
-                    raise ValueError(f"Invalid JSON payload: {payload_data}")
+        with response:
+            if response.status_code != 200:
+                raise parse_error(response.status_code, response.content)
+            # chunk_size=None yields data as soon as it arrives off the socket.
+            yield from iter_sse_json(response.iter_content(chunk_size=None))
 
     @classmethod
     async def apost_sync(
         cls, resource_name: str, data: Dict[str, Any], timeout: int
     ) -> Dict[str, Any]:
         api_key = get_api_key()
-        async with ClientSession(
-            timeout=ClientTimeout(timeout), headers={"x-api-key": api_key}
-        ) as session:
-            async with session.post(
-                os.path.join(LLM_ENGINE_BASE_PATH, resource_name), json=data
-            ) as resp:
-                if resp.status != 200:
-                    raise parse_error(resp.status, await resp.read())
-                payload = await resp.json()
-                return payload
+        async with await cls.http_client.arequest(
+            "POST",
+            os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
+            json=data,
+            timeout=timeout,
+            headers={"x-api-key": api_key},
+        ) as resp:
+            if resp.status != 200:
+                raise parse_error(resp.status, await resp.read())
+            payload = await resp.json()
+            return payload
 
     @classmethod
     async def apost_stream(
         cls, resource_name: str, data: Dict[str, Any], timeout: int
     ) -> AsyncIterable[Dict[str, Any]]:
         api_key = get_api_key()
-        async with ClientSession(
-            timeout=ClientTimeout(timeout), headers={"x-api-key": api_key}
-        ) as session:
-            async with session.post(
-                os.path.join(LLM_ENGINE_BASE_PATH, resource_name), json=data
-            ) as resp:
-                if resp.status != 200:
-                    raise parse_error(resp.status, await resp.read())
-                async for byte_payload in resp.content:
-                    # Skip line
-                    if byte_payload == b"\n":
-                        continue
-
-                    payload = byte_payload.decode("utf-8")
-
-                    # Event data
-                    if payload.startswith("data:"):
-                        # Decode payload
-                        payload_data = payload.lstrip("data:").rstrip("/n")
-                        try:
-                            response = json.loads(payload_data)
-                            yield response
-                        except json.JSONDecodeError:
-                            raise ValueError(f"Invalid JSON payload: {payload_data}")
+        async with await cls.http_client.arequest(
+            "POST",
+            os.path.join(LLM_ENGINE_BASE_PATH, resource_name),
+            json=data,
+            timeout=timeout,
+            headers={"x-api-key": api_key},
+        ) as resp:
+            if resp.status != 200:
+                raise parse_error(resp.status, await resp.read())
+            async for payload in aiter_sse_json(resp.content.iter_any()):
+                yield payload
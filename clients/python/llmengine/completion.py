@@ -1,12 +1,120 @@
-from typing import AsyncIterable, Iterator, Union
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
 
+import aiohttp
+import requests
 from llmengine.api_engine import APIEngine
 from llmengine.data_types import (
+    CompletionBatchResult,
+    CompletionOutput,
     CompletionStreamResponse,
     CompletionStreamV1Request,
+    CompletionSyncBatchV1Request,
+    CompletionSyncBatchV1Response,
     CompletionSyncResponse,
     CompletionSyncV1Request,
 )
+from llmengine.errors import BadRequestError, RateLimitExceededError, ServerError, UnknownError
+from llmengine.http_client import HttpClient
+
+# Errors after which a batch item is tried again; anything else either fails just that item
+# (e.g. BadRequestError) or would fail every item (e.g. UnauthorizedError) and is raised.
+_RETRYABLE_ERRORS = (
+    RateLimitExceededError,
+    ServerError,
+    UnknownError,
+    requests.RequestException,
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+)
+_RETRY_BACKOFF_SECONDS = 1.0
+
+
+def _is_retryable(exc: Exception, http_client: HttpClient) -> bool:
+    """
+    Whether a batch item is tried again after `exc`. Responses with one of the HTTP client's retry
+    statuses were already retried by the client, so they are not retried again here.
+    """
+    if isinstance(exc, RateLimitExceededError):
+        return 429 not in http_client.retry_statuses
+    if isinstance(exc, ServerError):
+        return exc.status_code not in http_client.retry_statuses
+    return isinstance(exc, _RETRYABLE_ERRORS)
+
+
+def _chunk_prompts(prompts: Iterable[str], chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Lazily splits prompts into lists of up to `chunk_size`, with the index of their first one."""
+    start = 0
+    chunk: List[str] = []
+    for prompt in prompts:
+        chunk.append(prompt)
+        if len(chunk) == chunk_size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+async def _achunk_prompts(
+    prompts: Union[Iterable[str], AsyncIterable[str]], chunk_size: int
+) -> AsyncIterator[Tuple[int, List[str]]]:
+    if not isinstance(prompts, AsyncIterable):
+        for item in _chunk_prompts(prompts, chunk_size):
+            yield item
+        return
+    start = 0
+    chunk: List[str] = []
+    async for prompt in prompts:
+        chunk.append(prompt)
+        if len(chunk) == chunk_size:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def _get_batch_outputs(num_prompts: int, response: Dict[str, Any]) -> List[CompletionOutput]:
+    batch_response = CompletionSyncBatchV1Response.parse_obj(response)
+    if batch_response.status != "SUCCESS" or len(batch_response.outputs) != num_prompts:
+        raise ServerError(
+            500,
+            batch_response.traceback
+            or f"Expected {num_prompts} outputs, got {len(batch_response.outputs)}",
+        )
+    return batch_response.outputs
+
+
+def _to_batch_results(
+    start: int, prompts: List[str], outputs: List[CompletionOutput]
+) -> List[CompletionBatchResult]:
+    return [
+        CompletionBatchResult(index=start + i, prompt=prompt, output=output)
+        for i, (prompt, output) in enumerate(zip(prompts, outputs))
+    ]
+
+
+def _to_batch_errors(start: int, prompts: List[str], error: str) -> List[CompletionBatchResult]:
+    return [
+        CompletionBatchResult(index=start + i, prompt=prompt, error=error)
+        for i, prompt in enumerate(prompts)
+    ]
 
 
 class Completion(APIEngine):
@@ -31,7 +139,12 @@ class Completion(APIEngine):
         temperature: float = 0.2,
         timeout: int = 10,
         stream: bool = False,
-    ) -> Union[CompletionSyncResponse, AsyncIterable[CompletionStreamResponse]]:
+        raw: bool = False,
+    ) -> Union[
+        CompletionSyncResponse,
+        AsyncIterable[CompletionStreamResponse],
+        AsyncIterable[Dict[str, Any]],
+    ]:
         """
         Creates a completion for the provided prompt and parameters asynchronously (with `asyncio`).
 
@@ -68,6 +181,11 @@ class Completion(APIEngine):
                 `Iterator[CompletionStreamResponse]`. Otherwise, the return type is a `CompletionSyncResponse`.
                 When streaming, tokens will be sent as data-only [server-sent events](https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events/Using_server-sent_events#event_stream_format).
 
+            raw (bool):
+                Only used when `stream=True`. If true, each streamed event is returned as the `dict` decoded
+                from the stream, instead of being validated into a `CompletionStreamResponse`. This saves client
+                CPU for high-rate token streams.
+
         Returns:
             response (Union[CompletionSyncResponse, AsyncIterable[CompletionStreamResponse]]): The generated response (if `stream=False`) or iterator of response chunks (if `stream=True`)
 
@@ -135,7 +253,7 @@ class Completion(APIEngine):
 
             async def _acreate_stream(
                 **kwargs,
-            ) -> AsyncIterable[CompletionStreamResponse]:
+            ) -> AsyncIterable[Any]:
                 data = CompletionStreamV1Request(**kwargs).dict()
                 response = cls.apost_stream(
                     resource_name=f"v1/llm/completions-stream?model_endpoint_name={model}",
@@ -143,7 +261,7 @@ class Completion(APIEngine):
                     timeout=timeout,
                 )
                 async for chunk in response:
-                    yield CompletionStreamResponse.parse_obj(chunk)
+                    yield chunk if raw else CompletionStreamResponse.parse_obj(chunk)
 
             return _acreate_stream(
                 model=model,
@@ -177,7 +295,12 @@ class Completion(APIEngine):
         temperature: float = 0.2,
         timeout: int = 10,
         stream: bool = False,
-    ) -> Union[CompletionSyncResponse, Iterator[CompletionStreamResponse]]:
+        raw: bool = False,
+    ) -> Union[
+        CompletionSyncResponse,
+        Iterator[CompletionStreamResponse],
+        Iterator[Dict[str, Any]],
+    ]:
         """
         Creates a completion for the provided prompt and parameters synchronously.
 
@@ -215,6 +338,11 @@ class Completion(APIEngine):
                 `Iterator[CompletionStreamResponse]`. Otherwise, the return type is a `CompletionSyncResponse`.
                 When streaming, tokens will be sent as data-only [server-sent events](https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events/Using_server-sent_events#event_stream_format).
 
+            raw (bool):
+                Only used when `stream=True`. If true, each streamed event is returned as the `dict` decoded
+                from the stream, instead of being validated into a `CompletionStreamResponse`. This saves client
+                CPU for high-rate token streams.
+
 
         Returns:
             response (Union[CompletionSyncResponse, AsyncIterable[CompletionStreamResponse]]): The generated response (if `stream=False`) or iterator of response chunks (if `stream=True`)
@@ -281,7 +409,7 @@ class Completion(APIEngine):
                     timeout=timeout,
                 )
                 for chunk in response_stream:
-                    yield CompletionStreamResponse.parse_obj(chunk)
+                    yield chunk if raw else CompletionStreamResponse.parse_obj(chunk)
 
             return _create_stream(
                 prompt=prompt, max_new_tokens=max_new_tokens, temperature=temperature
@@ -297,3 +425,263 @@ class Completion(APIEngine):
                 timeout=timeout,
             )
             return CompletionSyncResponse.parse_obj(response)
+
+    @classmethod
+    def batch_create(
+        cls,
+        model: str,
+        prompts: Iterable[str],
+        max_new_tokens: int = 20,
+        temperature: float = 0.2,
+        timeout: int = 10,
+        max_concurrency: int = 8,
+        prompts_per_request: int = 1,
+        ordered: bool = True,
+        max_retries: int = 3,
+    ) -> Iterator[CompletionBatchResult]:
+        """
+        Creates completions for many prompts synchronously, with a bounded number of requests in flight.
+
+        `prompts` can be any iterable, including a generator: it is consumed lazily, so it does not
+        need to fit in memory. Up to `max_concurrency` requests are sent at once from a thread pool.
+        Requests that fail with a server or connection error are retried up to `max_retries` times.
+        Rate limited and unavailable (429 and 503) responses are instead retried by the
+        [HttpClient](./#llmengine.HttpClient), which honors the server's `Retry-After`. Prompts that still fail, or that the server rejects as invalid, are
+        yielded with their `error` set instead of raising, so one bad prompt does not stop the batch.
+
+        Args:
+            model (str):
+                Name of the model to use. See [Model Zoo](../../model_zoo) for a list of Models that are supported.
+
+            prompts (Iterable[str]):
+                The prompts to generate completions for.
+
+            max_new_tokens (int):
+                The maximum number of tokens to generate in each completion.
+
+            temperature (float):
+                What sampling temperature to use, in the range `(0, 1]`.
+
+            timeout (int):
+                Timeout in seconds for each request.
+
+            max_concurrency (int):
+                Maximum number of requests in flight at once.
+
+            prompts_per_request (int):
+                Number of prompts sent in each request. Values above 1 send several prompts in one
+                `completions-sync` call, which is only supported by self-hosted LLM Engine servers.
+
+            ordered (bool):
+                If true, results are yielded in the order of `prompts`. Otherwise they are yielded as
+                soon as they complete, which avoids waiting on a slow request.
+
+            max_retries (int):
+                Maximum number of times to retry a request that failed with a server or connection
+                error.
+
+        Returns:
+            results (Iterator[CompletionBatchResult]): One result per prompt, with the `index` of its prompt.
+
+        === "Batch completion in Python"
+            ```python
+            from llmengine import Completion
+
+            prompts = (f"What is {i} + {i}?" for i in range(1000))
+            for result in Completion.batch_create(
+                model="llama-2-7b",
+                prompts=prompts,
+                max_new_tokens=10,
+                max_concurrency=16,
+            ):
+                if result.error is None:
+                    print(result.index, result.output.text)
+            ```
+        """
+
+        def complete_chunk(start: int, chunk: List[str]) -> List[CompletionBatchResult]:
+            attempt = 0
+            while True:
+                try:
+                    outputs = cls._create_outputs(
+                        model, chunk, max_new_tokens, temperature, timeout
+                    )
+                    return _to_batch_results(start, chunk, outputs)
+                except (BadRequestError, ValueError) as exc:
+                    return _to_batch_errors(start, chunk, str(exc) or repr(exc))
+                except _RETRYABLE_ERRORS as exc:
+                    if attempt >= max_retries or not _is_retryable(exc, cls.http_client):
+                        return _to_batch_errors(start, chunk, str(exc) or repr(exc))
+                time.sleep(_RETRY_BACKOFF_SECONDS * 2**attempt)
+                attempt += 1
+
+        chunks = _chunk_prompts(prompts, prompts_per_request)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures: Deque["Future[List[CompletionBatchResult]]"] = deque()
+            pending: Set["Future[List[CompletionBatchResult]]"] = set()
+            try:
+                for start, chunk in chunks:
+                    future = executor.submit(complete_chunk, start, chunk)
+                    if ordered:
+                        futures.append(future)
+                        if len(futures) >= max_concurrency:
+                            yield from futures.popleft().result()
+                    else:
+                        pending.add(future)
+                        if len(pending) >= max_concurrency:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for done_future in done:
+                                yield from done_future.result()
+                while futures:
+                    yield from futures.popleft().result()
+                for done_future in as_completed(pending):
+                    yield from done_future.result()
+            finally:
+                for future in (*futures, *pending):
+                    future.cancel()
+
+    @classmethod
+    async def abatch_create(
+        cls,
+        model: str,
+        prompts: Union[Iterable[str], AsyncIterable[str]],
+        max_new_tokens: int = 20,
+        temperature: float = 0.2,
+        timeout: int = 10,
+        max_concurrency: int = 8,
+        prompts_per_request: int = 1,
+        ordered: bool = True,
+        max_retries: int = 3,
+    ) -> AsyncIterator[CompletionBatchResult]:
+        """
+        Creates completions for many prompts asynchronously (with `asyncio`), with a bounded number of requests in flight.
+
+        This is the `asyncio` version of [batch_create](./#llmengine.Completion.batch_create), and takes
+        the same arguments. `prompts` can also be an async iterable.
+
+        Returns:
+            results (AsyncIterator[CompletionBatchResult]): One result per prompt, with the `index` of its prompt.
+
+        === "Asynchronous batch completion in Python"
+            ```python
+            import asyncio
+            from llmengine import Completion
+
+            async def main():
+                prompts = [f"What is {i} + {i}?" for i in range(1000)]
+                async for result in Completion.abatch_create(
+                    model="llama-2-7b",
+                    prompts=prompts,
+                    max_new_tokens=10,
+                    max_concurrency=16,
+                    ordered=False,
+                ):
+                    if result.error is None:
+                        print(result.index, result.output.text)
+
+            asyncio.run(main())
+            ```
+        """
+
+        async def complete_chunk(start: int, chunk: List[str]) -> List[CompletionBatchResult]:
+            attempt = 0
+            while True:
+                try:
+                    outputs = await cls._acreate_outputs(
+                        model, chunk, max_new_tokens, temperature, timeout
+                    )
+                    return _to_batch_results(start, chunk, outputs)
+                except (BadRequestError, ValueError) as exc:
+                    return _to_batch_errors(start, chunk, str(exc) or repr(exc))
+                except _RETRYABLE_ERRORS as exc:
+                    if attempt >= max_retries or not _is_retryable(exc, cls.http_client):
+                        return _to_batch_errors(start, chunk, str(exc) or repr(exc))
+                await asyncio.sleep(_RETRY_BACKOFF_SECONDS * 2**attempt)
+                attempt += 1
+
+        tasks: Deque["asyncio.Task[List[CompletionBatchResult]]"] = deque()
+        pending: Set["asyncio.Task[List[CompletionBatchResult]]"] = set()
+        try:
+            async for start, chunk in _achunk_prompts(prompts, prompts_per_request):
+                task = asyncio.ensure_future(complete_chunk(start, chunk))
+                if ordered:
+                    tasks.append(task)
+                    if len(tasks) >= max_concurrency:
+                        for result in await tasks.popleft():
+                            yield result
+                else:
+                    pending.add(task)
+                    if len(pending) >= max_concurrency:
+                        done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+                        for done_task in done:
+                            for result in done_task.result():
+                                yield result
+            while tasks:
+                for result in await tasks.popleft():
+                    yield result
+            for next_done in asyncio.as_completed(pending):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in (*tasks, *pending):
+                task.cancel()
+
+    @classmethod
+    def _create_outputs(
+        cls,
+        model: str,
+        prompts: List[str],
+        max_new_tokens: int,
+        temperature: float,
+        timeout: int,
+    ) -> List[CompletionOutput]:
+        if len(prompts) == 1:
+            data = CompletionSyncV1Request(
+                prompt=prompts[0], max_new_tokens=max_new_tokens, temperature=temperature
+            ).dict()
+            response = cls.post_sync(
+                resource_name=f"v1/llm/completions-sync?model_endpoint_name={model}",
+                data=data,
+                timeout=timeout,
+            )
+            return [CompletionSyncResponse.parse_obj(response).output]
+
+        data = CompletionSyncBatchV1Request(
+            prompts=prompts, max_new_tokens=max_new_tokens, temperature=temperature
+        ).dict()
+        response = cls.post_sync(
+            resource_name=f"v1/llm/completions-sync?model_endpoint_name={model}",
+            data=data,
+            timeout=timeout,
+        )
+        return _get_batch_outputs(len(prompts), response)
+
+    @classmethod
+    async def _acreate_outputs(
+        cls,
+        model: str,
+        prompts: List[str],
+        max_new_tokens: int,
+        temperature: float,
+        timeout: int,
+    ) -> List[CompletionOutput]:
+        if len(prompts) == 1:
+            data = CompletionSyncV1Request(
+                prompt=prompts[0], max_new_tokens=max_new_tokens, temperature=temperature
+            ).dict()
+            response = await cls.apost_sync(
+                resource_name=f"v1/llm/completions-sync?model_endpoint_name={model}",
+                data=data,
+                timeout=timeout,
+            )
+            return [CompletionSyncResponse.parse_obj(response).output]
+
+        data = CompletionSyncBatchV1Request(
+            prompts=prompts, max_new_tokens=max_new_tokens, temperature=temperature
+        ).dict()
+        response = await cls.apost_sync(
+            resource_name=f"v1/llm/completions-sync?model_endpoint_name={model}",
+            data=data,
+            timeout=timeout,
+        )
+        return _get_batch_outputs(len(prompts), response)
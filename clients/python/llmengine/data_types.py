@@ -279,6 +279,44 @@ class CompletionSyncResponse(BaseModel):
     """Completion output."""
 
 
+class CompletionSyncBatchV1Request(BaseModel):
+    """
+    Request object for a synchronous completion task over several prompts at once.
+    """
+
+    prompts: List[str] = Field(..., min_items=1)
+    max_new_tokens: int = Field(..., gt=0)
+    temperature: float = Field(..., gt=0.0)
+
+
+class CompletionSyncBatchV1Response(BaseModel):
+    """
+    Response object for a synchronous completion task over several prompts at once.
+    """
+
+    status: str
+    outputs: List[CompletionOutput]
+    traceback: Optional[str] = None
+
+
+class CompletionBatchResult(BaseModel):
+    """
+    Result for a single prompt of a batch completion.
+    """
+
+    index: int
+    """The position of the prompt in the prompts passed to `Completion.batch_create`."""
+
+    prompt: str
+    """The prompt that was completed."""
+
+    output: Optional[CompletionOutput] = None
+    """Completion output, if the completion succeeded."""
+
+    error: Optional[str] = None
+    """Error message, if the completion still failed after all retries."""
+
+
 class CompletionStreamV1Request(BaseModel):
     """
     Request object for a streaming prompt completion.
@@ -55,6 +55,7 @@ class ServerError(Exception):
 
     def __init__(self, status_code: int, message: str):
         super().__init__(f"Server exception with {status_code=}, {message=}")
+        self.status_code = status_code
 
 
 # Unknown error
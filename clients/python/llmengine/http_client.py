@@ -0,0 +1,177 @@
+import asyncio
+import random
+import time
+from typing import Any, Collection, Optional
+from weakref import WeakKeyDictionary
+
+import requests
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_MAXSIZE: int = 10
+DEFAULT_MAX_RETRIES: int = 3
+DEFAULT_BACKOFF_FACTOR: float = 0.5
+DEFAULT_MAX_BACKOFF: float = 30.0
+DEFAULT_RETRY_STATUSES: Collection[int] = (429, 503)
+DEFAULT_KEEPALIVE_TIMEOUT: float = 30.0
+
+
+class HttpClient:
+    """
+    HTTP transport shared by all LLM Engine API calls.
+
+    Connections are pooled and kept alive across calls, so that making many requests does not pay
+    for a TCP and TLS handshake each time. A `requests.Session` serves synchronous calls, and an
+    `aiohttp.ClientSession` is kept per event loop for `asyncio` calls. Requests that are rejected
+    with one of `retry_statuses` (by default, 429 and 503) are retried with exponential backoff,
+    honoring the `Retry-After` header when the server sends one.
+
+    By default, all API classes share a single client. To tune it, e.g. for scripts that send many
+    concurrent requests, replace it:
+
+    ```python
+    from llmengine import HttpClient
+    from llmengine.api_engine import APIEngine
+
+    APIEngine.http_client = HttpClient(pool_maxsize=100, max_retries=5)
+    ```
+
+    Args:
+        pool_maxsize (int):
+            Maximum number of connections to keep open to the server, for synchronous calls and
+            for `asyncio` calls (per event loop) respectively.
+
+        max_retries (int):
+            Maximum number of times to retry a request that was rejected with one of
+            `retry_statuses`. Set to 0 to disable retries.
+
+        backoff_factor (float):
+            The `n`-th retry waits for `backoff_factor * 2 ** (n - 1)` seconds, up to
+            `max_backoff`, unless the server says otherwise with `Retry-After`.
+
+        max_backoff (float):
+            Maximum number of seconds to wait between two attempts.
+
+        retry_statuses (Collection[int]):
+            HTTP status codes for which requests are retried.
+
+        keepalive_timeout (float):
+            Number of seconds an idle `asyncio` connection is kept open for reuse.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ):
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[requests.Session] = None
+        # Weakly keyed by event loop. Sessions reference their loop, though, so the sessions of
+        # closed loops are also closed and dropped explicitly, whenever a session is looked up.
+        self._async_sessions: "WeakKeyDictionary[asyncio.AbstractEventLoop, ClientSession]" = (
+            WeakKeyDictionary()
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled `requests.Session` used for synchronous calls."""
+        if self._session is None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Sends a synchronous request over the pooled session, retrying as configured."""
+        session = self.session
+        attempt = 0
+        while True:
+            response = session.request(method, url, **kwargs)
+            if response.status_code not in self.retry_statuses or attempt >= self.max_retries:
+                return response
+            delay = self._get_backoff(attempt, response.headers.get("Retry-After"))
+            response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    async def get_async_session(self) -> ClientSession:
+        """
+        Returns the pooled `aiohttp.ClientSession` for the running event loop.
+
+        `aiohttp` sessions are bound to the event loop they were created in, so each loop gets its
+        own session, e.g. each `asyncio.run()`. The sessions of loops that have since been closed
+        are closed here, so that they don't leak.
+        """
+        loop = asyncio.get_running_loop()
+        await self._close_stale_async_sessions()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.pool_maxsize, keepalive_timeout=self.keepalive_timeout
+                )
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    async def arequest(
+        self, method: str, url: str, timeout: Optional[float] = None, **kwargs: Any
+    ) -> ClientResponse:
+        """
+        Sends an `asyncio` request over the pooled session, retrying as configured.
+
+        The returned response should be used as an async context manager, so that its connection
+        goes back to the pool.
+        """
+        session = await self.get_async_session()
+        attempt = 0
+        while True:
+            response = await session.request(
+                method, url, timeout=ClientTimeout(total=timeout), **kwargs
+            )
+            if response.status not in self.retry_statuses or attempt >= self.max_retries:
+                return response
+            delay = self._get_backoff(attempt, response.headers.get("Retry-After"))
+            response.release()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        """Closes the synchronous connection pool."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self) -> None:
+        """Closes the `asyncio` connection pool of the running event loop."""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+        await self._close_stale_async_sessions()
+
+    async def _close_stale_async_sessions(self) -> None:
+        for loop, session in list(self._async_sessions.items()):
+            if loop.is_closed() and self._async_sessions.pop(loop, None) is not None:
+                # The connections of a closed loop can't be used anymore, so this only releases them.
+                await session.close()
+
+    def _get_backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self.max_backoff)
+            except ValueError:
+                pass
+        backoff = min(self.backoff_factor * (2**attempt), self.max_backoff)
+        # Jitter so that many clients rejected at once don't all retry at the same instant.
+        return backoff * random.uniform(0.5, 1.0)
@@ -0,0 +1,84 @@
+"""
+Minimal reader for the `text/event-stream` responses of the streaming APIs.
+"""
+import json
+from typing import Any, AsyncIterable, Callable, Iterable, Iterator, List
+
+try:
+    # orjson is optional, and noticeably faster at decoding high-rate token streams.
+    import orjson
+
+    loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover
+    loads = json.loads
+
+_LF = b"\n"
+_CR = 13  # ord("\r")
+_SPACE = 32  # ord(" ")
+_DATA_PREFIX = b"data:"
+
+
+class SSEDecoder:
+    """
+    Incremental decoder that turns chunks of a server-sent event stream into event payloads.
+
+    Chunks can be split at arbitrary byte boundaries. Lines are never decoded to `str`, and only
+    the `data` field is kept, since that is all the LLM Engine APIs send. Lines end with `\\n` or
+    `\\r\\n`, and a single space after `data:` is stripped, as per the SSE spec.
+    """
+
+    __slots__ = ("_buffer", "_data")
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._data: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Consumes a chunk and returns the `data` of the events that it completes, in order."""
+        buffer = self._buffer + chunk if self._buffer else chunk
+        payloads: List[bytes] = []
+        start = 0
+        while True:
+            end = buffer.find(_LF, start)
+            if end == -1:
+                break
+            line_end = end - 1 if end > start and buffer[end - 1] == _CR else end
+            if line_end == start:
+                # An empty line dispatches the event.
+                if self._data:
+                    payloads.append(self._data[0] if len(self._data) == 1 else _LF.join(self._data))
+                    self._data = []
+            elif buffer.startswith(_DATA_PREFIX, start, line_end):
+                value_start = start + 5
+                if value_start < line_end and buffer[value_start] == _SPACE:
+                    value_start += 1
+                self._data.append(buffer[value_start:line_end])
+            elif buffer[start:line_end] == b"data":
+                self._data.append(b"")
+            # Comments and other fields (event, id, retry) are ignored.
+            start = end + 1
+        self._buffer = buffer[start:] if start else buffer
+        return payloads
+
+
+def _decode(payload: bytes) -> Any:
+    try:
+        return loads(payload)
+    except ValueError:
+        raise ValueError(f"Invalid JSON payload: {payload.decode('utf-8', errors='replace')}")
+
+
+def iter_sse_json(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Decodes the JSON `data` of each event in a stream of raw chunks."""
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        for payload in decoder.feed(chunk):
+            yield _decode(payload)
+
+
+async def aiter_sse_json(chunks: AsyncIterable[bytes]) -> AsyncIterable[Any]:
+    """Decodes the JSON `data` of each event in an async stream of raw chunks."""
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for payload in decoder.feed(chunk):
+            yield _decode(payload)
@@ -0,0 +1,197 @@
+import asyncio
+import time
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from llmengine import Completion
+from llmengine.data_types import CompletionOutput
+from llmengine.errors import BadRequestError, ServerError, UnauthorizedError
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff():
+    with patch("llmengine.completion._RETRY_BACKOFF_SECONDS", 0.0):
+        yield
+
+
+def _make_outputs(prompts: List[str]) -> List[CompletionOutput]:
+    return [CompletionOutput(text=prompt.upper(), num_completion_tokens=1) for prompt in prompts]
+
+
+def _slow_first_chunk(model, prompts, max_new_tokens, temperature, timeout):
+    if prompts[0] == "p0":
+        time.sleep(0.2)
+    return _make_outputs(prompts)
+
+
+async def _aslow_first_chunk(model, prompts, max_new_tokens, temperature, timeout):
+    if prompts[0] == "p0":
+        await asyncio.sleep(0.2)
+    return _make_outputs(prompts)
+
+
+@pytest.mark.parametrize("prompts_per_request", [1, 2])
+def test_batch_create_ordered(prompts_per_request: int):
+    prompts = (f"p{i}" for i in range(5))
+    with patch.object(Completion, "_create_outputs", side_effect=_slow_first_chunk):
+        results = list(
+            Completion.batch_create(
+                model="model",
+                prompts=prompts,
+                max_concurrency=3,
+                prompts_per_request=prompts_per_request,
+            )
+        )
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.prompt for result in results] == [f"p{i}" for i in range(5)]
+    assert [result.output.text for result in results] == [f"P{i}" for i in range(5)]  # type: ignore
+    assert all(result.error is None for result in results)
+
+
+def test_batch_create_unordered():
+    prompts = [f"p{i}" for i in range(5)]
+    with patch.object(Completion, "_create_outputs", side_effect=_slow_first_chunk):
+        results = list(
+            Completion.batch_create(
+                model="model", prompts=prompts, max_concurrency=3, ordered=False
+            )
+        )
+
+    # The slow first prompt doesn't hold back the others.
+    assert results[-1].index == 0
+    assert sorted(result.index for result in results) == [0, 1, 2, 3, 4]
+    for result in results:
+        assert result.prompt == prompts[result.index]
+        assert result.output.text == prompts[result.index].upper()  # type: ignore
+
+
+def test_batch_create_retries_failed_chunks():
+    attempts = {"p0": 0, "p1": 0}
+
+    def create_outputs(model, prompts, max_new_tokens, temperature, timeout):
+        attempts[prompts[0]] += 1
+        if prompts[0] == "p0" and attempts["p0"] < 3:
+            raise ServerError(500, "Internal error")
+        if prompts[0] == "p1":
+            raise ServerError(500, "Internal error")
+        return _make_outputs(prompts)
+
+    with patch.object(Completion, "_create_outputs", side_effect=create_outputs):
+        results = list(Completion.batch_create(model="model", prompts=["p0", "p1"], max_retries=2))
+
+    assert attempts == {"p0": 3, "p1": 3}
+    assert results[0].output.text == "P0"  # type: ignore
+    assert results[0].error is None
+    assert results[1].output is None
+    assert "Internal error" in results[1].error  # type: ignore
+
+
+def test_batch_create_does_not_retry_what_the_http_client_retried():
+    attempts = []
+
+    def create_outputs(model, prompts, max_new_tokens, temperature, timeout):
+        attempts.append(prompts[0])
+        raise ServerError(503, "Unavailable")
+
+    with patch.object(Completion, "_create_outputs", side_effect=create_outputs):
+        results = list(Completion.batch_create(model="model", prompts=["p0"], max_retries=3))
+
+    assert attempts == ["p0"]
+    assert "Unavailable" in results[0].error  # type: ignore
+
+
+def test_batch_create_returns_errors_for_invalid_prompts():
+    attempts = []
+
+    def create_outputs(model, prompts, max_new_tokens, temperature, timeout):
+        attempts.append(prompts)
+        if "bad" in prompts:
+            raise BadRequestError("Invalid prompt")
+        return _make_outputs(prompts)
+
+    with patch.object(Completion, "_create_outputs", side_effect=create_outputs):
+        results = list(
+            Completion.batch_create(
+                model="model", prompts=["a", "b", "bad", "c"], prompts_per_request=2
+            )
+        )
+
+    # The whole chunk of the invalid prompt fails, once, and the other chunks still complete.
+    assert attempts.count(["bad", "c"]) == 1
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.error for result in results] == [None, None, "Invalid prompt", "Invalid prompt"]
+    assert [result.output.text for result in results[:2]] == ["A", "B"]  # type: ignore
+
+
+def test_batch_create_raises_errors_that_would_fail_every_prompt():
+    with patch.object(
+        Completion, "_create_outputs", side_effect=UnauthorizedError("Invalid API key")
+    ):
+        with pytest.raises(UnauthorizedError):
+            list(Completion.batch_create(model="model", prompts=["p0", "p1"]))
+
+
+@pytest.mark.parametrize("prompts_per_request", [1, 2])
+async def test_abatch_create_ordered(prompts_per_request: int):
+    async def prompts():
+        for i in range(5):
+            yield f"p{i}"
+
+    with patch.object(Completion, "_acreate_outputs", side_effect=_aslow_first_chunk):
+        results = [
+            result
+            async for result in Completion.abatch_create(
+                model="model",
+                prompts=prompts(),
+                max_concurrency=3,
+                prompts_per_request=prompts_per_request,
+            )
+        ]
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.output.text for result in results] == [f"P{i}" for i in range(5)]  # type: ignore
+
+
+async def test_abatch_create_unordered():
+    prompts = [f"p{i}" for i in range(5)]
+    with patch.object(Completion, "_acreate_outputs", side_effect=_aslow_first_chunk):
+        results = [
+            result
+            async for result in Completion.abatch_create(
+                model="model", prompts=prompts, max_concurrency=3, ordered=False
+            )
+        ]
+
+    assert results[-1].index == 0
+    assert sorted(result.index for result in results) == [0, 1, 2, 3, 4]
+    for result in results:
+        assert result.output.text == prompts[result.index].upper()  # type: ignore
+
+
+async def test_abatch_create_retries_failed_chunks_and_returns_errors():
+    attempts = {"p0": 0, "p1": 0, "bad": 0}
+
+    async def create_outputs(model, prompts, max_new_tokens, temperature, timeout):
+        attempts[prompts[0]] += 1
+        if prompts[0] == "p0" and attempts["p0"] < 2:
+            raise asyncio.TimeoutError()
+        if prompts[0] == "p1":
+            raise ServerError(500, "Internal error")
+        if prompts[0] == "bad":
+            raise BadRequestError("Invalid prompt")
+        return _make_outputs(prompts)
+
+    with patch.object(Completion, "_acreate_outputs", side_effect=create_outputs):
+        results = [
+            result
+            async for result in Completion.abatch_create(
+                model="model", prompts=["p0", "p1", "bad"], max_retries=1
+            )
+        ]
+
+    assert attempts == {"p0": 2, "p1": 2, "bad": 1}
+    assert results[0].output.text == "P0"  # type: ignore
+    assert "Internal error" in results[1].error  # type: ignore
+    assert results[2].error == "Invalid prompt"
@@ -0,0 +1,162 @@
+import asyncio
+import io
+from typing import AsyncIterator, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from llmengine.http_client import HttpClient
+
+
+def _make_response(status_code: int, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+def test_request_retries_retry_statuses():
+    client = HttpClient(max_retries=3, backoff_factor=1.0)
+    responses = [_make_response(429), _make_response(503), _make_response(200)]
+    with patch.object(requests.Session, "request", Mock(side_effect=responses)) as mock_request:
+        with patch("llmengine.http_client.time.sleep") as mock_sleep:
+            response = client.request("GET", "http://test/v1/resource")
+
+    assert response.status_code == 200
+    assert mock_request.call_count == 3
+    # Exponential backoff, with jitter of up to half of it.
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert 0.5 <= delays[0] <= 1.0
+    assert 1.0 <= delays[1] <= 2.0
+
+
+def test_request_returns_the_last_response_after_max_retries():
+    client = HttpClient(max_retries=2)
+    with patch.object(
+        requests.Session, "request", Mock(side_effect=lambda *args, **kwargs: _make_response(503))
+    ) as mock_request:
+        with patch("llmengine.http_client.time.sleep"):
+            response = client.request("GET", "http://test/v1/resource")
+
+    assert response.status_code == 503
+    assert mock_request.call_count == 3
+
+
+def test_request_does_not_retry_other_statuses():
+    client = HttpClient(max_retries=3)
+    with patch.object(
+        requests.Session, "request", Mock(return_value=_make_response(500))
+    ) as mock_request:
+        response = client.request("GET", "http://test/v1/resource")
+
+    assert response.status_code == 500
+    assert mock_request.call_count == 1
+
+
+def test_request_honors_retry_after():
+    client = HttpClient(max_retries=3, max_backoff=10.0)
+    responses = [
+        _make_response(429, {"Retry-After": "2"}),
+        # Capped at max_backoff.
+        _make_response(429, {"Retry-After": "120"}),
+        # Not a number of seconds, so the backoff is used instead.
+        _make_response(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+        _make_response(200),
+    ]
+    with patch.object(requests.Session, "request", Mock(side_effect=responses)):
+        with patch("llmengine.http_client.time.sleep") as mock_sleep:
+            response = client.request("GET", "http://test/v1/resource")
+
+    assert response.status_code == 200
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays[:2] == [2.0, 10.0]
+    assert delays[2] <= client.backoff_factor * 4
+
+
+def test_session_is_reused():
+    client = HttpClient(pool_maxsize=4)
+    session = client.session
+    assert client.session is session
+    assert session.get_adapter("https://test").poolmanager.connection_pool_kw["maxsize"] == 4
+
+    client.close()
+    assert client.session is not session
+
+
+@pytest.fixture
+async def test_server() -> AsyncIterator[TestServer]:
+    transports: List[object] = []
+    statuses: List[int] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        transports.append(request.transport)
+        status = statuses.pop(0) if statuses else 200
+        headers = {"Retry-After": "0"} if status != 200 else {}
+        return web.json_response({"attempt": len(transports)}, status=status, headers=headers)
+
+    app = web.Application()
+    app.router.add_route("*", "/v1/resource", handler)
+    server = TestServer(app)
+    await server.start_server()
+    server.transports = transports  # type: ignore
+    server.statuses = statuses  # type: ignore
+    yield server
+    await server.close()
+
+
+async def test_arequest_retries_retry_statuses(test_server):
+    client = HttpClient(max_retries=3)
+    test_server.statuses.extend([429, 503])
+    async with await client.arequest("GET", str(test_server.make_url("/v1/resource"))) as response:
+        assert response.status == 200
+        assert await response.json() == {"attempt": 3}
+    await client.aclose()
+
+
+async def test_arequest_returns_the_last_response_after_max_retries(test_server):
+    client = HttpClient(max_retries=1)
+    test_server.statuses.extend([503, 503, 503])
+    async with await client.arequest("GET", str(test_server.make_url("/v1/resource"))) as response:
+        assert response.status == 503
+    assert len(test_server.transports) == 2
+    await client.aclose()
+
+
+async def test_async_session_is_reused_within_an_event_loop(test_server):
+    client = HttpClient()
+    session = await client.get_async_session()
+    for _ in range(3):
+        async with await client.arequest("GET", str(test_server.make_url("/v1/resource"))):
+            pass
+    assert await client.get_async_session() is session
+    # The requests share a single kept-alive connection.
+    assert len(test_server.transports) == 3
+    assert len({id(transport) for transport in test_server.transports}) == 1
+
+    await client.aclose()
+    assert session.closed
+    assert await client.get_async_session() is not session
+    await client.aclose()
+
+
+def test_async_sessions_of_closed_event_loops_are_closed():
+    client = HttpClient()
+
+    async def get_session():
+        return await client.get_async_session()
+
+    first_session = asyncio.run(get_session())
+    assert not first_session.closed
+    second_session = asyncio.run(get_session())
+
+    # Each loop gets its own session, and the session of the closed loop is closed and dropped.
+    assert second_session is not first_session
+    assert first_session.closed
+    assert list(client._async_sessions.values()) == [second_session]
+
+    asyncio.run(client.aclose())
+    assert second_session.closed
+    assert len(client._async_sessions) == 0
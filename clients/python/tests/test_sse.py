@@ -0,0 +1,96 @@
+import importlib
+import json
+import sys
+from typing import AsyncIterator, List
+from unittest.mock import patch
+
+import pytest
+from llmengine import sse
+from llmengine.sse import SSEDecoder, aiter_sse_json, iter_sse_json
+
+
+def test_sse_decoder_single_data_line():
+    decoder = SSEDecoder()
+    assert decoder.feed(b'data: {"token": "a"}\r\n\r\n') == [b'{"token": "a"}']
+
+
+def test_sse_decoder_chunk_boundaries():
+    stream = b'data: {"token": "a"}\r\n\r\ndata: {"token": "b"}\r\n\r\ndata: {"token": "c"}\n\n'
+    expected = [b'{"token": "a"}', b'{"token": "b"}', b'{"token": "c"}']
+    for chunk_size in range(1, len(stream) + 1):
+        decoder = SSEDecoder()
+        payloads = []
+        for i in range(0, len(stream), chunk_size):
+            payloads.extend(decoder.feed(stream[i : i + chunk_size]))
+        assert payloads == expected
+
+
+def test_sse_decoder_multi_line_data():
+    decoder = SSEDecoder()
+    payloads = decoder.feed(b"data:first\ndata:  second\ndata\ndata: \n\n")
+    # Only one space after the colon is stripped, and empty data lines are kept.
+    assert payloads == [b"first\n second\n\n"]
+
+
+def test_sse_decoder_ignores_comments_and_other_fields():
+    decoder = SSEDecoder()
+    payloads = decoder.feed(
+        b": this is a comment\n"
+        b"event: token\n"
+        b"id: 7\n"
+        b"retry: 1000\n"
+        b"data: 1\n"
+        b"\n"
+        b": keep-alive\n"
+        b"\n"
+        b"event: ping\n"
+        b"\n"
+    )
+    assert payloads == [b"1"]
+
+
+def test_sse_decoder_only_dispatches_complete_events():
+    decoder = SSEDecoder()
+    assert decoder.feed(b"data: partial") == []
+    assert decoder.feed(b"\r") == []
+    assert decoder.feed(b"\n") == []
+    assert decoder.feed(b"\r\n") == [b"partial"]
+
+
+def test_iter_sse_json():
+    chunks = [b'data: {"a"', b": 1}\n\ndata: [1, ", b"2]\n", b"\n"]
+    assert list(iter_sse_json(chunks)) == [{"a": 1}, [1, 2]]
+
+
+def test_iter_sse_json_invalid_payload():
+    with pytest.raises(ValueError, match="Invalid JSON payload: not json"):
+        list(iter_sse_json([b"data: not json\n\n"]))
+
+
+async def test_aiter_sse_json() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in [b"data: 1\r\n", b"\r\ndata", b': "2"\r\n\r\nda', b"ta: null\r\n\r\n"]:
+            yield chunk
+
+    payloads: List[object] = [payload async for payload in aiter_sse_json(chunks())]
+    assert payloads == [1, "2", None]
+
+
+def test_orjson_is_used_when_installed():
+    orjson = pytest.importorskip("orjson")
+    assert sse.loads is orjson.loads
+    assert list(iter_sse_json([b'data: {"token": "\\u00e9"}\n\n'])) == [{"token": "\u00e9"}]
+
+
+def test_json_is_used_without_orjson():
+    try:
+        with patch.dict(sys.modules, {"orjson": None}):
+            importlib.reload(sse)
+            assert sse.loads is json.loads
+            assert list(sse.iter_sse_json([b'data: {"token": "\\u00e9"}\n\n'])) == [
+                {"token": "\u00e9"}
+            ]
+            with pytest.raises(ValueError, match="Invalid JSON payload"):
+                list(sse.iter_sse_json([b"data: {\n\n"]))
+    finally:
+        importlib.reload(sse)
@@ -0,0 +1,82 @@
+"""Benchmark of the import time of the main entrypoints.
+
+Imports each entrypoint module in a fresh interpreter, as a cold start does, and reports the
+median wall time over a few runs. With ``--top``, also lists the slowest modules that the import
+pulled in, cumulatively, as reported by ``python -X importtime``.
+
+Usage:
+    python benchmarks/import_time_benchmark.py --runs 5 --top 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ENTRYPOINTS: Dict[str, str] = {
+    "gateway": "llm_engine_server.api.app",
+    "cacher": "llm_engine_server.entrypoints.k8s_cache",
+    "builder": "llm_engine_server.service_builder.celery",
+    "forwarder": "llm_engine_server.inference.forwarding.http_forwarder",
+}
+
+
+def _import_once(module: str, importtime: bool) -> Tuple[float, str]:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", f"import {module}"]
+    start_time = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, env=os.environ.copy())
+    elapsed = time.perf_counter() - start_time
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return elapsed, result.stderr
+
+
+def _get_slowest_imports(importtime_output: str, top: int) -> List[Tuple[int, str]]:
+    # Lines look like "import time:   self [us] | cumulative | imported package".
+    timings = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        timings.append((int(cumulative), name.rstrip()))
+    return sorted(timings, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0)
+    parser.add_argument("entrypoints", nargs="*", help=f"Any of {', '.join(ENTRYPOINTS)}")
+    args = parser.parse_args()
+    unknown = set(args.entrypoints) - set(ENTRYPOINTS)
+    if unknown:
+        parser.error(f"Unknown entrypoints: {', '.join(sorted(unknown))}")
+
+    for name in args.entrypoints or ENTRYPOINTS:
+        module = ENTRYPOINTS[name]
+        # The first run warms up the bytecode and filesystem caches.
+        try:
+            _import_once(module, importtime=False)
+        except RuntimeError as exc:
+            # e.g. the cacher needs a kube config when it's imported.
+            print(f"{name:<10} {module:<56} failed: {str(exc).splitlines()[-1]}")
+            continue
+        times = [_import_once(module, importtime=False)[0] for _ in range(args.runs)]
+        print(
+            f"{name:<10} {module:<56} median {statistics.median(times) * 1000:8.1f} ms, "
+            f"min {min(times) * 1000:8.1f} ms"
+        )
+        if args.top:
+            _, importtime_output = _import_once(module, importtime=True)
+            for cumulative, imported in _get_slowest_imports(importtime_output, args.top):
+                print(f"    {cumulative / 1000:8.1f} ms {imported}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark of rendering the k8s resource templates during bursts of endpoint creations.
+
+Each endpoint build renders a deployment, two config maps, a VPA, an HPA and a service, and each
+batch job renders one job. Compares re-reading and re-parsing the whole service template config
+map on every render, as `load_k8s_yaml` used to do, against the compiled `K8sTemplateRegistry`.
+
+Usage:
+    python benchmarks/k8s_template_benchmark.py --num-endpoints 100 --num-batch-jobs 500
+"""
+
+import argparse
+import time
+from string import Template
+from typing import Any, Callable, Dict, List, Tuple
+
+import yaml
+from llm_engine_server.common.env_vars import LLM_ENGINE_SERVICE_TEMPLATE_CONFIG_MAP_PATH
+from llm_engine_server.infra.gateways.resources.k8s_endpoint_resource_delegate import load_k8s_yaml
+from llm_engine_server.infra.gateways.resources.k8s_resource_types import (
+    DeploymentRunnableImageSyncCpuArguments,
+    DictStrInt,
+    DictStrStr,
+    DockerImageBatchJobCpuArguments,
+    EndpointConfigArguments,
+    HorizontalPodAutoscalerArguments,
+    ServiceArguments,
+    UserConfigArguments,
+    VerticalPodAutoscalerArguments,
+)
+
+_DEFAULT_VALUES: Dict[Any, Any] = {
+    DictStrInt: "foo: 2",
+    DictStrStr: "foo: bar",
+    List[Dict[str, Any]]: [{"name": "foo", "value": "bar"}],
+    List[str]: ["foo", "bar"],
+    bool: True,
+    float: 1.1,
+    int: 1,
+    str: "foo",
+}
+
+ENDPOINT_RESOURCES: List[Tuple[str, Any]] = [
+    ("deployment-runnable-image-sync-cpu.yaml", DeploymentRunnableImageSyncCpuArguments),
+    ("user-config.yaml", UserConfigArguments),
+    ("endpoint-config.yaml", EndpointConfigArguments),
+    ("vertical-pod-autoscaler.yaml", VerticalPodAutoscalerArguments),
+    ("horizontal-pod-autoscaler.yaml", HorizontalPodAutoscalerArguments),
+    ("service.yaml", ServiceArguments),
+]
+BATCH_JOB_RESOURCE = ("docker-image-batch-job-cpu.yaml", DockerImageBatchJobCpuArguments)
+
+
+def _get_arguments(arguments_type: Any) -> Dict[str, Any]:
+    return {key: _DEFAULT_VALUES[type_] for key, type_ in arguments_type.__annotations__.items()}
+
+
+def _load_k8s_yaml_uncached(key: str, substitution_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    with open(LLM_ENGINE_SERVICE_TEMPLATE_CONFIG_MAP_PATH, "r") as f:
+        config_map = yaml.safe_load(f.read())
+    return yaml.safe_load(Template(config_map["data"][key]).substitute(**substitution_kwargs))
+
+
+def _run_burst(
+    load: Callable[..., Dict[str, Any]],
+    num_endpoints: int,
+    num_batch_jobs: int,
+) -> float:
+    resources = ENDPOINT_RESOURCES * num_endpoints + [BATCH_JOB_RESOURCE] * num_batch_jobs
+    arguments = {arguments_type: _get_arguments(arguments_type) for _, arguments_type in resources}
+    start_time = time.perf_counter()
+    for key, arguments_type in resources:
+        load(key, arguments[arguments_type])
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-endpoints", type=int, default=100)
+    parser.add_argument("--num-batch-jobs", type=int, default=500)
+    args = parser.parse_args()
+
+    loads: List[Tuple[str, Callable[..., Dict[str, Any]]]] = [
+        ("uncached", _load_k8s_yaml_uncached),
+        ("registry", load_k8s_yaml),
+    ]
+    for name, load in loads:
+        # Warm up, e.g. so that the registry has parsed the config map.
+        _run_burst(load, 1, 1)
+        elapsed = _run_burst(load, args.num_endpoints, args.num_batch_jobs)
+        num_renders = len(ENDPOINT_RESOURCES) * args.num_endpoints + args.num_batch_jobs
+        print(
+            f"{name:<10} {elapsed:8.3f}s for {args.num_endpoints} endpoints and "
+            f"{args.num_batch_jobs} batch jobs, {elapsed / num_renders * 1000:8.3f} ms per render"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Micro-benchmark for the SSE parsing done by the streaming inference gateway.
+
+Simulates one gateway process relaying many concurrent token streams, and compares the
+str-based, line-at-a-time parsing that ``EventSource`` used to do against the bytes-level
+``SSEParser``. Both paths finish with ``orjson.loads`` on every payload, as
+``LiveStreamingModelEndpointInferenceGateway`` does.
+
+Usage:
+    python benchmarks/sse_parser_benchmark.py --num-streams 200 --tokens-per-stream 500
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, List
+
+import aiohttp
+import orjson
+from llm_engine_server.infra.gateways.aiohttp_sse_client import EventSource
+
+
+def _make_stream(num_tokens: int) -> bytes:
+    # Matches what sse_starlette writes for each token of a streaming endpoint.
+    return b"".join(
+        b"data: "
+        + orjson.dumps({"status": "SUCCESS", "result": {"token": f"tok{i}"}, "traceback": None})
+        + b"\r\n\r\n"
+        for i in range(num_tokens)
+    )
+
+
+def _split(stream: bytes, chunk_size: int) -> List[bytes]:
+    return [stream[i : i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+class _Protocol:
+    """Minimal stand-in for the aiohttp protocol that owns a StreamReader."""
+
+    _reading_paused = False
+
+    def pause_reading(self) -> None:
+        pass
+
+    def resume_reading(self) -> None:
+        pass
+
+
+class _FakeResponse:
+    def __init__(self, chunks: List[bytes]):
+        self.content = aiohttp.StreamReader(_Protocol(), limit=2**16)  # type: ignore
+        self._chunks = chunks
+
+    async def feed(self) -> None:
+        # Each chunk arrives in its own event loop iteration, as it would off the socket.
+        for chunk in self._chunks:
+            self.content.feed_data(chunk)
+            await asyncio.sleep(0)
+        self.content.feed_eof()
+
+
+async def _consume_line_based(response: _FakeResponse) -> int:
+    """The parsing loop of the previous EventSource.__anext__ implementation."""
+    count = 0
+    event_data = ""
+    async for line_in_bytes in response.content:
+        line = line_in_bytes.decode("utf8")
+        line = line.rstrip("\n").rstrip("\r")
+        if line == "":
+            if event_data != "":
+                orjson.loads(event_data.rstrip("\n"))
+                count += 1
+            event_data = ""
+            continue
+        if line[0] == ":":
+            continue
+        if ":" in line:
+            fields = line.split(":", 1)
+            field_name = fields[0]
+            field_value = fields[1].lstrip(" ")
+        else:
+            field_name, field_value = line, ""
+        if field_name == "data":
+            event_data += field_value
+            event_data += "\n"
+    return count
+
+
+async def _consume_sse_parser(response: _FakeResponse) -> int:
+    count = 0
+    async with EventSource(response=response) as event_source:  # type: ignore
+        async for event in event_source:
+            orjson.loads(event.data)
+            count += 1
+    return count
+
+
+async def _run(
+    consume: Callable[[_FakeResponse], "asyncio.Future[int]"],
+    stream: bytes,
+    num_streams: int,
+    chunk_size: int,
+) -> float:
+    chunks = _split(stream, chunk_size)
+    responses = [_FakeResponse(chunks) for _ in range(num_streams)]
+    start = time.perf_counter()
+    feeders = [asyncio.create_task(response.feed()) for response in responses]
+    counts = await asyncio.gather(*(consume(response) for response in responses))
+    await asyncio.gather(*feeders)
+    elapsed = time.perf_counter() - start
+    return sum(counts) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-streams", type=int, default=200)
+    parser.add_argument("--tokens-per-stream", type=int, default=500)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=256,
+        help="Size in bytes of the chunks that arrive off the socket.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stream = _make_stream(args.tokens_per_stream)
+    for name, consume in [
+        ("line-based str parsing", _consume_line_based),
+        ("bytes-level SSEParser", _consume_sse_parser),
+    ]:
+        best = max(
+            asyncio.run(_run(consume, stream, args.num_streams, args.chunk_size))  # type: ignore
+            for _ in range(args.repeat)
+        )
+        print(f"{name:>24}: {best:,.0f} tokens/sec")
+
+
+if __name__ == "__main__":
+    main()
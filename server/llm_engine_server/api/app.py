@@ -1,6 +1,10 @@
 from fastapi import FastAPI, Response
 from llm_engine_server.api.batch_jobs_v1 import batch_job_router_v1
-from llm_engine_server.api.dependencies import get_or_create_aioredis_pool
+from llm_engine_server.api.dependencies import (
+    get_or_create_aioredis_pool,
+    start_model_endpoint_record_cache_listener,
+    stop_model_endpoint_record_cache_listener,
+)
 from llm_engine_server.api.docker_image_batch_job_bundles_v1 import (
     docker_image_batch_job_bundle_router_v1,
 )
@@ -10,6 +14,10 @@ from llm_engine_server.api.model_bundles_v2 import model_bundle_router_v2
 from llm_engine_server.api.model_endpoints_docs_v1 import model_endpoints_docs_router_v1
 from llm_engine_server.api.model_endpoints_v1 import model_endpoint_router_v1
 from llm_engine_server.api.tasks_v1 import inference_task_router_v1
+from llm_engine_server.db.base import set_engine_monitoring_metrics_gateway
+from llm_engine_server.infra.gateways.datadog_monitoring_metrics_gateway import (
+    DatadogMonitoringMetricsGateway,
+)
 
 app = FastAPI(title="llm_engine", version="1.0.0", redoc_url="/api")
 
@@ -28,6 +36,21 @@ def load_redis():
     get_or_create_aioredis_pool()
 
 
+@app.on_event("startup")
+def instrument_db_engines():
+    set_engine_monitoring_metrics_gateway(DatadogMonitoringMetricsGateway())
+
+
+@app.on_event("startup")
+async def start_cache_invalidation_listener():
+    start_model_endpoint_record_cache_listener()
+
+
+@app.on_event("shutdown")
+async def stop_cache_invalidation_listener():
+    stop_model_endpoint_record_cache_listener()
+
+
 @app.get("/healthcheck")
 @app.get("/healthz")
 @app.get("/readyz")
@@ -11,6 +11,7 @@ from llm_engine_server.common.dtos.model_endpoints import BrokerType
 from llm_engine_server.common.env_vars import CIRCLECI
 from llm_engine_server.core.auth.authentication_repository import AuthenticationRepository, User
 from llm_engine_server.core.auth.fake_authentication_repository import FakeAuthenticationRepository
+from llm_engine_server.core.celery.app import get_redis_endpoint, get_redis_host_port
 from llm_engine_server.db.base import SessionAsync, SessionReadOnlyAsync
 from llm_engine_server.domain.gateways import (
     DockerImageBatchJobGateway,
@@ -39,6 +40,7 @@ from llm_engine_server.infra.gateways import (
     LiveStreamingModelEndpointInferenceGateway,
     LiveSyncModelEndpointInferenceGateway,
     ModelEndpointInfraGateway,
+    RedisTaskCompletionGateway,
     S3FilesystemGateway,
 )
 from llm_engine_server.infra.gateways.fake_model_primitive_gateway import FakeModelPrimitiveGateway
@@ -66,6 +68,9 @@ from llm_engine_server.infra.repositories import (
     RedisModelEndpointCacheRepository,
     S3FileLLMFineTuningJobRepository,
 )
+from llm_engine_server.infra.repositories.db_model_endpoint_record_repository import (
+    cache as model_endpoint_record_cache,
+)
 from llm_engine_server.infra.services import (
     DockerImageBatchJobLLMFineTuningService,
     LiveBatchJobService,
@@ -113,10 +118,12 @@ def _get_external_interfaces(
     redis_24h_task_queue_gateway = CeleryTaskQueueGateway(broker_type=BrokerType.REDIS_24H)
     sqs_task_queue_gateway = CeleryTaskQueueGateway(broker_type=BrokerType.SQS)
     monitoring_metrics_gateway = FakeMonitoringMetricsGateway()
+    redis_client = aioredis.Redis(connection_pool=get_or_create_aioredis_pool())
     model_endpoint_record_repo = DbModelEndpointRecordRepository(
         monitoring_metrics_gateway=monitoring_metrics_gateway,
         session=session,
         read_only=read_only,
+        redis_client=redis_client,
     )
 
     sqs_delegate: SQSEndpointResourceDelegate
@@ -131,7 +138,6 @@ def _get_external_interfaces(
         sqs_task_queue_gateway if not CIRCLECI else redis_24h_task_queue_gateway
     )
     resource_gateway = LiveEndpointResourceGateway(sqs_delegate=sqs_delegate)
-    redis_client = aioredis.Redis(connection_pool=get_or_create_aioredis_pool())
     model_endpoint_cache_repo = RedisModelEndpointCacheRepository(
         redis_client=redis_client,
     )
@@ -140,7 +146,8 @@ def _get_external_interfaces(
         task_queue_gateway=redis_task_queue_gateway,
     )
     async_model_endpoint_inference_gateway = LiveAsyncModelEndpointInferenceGateway(
-        task_queue_gateway=inference_task_queue_gateway
+        task_queue_gateway=inference_task_queue_gateway,
+        task_completion_gateway=get_or_create_task_completion_gateway(),
     )
     # In CircleCI, we cannot use asyncio because aiohttp cannot connect to the sync endpoints.
     sync_model_endpoint_inference_gateway = LiveSyncModelEndpointInferenceGateway(
@@ -278,3 +285,51 @@ def get_or_create_aioredis_pool() -> aioredis.ConnectionPool:
     if _pool is None:
         _pool = aioredis.BlockingConnectionPool.from_url(hmi_config.cache_redis_url)
     return _pool
+
+
+_model_endpoint_record_cache_listener: Optional[asyncio.Task] = None
+
+
+def start_model_endpoint_record_cache_listener() -> None:
+    """
+    Starts applying the model endpoint record cache invalidations of the other replicas. Must be
+    called from the event loop of the server.
+    """
+    global _model_endpoint_record_cache_listener
+
+    if (
+        _model_endpoint_record_cache_listener is None
+        or _model_endpoint_record_cache_listener.done()
+    ):
+        redis_client = aioredis.Redis(connection_pool=get_or_create_aioredis_pool())
+        _model_endpoint_record_cache_listener = asyncio.create_task(
+            model_endpoint_record_cache.listen_for_invalidations(redis_client)
+        )
+
+
+def stop_model_endpoint_record_cache_listener() -> None:
+    global _model_endpoint_record_cache_listener
+
+    if _model_endpoint_record_cache_listener is not None:
+        _model_endpoint_record_cache_listener.cancel()
+        _model_endpoint_record_cache_listener = None
+
+
+_task_completion_gateway: Optional[RedisTaskCompletionGateway] = None
+_task_completion_gateway_created = False
+
+
+def get_or_create_task_completion_gateway() -> Optional[RedisTaskCompletionGateway]:
+    """
+    Returns the gateway to the task completion notifications, or None if Redis isn't configured,
+    in which case waiting for tasks polls their status instead.
+    """
+    global _task_completion_gateway, _task_completion_gateway_created
+
+    if not _task_completion_gateway_created:
+        _task_completion_gateway_created = True
+        host, _ = get_redis_host_port()
+        if host is not None:
+            # Async inference workers publish task completions to the Redis of the Celery broker.
+            _task_completion_gateway = RedisTaskCompletionGateway(redis_url=get_redis_endpoint())
+    return _task_completion_gateway
@@ -12,6 +12,8 @@ from llm_engine_server.api.dependencies import (
 from llm_engine_server.common.datadog_utils import add_trace_resource_name
 from llm_engine_server.common.dtos.llms import (
     CancelFineTuneJobResponse,
+    CompletionBatchStreamV1Request,
+    CompletionBatchStreamV1Response,
     CompletionStreamV1Request,
     CompletionStreamV1Response,
     CompletionSyncV1Request,
@@ -27,6 +29,7 @@ from llm_engine_server.common.dtos.llms import (
 )
 from llm_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
 from llm_engine_server.common.dtos.tasks import TaskStatus
+from llm_engine_server.common.pagination import MAX_PAGE_SIZE
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
     ObjectAlreadyExistsException,
@@ -51,6 +54,7 @@ from llm_engine_server.domain.use_cases.llm_fine_tuning_use_cases import (
     ListFineTuneJobV1UseCase,
 )
 from llm_engine_server.domain.use_cases.llm_model_endpoint_use_cases import (
+    CompletionBatchStreamV1UseCase,
     CompletionStreamV1UseCase,
     CompletionSyncV1UseCase,
     CreateLLMModelEndpointV1UseCase,
@@ -120,6 +124,8 @@ async def create_model_endpoint(
 async def list_model_endpoints(
     name: Optional[str] = Query(default=None),
     order_by: Optional[ModelEndpointOrderBy] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    page_token: Optional[str] = Query(default=None),
     auth: User = Depends(verify_authentication),
     external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
 ) -> ListLLMModelEndpointsV1Response:
@@ -127,11 +133,19 @@ async def list_model_endpoints(
     Lists the LLM model endpoints owned by the current owner, plus all public_inference LLMs.
     """
     add_trace_resource_name("llm_model_endpoints_get")
-    logger.info(f"GET /llm/model-endpoints?name={name}&order_by={order_by} for {auth}")
+    logger.info(
+        f"GET /llm/model-endpoints?name={name}&order_by={order_by}&limit={limit}"
+        f"&page_token={page_token} for {auth}"
+    )
     use_case = ListLLMModelEndpointsV1UseCase(
         llm_model_endpoint_service=external_interfaces.llm_model_endpoint_service,
     )
-    return await use_case.execute(user=auth, name=name, order_by=order_by)
+    try:
+        return await use_case.execute(
+            user=auth, name=name, order_by=order_by, limit=limit, page_token=page_token
+        )
+    except ObjectHasInvalidValueException as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @llm_router_v1.get(
@@ -252,6 +266,52 @@ async def create_completion_stream_task(
         ) from exc
 
 
+@llm_router_v1.post("/completions-batch-stream", response_model=CompletionBatchStreamV1Response)
+async def create_completion_batch_stream_task(
+    model_endpoint_name: str,
+    request: CompletionBatchStreamV1Request,
+    auth: User = Depends(verify_authentication),
+    external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
+) -> EventSourceResponse:
+    """
+    Runs stream prompt completions for several prompts on an LLM, interleaving the tokens of all
+    prompts onto one stream. Each event carries the index of the prompt it belongs to.
+    """
+    add_trace_resource_name("llm_completion_batch_stream_post")
+    logger.info(
+        f"POST /completion_batch_stream with {request} to endpoint {model_endpoint_name} for {auth}"
+    )
+    try:
+        use_case = CompletionBatchStreamV1UseCase(
+            completion_stream_use_case=CompletionStreamV1UseCase(
+                model_endpoint_service=external_interfaces.model_endpoint_service,
+                llm_model_endpoint_service=external_interfaces.llm_model_endpoint_service,
+            ),
+        )
+        # The endpoint is resolved before streaming starts, so that its errors get a status code.
+        response = await use_case.execute(
+            user=auth, model_endpoint_name=model_endpoint_name, request=request
+        )
+
+        async def event_generator():
+            async for message in response:
+                yield {"data": message.json()}
+
+        return EventSourceResponse(event_generator())
+    except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
+        raise HTTPException(
+            status_code=404,
+            detail="The specified endpoint could not be found.",
+        ) from exc
+    except ObjectHasInvalidValueException as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except EndpointUnsupportedInferenceTypeException as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported inference type: {str(exc)}",
+        ) from exc
+
+
 @llm_router_v1.post("/fine-tunes", response_model=CreateFineTuneJobResponse)
 async def create_fine_tune_job(
     request: CreateFineTuneJobRequest,
@@ -18,6 +18,7 @@ from llm_engine_server.common.dtos.model_bundles import (
     ModelBundleOrderBy,
     ModelBundleV2Response,
 )
+from llm_engine_server.common.pagination import MAX_PAGE_SIZE
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
     DockerImageNotFoundException,
@@ -101,6 +102,8 @@ async def clone_model_bundle_with_changes(
 async def list_model_bundles(
     model_name: Optional[str] = Query(default=None),
     order_by: Optional[ModelBundleOrderBy] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    page_token: Optional[str] = Query(default=None),
     auth: User = Depends(verify_authentication),
     external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
 ) -> ListModelBundlesV2Response:
@@ -108,11 +111,23 @@ async def list_model_bundles(
     Lists the ModelBundles owned by the current owner.
     """
     add_trace_resource_name("model_bundles_get")
-    logger.info(f"GET /model-bundles?model_name={model_name}&order_by={order_by} for {auth}")
+    logger.info(
+        f"GET /model-bundles?model_name={model_name}&order_by={order_by}&limit={limit}"
+        f"&page_token={page_token} for {auth}"
+    )
     use_case = ListModelBundlesV2UseCase(
         model_bundle_repository=external_interfaces.model_bundle_repository
     )
-    return await use_case.execute(user=auth, model_name=model_name, order_by=order_by)
+    try:
+        return await use_case.execute(
+            user=auth,
+            model_name=model_name,
+            order_by=order_by,
+            limit=limit,
+            page_token=page_token,
+        )
+    except ObjectHasInvalidValueException as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @model_bundle_router_v2.get("/model-bundles/latest", response_model=ModelBundleV2Response)
@@ -23,6 +23,7 @@ from llm_engine_server.common.dtos.model_endpoints import (
     UpdateModelEndpointV1Request,
     UpdateModelEndpointV1Response,
 )
+from llm_engine_server.common.pagination import MAX_PAGE_SIZE
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
     ObjectAlreadyExistsException,
@@ -100,6 +101,8 @@ async def create_model_endpoint(
 async def list_model_endpoints(
     name: Optional[str] = Query(default=None),
     order_by: Optional[ModelEndpointOrderBy] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    page_token: Optional[str] = Query(default=None),
     auth: User = Depends(verify_authentication),
     external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
 ) -> ListModelEndpointsV1Response:
@@ -107,11 +110,19 @@ async def list_model_endpoints(
     Lists the Models owned by the current owner.
     """
     add_trace_resource_name("model_endpoints_get")
-    logger.info(f"GET /model-endpoints?name={name}&order_by={order_by} for {auth}")
+    logger.info(
+        f"GET /model-endpoints?name={name}&order_by={order_by}&limit={limit}"
+        f"&page_token={page_token} for {auth}"
+    )
     use_case = ListModelEndpointsV1UseCase(
         model_endpoint_service=external_interfaces.model_endpoint_service,
     )
-    return await use_case.execute(user=auth, name=name, order_by=order_by)
+    try:
+        return await use_case.execute(
+            user=auth, name=name, order_by=order_by, limit=limit, page_token=page_token
+        )
+    except ObjectHasInvalidValueException as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @model_endpoint_router_v1.get(
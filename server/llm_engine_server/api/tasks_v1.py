@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from llm_engine_server.api.dependencies import (
     ExternalInterfaces,
     get_external_interfaces_read_only,
@@ -6,8 +6,11 @@ from llm_engine_server.api.dependencies import (
 )
 from llm_engine_server.common.datadog_utils import add_trace_resource_name
 from llm_engine_server.common.dtos.tasks import (
+    MAX_ASYNC_TASK_WAIT_SECONDS,
     CreateAsyncTaskV1Response,
     EndpointPredictV1Request,
+    GetAsyncTasksStatusV1Request,
+    GetAsyncTasksStatusV1Response,
     GetAsyncTaskV1Response,
     SyncEndpointPredictV1Response,
     TaskStatus,
@@ -20,11 +23,15 @@ from llm_engine_server.core.domain_exceptions import (
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
 from llm_engine_server.domain.exceptions import (
     EndpointUnsupportedInferenceTypeException,
+    TooManyRequestsException,
     UpstreamServiceError,
 )
 from llm_engine_server.domain.use_cases.async_inference_use_cases import (
     CreateAsyncInferenceTaskV1UseCase,
+    GetAsyncInferenceTasksStatusV1UseCase,
     GetAsyncInferenceTaskV1UseCase,
+    StreamAsyncInferenceTaskV1UseCase,
+    WaitForAsyncInferenceTaskV1UseCase,
 )
 from llm_engine_server.domain.use_cases.streaming_inference_use_cases import (
     CreateStreamingInferenceTaskV1UseCase,
@@ -33,6 +40,7 @@ from llm_engine_server.domain.use_cases.sync_inference_use_cases import (
     CreateSyncInferenceTaskV1UseCase,
 )
 from sse_starlette.sse import EventSourceResponse
+from starlette.concurrency import run_in_threadpool
 
 inference_task_router_v1 = APIRouter(prefix="/v1")
 logger = make_logger(filename_wo_ext(__name__))
@@ -67,11 +75,19 @@ async def create_async_inference_task(
             status_code=400,
             detail=f"Unsupported inference type: {str(exc)}",
         ) from exc
+    except TooManyRequestsException as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
 
 
 @inference_task_router_v1.get("/async-tasks/{task_id}", response_model=GetAsyncTaskV1Response)
-def get_async_inference_task(
+async def get_async_inference_task(
     task_id: str,
+    wait_seconds: float = Query(
+        default=0,
+        ge=0,
+        le=MAX_ASYNC_TASK_WAIT_SECONDS,
+        description="If set, waits up to this many seconds for the task to finish before responding.",
+    ),
     auth: User = Depends(verify_authentication),
     external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
 ) -> GetAsyncTaskV1Response:
@@ -79,12 +95,19 @@ def get_async_inference_task(
     Gets the status of an async inference task.
     """
     add_trace_resource_name("task_async_id_get")
-    logger.info(f"GET /async-tasks/{task_id} for {auth}")
+    logger.info(f"GET /async-tasks/{task_id} with wait_seconds={wait_seconds} for {auth}")
     try:
+        if wait_seconds > 0:
+            wait_use_case = WaitForAsyncInferenceTaskV1UseCase(
+                model_endpoint_service=external_interfaces.model_endpoint_service,
+            )
+            return await wait_use_case.execute(
+                user=auth, task_id=task_id, wait_seconds=wait_seconds
+            )
         use_case = GetAsyncInferenceTaskV1UseCase(
             model_endpoint_service=external_interfaces.model_endpoint_service,
         )
-        return use_case.execute(user=auth, task_id=task_id)
+        return await run_in_threadpool(use_case.execute, user=auth, task_id=task_id)
     except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
         raise HTTPException(
             status_code=404,
@@ -92,6 +115,56 @@ def get_async_inference_task(
         ) from exc
 
 
+@inference_task_router_v1.get("/async-tasks/{task_id}/events")
+async def get_async_inference_task_events(
+    task_id: str,
+    auth: User = Depends(verify_authentication),
+    external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
+) -> EventSourceResponse:
+    """
+    Streams the status of an async inference task as server-sent events, until it finishes.
+    """
+    add_trace_resource_name("task_async_id_events_get")
+    logger.info(f"GET /async-tasks/{task_id}/events for {auth}")
+    use_case = StreamAsyncInferenceTaskV1UseCase(
+        model_endpoint_service=external_interfaces.model_endpoint_service,
+    )
+    response = use_case.execute(user=auth, task_id=task_id)
+
+    async def event_generator():
+        async for message in response:
+            yield {"data": message.json()}
+
+    return EventSourceResponse(event_generator())
+
+
+@inference_task_router_v1.post(
+    "/async-tasks/status",
+    response_model=GetAsyncTasksStatusV1Response,
+    response_model_exclude_none=True,
+)
+def get_async_inference_tasks_status(
+    request: GetAsyncTasksStatusV1Request,
+    auth: User = Depends(verify_authentication),
+    external_interfaces: ExternalInterfaces = Depends(get_external_interfaces_read_only),
+) -> GetAsyncTasksStatusV1Response:
+    """
+    Gets the statuses of many async inference tasks at once.
+    """
+    add_trace_resource_name("task_async_status_post")
+    logger.info(f"POST /async-tasks/status for {len(request.task_ids)} tasks for {auth}")
+    try:
+        use_case = GetAsyncInferenceTasksStatusV1UseCase(
+            model_endpoint_service=external_interfaces.model_endpoint_service,
+        )
+        return use_case.execute(user=auth, request=request)
+    except (ObjectNotFoundException, ObjectNotAuthorizedException) as exc:
+        raise HTTPException(
+            status_code=404,
+            detail="The specified tasks could not be found.",
+        ) from exc
+
+
 @inference_task_router_v1.post("/sync-tasks", response_model=SyncEndpointPredictV1Response)
 async def create_sync_inference_task(
     model_endpoint_id: str,
@@ -2,9 +2,9 @@
 # This file loads sensitive data that shouldn't make it to inference docker images
 # Do not include this file in our inference/endpoint code
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Dict, Sequence
 
 import yaml
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
@@ -36,6 +36,9 @@ class HostedModelInferenceServiceConfig:
     sqs_queue_tag_template: str
     s3_file_llm_fine_tuning_job_repository: str
     datadog_trace_enabled: str
+    # Connection pool settings of the DB engines, by process role and engine name. See
+    # llm_engine_server.db.base.get_engine_config.
+    db_engine_configs: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
 
     @classmethod
     def from_yaml(cls, yaml_path):
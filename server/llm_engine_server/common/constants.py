@@ -3,6 +3,10 @@ from pathlib import Path
 CALLBACK_POST_INFERENCE_HOOK: str = "callback"
 READYZ_FPATH: str = "/tmp/readyz"
 DEFAULT_CELERY_TASK_NAME: str = "llm_engine_server.inference.async_inference.tasks.predict"
+ASYNC_TASK_COMPLETION_CHANNEL_PREFIX: str = "llm-engine-async-task-completion:"
+MODEL_ENDPOINT_RECORD_CACHE_INVALIDATION_CHANNEL: str = (
+    "llm-engine-endpoint-record-cache-invalidation"
+)
 LIRA_CELERY_TASK_NAME: str = "llm_engine_server.inference.celery_service.exec_func"  # TODO: FIXME
 
 PROJECT_ROOT: Path = Path(__file__).parents[2].absolute()
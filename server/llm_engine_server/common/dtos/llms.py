@@ -22,6 +22,8 @@ from pydantic import BaseModel, Field, HttpUrl
 
 from .tasks import TaskStatus
 
+MAX_COMPLETION_BATCH_STREAM_PROMPTS = 32
+
 
 class CreateLLMModelEndpointV1Request(BaseModel):
     name: str
@@ -89,6 +91,7 @@ class GetLLMModelEndpointV1Response(BaseModel):
 
 class ListLLMModelEndpointsV1Response(BaseModel):
     model_endpoints: List[GetLLMModelEndpointV1Response]
+    next_page_token: Optional[str] = None
 
 
 # Delete and update use the default LLMEngine endpoint APIs.
@@ -145,6 +148,29 @@ class CompletionStreamV1Response(BaseModel):
     traceback: Optional[str] = None
 
 
+class CompletionBatchStreamV1Request(BaseModel):
+    """
+    Request object for a stream prompt completion task over several prompts, whose tokens are
+    multiplexed onto a single stream.
+    """
+
+    prompts: List[str] = Field(min_items=1, max_items=MAX_COMPLETION_BATCH_STREAM_PROMPTS)
+    max_new_tokens: int
+    temperature: float = Field(gt=0, le=100)
+
+
+class CompletionBatchStreamV1Response(BaseModel):
+    """
+    Response object for a stream prompt completion task over several prompts. Each event is
+    tagged with the index of the prompt in the request that it belongs to.
+    """
+
+    prompt_index: int
+    status: TaskStatus
+    output: Optional[CompletionStreamOutput] = None
+    traceback: Optional[str] = None
+
+
 class CreateFineTuneJobRequest(BaseModel):
     training_file: str
     validation_file: str
@@ -84,6 +84,7 @@ class ListModelBundlesV1Response(BaseModel):
     """
 
     model_bundles: List[ModelBundleV1Response]
+    next_page_token: Optional[str] = None
 
 
 class CreateModelBundleV2Request(BaseModel):
@@ -149,6 +150,7 @@ class ListModelBundlesV2Response(BaseModel):
     """
 
     model_bundles: List[ModelBundleV2Response]
+    next_page_token: Optional[str] = None
 
 
 class ModelBundleOrderBy(str, Enum):
@@ -122,6 +122,7 @@ class GetModelEndpointV1Response(BaseModel):
 
 class ListModelEndpointsV1Response(BaseModel):
     model_endpoints: List[GetModelEndpointV1Response]
+    next_page_token: Optional[str] = None
 
 
 class DeleteModelEndpointV1Response(BaseModel):
@@ -3,10 +3,13 @@ DTOs for the task abstraction.
 """
 
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from llm_engine_server.domain.entities import CallbackAuth
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+MAX_ASYNC_TASK_STATUS_BATCH_SIZE = 1000
+MAX_ASYNC_TASK_WAIT_SECONDS = 60
 
 
 class ResponseSchema(BaseModel):
@@ -36,6 +39,18 @@ class GetAsyncTaskV1Response(BaseModel):
     traceback: Optional[str] = None
 
 
+class GetAsyncTasksStatusV1Request(BaseModel):
+    task_ids: List[str] = Field(..., max_items=MAX_ASYNC_TASK_STATUS_BATCH_SIZE)
+    include_results: bool = False
+    """
+    Whether to return the results and tracebacks of finished tasks, rather than only their statuses.
+    """
+
+
+class GetAsyncTasksStatusV1Response(BaseModel):
+    tasks: List[GetAsyncTaskV1Response]
+
+
 class SyncEndpointPredictV1Response(BaseModel):
     status: TaskStatus
     result: Optional[Any] = None
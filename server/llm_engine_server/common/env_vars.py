@@ -8,6 +8,8 @@ from llm_engine_server.common.constants import PROJECT_ROOT
 from llm_engine_server.core.loggers import logger_name, make_logger
 
 __all__: Sequence[str] = (
+    "CELERY_PUBLISHER_MAX_PENDING",
+    "CELERY_PUBLISHER_POOL_SIZE",
     "CIRCLECI",
     "LLM_ENGINE_SERVICE_TEMPLATE_CONFIG_MAP_PATH",
     "LLM_ENGINE_SERVICE_TEMPLATE_FOLDER",
@@ -63,5 +65,14 @@ LLM_ENGINE_SERVICE_TEMPLATE_FOLDER: Optional[str] = os.environ.get(
 LLM_ENGINE_SERVICE_TEMPLATE_CONFIG_MAP_PATH.
 """
 
+CELERY_PUBLISHER_POOL_SIZE: int = int(os.environ.get("CELERY_PUBLISHER_POOL_SIZE", "10"))
+"""The number of threads publishing async inference tasks to the Celery broker.
+"""
+
+CELERY_PUBLISHER_MAX_PENDING: int = int(os.environ.get("CELERY_PUBLISHER_MAX_PENDING", "1000"))
+"""The maximum number of async inference tasks being or waiting to be published to the Celery broker.
+Tasks beyond that are rejected, so that a stalled broker doesn't buffer them without limit.
+"""
+
 if LOCAL:
     logger.warning("LOCAL development & testing mode is ON")
@@ -0,0 +1,37 @@
+"""
+Keyset pagination of the list APIs.
+
+A page token points at the last item of the previous page, by its creation time and ID, so that
+the next page can be selected with an indexed range scan rather than an OFFSET.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from llm_engine_server.core.domain_exceptions import ObjectHasInvalidValueException
+
+MAX_PAGE_SIZE = 1000
+
+
+def encode_page_token(created_at: datetime, id: str) -> str:
+    payload = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_page_token(page_token: str) -> Tuple[datetime, str]:
+    try:
+        created_at, id = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+        return datetime.fromisoformat(created_at), str(id)
+    except (ValueError, TypeError) as exc:
+        raise ObjectHasInvalidValueException(f"Invalid page token: {page_token}") from exc
+
+
+def get_next_page_token(items: Sequence[Any], limit: Optional[int]) -> Optional[str]:
+    """
+    Returns the token of the page that follows `items`, which have `created_at` and `id`
+    attributes, or None if `items` is the last page.
+    """
+    if limit is None or len(items) < limit:
+        return None
+    return encode_page_token(items[-1].created_at, items[-1].id)
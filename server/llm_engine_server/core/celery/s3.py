@@ -2,6 +2,7 @@
 copied from https://github.com/celery/celery/blob/81df81acf8605ba3802810c7901be7d905c5200b/celery/backends/s3.py"""
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import tenacity
 from celery.backends.base import KeyValueStoreBackend
@@ -10,11 +11,17 @@ from kombu.utils.encoding import bytes_to_str
 
 try:
     import botocore
+    from botocore.config import Config
 except ImportError:
     botocore = None
 
 __all__ = ("S3Backend",)
 
+# Max number of concurrent GETs issued by S3Backend.mget, shared by all the calls of a process.
+MGET_MAX_WORKERS = 32
+
+_mget_executor = ThreadPoolExecutor(max_workers=MGET_MAX_WORKERS, thread_name_prefix="s3-mget")
+
 
 class S3Backend(KeyValueStoreBackend):
     """An S3 task result store.
@@ -50,6 +57,9 @@ class S3Backend(KeyValueStoreBackend):
 
         self._s3_resource_per_thread = {}  # thread identifier: s3 resource
         self._s3_resource_dict_lock = threading.Lock()  # might not be necessary but it's insurance
+        # Unlike resources, clients are thread-safe, so mget's threads all share this one.
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
 
     def _get_s3_object(self, key):
         current_thread = threading.get_ident()
@@ -91,6 +101,22 @@ class S3Backend(KeyValueStoreBackend):
         session = self.boto3_session
         return session.resource("s3", endpoint_url=self.endpoint_url)
 
+    # Same issue as above
+    @tenacity.retry(stop=tenacity.stop_after_attempt(10), reraise=True)
+    def _connect_to_s3_client(self):
+        session = self.boto3_session
+        return session.client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            config=Config(max_pool_connections=MGET_MAX_WORKERS),
+        )
+
+    def _get_s3_client(self):
+        with self._s3_client_lock:
+            if self._s3_client is None:
+                self._s3_client = self._connect_to_s3_client()
+            return self._s3_client
+
     # Same issue as above
     @tenacity.retry(stop=tenacity.stop_after_attempt(20), reraise=True)
     def _get_credentials(self):
@@ -103,4 +129,21 @@ class S3Backend(KeyValueStoreBackend):
         raise NotImplementedError
 
     def mget(self, keys):
-        raise NotImplementedError
+        # S3 has no batched read, so issue the GETs in parallel. Returns the values in the order of
+        # keys, with None for keys that don't exist, like the Redis backend's MGET.
+        if len(keys) <= 1:
+            return [self.get(key) for key in keys]
+        s3_client = self._get_s3_client()
+        return list(_mget_executor.map(lambda key: self._get_with_client(s3_client, key), keys))
+
+    def _get_with_client(self, s3_client, key):
+        key = bytes_to_str(key)
+        key_bucket_path = self.base_path + key if self.base_path else key
+        try:
+            data = s3_client.get_object(Bucket=self.bucket_name, Key=key_bucket_path)["Body"].read()
+            return data if self.content_encoding == "binary" else data.decode("utf-8")
+        except botocore.exceptions.ClientError as error:
+            # Same as in get, but GetObject reports errors by name rather than by status code.
+            if error.response["Error"]["Code"] in ["403", "404", "AccessDenied", "NoSuchKey"]:
+                return None
+            raise error
@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
+import aioboto3
 import boto3
 from llm_engine_server.core.config import ml_infra_config
 from llm_engine_server.core.utils.git import tag
@@ -84,6 +85,58 @@ def image_exists(
     )
 
 
+async def image_exists_async(
+    *,
+    region_name: str = ml_infra_config().default_region,
+    repository_name: str,
+    image_tag: str,
+    filter: Optional[Dict[str, str]] = None,  # pylint:disable=redefined-builtin
+    aws_profile: Optional[str] = None,
+) -> bool:
+    """Like `image_exists`, but with an async ECR client, so that it doesn't block the event loop."""
+    if filter is None:
+        filter = DEFAULT_FILTER
+
+    session = aioboto3.Session(profile_name=aws_profile)
+    async with session.client("ecr", region_name=region_name) as client:
+        try:
+            await client.describe_images(
+                registryId=ml_infra_config().ml_account_id,
+                repositoryName=repository_name,
+                imageIds=[{"imageTag": image_tag}],
+                filter=filter,
+            )
+        except client.exceptions.ImageNotFoundException:
+            return False
+
+    return True
+
+
+def list_image_tags(
+    *,
+    region_name: str = ml_infra_config().default_region,
+    repository_name: str,
+    aws_profile: Optional[str] = None,
+) -> Set[str]:
+    """Returns the tags of all the images in a repository, or an empty set if it doesn't exist."""
+    if aws_profile is None:
+        client = boto3.client("ecr", region_name=region_name)
+    else:
+        session = boto3.Session(profile_name=aws_profile)
+        client = session.client("ecr", region_name=region_name)
+    image_tags: Set[str] = set()
+    try:
+        for page in client.get_paginator("list_images").paginate(
+            registryId=ml_infra_config().ml_account_id,
+            repositoryName=repository_name,
+            filter=DEFAULT_FILTER,
+        ):
+            image_tags.update(image_id["imageTag"] for image_id in page["imageIds"])
+    except client.exceptions.RepositoryNotFoundException:
+        pass
+    return image_tags
+
+
 def ecr_exists_for_repo(repo_name: str, image_tag: Optional[str] = None):
     """Check if image exists in ECR"""
     if image_tag is None:
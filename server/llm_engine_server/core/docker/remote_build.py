@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import json
 import os
 import shutil
@@ -7,10 +9,11 @@ import uuid
 from base64 import b64encode
 from contextlib import ExitStack
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from string import Template
 from subprocess import PIPE
-from typing import Dict, Iterable, List, Optional, Union
+from typing import IO, Dict, Iterable, List, Optional, Union
 
 import click
 import tenacity
@@ -20,6 +23,10 @@ from kubernetes import client
 from kubernetes import config as kube_config
 from kubernetes import watch
 from kubernetes.config.config_exception import ConfigException
+from kubernetes_asyncio import client as kube_client_async
+from kubernetes_asyncio import config as kube_config_async
+from kubernetes_asyncio import watch as kube_watch_async
+from kubernetes_asyncio.config import ConfigException as AsyncConfigException
 from llm_engine_server.core.aws import storage_client
 from llm_engine_server.core.config import ml_infra_config
 from llm_engine_server.core.loggers import logger_name, make_logger
@@ -39,6 +46,12 @@ NAMESPACE = "default"
 
 TIMEOUT_SECS = 1800
 
+# Every file in a docker context archive gets the same owner and modification time, so that the
+# archive, and thus its content hash, only depends on the contents of the files. The time is after
+# 1980, since e.g. zip files (and thus wheels built from the context) can't hold earlier times.
+CONTEXT_ARCHIVE_MTIME = "@946684800"
+CONTEXT_ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class BuildResult:
@@ -50,49 +63,58 @@ class BuildResult:
     logs: str
 
 
-def zip_context(
-    s3_file_name: str,
+def upload_context(
     context: str,
     folders_to_include: List[str],
     ignore_file: Optional[str] = None,
-) -> None:
+) -> str:
     """
-    Takes a path to a folder, zips up the folder and sticks it into s3
+    Archives a docker context and uploads it to s3, named after the hash of its contents. An
+    archive that is already in s3 isn't uploaded again, so rebuilding from an unchanged context
+    only costs archiving it locally.
 
-    :param s3_file_name: Bucket/file for context tar.gz, will upload to here
     :param context: Path to context for dockerfile, relative to calling script, i.e. box_detection/ or scaleml/ if you're running from models/
     :param folders_to_include: List of paths to subfolders needed to build docker image, relative to context
-    :param ignore_file: File (e.g. .dockerignore) containing things to ignore when preparing docker context.
-        Relative to context. Contents of file are parsed according to tar's --exclude-from, which differs slightly from
-        docker's behavior
-    :return:
+    :param ignore_file: File (e.g. .dockerignore) containing things to ignore, relative to context
+    :return: The s3 file name of the archive, within S3_BUCKET
     """
-
-    assert len(folders_to_include) > 0
-    assert s3_file_name.endswith(".gz")
-    print(f"Uploading to s3 at: {s3_file_name}")
     try:
-        # Need to gimme_okta_aws_creds (you can export AWS_PROFILE='ml-admin' right after)
         tar_command = _build_tar_cmd(context, ignore_file, folders_to_include)
         print(f"Creating archive:   {' '.join(tar_command)}")
-
-        with subprocess.Popen(
-            tar_command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-        ) as proc:
-            assert proc.stdout is not None
-            with storage_client.open(
-                f"s3://{S3_BUCKET}/{s3_file_name}",
-                "wb",
-            ) as out_file:
-                shutil.copyfileobj(proc.stdout, out_file)
+        with tempfile.TemporaryFile() as archive:
+            content_hash = _write_archive(tar_command, archive)
+            s3_file_name = f"{SUB_BUCKET}/{content_hash}.tar.gz"
+            if storage_client.s3_fileobj_exists(bucket=S3_BUCKET, key=s3_file_name):
+                print(f"Reusing context in s3 at: {s3_file_name}")
+                return s3_file_name
+            print(f"Uploading to s3 at: {s3_file_name}")
+            archive.seek(0)
+            with storage_client.open(f"s3://{S3_BUCKET}/{s3_file_name}", "wb") as out_file:
+                shutil.copyfileobj(archive, out_file)
         print("Done uploading!")
+        return s3_file_name
     except (ClientError, ProfileNotFound):
         print("Did you gimme_okta_aws_creds and then export AWS_PROFILE='ml-admin'? Try doing both")
         raise
 
 
+def _write_archive(tar_command: List[str], archive: IO[bytes]) -> str:
+    """Writes the output of the tar command to the archive, and returns its sha256 hex digest."""
+    content_hash = hashlib.sha256()
+    with subprocess.Popen(
+        tar_command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as proc:
+        assert proc.stdout is not None
+        for chunk in iter(partial(proc.stdout.read, CONTEXT_ARCHIVE_CHUNK_SIZE), b""):
+            content_hash.update(chunk)
+            archive.write(chunk)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, tar_command)
+    return content_hash.hexdigest()
+
+
 def _build_tar_cmd(
     context: str, ignore_file: Optional[str], folders_to_include: List[str]
 ) -> List[str]:
@@ -110,6 +132,16 @@ def _build_tar_cmd(
             tar_command.append("--exclude-from")
             tar_command.append(ignore_file)
 
+    tar_command.extend(
+        [
+            "--format=gnu",
+            "--sort=name",
+            f"--mtime={CONTEXT_ARCHIVE_MTIME}",
+            "--owner=0",
+            "--group=0",
+            "--numeric-owner",
+        ]
+    )
     tar_command.append("-cf")
     tar_command.append("-")
     tar_command.extend(folders_to_include)
@@ -284,10 +316,7 @@ def build_remote(
     print(f"Using context:      {calling_path}")
     print(f"Including folders:  {folders_to_include}")
 
-    file_uuid = uuid.uuid4()
-    s3_file_name = f"{SUB_BUCKET}/{file_uuid}.tar.gz"
-    zip_context(
-        s3_file_name,
+    s3_file_name = upload_context(
         context=context,
         folders_to_include=folders_to_include,
         ignore_file=ignore_file,
@@ -416,6 +445,62 @@ def get_pod_status_and_log(job_name: str) -> BuildResult:
     return BuildResult(status=False, logs=_read_pod_logs(pod_name))
 
 
+async def get_pod_status_and_log_async(job_name: str) -> BuildResult:
+    """
+    Like `get_pod_status_and_log`, but watches the pod with an async k8s client, so that waiting
+    for the build doesn't block the event loop. The logs of the pod are read once it's done,
+    rather than streamed.
+
+    :param job_name: Name of k8s job of given pod
+    :return: Whether the pod succeeded, and its logs
+    """
+    try:
+        kube_config_async.load_incluster_config()
+    except AsyncConfigException:
+        print("No cluster config found, using local config")
+        await kube_config_async.load_kube_config()
+
+    async with kube_client_async.ApiClient() as api_client:
+        core_api_instance = kube_client_async.CoreV1Api(api_client)
+
+        @tenacity.retry(
+            wait=tenacity.wait_fixed(5),
+            stop=tenacity.stop_after_attempt(5),
+            retry=tenacity.retry_if_exception_type(ValueError),
+            reraise=True,
+        )
+        async def get_pod_name():
+            pods = (
+                await core_api_instance.list_namespaced_pod(
+                    NAMESPACE, label_selector=f"app={job_name}"
+                )
+            ).items
+            if len(pods) != 1:
+                raise ValueError("No pod created")
+            return pods[0].metadata.name
+
+        pod_name = await get_pod_name()
+
+        succeeded = False
+        async with kube_watch_async.Watch() as watcher:
+            async for event in watcher.stream(
+                core_api_instance.list_namespaced_pod,
+                namespace=NAMESPACE,
+                field_selector=f"metadata.name={pod_name}",
+                timeout_seconds=TIMEOUT_SECS,
+            ):
+                phase = event["object"].status.phase
+                print(f"Pod status: {phase}")
+                if phase in ("Succeeded", "Failed"):
+                    succeeded = phase == "Succeeded"
+                    break
+
+        logs = await core_api_instance.read_namespaced_pod_log(
+            pod_name, NAMESPACE, container="kaniko"
+        )
+    return BuildResult(status=succeeded, logs=logs)
+
+
 def build_remote_block(
     context: str,
     dockerfile: str,
@@ -453,6 +538,39 @@ def build_remote_block(
     return result
 
 
+async def build_remote_block_async(
+    context: str,
+    dockerfile: str,
+    repotags: Union[str, Iterable[str]],
+    folders_to_include: Optional[List[str]] = None,
+    use_cache: bool = True,
+    ignore_file: Optional[str] = None,
+    build_args: Optional[Dict[str, str]] = None,
+    custom_tags: Optional[Dict[str, str]] = None,
+) -> BuildResult:
+    """
+    Like `build_remote_block`, but without blocking the event loop: the docker context is uploaded
+    and the build job is started in a thread, and the build job is then watched asynchronously.
+    See `build_remote_block` for the parameters.
+    """
+    loop = asyncio.get_running_loop()
+    job_name = await loop.run_in_executor(
+        None,
+        partial(
+            build_remote,
+            context,
+            dockerfile,
+            repotags,
+            folders_to_include,
+            use_cache,
+            ignore_file,
+            build_args,
+            custom_tags,
+        ),
+    )
+    return await get_pod_status_and_log_async(job_name)
+
+
 @click.command()
 @click.option(
     "--context",
@@ -1,35 +1,108 @@
 import asyncio
+import contextvars
 import os
 import sys
-from typing import Iterator, Optional
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Type
 
 import sqlalchemy
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
+from llm_engine_server.db.read_replicas import ReadReplicaSet
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+if TYPE_CHECKING:
+    from llm_engine_server.domain.gateways.monitoring_metrics_gateway import (
+        MonitoringMetricsGateway,
+    )
 
 logger = make_logger(filename_wo_ext(__file__))
 
+# Selects the `db_engine_configs` of the service config that apply to this process, e.g. "gateway".
+PROCESS_ROLE_ENV_VAR = "LLM_ENGINE_PROCESS_ROLE"
+DEFAULT_PROCESS_ROLE = "default"
+
+# Comma-separated URLs of the read replicas that the read-only sessions should use. If unset,
+# they use the primary.
+READ_REPLICA_URLS_ENV_VAR = "ML_INFRA_DATABASE_READ_REPLICA_URLS"
+
+# 0 on the primary, and on replicas that have replayed everything they received. NULL on replicas
+# that aren't streaming from the primary, e.g. that lost their connection to it, since they would
+# otherwise look caught up with whatever they last received. Only privileged users see the status
+# of the WAL receiver, others only see whether there is one.
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN NOT EXISTS (
+        SELECT 1 FROM pg_stat_wal_receiver WHERE COALESCE(status, 'streaming') = 'streaming'
+    ) THEN NULL
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+_monitoring_metrics_gateway: Optional["MonitoringMetricsGateway"] = None
+_testing_postgresql: Optional[Any] = None
+_read_replica_set: Optional[ReadReplicaSet] = None
+_read_replica_set_lock = threading.Lock()
+_reads_from_primary: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "reads_from_primary", default=False
+)
+
+
+@dataclass(frozen=True)
+class EngineConfig:
+    """Connection pool settings of an engine. None means SQLAlchemy's default."""
+
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_timeout: Optional[float] = None
+    pool_recycle: int = -1
+    pool_pre_ping: bool = True
+    slow_query_threshold_seconds: float = 1.0
+
+
+DEFAULT_ENGINE_CONFIGS: Dict[str, EngineConfig] = {
+    "sync": EngineConfig(),
+    "sync_read_only": EngineConfig(),
+    "async": EngineConfig(),
+    "async_read_only": EngineConfig(max_overflow=5),
+    "async_null_pool": EngineConfig(),
+}
+
 
 def get_engine_url(env: Optional[str] = None, read_only: bool = True, sync: bool = True) -> str:
-    """Gets the URL of the Postgresql engine depending on the environment."""
+    """
+    Gets the URL of the Postgresql primary depending on the environment. Read-only sessions use the
+    replicas of `get_read_replica_urls` instead, if there are any.
+    """
     if os.getenv("ML_INFRA_DATABASE_URL"):
         # In CircleCI environment, we set up a test in another container and specify the URL.
         engine_url = os.getenv("ML_INFRA_DATABASE_URL")
     else:
         assert "pytest" in sys.modules, "Must specify ML_INFRA_DATABASE_URL or be in a testing env."
         # If we are in a local testing environment, we can set up a test psql instance.
-        # pylint: disable=import-outside-toplevel
-        import testing.postgresql
+        global _testing_postgresql
+        if _testing_postgresql is None:
+            # pylint: disable=import-outside-toplevel
+            import testing.postgresql
 
-        Postgresql = testing.postgresql.PostgresqlFactory(
-            cache_initialized_db=True,
-        )
-        postgresql = Postgresql()
-        engine_url = postgresql.url()
+            Postgresql = testing.postgresql.PostgresqlFactory(
+                cache_initialized_db=True,
+            )
+            _testing_postgresql = Postgresql()
+        engine_url = _testing_postgresql.url()
 
     assert engine_url
 
@@ -39,7 +112,170 @@ def get_engine_url(env: Optional[str] = None, read_only: bool = True, sync: bool
     return engine_url
 
 
-# Try pool_pre_ping=True, see
+def get_read_replica_urls(sync: bool = True) -> List[str]:
+    """Gets the URLs of the read replicas, if any."""
+    engine_urls = [
+        url.strip() for url in os.getenv(READ_REPLICA_URLS_ENV_VAR, "").split(",") if url.strip()
+    ]
+    if not sync:
+        engine_urls = [url.replace("postgresql://", "postgresql+asyncpg://") for url in engine_urls]
+    return engine_urls
+
+
+def get_engine_config(engine_name: str) -> EngineConfig:
+    """
+    Gets the settings of an engine. The `db_engine_configs` of the service config override the
+    defaults, first with the settings of the "default" role, then with the ones of this process'
+    role, e.g.:
+
+        db_engine_configs:
+          default:
+            async_read_only:
+              pool_size: 10
+          gateway:
+            async:
+              pool_size: 20
+              max_overflow: 10
+    """
+    # pylint: disable=import-outside-toplevel
+    from llm_engine_server.common.config import hmi_config
+
+    engine_config = DEFAULT_ENGINE_CONFIGS[engine_name]
+    roles = [DEFAULT_PROCESS_ROLE, os.getenv(PROCESS_ROLE_ENV_VAR, DEFAULT_PROCESS_ROLE)]
+    for role in dict.fromkeys(roles):
+        overrides = hmi_config.db_engine_configs.get(role, {}).get(engine_name, {})
+        try:
+            engine_config = replace(engine_config, **overrides)
+        except TypeError as exc:
+            raise ValueError(
+                f"Invalid config of the {engine_name} engine for the {role} role: {exc}"
+            ) from exc
+    return engine_config
+
+
+def set_engine_monitoring_metrics_gateway(
+    monitoring_metrics_gateway: "MonitoringMetricsGateway",
+) -> None:
+    """Exports the pool usage and the slow queries of all the engines through the gateway."""
+    global _monitoring_metrics_gateway
+    _monitoring_metrics_gateway = monitoring_metrics_gateway
+
+
+def _do_get_instrumented(pool: QueuePool, engine_name: str, do_get: Callable[[], Any]) -> Any:
+    # Only the wait for a connection of the pool, or for a new one, since the pre-ping that
+    # follows is timed on its own.
+    start_time = time.monotonic()
+    try:
+        return do_get()
+    finally:
+        if _monitoring_metrics_gateway is not None:
+            _monitoring_metrics_gateway.emit_database_pool_checkout_metric(
+                engine_name=engine_name,
+                wait_seconds=time.monotonic() - start_time,
+                checked_out=pool.checkedout(),
+                pool_size=pool.size(),
+            )
+
+
+class _InstrumentedQueuePool(QueuePool):
+    engine_name = ""
+
+    def _do_get(self):
+        return _do_get_instrumented(self, self.engine_name, super()._do_get)
+
+
+class _InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    engine_name = ""
+
+    def _do_get(self):
+        return _do_get_instrumented(self, self.engine_name, super()._do_get)
+
+
+def _get_pool_class(base: Type[Pool], engine_name: str) -> Type[Pool]:
+    # A subclass per engine, since pools are recreated from their class, e.g. on dispose.
+    return type(f"{base.__name__}_{engine_name}", (base,), {"engine_name": engine_name})
+
+
+def _get_engine_kwargs(engine_name: str, pool_class: Type[Pool]) -> Dict[str, Any]:
+    engine_config = get_engine_config(engine_name)
+    kwargs: Dict[str, Any] = dict(
+        pool_recycle=engine_config.pool_recycle, pool_pre_ping=engine_config.pool_pre_ping
+    )
+    if pool_class is NullPool:
+        kwargs["poolclass"] = NullPool
+    else:
+        kwargs["poolclass"] = _get_pool_class(pool_class, engine_name)
+        for key in ("pool_size", "max_overflow", "pool_timeout"):
+            value = getattr(engine_config, key)
+            if value is not None:
+                kwargs[key] = value
+    return kwargs
+
+
+def _listen_for_slow_queries(engine: Engine, engine_name: str) -> None:
+    threshold_seconds = get_engine_config(engine_name).slow_query_threshold_seconds
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_times", []).append(time.monotonic())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration_seconds = time.monotonic() - conn.info["query_start_times"].pop()
+        if duration_seconds < threshold_seconds:
+            return
+        logger.warning(f"Slow query on {engine_name} took {duration_seconds:.3f}s: {statement}")
+        if _monitoring_metrics_gateway is not None:
+            _monitoring_metrics_gateway.emit_database_slow_query_metric(
+                engine_name=engine_name, duration_seconds=duration_seconds
+            )
+
+
+def _time_pre_pings(engine: Engine, engine_name: str) -> None:
+    # The pools ping through the dialect of their engine, which outlives them.
+    dialect = engine.dialect
+    do_ping = dialect.do_ping
+
+    def do_ping_timed(dbapi_connection):
+        start_time = time.monotonic()
+        try:
+            return do_ping(dbapi_connection)
+        finally:
+            if _monitoring_metrics_gateway is not None:
+                _monitoring_metrics_gateway.emit_database_pool_pre_ping_metric(
+                    engine_name=engine_name, duration_seconds=time.monotonic() - start_time
+                )
+
+    dialect.do_ping = do_ping_timed  # type: ignore[assignment]
+
+
+def _create_engine(engine_name: str, read_only: bool, url: Optional[str] = None) -> Engine:
+    engine = create_engine(
+        url or get_engine_url(read_only=read_only, sync=True),
+        echo=False,
+        future=True,
+        **_get_engine_kwargs(engine_name, _InstrumentedQueuePool),
+    )
+    _listen_for_slow_queries(engine, engine_name)
+    _time_pre_pings(engine, engine_name)
+    return engine
+
+
+def _create_async_engine(
+    engine_name: str, read_only: bool, pool_class: Type[Pool], url: Optional[str] = None
+) -> AsyncEngine:
+    engine = create_async_engine(
+        url or get_engine_url(read_only=read_only, sync=False),
+        echo=False,
+        future=True,
+        **_get_engine_kwargs(engine_name, pool_class),
+    )
+    _listen_for_slow_queries(engine.sync_engine, engine_name)
+    _time_pre_pings(engine.sync_engine, engine_name)
+    return engine
+
+
+# Engines default to pool_pre_ping=True, see
 # https://docs.sqlalchemy.org/en/14/core/engines.html
 #   ?highlight=create_engine#sqlalchemy.create_engine.params.pool_pre_ping
 # tl;dr is hopefully it stops the psycopg errors from happening
@@ -51,72 +287,222 @@ def get_engine_url(env: Optional[str] = None, read_only: bool = True, sync: bool
 # but hopefully should completely eliminate
 # any of the postgres connection errors we've been seeing.
 
-ml_infra_pg_engine = create_engine(
-    get_engine_url(read_only=False, sync=True),
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-)
-ml_infra_pg_engine_read_only = create_engine(
-    get_engine_url(read_only=True, sync=True),
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-)
-ml_infra_pg_engine_async = create_async_engine(
-    get_engine_url(read_only=False, sync=False),
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-)
-ml_infra_pg_engine_read_only_async = create_async_engine(
-    get_engine_url(read_only=True, sync=False),
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-    max_overflow=5,
-)
-ml_infra_pg_engine_async_null_pool = create_async_engine(
-    get_engine_url(read_only=False, sync=False),
-    echo=False,
-    future=True,
-    poolclass=NullPool,
-    pool_pre_ping=True,
-)
+# Engines are only created when first used, so that importing this module stays cheap for the
+# processes, and the code paths, that never touch the database.
+_ENGINE_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "sync": lambda: _create_engine("sync", read_only=False),
+    "sync_read_only": lambda: _create_engine("sync_read_only", read_only=True),
+    "async": lambda: _create_async_engine(
+        "async", read_only=False, pool_class=_InstrumentedAsyncAdaptedQueuePool
+    ),
+    "async_read_only": lambda: _create_async_engine(
+        "async_read_only", read_only=True, pool_class=_InstrumentedAsyncAdaptedQueuePool
+    ),
+    "async_null_pool": lambda: _create_async_engine(
+        "async_null_pool", read_only=False, pool_class=NullPool
+    ),
+}
+_ENGINE_NAMES_BY_ATTRIBUTE = {
+    "ml_infra_pg_engine": "sync",
+    "ml_infra_pg_engine_read_only": "sync_read_only",
+    "ml_infra_pg_engine_async": "async",
+    "ml_infra_pg_engine_read_only_async": "async_read_only",
+    "ml_infra_pg_engine_async_null_pool": "async_null_pool",
+}
+_engines: Dict[str, Any] = {}
+_engines_lock = threading.Lock()
+
+
+def _get_or_create_engine(engine_key: str, create: Callable[[], Any]) -> Any:
+    engine = _engines.get(engine_key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(engine_key)
+            if engine is None:
+                engine = create()
+                _engines[engine_key] = engine
+    return engine
+
+
+def get_engine(engine_name: str) -> Engine:
+    """Gets one of the synchronous engines, "sync" or "sync_read_only"."""
+    return _get_or_create_engine(engine_name, _ENGINE_FACTORIES[engine_name])
+
+
+def get_async_engine(engine_name: str) -> AsyncEngine:
+    """Gets one of the asynchronous engines, "async", "async_read_only" or "async_null_pool"."""
+    return _get_or_create_engine(engine_name, _ENGINE_FACTORIES[engine_name])
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps the engines available as the module attributes they used to be.
+    engine_name = _ENGINE_NAMES_BY_ATTRIBUTE.get(name)
+    if engine_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _get_or_create_engine(engine_name, _ENGINE_FACTORIES[engine_name])
+
+
+def _get_read_replica_lag_seconds(index: int) -> float:
+    # A connection of its own, so that the checks don't wait on a busy pool.
+    engine = _get_or_create_engine(
+        f"health_check/replica-{index}",
+        lambda: create_engine(
+            get_read_replica_urls()[index], future=True, pool_size=1, max_overflow=0
+        ),
+    )
+    with engine.connect() as connection:
+        lag_seconds = connection.execute(text(REPLICA_LAG_QUERY)).scalar_one()
+    if lag_seconds is None:
+        raise RuntimeError(f"Read replica {index} isn't streaming from the primary")
+    return float(lag_seconds)
+
+
+def _get_read_replica_set() -> Optional[ReadReplicaSet]:
+    global _read_replica_set
+    if _read_replica_set is None:
+        num_replicas = len(get_read_replica_urls())
+        if num_replicas == 0:
+            return None
+        with _read_replica_set_lock:
+            if _read_replica_set is None:
+                _read_replica_set = ReadReplicaSet(
+                    num_replicas=num_replicas, get_lag_seconds=_get_read_replica_lag_seconds
+                )
+    return _read_replica_set
+
+
+def _create_read_replica_engine(
+    engine_name: str, index: int, read_replica_set: ReadReplicaSet
+) -> Any:
+    sync = engine_name == "sync_read_only"
+    url = get_read_replica_urls(sync=sync)[index]
+    if sync:
+        engine = _create_engine(engine_name, read_only=True, url=url)
+        sync_engine = engine
+    else:
+        engine = _create_async_engine(
+            engine_name,
+            read_only=True,
+            pool_class=_InstrumentedAsyncAdaptedQueuePool,
+            url=url,
+        )
+        sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        if context.is_disconnect:
+            read_replica_set.mark_unhealthy(index)
+
+    return engine
+
+
+def _get_read_only_engine(engine_name: str, primary_engine_name: str) -> Any:
+    """
+    Gets the engine of a new read-only session: a healthy read replica, or the primary if there
+    is none, or if this context already wrote to the primary.
+    """
+    if _reads_from_primary.get():
+        return _get_or_create_engine(primary_engine_name, _ENGINE_FACTORIES[primary_engine_name])
+    read_replica_set = _get_read_replica_set()
+    if read_replica_set is None:
+        return _get_or_create_engine(engine_name, _ENGINE_FACTORIES[engine_name])
+    index = read_replica_set.pick()
+    if index is None:
+        return _get_or_create_engine(primary_engine_name, _ENGINE_FACTORIES[primary_engine_name])
+    return _get_or_create_engine(
+        f"{engine_name}/replica-{index}",
+        lambda: _create_read_replica_engine(engine_name, index, read_replica_set),
+    )
+
+
+def stick_reads_to_primary() -> None:
+    """
+    Makes the read-only sessions that are created later in the current context, e.g. the current
+    request, read from the primary, so that they see the writes made to it.
+    """
+    _reads_from_primary.set(True)
+
+
+class _ReadOnlySessionmaker(sessionmaker):
+    def __call__(self, **local_kw):
+        local_kw.setdefault("bind", _get_read_only_engine("sync_read_only", "sync"))
+        return super().__call__(**local_kw)
+
+
+class _ReadOnlyAsyncSessionmaker(async_sessionmaker):
+    def __call__(self, **local_kw):
+        local_kw.setdefault("bind", _get_read_only_engine("async_read_only", "async"))
+        return super().__call__(**local_kw)
+
+
+class _LazySessionFactory:
+    """
+    Stands in for a session factory, e.g. a sessionmaker, which is only created, along with its
+    engine, when first used.
+    """
+
+    def __init__(self, create_session_factory: Callable[[], Any]):
+        self._create_session_factory = create_session_factory
+        self._session_factory: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def _get_session_factory(self) -> Any:
+        if self._session_factory is None:
+            with self._lock:
+                if self._session_factory is None:
+                    self._session_factory = self._create_session_factory()
+        return self._session_factory
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._get_session_factory()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_session_factory(), name)
+
 
 # Synchronous sessions (Session and SessionReadOnly) are fairly straightforward, and both
 # can be used at any time. To use asynchronous sqlalchemy, use the SessionAsyncNullPool
 # if you're running a synchronous program where concurrency of database connections is not
 # super important (e.g. Celery workers that use long-standing connections, and Celery is currently
 # synchronous). Use SessionAsync and SessionReadOnlyAsync in ASGI applications.
-Session = sessionmaker(autocommit=False, autoflush=False, bind=ml_infra_pg_engine)
-SessionReadOnly = sessionmaker(autocommit=False, autoflush=False, bind=ml_infra_pg_engine_read_only)
-SessionAsync = async_scoped_session(
-    session_factory=async_sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=ml_infra_pg_engine_async,
-        expire_on_commit=False,
-    ),
-    scopefunc=asyncio.current_task,
+Session = _LazySessionFactory(
+    lambda: sessionmaker(autocommit=False, autoflush=False, bind=get_engine("sync"))
 )
-SessionAsyncNullPool = async_scoped_session(
-    session_factory=async_sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=ml_infra_pg_engine_async_null_pool,
-        expire_on_commit=False,
-    ),
-    scopefunc=asyncio.current_task,
+# The read-only sessions are spread over the read replicas, if there are any.
+SessionReadOnly = _LazySessionFactory(
+    lambda: _ReadOnlySessionmaker(autocommit=False, autoflush=False)
 )
-SessionReadOnlyAsync = async_scoped_session(
-    async_sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=ml_infra_pg_engine_read_only_async,
-        expire_on_commit=False,
-    ),
-    scopefunc=asyncio.current_task,
+SessionAsync = _LazySessionFactory(
+    lambda: async_scoped_session(
+        session_factory=async_sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=get_async_engine("async"),
+            expire_on_commit=False,
+        ),
+        scopefunc=asyncio.current_task,
+    )
+)
+SessionAsyncNullPool = _LazySessionFactory(
+    lambda: async_scoped_session(
+        session_factory=async_sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=get_async_engine("async_null_pool"),
+            expire_on_commit=False,
+        ),
+        scopefunc=asyncio.current_task,
+    )
+)
+SessionReadOnlyAsync = _LazySessionFactory(
+    lambda: async_scoped_session(
+        _ReadOnlyAsyncSessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+        ),
+        scopefunc=asyncio.current_task,
+    )
 )
 Base = declarative_base()
 
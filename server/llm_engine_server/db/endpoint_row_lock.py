@@ -1,18 +1,25 @@
 # An implementation of a row-based lock.
 import asyncio as aio
 import hashlib
+import random
 import time
 from contextlib import AbstractContextManager
 
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
 from sqlalchemy import BIGINT, cast, func, select
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.session import Session
 
 logger = make_logger(filename_wo_ext(__file__))
 
 BLOCKING_LOCK_TIMEOUT_SECONDS = 120
-BLOCKING_LOCK_TIMEOUT_POLL_FREQ_SECONDS = 0.5
+# Only used if the server cancels the blocking wait, e.g. because of its statement_timeout.
+FALLBACK_POLL_MIN_DELAY_SECONDS = 0.5
+FALLBACK_POLL_MAX_DELAY_SECONDS = 5.0
+
+LOCK_NOT_AVAILABLE_SQLSTATE = "55P03"
+QUERY_CANCELED_SQLSTATE = "57014"
 
 
 def get_lock_key(user_id: str, endpoint_name: str) -> int:
@@ -43,6 +50,31 @@ def try_obtain_lock(session: Session, lock_id: int):
     return session.execute(select(lock_fn(cast(lock_id, BIGINT)))).scalar()
 
 
+def obtain_lock_with_timeout(session: Session, lock_id: int, timeout_seconds: float):
+    """
+    Waits for the lock on the server, without polling, and obtains it. Gives up after
+    `timeout_seconds`, in which case the session's transaction is rolled back.
+    Args:
+        session: SQLAlchemy session object
+        lock_id: id of lock to take out
+        timeout_seconds: how long to wait for the lock
+
+    Returns:
+        Whether lock was obtained.
+    """
+    # Local to the transaction, so that the session's later statements get the default timeout
+    # once it ends.
+    session.execute(select(func.set_config("lock_timeout", _to_ms(timeout_seconds), True)))
+    try:
+        session.execute(select(func.pg_advisory_lock(cast(lock_id, BIGINT))))
+    except DBAPIError as exc:
+        if _get_sqlstate(exc) != LOCK_NOT_AVAILABLE_SQLSTATE:
+            raise
+        session.rollback()
+        return False
+    return True
+
+
 def release_lock(session: Session, lock_id: int):
     """
     Releases an obtained lock.
@@ -72,6 +104,33 @@ async def try_obtain_lock_async(async_session: AsyncSession, lock_id: int):
     return result.scalar()
 
 
+async def obtain_lock_with_timeout_async(
+    async_session: AsyncSession, lock_id: int, timeout_seconds: float
+):
+    """
+    Waits for the lock on the server, without polling, and obtains it. Gives up after
+    `timeout_seconds`, in which case the session's transaction is rolled back.
+    Args:
+        async_session: SQLAlchemy async session object
+        lock_id: id of lock to take out
+        timeout_seconds: how long to wait for the lock
+
+    Returns:
+        Whether lock was obtained.
+    """
+    await async_session.execute(
+        select(func.set_config("lock_timeout", _to_ms(timeout_seconds), True))
+    )
+    try:
+        await async_session.execute(select(func.pg_advisory_lock(cast(lock_id, BIGINT))))
+    except DBAPIError as exc:
+        if _get_sqlstate(exc) != LOCK_NOT_AVAILABLE_SQLSTATE:
+            raise
+        await async_session.rollback()
+        return False
+    return True
+
+
 async def release_lock_async(async_session: AsyncSession, lock_id: int):
     """
     Releases an obtained lock.
@@ -87,16 +146,37 @@ async def release_lock_async(async_session: AsyncSession, lock_id: int):
     return result.scalar()
 
 
+def _to_ms(seconds: float) -> str:
+    # A lock_timeout of 0 disables it.
+    return f"{max(1, int(seconds * 1000))}ms"
+
+
+def _get_sqlstate(exc: DBAPIError):
+    return getattr(exc.orig, "pgcode", None)
+
+
+def _get_fallback_poll_delay(attempt: int) -> float:
+    """Exponential backoff, with jitter so that waiters that were cut off together spread out."""
+    delay = min(FALLBACK_POLL_MAX_DELAY_SECONDS, FALLBACK_POLL_MIN_DELAY_SECONDS * 2**attempt)
+    return random.uniform(delay / 2, delay)
+
+
 class AdvisoryLockContextManager(AbstractContextManager):
     """
     Implements locking on a given lock_id (which must be between -2 ** 63 and 2 ** 63 - 1)
-    Has both blocking and non-blocking modes. Blocking mode polls until acquisition, but times out
-    after a few minutes.
+    Has both blocking and non-blocking modes. If the lock is taken, blocking mode waits for it on the
+    server with ``pg_advisory_lock``, but times out after a few minutes. If the server cancels the
+    wait before that, it falls back to polling, with a jittered backoff.
+
+    After entering, ``contended`` tells whether the lock was taken at first, and ``wait_seconds``
+    how long it took to acquire it or to give up.
 
     Notes on usage:
     The session passed in should be a short-lived session ideally, as locks get closed out when the
     session ends.
     This reduces the impact of locks failing to release correctly.
+    In blocking mode, the session's transaction is rolled back if the lock is not acquired, so the
+    session shouldn't be used for anything else.
     Currently obtained locks can be found via
     ``select * from pg_locks where locktype = 'advisory' limit 10``
     inside of dbeaver
@@ -114,21 +194,33 @@ class AdvisoryLockContextManager(AbstractContextManager):
         self.session = session
         self.lock_id = lock_id
         self.blocking = blocking
+        self.contended = False
+        self.wait_seconds = 0.0
         self._lock_acquired = False
 
     def __enter__(self):
-        if self.blocking:
-            start_time = time.time()
-            while time.time() - start_time < BLOCKING_LOCK_TIMEOUT_SECONDS:
-                lock_acquired = try_obtain_lock(self.session, self.lock_id)
-                if lock_acquired:
-                    self._lock_acquired = True
-                    break
-                time.sleep(
-                    BLOCKING_LOCK_TIMEOUT_POLL_FREQ_SECONDS
-                )  # Should we add a bit of jitter?
-        else:
-            self._lock_acquired = try_obtain_lock(self.session, self.lock_id)
+        start_time = time.monotonic()
+        self._lock_acquired = try_obtain_lock(self.session, self.lock_id)
+        self.contended = not self._lock_acquired
+        if self.contended and self.blocking:
+            try:
+                self._lock_acquired = obtain_lock_with_timeout(
+                    self.session, self.lock_id, BLOCKING_LOCK_TIMEOUT_SECONDS
+                )
+            except DBAPIError as exc:
+                if _get_sqlstate(exc) != QUERY_CANCELED_SQLSTATE:
+                    raise
+                logger.warning(f"Wait for lock {self.lock_id} was canceled, polling for it instead")
+                self.session.rollback()
+                attempt = 0
+                while not self._lock_acquired:
+                    remaining = BLOCKING_LOCK_TIMEOUT_SECONDS - (time.monotonic() - start_time)
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(remaining, _get_fallback_poll_delay(attempt)))
+                    attempt += 1
+                    self._lock_acquired = try_obtain_lock(self.session, self.lock_id)
+        self.wait_seconds = time.monotonic() - start_time
         logger.debug(
             f"Low-level: acquired lock? {self._lock_acquired}, classid, objid = "
             f"{self.lock_id // 2 ** 32}, {self.lock_id % 2 ** 32}"
@@ -141,18 +233,28 @@ class AdvisoryLockContextManager(AbstractContextManager):
             logger.debug(f"Low-level: Releasing lock: {lock_release}")
 
     async def __aenter__(self):
-        if self.blocking:
-            start_time = time.time()
-            while time.time() - start_time < BLOCKING_LOCK_TIMEOUT_SECONDS:
-                lock_acquired = await try_obtain_lock_async(self.session, self.lock_id)
-                if lock_acquired:
-                    self._lock_acquired = True
-                    break
-                await aio.sleep(
-                    BLOCKING_LOCK_TIMEOUT_POLL_FREQ_SECONDS
-                )  # Should we add a bit of jitter?
-        else:
-            self._lock_acquired = await try_obtain_lock_async(self.session, self.lock_id)
+        start_time = time.monotonic()
+        self._lock_acquired = await try_obtain_lock_async(self.session, self.lock_id)
+        self.contended = not self._lock_acquired
+        if self.contended and self.blocking:
+            try:
+                self._lock_acquired = await obtain_lock_with_timeout_async(
+                    self.session, self.lock_id, BLOCKING_LOCK_TIMEOUT_SECONDS
+                )
+            except DBAPIError as exc:
+                if _get_sqlstate(exc) != QUERY_CANCELED_SQLSTATE:
+                    raise
+                logger.warning(f"Wait for lock {self.lock_id} was canceled, polling for it instead")
+                await self.session.rollback()
+                attempt = 0
+                while not self._lock_acquired:
+                    remaining = BLOCKING_LOCK_TIMEOUT_SECONDS - (time.monotonic() - start_time)
+                    if remaining <= 0:
+                        break
+                    await aio.sleep(min(remaining, _get_fallback_poll_delay(attempt)))
+                    attempt += 1
+                    self._lock_acquired = await try_obtain_lock_async(self.session, self.lock_id)
+        self.wait_seconds = time.monotonic() - start_time
         logger.debug(
             f"Low-level: acquired lock? {self._lock_acquired}, classid, objid = "
             f"{self.lock_id // 2 ** 32}, {self.lock_id % 2 ** 32}"
@@ -0,0 +1,38 @@
+"""add llm endpoint indexes
+
+Revision ID: 2dc1a8f6b0d3
+Revises: f55525c81eb5
+Create Date: 2023-08-16 11:24:09.730164
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2dc1a8f6b0d3"
+down_revision = "f55525c81eb5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial indexes, whose predicates match the filters of the LLM endpoint lookups, rather than a
+    # GIN index on endpoint_metadata: the lookups only ever test for the '_llm' key.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS endpoint_llm_owner_created_at_idx "
+            "ON llm_engine.endpoints (owner, created_at) "
+            "WHERE endpoint_metadata ? '_llm'"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS endpoint_llm_public_created_at_idx "
+            "ON llm_engine.endpoints (created_at) "
+            "WHERE endpoint_metadata ? '_llm' AND public_inference"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS llm_engine.endpoint_llm_public_created_at_idx"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS llm_engine.endpoint_llm_owner_created_at_idx")
@@ -0,0 +1,34 @@
+"""add owner created_at indexes
+
+Revision ID: f55525c81eb5
+Revises:
+Create Date: 2023-08-14 17:02:31.418223
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f55525c81eb5"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Built concurrently so that the tables stay writable. IF NOT EXISTS, since databases set up
+    # from the models already have them.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS bundle_owner_created_at_idx "
+            "ON llm_engine.bundles (owner, created_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS endpoint_owner_created_at_idx "
+            "ON llm_engine.endpoints (owner, created_at)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS llm_engine.endpoint_owner_created_at_idx")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS llm_engine.bundle_owner_created_at_idx")
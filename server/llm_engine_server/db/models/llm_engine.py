@@ -105,6 +105,7 @@ class Bundle(Base):
         CheckConstraint(
             "(flavor = 'triton_enhanced_runnable_image') = (triton_enhanced_runnable_image_readiness_initial_delay_seconds IS NOT NULL)"
         ),
+        Index("bundle_owner_created_at_idx", "owner", "created_at"),  # For paginated listings
         {"schema": "llm_engine"},
     )
 
@@ -362,12 +363,21 @@ class Bundle(Base):
 
     @classmethod
     async def select_all_by_filters_owner(
-        cls, session: AsyncSession, filters: List[Any], owner: str
+        cls,
+        session: AsyncSession,
+        filters: List[Any],
+        owner: str,
+        order_by: Optional[List[Any]] = None,
+        limit: Optional[int] = None,
     ) -> List["Bundle"]:
         query = select(Bundle).filter_by(owner=owner)
 
         for f in filters:
             query = query.filter(f)
+        if order_by:
+            query = query.order_by(*order_by)
+        if limit:
+            query = query.limit(limit)
 
         bundles = await session.execute(query)
         return bundles.scalars().all()
@@ -433,6 +443,18 @@ class Endpoint(Base):
             unique=True,
             postgresql_where=text("endpoint_metadata ? '_llm'"),
         ),
+        Index("endpoint_owner_created_at_idx", "owner", "created_at"),  # For paginated listings
+        Index(  # For the listings of the LLM endpoints that a user can access
+            "endpoint_llm_owner_created_at_idx",
+            "owner",
+            "created_at",
+            postgresql_where=text("endpoint_metadata ? '_llm'"),
+        ),
+        Index(
+            "endpoint_llm_public_created_at_idx",
+            "created_at",
+            postgresql_where=text("endpoint_metadata ? '_llm' AND public_inference"),
+        ),
         {"schema": "llm_engine"},
     )
 
@@ -600,6 +622,7 @@ class Endpoint(Base):
         filters: List[Any],
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        order_by: Optional[List[Any]] = None,
     ) -> List["Endpoint"]:
         """DO NOT USE FOR EXTERNAL FUNCTIONS, this bypasses the owner
         check and should only be used for internal use cases"""
@@ -607,6 +630,8 @@ class Endpoint(Base):
 
         for f in filters:
             query = query.filter(f)
+        if order_by:
+            query = query.order_by(*order_by)
         if limit:
             query = query.limit(limit)
         if offset:
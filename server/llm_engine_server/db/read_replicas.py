@@ -0,0 +1,99 @@
+import itertools
+import threading
+from typing import Callable, List, Optional
+
+from llm_engine_server.core.loggers import filename_wo_ext, make_logger
+
+logger = make_logger(filename_wo_ext(__file__))
+
+# Only the replicas whose last health check found them at most this far behind the primary serve
+# reads.
+DEFAULT_MAX_LAG_SECONDS = 10.0
+DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS = 5.0
+
+
+class ReadReplicaSet:
+    """
+    Picks the read replica that a read-only session should use, round-robin over the healthy
+    ones. A replica is unhealthy if its last health check failed, or found it lagging too far
+    behind the primary, or if one of its connections was lost since.
+
+    Health checks run in a daemon thread, so that picking a replica never waits on the database.
+    Replicas only serve reads once their first check found them healthy; until then, reads go to
+    the primary.
+    """
+
+    def __init__(
+        self,
+        num_replicas: int,
+        get_lag_seconds: Callable[[int], float],
+        max_lag_seconds: float = DEFAULT_MAX_LAG_SECONDS,
+        health_check_interval_seconds: float = DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            num_replicas: The number of replicas.
+            get_lag_seconds: Returns how far behind the primary a replica, given by its index, is.
+            max_lag_seconds: How far behind the primary a replica can be, and still serve reads.
+            health_check_interval_seconds: How often to check the replicas.
+        """
+        self.num_replicas = num_replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self._get_lag_seconds = get_lag_seconds
+        self._healthy: List[bool] = [False] * num_replicas
+        self._checked = False
+        self._counter = itertools.count()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def pick(self) -> Optional[int]:
+        """Returns the index of the replica to read from, or None to read from the primary."""
+        self._start_health_checks()
+        for _ in range(self.num_replicas):
+            index = next(self._counter) % self.num_replicas
+            if self._healthy[index]:
+                return index
+        return None
+
+    def mark_unhealthy(self, index: int) -> None:
+        if self._healthy[index]:
+            logger.warning(f"Read replica {index} is unhealthy, reading from the others")
+        self._healthy[index] = False
+
+    def check_health(self) -> None:
+        for index in range(self.num_replicas):
+            try:
+                lag_seconds = self._get_lag_seconds(index)
+            except Exception:
+                logger.exception(f"Health check of read replica {index} failed")
+                self.mark_unhealthy(index)
+                continue
+            if lag_seconds > self.max_lag_seconds:
+                logger.warning(f"Read replica {index} is {lag_seconds:.1f}s behind the primary")
+                self.mark_unhealthy(index)
+            elif not self._healthy[index]:
+                if self._checked:
+                    logger.info(f"Read replica {index} is healthy again")
+                self._healthy[index] = True
+        self._checked = True
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _start_health_checks(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_health_checks, name="read-replica-health-checks", daemon=True
+                )
+                self._thread.start()
+
+    def _run_health_checks(self) -> None:
+        # The first check runs right away, since no replica serves reads before it.
+        while not self._stopped.is_set():
+            self.check_health()
+            self._stopped.wait(self.health_check_interval_seconds)
@@ -5,6 +5,7 @@ from .model_primitive_gateway import ModelPrimitiveGateway
 from .monitoring_metrics_gateway import MonitoringMetricsGateway
 from .streaming_model_endpoint_inference_gateway import StreamingModelEndpointInferenceGateway
 from .sync_model_endpoint_inference_gateway import SyncModelEndpointInferenceGateway
+from .task_completion_gateway import TaskCompletionGateway
 from .task_queue_gateway import TaskQueueGateway
 
 __all__ = (
@@ -15,5 +16,6 @@ __all__ = (
     "MonitoringMetricsGateway",
     "StreamingModelEndpointInferenceGateway",
     "SyncModelEndpointInferenceGateway",
+    "TaskCompletionGateway",
     "TaskQueueGateway",
 )
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Sequence
 
 from llm_engine_server.common.constants import DEFAULT_CELERY_TASK_NAME
 from llm_engine_server.common.dtos.tasks import (
@@ -29,8 +30,33 @@ class AsyncModelEndpointInferenceGateway(ABC):
         Runs a prediction request and returns a response.
         """
 
+    @abstractmethod
+    async def create_task_async(
+        self,
+        topic: str,
+        predict_request: EndpointPredictV1Request,
+        task_timeout_seconds: int,
+        *,
+        task_name: str = DEFAULT_CELERY_TASK_NAME,
+    ) -> CreateAsyncTaskV1Response:
+        """
+        Runs a prediction request and returns a response, without blocking the event loop.
+        """
+
     @abstractmethod
     def get_task(self, task_id: str) -> GetAsyncTaskV1Response:
         """
         Gets the status of a prediction request.
         """
+
+    @abstractmethod
+    async def wait_for_task(self, task_id: str, timeout_seconds: float) -> GetAsyncTaskV1Response:
+        """
+        Gets the status of a prediction request, waiting up to timeout_seconds for it to finish.
+        """
+
+    @abstractmethod
+    def get_tasks(self, task_ids: Sequence[str]) -> List[GetAsyncTaskV1Response]:
+        """
+        Gets the statuses of many prediction requests at once, in the order of task_ids.
+        """
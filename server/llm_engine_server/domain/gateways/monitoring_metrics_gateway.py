@@ -44,3 +44,43 @@ class MonitoringMetricsGateway(ABC):
         Missed database cache metric
 
         """
+
+    @abstractmethod
+    def emit_database_cache_eviction_metric(self, num_evicted: int):
+        """
+        Database cache entries evicted to make room for new ones metric
+
+        """
+
+    @abstractmethod
+    def emit_database_lock_contention_metric(self, acquired: bool, wait_seconds: float):
+        """
+        Database lock that was already taken when first requested metric, with whether it was
+        eventually acquired and how long was spent waiting for it
+
+        """
+
+    @abstractmethod
+    def emit_database_pool_checkout_metric(
+        self, engine_name: str, wait_seconds: float, checked_out: int, pool_size: int
+    ):
+        """
+        Database connection pool checkout metric, with how long was spent waiting for a
+        connection, not counting its pre-ping, and how many connections of the pool were checked
+        out afterwards
+
+        """
+
+    @abstractmethod
+    def emit_database_pool_pre_ping_metric(self, engine_name: str, duration_seconds: float):
+        """
+        Database connection pre-ping on checkout metric, with how long it took
+
+        """
+
+    @abstractmethod
+    def emit_database_slow_query_metric(self, engine_name: str, duration_seconds: float):
+        """
+        Database query slower than the engine's threshold metric
+
+        """
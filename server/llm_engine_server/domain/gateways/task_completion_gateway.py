@@ -0,0 +1,24 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Optional
+
+
+class TaskCompletionGateway(ABC):
+    """
+    Base class for gateways that notify when async tasks finish.
+    """
+
+    @abstractmethod
+    def subscribe(self, task_id: str) -> AsyncContextManager[Optional[asyncio.Event]]:
+        """
+        Subscribes to the completion of a task, for as long as the context is entered.
+
+        Args:
+            task_id: The ID of the task.
+
+        Returns: A context manager yielding an event that is set once the task finishes, or None if
+            notifications are currently unavailable, in which case the status of the task should be
+            polled. Events may also be set spuriously, e.g. when notifications were interrupted, so
+            the status of the task should be read again after the event is set, in a new
+            subscription.
+        """
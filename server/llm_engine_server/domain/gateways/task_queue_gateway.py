@@ -1,6 +1,6 @@
 # This is the abstract class defining putting and retrieving tasks into a queue.
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from llm_engine_server.common.dtos.tasks import CreateAsyncTaskV1Response, GetAsyncTaskV1Response
 
@@ -32,8 +32,42 @@ class TaskQueueGateway(ABC):
         Returns: The unique identifier for the task.
         """
 
+    @abstractmethod
+    async def send_task_async(
+        self,
+        task_name: str,
+        queue_name: str,
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        expires: Optional[int] = None,
+    ) -> CreateAsyncTaskV1Response:
+        """
+        Sends a task to the queue without blocking the event loop.
+
+        Args:
+            task_name: The name of the task to submit.
+            queue_name: The name of the queue of the task.
+            args: Optional arguments for the task.
+            kwargs: Optional keyword-arguments for the task.
+            expires: Optional number of seconds before the time should time out.
+
+        Returns: The unique identifier for the task.
+
+        Raises:
+            TooManyRequestsException: If too many tasks are already waiting to be sent.
+        """
+
     @abstractmethod
     def get_task(self, task_id: str) -> GetAsyncTaskV1Response:
         """
         Gets a task's status and its final result if it's done.
         """
+
+    @abstractmethod
+    def get_tasks(self, task_ids: Sequence[str]) -> List[GetAsyncTaskV1Response]:
+        """
+        Gets the statuses of many tasks, and their final results if they're done, with a single
+        batched read of the result backend.
+
+        Returns: The tasks, in the order of task_ids.
+        """
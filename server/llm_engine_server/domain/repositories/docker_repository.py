@@ -25,6 +25,22 @@ class DockerRepository(ABC):
         Returns: boolean of whether the image exists.
         """
 
+    @abstractmethod
+    async def image_exists_async(
+        self, image_tag: str, repository_name: str, aws_profile: Optional[str] = None
+    ) -> bool:
+        """
+        Returns whether a Docker image with the provided tag and repository name exists, without
+        blocking the event loop.
+
+        Args:
+            image_tag: the tag given to the Docker image.
+            repository_name: the name of the repository containing the image.
+            aws_profile: the aws profile to use for ECR.
+
+        Returns: boolean of whether the image exists.
+        """
+
     @abstractmethod
     def get_image_url(self, image_tag: str, repository_name: str) -> str:
         """
@@ -49,6 +65,17 @@ class DockerRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def build_image_async(self, image_params: BuildImageRequest) -> BuildImageResponse:
+        """
+        Builds a docker image without blocking the event loop.
+
+        Args:
+            image_params: Parameters to use for building the image.
+
+        Returns: The status and logs of the image building.
+        """
+
     def is_repo_name(self, repo_name: str):
         # We assume repository names must start with a letter and can only contain lowercase letters, numbers, hyphens, underscores, and forward slashes.
         # Based-off ECR naming standards
@@ -56,7 +56,12 @@ class ModelBundleRepository(ABC):
 
     @abstractmethod
     async def list_model_bundles(
-        self, owner: str, name: Optional[str], order_by: Optional[ModelBundleOrderBy]
+        self,
+        owner: str,
+        name: Optional[str],
+        order_by: Optional[ModelBundleOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> Sequence[ModelBundle]:
         """
         Lists the Model Bundles associated with a given owner and name.
@@ -65,6 +70,9 @@ class ModelBundleRepository(ABC):
             owner: The owner of the model bundle(s).
             name: The name of the model bundle(s).
             order_by: The ordering (newest or oldest) to output the Model Bundle versions.
+            limit: An optional maximum number of Model Bundles to return.
+            page_token: An optional token of the last Model Bundle of the previous page, to return
+                the ones that come after it. Pages are ordered by newest first by default.
 
         Returns:
             A sequence of Model Bundle domain entities.
@@ -171,6 +171,8 @@ class ModelEndpointService(ABC):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpoint]:
         """
         Lists model endpoints.
@@ -178,6 +180,8 @@ class ModelEndpointService(ABC):
             owner: The user ID of the owner of the endpoints.
             name: An optional name of the endpoint used for filtering endpoints.
             order_by: The ordering to output the Model Endpoints.
+            limit: An optional maximum number of endpoints to return.
+            page_token: An optional token of the last endpoint of the previous page.
         Returns:
             A Model Endpoint Record domain entity, or None if not found.
         """
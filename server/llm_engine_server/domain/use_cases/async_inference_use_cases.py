@@ -1,7 +1,12 @@
+from typing import AsyncIterable
+
 from llm_engine_server.common.dtos.tasks import (
     CreateAsyncTaskV1Response,
     EndpointPredictV1Request,
+    GetAsyncTasksStatusV1Request,
+    GetAsyncTasksStatusV1Response,
     GetAsyncTaskV1Response,
+    TaskStatus,
 )
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
@@ -16,6 +21,8 @@ from llm_engine_server.domain.exceptions import EndpointUnsupportedInferenceType
 from llm_engine_server.domain.services.model_endpoint_service import ModelEndpointService
 
 DEFAULT_TASK_TIMEOUT_SECONDS = 86400
+# How long each wait of a task status stream lasts, before the status is read again anyway.
+TASK_EVENTS_WAIT_SECONDS = 60
 
 
 class CreateAsyncInferenceTaskV1UseCase:
@@ -66,7 +73,7 @@ class CreateAsyncInferenceTaskV1UseCase:
         task_name = model_endpoint.record.current_model_bundle.celery_task_name()
 
         inference_gateway = self.model_endpoint_service.get_async_model_endpoint_inference_gateway()
-        return inference_gateway.create_task(
+        return await inference_gateway.create_task_async(
             topic=model_endpoint.record.destination,
             predict_request=request,
             task_timeout_seconds=DEFAULT_TASK_TIMEOUT_SECONDS,
@@ -96,3 +103,83 @@ class GetAsyncInferenceTaskV1UseCase:
         # TODO: check that user is authorized to access this task.
         inference_gateway = self.model_endpoint_service.get_async_model_endpoint_inference_gateway()
         return inference_gateway.get_task(task_id=task_id)
+
+
+class WaitForAsyncInferenceTaskV1UseCase:
+    def __init__(self, model_endpoint_service: ModelEndpointService):
+        self.model_endpoint_service = model_endpoint_service
+
+    async def execute(
+        self, user: User, task_id: str, wait_seconds: float
+    ) -> GetAsyncTaskV1Response:
+        """
+        Runs the use case to get an async inference task, waiting for it to finish if it hasn't.
+
+        Args:
+            user: The user who is getting the async inference task.
+            task_id: The ID of the task.
+            wait_seconds: The maximum number of seconds to wait for the task to finish.
+
+        Returns:
+            A response object that contains the status and result of the task.
+        """
+        # TODO: check that user is authorized to access this task.
+        inference_gateway = self.model_endpoint_service.get_async_model_endpoint_inference_gateway()
+        return await inference_gateway.wait_for_task(task_id=task_id, timeout_seconds=wait_seconds)
+
+
+class StreamAsyncInferenceTaskV1UseCase:
+    def __init__(self, model_endpoint_service: ModelEndpointService):
+        self.model_endpoint_service = model_endpoint_service
+
+    async def execute(self, user: User, task_id: str) -> AsyncIterable[GetAsyncTaskV1Response]:
+        """
+        Runs the use case to stream the status of an async inference task until it finishes.
+
+        Args:
+            user: The user who is getting the async inference task.
+            task_id: The ID of the task.
+
+        Returns:
+            An iterable of response objects, one for the current status of the task, and one more
+            each time it changes. The last one contains the result of the task.
+        """
+        # TODO: check that user is authorized to access this task.
+        inference_gateway = self.model_endpoint_service.get_async_model_endpoint_inference_gateway()
+        response = await inference_gateway.wait_for_task(task_id=task_id, timeout_seconds=0)
+        yield response
+        while response.status not in (TaskStatus.SUCCESS, TaskStatus.FAILURE):
+            last_status = response.status
+            response = await inference_gateway.wait_for_task(
+                task_id=task_id, timeout_seconds=TASK_EVENTS_WAIT_SECONDS
+            )
+            if response.status != last_status:
+                yield response
+
+
+class GetAsyncInferenceTasksStatusV1UseCase:
+    def __init__(self, model_endpoint_service: ModelEndpointService):
+        self.model_endpoint_service = model_endpoint_service
+
+    def execute(
+        self, user: User, request: GetAsyncTasksStatusV1Request
+    ) -> GetAsyncTasksStatusV1Response:
+        """
+        Runs the use case to get the statuses of many async inference tasks at once.
+
+        Args:
+            user: The user who is getting the async inference tasks.
+            request: The IDs of the tasks, and whether to include their results.
+
+        Returns:
+            A response object that contains the statuses of the tasks, in the order of the request,
+            and their results if requested.
+        """
+        # TODO: check that user is authorized to access these tasks.
+        inference_gateway = self.model_endpoint_service.get_async_model_endpoint_inference_gateway()
+        tasks = inference_gateway.get_tasks(task_ids=request.task_ids)
+        if not request.include_results:
+            tasks = [
+                GetAsyncTaskV1Response(task_id=task.task_id, status=task.status) for task in tasks
+            ]
+        return GetAsyncTasksStatusV1Response(tasks=tasks)
@@ -197,7 +197,7 @@ class CreateDockerImageBatchJobV1UseCase:
                 f"User {user} does not have permission for the specified batch job bundle"
             )
 
-        if not self.docker_repository.image_exists(
+        if not await self.docker_repository.image_exists_async(
             image_tag=batch_bundle.image_tag, repository_name=batch_bundle.image_repository
         ):
             raise DockerImageNotFoundException(
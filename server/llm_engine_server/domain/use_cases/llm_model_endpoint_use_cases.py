@@ -1,8 +1,11 @@
+import asyncio
 import json
 from dataclasses import asdict
-from typing import Any, AsyncIterable, Dict, Optional
+from typing import Any, AsyncIterable, Dict, Optional, Tuple
 
 from llm_engine_server.common.dtos.llms import (
+    CompletionBatchStreamV1Request,
+    CompletionBatchStreamV1Response,
     CompletionOutput,
     CompletionStreamOutput,
     CompletionStreamV1Request,
@@ -17,6 +20,7 @@ from llm_engine_server.common.dtos.llms import (
 from llm_engine_server.common.dtos.model_bundles import CreateModelBundleV2Request
 from llm_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
 from llm_engine_server.common.dtos.tasks import EndpointPredictV1Request, TaskStatus
+from llm_engine_server.common.pagination import get_next_page_token
 from llm_engine_server.common.resource_limits import validate_resource_requests
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
@@ -431,7 +435,12 @@ class ListLLMModelEndpointsV1UseCase:
         self.llm_model_endpoint_service = llm_model_endpoint_service
 
     async def execute(
-        self, user: User, name: Optional[str], order_by: Optional[ModelEndpointOrderBy]
+        self,
+        user: User,
+        name: Optional[str],
+        order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> ListLLMModelEndpointsV1Response:
         """
         Runs the use case to list all Model Endpoints owned by the user with the given name.
@@ -440,18 +449,21 @@ class ListLLMModelEndpointsV1UseCase:
             user: The owner of the model endpoint(s).
             name: The name of the Model Endpoint(s).
             order_by: An optional argument to specify the output ordering of the model endpoints.
+            limit: An optional maximum number of model endpoints to return.
+            page_token: An optional token, from a previous response, of the page to return.
 
         Returns:
             A response object that contains the model endpoints.
         """
         model_endpoints = await self.llm_model_endpoint_service.list_llm_model_endpoints(
-            owner=user.team_id, name=name, order_by=order_by
+            owner=user.team_id, name=name, order_by=order_by, limit=limit, page_token=page_token
         )
         return ListLLMModelEndpointsV1Response(
             model_endpoints=[
                 _model_endpoint_entity_to_get_llm_model_endpoint_response(m)
                 for m in model_endpoints
-            ]
+            ],
+            next_page_token=get_next_page_token([m.record for m in model_endpoints], limit),
         )
 
 
@@ -689,7 +701,25 @@ class CompletionStreamV1UseCase:
             ObjectNotFoundException: If a model endpoint with the given name could not be found.
             ObjectNotAuthorizedException: If the owner does not own the model endpoint.
         """
+        model_endpoint = await self.get_streaming_model_endpoint(
+            user=user, model_endpoint_name=model_endpoint_name
+        )
+        async for response in self.stream_completion(
+            model_endpoint=model_endpoint, request=request
+        ):
+            yield response
+
+    async def get_streaming_model_endpoint(
+        self, user: User, model_endpoint_name: str
+    ) -> ModelEndpoint:
+        """
+        Looks up the streaming LLM endpoint with the given name and checks the user can use it.
 
+        Raises:
+            ObjectNotFoundException: If a model endpoint with the given name could not be found.
+            ObjectNotAuthorizedException: If the owner does not own the model endpoint.
+            EndpointUnsupportedInferenceTypeException: If the endpoint is not a streaming endpoint.
+        """
         model_endpoints = await self.llm_model_endpoint_service.list_llm_model_endpoints(
             owner=user.team_id, name=model_endpoint_name, order_by=None
         )
@@ -716,6 +746,14 @@ class CompletionStreamV1UseCase:
                 f"Endpoint {model_endpoint_name} is not a streaming endpoint."
             )
 
+        return model_endpoint
+
+    async def stream_completion(
+        self, model_endpoint: ModelEndpoint, request: CompletionStreamV1Request
+    ) -> AsyncIterable[CompletionStreamV1Response]:
+        """
+        Streams the completion of a single prompt from an already resolved streaming endpoint.
+        """
         inference_gateway = (
             self.model_endpoint_service.get_streaming_model_endpoint_inference_gateway()
         )
@@ -809,3 +847,89 @@ class CompletionStreamV1UseCase:
                 raise EndpointUnsupportedInferenceTypeException(
                     f"Unsupported inference framework {model_content.inference_framework}"
                 )
+
+
+class CompletionBatchStreamV1UseCase:
+    """
+    Use case for running stream prompt completions for several prompts on an LLM endpoint, with
+    the tokens of all prompts interleaved onto a single stream.
+    """
+
+    def __init__(self, completion_stream_use_case: CompletionStreamV1UseCase):
+        self.completion_stream_use_case = completion_stream_use_case
+
+    async def execute(
+        self, user: User, model_endpoint_name: str, request: CompletionBatchStreamV1Request
+    ) -> AsyncIterable[CompletionBatchStreamV1Response]:
+        """
+        Runs the use case to create a stream inference task for each of the request's prompts.
+
+        The endpoint is resolved and authorized before this returns, so that errors can be
+        reported before the response starts streaming. The prompts are then streamed from it
+        concurrently. Messages are yielded as soon as they arrive from any of the prompts, each
+        tagged with the index of its prompt in the request, so the messages of a given prompt stay
+        in order.
+
+        Args:
+            user: The user who is creating the stream inference tasks.
+            model_endpoint_name: The name of the model endpoint for the tasks.
+            request: The body of the request to forward to the endpoint.
+
+        Returns:
+            Response objects that contain the prompt index, status and result of the tasks.
+
+        Raises:
+            ObjectNotFoundException: If a model endpoint with the given name could not be found.
+            ObjectNotAuthorizedException: If the owner does not own the model endpoint.
+            EndpointUnsupportedInferenceTypeException: If the endpoint is not a streaming endpoint.
+        """
+        model_endpoint = await self.completion_stream_use_case.get_streaming_model_endpoint(
+            user=user, model_endpoint_name=model_endpoint_name
+        )
+        return self._stream_prompts(model_endpoint=model_endpoint, request=request)
+
+    async def _stream_prompts(
+        self, model_endpoint: ModelEndpoint, request: CompletionBatchStreamV1Request
+    ) -> AsyncIterable[CompletionBatchStreamV1Response]:
+        queue: "asyncio.Queue[Tuple[int, Optional[CompletionStreamV1Response]]]" = asyncio.Queue()
+
+        async def stream_prompt(prompt_index: int, prompt: str) -> None:
+            try:
+                async for response in self.completion_stream_use_case.stream_completion(
+                    model_endpoint=model_endpoint,
+                    request=CompletionStreamV1Request(
+                        prompt=prompt,
+                        max_new_tokens=request.max_new_tokens,
+                        temperature=request.temperature,
+                    ),
+                ):
+                    await queue.put((prompt_index, response))
+            finally:
+                # None marks the end of this prompt's stream, whether it finished or failed.
+                await queue.put((prompt_index, None))
+
+        tasks = [
+            asyncio.create_task(stream_prompt(prompt_index, prompt))
+            for prompt_index, prompt in enumerate(request.prompts)
+        ]
+        try:
+            num_unfinished = len(tasks)
+            while num_unfinished > 0:
+                prompt_index, response = await queue.get()
+                if response is None:
+                    num_unfinished -= 1
+                    # Surface any unexpected error; failures from the endpoint itself are
+                    # already returned as FAILURE messages by the inference gateway.
+                    await tasks[prompt_index]
+                    continue
+                yield CompletionBatchStreamV1Response(
+                    prompt_index=prompt_index,
+                    status=response.status,
+                    output=response.output,
+                    traceback=response.traceback,
+                )
+        finally:
+            # Stop the remaining upstream requests if the client went away or a prompt errored.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
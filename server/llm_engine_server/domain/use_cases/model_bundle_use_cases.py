@@ -15,6 +15,7 @@ from llm_engine_server.common.dtos.model_bundles import (
     ModelBundleV1Response,
     ModelBundleV2Response,
 )
+from llm_engine_server.common.pagination import get_next_page_token
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
     DockerImageNotFoundException,
@@ -78,7 +79,7 @@ class CreateModelBundleV1UseCase:
         if request.env_params.framework_type == ModelBundleFrameworkType.CUSTOM:
             # This should always pass due to Pydantic validation.
             assert request.env_params.ecr_repo and request.env_params.image_tag
-            if not self.docker_repository.image_exists(
+            if not await self.docker_repository.image_exists_async(
                 image_tag=request.env_params.image_tag,
                 repository_name=request.env_params.ecr_repo,
             ):
@@ -253,6 +254,8 @@ class ListModelBundlesV1UseCase:
         user: User,
         model_name: Optional[str],
         order_by: Optional[ModelBundleOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> ListModelBundlesV1Response:
         """
         Runs the use case to list all Model Bundles owned by the user with the given name.
@@ -261,15 +264,18 @@ class ListModelBundlesV1UseCase:
             user: The user making request, on team who owns the model bundle(s).
             model_name: The name of the Model Bundle(s).
             order_by: An optional argument to specify the output ordering of the model bundles.
+            limit: An optional maximum number of model bundles to return.
+            page_token: An optional token, from a previous response, of the page to return.
 
         Returns:
             A response object that contains the model bundles.
         """
         model_bundles = await self.model_bundle_repository.list_model_bundles(
-            user.team_id, model_name, order_by
+            user.team_id, model_name, order_by, limit=limit, page_token=page_token
         )
         return ListModelBundlesV1Response(
-            model_bundles=[ModelBundleV1Response.from_orm(mb) for mb in model_bundles]
+            model_bundles=[ModelBundleV1Response.from_orm(mb) for mb in model_bundles],
+            next_page_token=get_next_page_token(model_bundles, limit),
         )
 
 
@@ -372,7 +378,7 @@ class CreateModelBundleV2UseCase:
         if (
             isinstance(request.flavor, ArtifactLike)
             and isinstance(request.flavor.framework, CustomFramework)
-            and not self.docker_repository.image_exists(
+            and not await self.docker_repository.image_exists_async(
                 image_tag=request.flavor.framework.image_tag,
                 repository_name=request.flavor.framework.image_repository,
             )
@@ -384,7 +390,7 @@ class CreateModelBundleV2UseCase:
         elif (
             isinstance(request.flavor, RunnableImageLike)
             and self.docker_repository.is_repo_name(request.flavor.repository)
-            and not self.docker_repository.image_exists(
+            and not await self.docker_repository.image_exists_async(
                 image_tag=request.flavor.tag,
                 repository_name=request.flavor.repository,
             )
@@ -534,6 +540,8 @@ class ListModelBundlesV2UseCase:
         user: User,
         model_name: Optional[str],
         order_by: Optional[ModelBundleOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> ListModelBundlesV2Response:
         """
         Runs the use case to list all Model Bundles owned by the user with the given name.
@@ -542,15 +550,18 @@ class ListModelBundlesV2UseCase:
             user: The user making request, on team who owns the model bundle(s).
             model_name: The name of the Model Bundle(s).
             order_by: An optional argument to specify the output ordering of the model bundles.
+            limit: An optional maximum number of model bundles to return.
+            page_token: An optional token, from a previous response, of the page to return.
 
         Returns:
             A response object that contains the model bundles.
         """
         model_bundles = await self.model_bundle_repository.list_model_bundles(
-            user.team_id, model_name, order_by
+            user.team_id, model_name, order_by, limit=limit, page_token=page_token
         )
         return ListModelBundlesV2Response(
-            model_bundles=[ModelBundleV2Response.from_orm(mb) for mb in model_bundles]
+            model_bundles=[ModelBundleV2Response.from_orm(mb) for mb in model_bundles],
+            next_page_token=get_next_page_token(model_bundles, limit),
         )
 
 
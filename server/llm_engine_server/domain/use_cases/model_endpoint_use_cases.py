@@ -17,6 +17,7 @@ from llm_engine_server.common.dtos.model_endpoints import (
     UpdateModelEndpointV1Request,
     UpdateModelEndpointV1Response,
 )
+from llm_engine_server.common.pagination import get_next_page_token
 from llm_engine_server.common.resource_limits import MAX_ENDPOINT_SIZE, validate_resource_requests
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
@@ -351,7 +352,12 @@ class ListModelEndpointsV1UseCase:
         self.model_endpoint_service = model_endpoint_service
 
     async def execute(
-        self, user: User, name: Optional[str], order_by: Optional[ModelEndpointOrderBy]
+        self,
+        user: User,
+        name: Optional[str],
+        order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> ListModelEndpointsV1Response:
         """
         Runs the use case to list all Model Endpoints owned by the user with the given name.
@@ -360,17 +366,20 @@ class ListModelEndpointsV1UseCase:
             user: The owner of the model endpoint(s).
             name: The name of the Model Endpoint(s).
             order_by: An optional argument to specify the output ordering of the model endpoints.
+            limit: An optional maximum number of model endpoints to return.
+            page_token: An optional token, from a previous response, of the page to return.
 
         Returns:
             A response object that contains the model endpoints.
         """
         model_endpoints = await self.model_endpoint_service.list_model_endpoints(
-            owner=user.team_id, name=name, order_by=order_by
+            owner=user.team_id, name=name, order_by=order_by, limit=limit, page_token=page_token
         )
         return ListModelEndpointsV1Response(
             model_endpoints=[
                 model_endpoint_entity_to_get_model_endpoint_response(m) for m in model_endpoints
-            ]
+            ],
+            next_page_token=get_next_page_token([m.record for m in model_endpoints], limit),
         )
 
 
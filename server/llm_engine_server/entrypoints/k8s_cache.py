@@ -14,9 +14,9 @@ from llm_engine_server.common.config import hmi_config
 from llm_engine_server.common.constants import READYZ_FPATH
 from llm_engine_server.common.env_vars import CIRCLECI
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
-from llm_engine_server.db.base import SessionAsyncNullPool
+from llm_engine_server.db.base import SessionAsyncNullPool, set_engine_monitoring_metrics_gateway
 from llm_engine_server.domain.repositories import DockerRepository
-from llm_engine_server.infra.gateways import FakeMonitoringMetricsGateway
+from llm_engine_server.infra.gateways import DatadogMonitoringMetricsGateway
 from llm_engine_server.infra.gateways.resources.endpoint_resource_gateway import (
     EndpointResourceGateway,
 )
@@ -91,7 +91,8 @@ async def main(args: Any):
     logger.info(f"Using cache redis url {redis_url}")
     cache_repo = RedisModelEndpointCacheRepository(redis_info=redis_url)
 
-    monitoring_metrics_gateway = FakeMonitoringMetricsGateway()
+    monitoring_metrics_gateway = DatadogMonitoringMetricsGateway()
+    set_engine_monitoring_metrics_gateway(monitoring_metrics_gateway)
     endpoint_record_repo = DbModelEndpointRecordRepository(
         monitoring_metrics_gateway=monitoring_metrics_gateway,
         session=SessionAsyncNullPool,
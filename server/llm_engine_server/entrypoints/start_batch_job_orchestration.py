@@ -60,6 +60,7 @@ async def run_batch_job(
         monitoring_metrics_gateway=monitoring_metrics_gateway,
         session=session,
         read_only=False,
+        redis_client=redis,
     )
 
     sqs_delegate: SQSEndpointResourceDelegate
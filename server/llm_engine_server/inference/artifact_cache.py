@@ -0,0 +1,164 @@
+"""
+A cache of model artifacts (e.g. bundles) in a directory shared by the inference pods of a node,
+so that pods scheduled onto a node that already has their artifact don't download it again. Each
+owner's pods mount a directory of their own (see the chart's serviceTemplate.artifactCache), since
+the code that pods run would otherwise be able to overwrite the artifacts of other owners. Each of
+these directories is a cache of its own, so ARTIFACT_CACHE_MAX_BYTES is an owner's share of the
+node's disk budget rather than the whole budget.
+"""
+import fcntl
+import hashlib
+import os
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import boto3
+from llm_engine_server.core.loggers import make_logger
+from llm_engine_server.core.utils.url import parse_attachment_url
+from llm_engine_server.inference.domain.gateways.inference_monitoring_metrics_gateway import (
+    InferenceMonitoringMetricsGateway,
+)
+
+logger = make_logger(__name__)
+
+ARTIFACT_CACHE_DIR_KEY = "ARTIFACT_CACHE_DIR"
+ARTIFACT_CACHE_MAX_BYTES_KEY = "ARTIFACT_CACHE_MAX_BYTES"
+DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 25 * 1024**3
+
+_PARTIAL_SUFFIX = ".partial"
+_ENTRY_MODE = 0o444
+
+
+class NodeArtifactCache:
+    """
+    Artifacts are stored under a hash of their url and version (e.g. their s3 ETag), so a new
+    version of an artifact is a new entry. Pods populating the same entry at once take a lock on
+    it, so that only one of them downloads it while the others wait, and pods using an entry share
+    that lock, so that it isn't evicted under them. Entries are read-only once
+    populated. Once the entries take more than max_bytes, the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: int,
+        monitoring_metrics_gateway: Optional[InferenceMonitoringMetricsGateway] = None,
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.monitoring_metrics_gateway = monitoring_metrics_gateway
+        self._objects_dir = os.path.join(root, "objects")
+        self._locks_dir = os.path.join(root, "locks")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._locks_dir, exist_ok=True)
+
+    @staticmethod
+    def get_key(url: str, version: str) -> str:
+        return hashlib.sha256(f"{url}\n{version}".encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def get_or_populate(
+        self, url: str, version: str, populate: Callable[[str], None]
+    ) -> Iterator[str]:
+        """
+        Yields the path of the cached artifact, which isn't evicted until the context exits. On a
+        miss, populate is called with the path to write the artifact to first.
+        """
+        key = self.get_key(url, version)
+        path = os.path.join(self._objects_dir, key)
+        populated = False
+        while True:
+            # Readers share the entry's lock, so that it isn't evicted while they use it.
+            with self._lock(key, shared=True):
+                if os.path.exists(path):
+                    if not populated:
+                        self._hit(url, path)
+                    yield path
+                    return
+
+            with self._lock(key):
+                # Another pod may have populated the entry while this one waited for the lock.
+                if not os.path.exists(path):
+                    self._populate(url, path, populate)
+                    populated = True
+            # If the entry is evicted before it's locked again, it's populated again.
+            self.evict(keep=key)
+
+    def _populate(self, url: str, path: str, populate: Callable[[str], None]) -> None:
+        logger.info(f"Artifact cache miss for {url}")
+        if self.monitoring_metrics_gateway is not None:
+            self.monitoring_metrics_gateway.emit_artifact_cache_miss()
+        partial_path = path + _PARTIAL_SUFFIX
+        try:
+            populate(partial_path)
+            os.chmod(partial_path, _ENTRY_MODE)
+            os.rename(partial_path, path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Evicts the least recently used entries until the entries fit in max_bytes, except for the
+        entry given by keep.
+        """
+        with self._lock("evict"):
+            entries: List[Tuple[float, int, str]] = []
+            for entry in os.scandir(self._objects_dir):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.name))
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+                key = name[: -len(_PARTIAL_SUFFIX)] if name.endswith(_PARTIAL_SUFFIX) else name
+                if key == keep:
+                    continue
+                # Entries that are being populated, or used, are skipped.
+                with self._lock(key, blocking=False) as locked:
+                    if not locked:
+                        continue
+                    logger.info(f"Evicting {name} from the artifact cache")
+                    os.remove(os.path.join(self._objects_dir, name))
+                total_bytes -= size
+
+    def _hit(self, url: str, path: str) -> None:
+        logger.info(f"Artifact cache hit for {url}")
+        if self.monitoring_metrics_gateway is not None:
+            self.monitoring_metrics_gateway.emit_artifact_cache_hit()
+        # Marks the entry as recently used.
+        os.utime(path)
+
+    @contextmanager
+    def _lock(self, name: str, blocking: bool = True, shared: bool = False) -> Iterator[bool]:
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            operation |= fcntl.LOCK_NB
+        with open(os.path.join(self._locks_dir, f"{name}.lock"), "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, operation)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def get_artifact_cache(
+    monitoring_metrics_gateway: Optional[InferenceMonitoringMetricsGateway] = None,
+) -> Optional[NodeArtifactCache]:
+    """Returns the artifact cache of the node, if the pod has one mounted."""
+    root = os.getenv(ARTIFACT_CACHE_DIR_KEY)
+    if not root:
+        return None
+    max_bytes = int(os.getenv(ARTIFACT_CACHE_MAX_BYTES_KEY, DEFAULT_ARTIFACT_CACHE_MAX_BYTES))
+    return NodeArtifactCache(root, max_bytes, monitoring_metrics_gateway)
+
+
+def get_s3_object_version(url: str) -> str:
+    """Returns the ETag of an s3 object, which changes whenever the object is overwritten."""
+    parsed_url = parse_attachment_url(url)
+    s3_client = boto3.Session(profile_name=os.getenv("AWS_PROFILE")).client("s3")
+    return s3_client.head_object(Bucket=parsed_url.bucket, Key=parsed_url.key)["ETag"]
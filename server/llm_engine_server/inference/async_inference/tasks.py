@@ -1,14 +1,16 @@
 import os
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
 from celery import Task
 from celery.signals import worker_process_init
-from llm_engine_server.common.constants import READYZ_FPATH
-from llm_engine_server.common.dtos.tasks import EndpointPredictV1Request
+from llm_engine_server.common.constants import ASYNC_TASK_COMPLETION_CHANNEL_PREFIX, READYZ_FPATH
+from llm_engine_server.common.dtos.tasks import EndpointPredictV1Request, TaskStatus
 from llm_engine_server.common.serialization_utils import str_to_bool
+from llm_engine_server.core.celery.app import get_redis_host_port, get_redis_instance
 from llm_engine_server.core.loggers import make_logger
 from llm_engine_server.core.utils.timer import timer
 from llm_engine_server.domain.entities import ModelEndpointConfig
+from llm_engine_server.inference.artifact_cache import get_artifact_cache
 from llm_engine_server.inference.async_inference.celery import async_inference_service
 from llm_engine_server.inference.common import (
     get_endpoint_config,
@@ -19,6 +21,7 @@ from llm_engine_server.inference.infra.gateways.datadog_inference_monitoring_met
     DatadogInferenceMonitoringMetricsGateway,
 )
 from llm_engine_server.inference.post_inference_hooks import PostInferenceHooksHandler
+from redis import Redis, StrictRedis
 
 logger = make_logger(__name__)
 
@@ -27,13 +30,15 @@ logger = make_logger(__name__)
 predict_fn_or_cls: Optional[Callable] = None
 endpoint_config: Optional[ModelEndpointConfig] = None
 hooks: Optional[PostInferenceHooksHandler] = None
+completion_redis: Optional[Union[Redis, StrictRedis]] = None
 
 
 def init_worker_global():
     global predict_fn_or_cls, endpoint_config, hooks
 
+    monitoring_metrics_gateway = DatadogInferenceMonitoringMetricsGateway()
     with timer(logger=logger, name="load_predict_fn_or_cls"):
-        predict_fn_or_cls = load_predict_fn_or_cls()
+        predict_fn_or_cls = load_predict_fn_or_cls(get_artifact_cache(monitoring_metrics_gateway))
 
     endpoint_config = get_endpoint_config()
     hooks = PostInferenceHooksHandler(
@@ -43,7 +48,7 @@ def init_worker_global():
         user_id=endpoint_config.user_id,
         default_callback_url=endpoint_config.default_callback_url,
         default_callback_auth=endpoint_config.default_callback_auth,
-        monitoring_metrics_gateway=DatadogInferenceMonitoringMetricsGateway(),
+        monitoring_metrics_gateway=monitoring_metrics_gateway,
     )
     # k8s health check
     with open(READYZ_FPATH, "w") as f:
@@ -67,6 +72,23 @@ if not str_to_bool(os.getenv("PREWARM")):
         f.write("READY")
 
 
+def publish_task_completion(task_id: str, status: TaskStatus) -> None:
+    """
+    Notifies the gateway that a task finished, so that clients waiting on it don't need to poll the
+    result backend. This is best-effort, since clients read the result backend again eventually.
+    """
+    global completion_redis
+    try:
+        if completion_redis is None:
+            host, _ = get_redis_host_port()
+            if host is None:
+                return
+            completion_redis = get_redis_instance()
+        completion_redis.publish(f"{ASYNC_TASK_COMPLETION_CHANNEL_PREFIX}{task_id}", status.value)
+    except Exception:
+        logger.exception(f"Failed to publish the completion of task {task_id}")
+
+
 class InferenceTask(Task):
     def __init__(self):
         self.worker_initialized = False
@@ -87,10 +109,15 @@ class InferenceTask(Task):
         return run_predict(predict_fn_or_cls, request_params_pydantic)  # type: ignore
 
     def on_success(self, retval, task_id, args, kwargs):
+        # The result is already stored by now.
+        publish_task_completion(task_id, TaskStatus.SUCCESS)
         request_params = args[0]
         request_params_pydantic = EndpointPredictV1Request.parse_obj(request_params)
         hooks.handle(request_params_pydantic, retval, task_id)  # type: ignore
 
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        publish_task_completion(task_id, TaskStatus.FAILURE)
+
 
 @async_inference_service.task(base=InferenceTask)
 def predict(request_params: Dict[str, Any], return_pickled=True):
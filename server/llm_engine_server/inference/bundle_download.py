@@ -0,0 +1,236 @@
+"""
+Downloads zip bundles from s3 with parallel ranged GETs, streaming each part to disk so that memory
+use is bounded no matter how large the bundle is. Members of the zip file are extracted as soon as
+the parts holding them are downloaded, rather than after the whole download.
+"""
+import hashlib
+import os
+import shutil
+import time
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from llm_engine_server.common.io import open_wrapper
+from llm_engine_server.core.loggers import make_logger
+from llm_engine_server.core.utils.url import parse_attachment_url
+
+logger = make_logger(__name__)
+
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_NUM_WORKERS = 8
+READ_CHUNK_SIZE = 1024 * 1024
+MAX_PART_ATTEMPTS = 5
+PART_RETRY_BACKOFF_SECONDS = 1.0
+
+_Part = Tuple[int, int]
+
+
+class BundleChecksumError(ValueError):
+    pass
+
+
+def download_and_unzip_bundle(
+    bundle_url: str,
+    local_zip_path: str,
+    extract_path: str,
+    s3_client: Optional[Any] = None,
+    part_size: int = DEFAULT_PART_SIZE,
+    num_workers: int = DEFAULT_NUM_WORKERS,
+) -> None:
+    """
+    Downloads the zip bundle at bundle_url to local_zip_path, and extracts it into extract_path.
+
+    Bundles in s3 are downloaded in parts of part_size bytes, num_workers at a time. Each part is
+    retried from where it stopped if its download fails, and all the parts are read from the same
+    version of the bundle. The download is checked against the MD5 checksum of the bundle when s3
+    has it (i.e. when the bundle wasn't a multipart upload, nor encrypted with SSE-KMS or SSE-C),
+    and each extracted member against its CRC-32. Bundles elsewhere are streamed to disk and then
+    extracted.
+    """
+    if not bundle_url.startswith("s3://"):
+        with open_wrapper(bundle_url, "rb") as remote_zip_f, open(
+            local_zip_path, "wb"
+        ) as local_zip_f:
+            shutil.copyfileobj(remote_zip_f, local_zip_f, READ_CHUNK_SIZE)
+        shutil.unpack_archive(local_zip_path, extract_path, "zip")
+        return
+
+    if s3_client is None:
+        s3_client = boto3.Session(profile_name=os.getenv("AWS_PROFILE")).client(
+            "s3", config=Config(max_pool_connections=num_workers)
+        )
+    parsed_url = parse_attachment_url(bundle_url)
+    _ParallelBundleDownload(
+        s3_client=s3_client,
+        bucket=parsed_url.bucket,
+        key=parsed_url.key,
+        local_zip_path=local_zip_path,
+        extract_path=extract_path,
+        part_size=part_size,
+        num_workers=num_workers,
+    ).run()
+
+
+class _ParallelBundleDownload:
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        local_zip_path: str,
+        extract_path: str,
+        part_size: int,
+        num_workers: int,
+    ):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.local_zip_path = local_zip_path
+        self.extract_path = extract_path
+        self.part_size = part_size
+        self.num_workers = num_workers
+        self._etag = ""
+        self._etag_is_md5 = False
+
+    def run(self) -> None:
+        head = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+        size = head["ContentLength"]
+        if size == 0:
+            raise zipfile.BadZipFile(f"s3://{self.bucket}/{self.key} is empty, not a zip file")
+        self._etag = head["ETag"]
+        # The ETags of multipart uploads, and of objects encrypted with SSE-KMS or SSE-C, aren't
+        # the MD5 of the object.
+        self._etag_is_md5 = (
+            "-" not in self._etag
+            and not head.get("ServerSideEncryption", "").startswith("aws:kms")
+            and "SSECustomerAlgorithm" not in head
+        )
+        parts = [
+            (start, min(start + self.part_size, size) - 1)
+            for start in range(0, size, self.part_size)
+        ]
+        logger.info(
+            f"Downloading {size} bytes from s3://{self.bucket}/{self.key} in {len(parts)} parts"
+        )
+
+        with open(self.local_zip_path, "wb") as f:
+            f.truncate(size)
+        fd = os.open(self.local_zip_path, os.O_WRONLY)
+        # Unbuffered, since a read-ahead buffer could hold bytes of parts that aren't downloaded yet.
+        zip_f = open(self.local_zip_path, "rb", buffering=0)
+        try:
+            # The central directory is at the end of a zip file, so the last part is downloaded
+            # first. The byte range of each member is then known, and each member can be extracted
+            # as soon as the parts holding it are downloaded.
+            self._download_part(fd, parts[-1])
+            downloaded = {len(parts) - 1}
+            zip_file = self._open_zip_file(zip_f)
+            if zip_file is None:
+                logger.info("Central directory spans several parts, extracting after downloading")
+            pending_members = self._get_member_parts(zip_file, size) if zip_file else {}
+
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                futures: Dict[Future, int] = {
+                    executor.submit(self._download_part, fd, part): index
+                    for index, part in enumerate(parts[:-1])
+                }
+                try:
+                    self._extract_ready_members(zip_file, pending_members, downloaded)
+                    for future in as_completed(futures):
+                        future.result()
+                        downloaded.add(futures[future])
+                        self._extract_ready_members(zip_file, pending_members, downloaded)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            os.close(fd)
+            zip_f.close()
+
+        if zip_file is None:
+            shutil.unpack_archive(self.local_zip_path, self.extract_path, "zip")
+        self._check_md5()
+
+    def _download_part(self, fd: int, part: _Part) -> None:
+        start, end = part
+        offset = start
+        for attempt in range(1, MAX_PART_ATTEMPTS + 1):
+            try:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    Range=f"bytes={offset}-{end}",
+                    IfMatch=self._etag,
+                )
+                body = response["Body"]
+                for chunk in iter(partial(body.read, READ_CHUNK_SIZE), b""):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                if offset > end:
+                    return
+                error: Exception = IOError(f"Download of bytes {offset}-{end} ended early")
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("PreconditionFailed", "412"):
+                    raise
+                error = e
+            except (BotoCoreError, IOError) as e:
+                # e.g. the connection was reset while streaming the part.
+                error = e
+            if attempt == MAX_PART_ATTEMPTS:
+                raise error
+            logger.warning(f"Retrying download of bytes {offset}-{end} after error: {error}")
+            time.sleep(PART_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+    @staticmethod
+    def _open_zip_file(zip_f: IO[bytes]) -> Optional[zipfile.ZipFile]:
+        try:
+            return zipfile.ZipFile(zip_f)
+        except zipfile.BadZipFile:
+            # The central directory doesn't fit in the last part, so it isn't all downloaded yet.
+            return None
+
+    def _get_member_parts(self, zip_file: zipfile.ZipFile, size: int) -> Dict[str, Set[int]]:
+        """Returns the indexes of the parts holding each member of the zip file, by name."""
+        members: List[zipfile.ZipInfo] = sorted(
+            zip_file.infolist(), key=lambda info: info.header_offset
+        )
+        member_parts: Dict[str, Set[int]] = {}
+        for index, member in enumerate(members):
+            # A member ends where the next one (or the central directory) starts.
+            end = members[index + 1].header_offset if index + 1 < len(members) else size
+            member_parts[member.filename] = set(
+                range(member.header_offset // self.part_size, (end - 1) // self.part_size + 1)
+            )
+        return member_parts
+
+    def _extract_ready_members(
+        self,
+        zip_file: Optional[zipfile.ZipFile],
+        pending_members: Dict[str, Set[int]],
+        downloaded: Set[int],
+    ) -> None:
+        if zip_file is None:
+            return
+        for name, member_parts in list(pending_members.items()):
+            if member_parts <= downloaded:
+                zip_file.extract(name, self.extract_path)
+                del pending_members[name]
+
+    def _check_md5(self) -> None:
+        if not self._etag_is_md5:
+            return
+        expected_md5 = self._etag.strip('"')
+        md5 = hashlib.md5()
+        with open(self.local_zip_path, "rb") as f:
+            for chunk in iter(partial(f.read, READ_CHUNK_SIZE), b""):
+                md5.update(chunk)
+        if md5.hexdigest() != expected_md5:
+            raise BundleChecksumError(
+                f"MD5 of s3://{self.bucket}/{self.key} is {md5.hexdigest()}, expected {expected_md5}"
+            )
@@ -0,0 +1,36 @@
+"""
+Records which bundle has been extracted into an image at build time, so that the pods running the
+image can tell whether they still need to download and extract their bundle.
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+BUNDLE_MANIFEST_FILENAME = ".bundle_manifest.json"
+
+
+def write_bundle_manifest(base_path: str, bundle_url: str, files: List[str]) -> None:
+    """
+    Args:
+        base_path: The directory the bundle was extracted into.
+        bundle_url: The location the bundle was downloaded from.
+        files: The paths of the extracted files, relative to base_path.
+    """
+    manifest = {"bundle_url": bundle_url, "files": sorted(files)}
+    with open(os.path.join(base_path, BUNDLE_MANIFEST_FILENAME), "w") as f:
+        json.dump(manifest, f)
+
+
+def read_bundle_manifest(base_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(base_path, BUNDLE_MANIFEST_FILENAME), "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def bundle_manifest_matches(manifest: Dict[str, Any], base_path: str, bundle_url: str) -> bool:
+    """Whether the manifest is of the given bundle, and all of its files are still there."""
+    return manifest.get("bundle_url") == bundle_url and all(
+        os.path.exists(os.path.join(base_path, file)) for file in manifest.get("files", [])
+    )
@@ -4,7 +4,7 @@ import os
 import shutil
 import subprocess
 import tempfile
-from typing import Any, Callable, Dict
+from typing import IO, Any, Callable, Dict, Optional
 from uuid import uuid4
 
 import boto3
@@ -15,6 +15,12 @@ from llm_engine_server.common.serialization_utils import b64_to_python_json
 from llm_engine_server.core.loggers import make_logger
 from llm_engine_server.core.utils.timer import timer
 from llm_engine_server.domain.entities import ModelEndpointConfig
+from llm_engine_server.inference.artifact_cache import NodeArtifactCache, get_s3_object_version
+from llm_engine_server.inference.bundle_download import download_and_unzip_bundle
+from llm_engine_server.inference.bundle_manifest import (
+    bundle_manifest_matches,
+    read_bundle_manifest,
+)
 from llm_engine_server.inference.service_requests import make_request
 
 logger = make_logger(__name__)
@@ -59,7 +65,48 @@ def _set_make_request_fn(obj: Any) -> None:
         obj.set_make_request_fn(make_request)
 
 
-def load_predict_fn_or_cls():
+def _download_and_unzip_bundle(
+    bundle_url: str, base_path: str, artifact_cache: Optional[NodeArtifactCache]
+) -> None:
+    if artifact_cache is None or not bundle_url.startswith("s3://"):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            download_and_unzip_bundle(bundle_url, os.path.join(tmpdir, "bundle.zip"), base_path)
+        return
+
+    extracted = False
+
+    def populate(path: str) -> None:
+        nonlocal extracted
+        download_and_unzip_bundle(bundle_url, path, base_path)
+        extracted = True
+
+    with artifact_cache.get_or_populate(
+        bundle_url, get_s3_object_version(bundle_url), populate
+    ) as local_zip_path:
+        if not extracted:
+            shutil.unpack_archive(local_zip_path, base_path, "zip")
+
+
+def _open_bundle(bundle_url: str, artifact_cache: Optional[NodeArtifactCache]) -> IO:
+    if artifact_cache is None or not bundle_url.startswith("s3://"):
+        return open_wrapper(bundle_url, "rb")
+
+    def populate(path: str) -> None:
+        with open_wrapper(bundle_url, "rb") as remote_f, open(path, "wb") as local_f:
+            shutil.copyfileobj(remote_f, local_f)
+
+    with artifact_cache.get_or_populate(
+        bundle_url, get_s3_object_version(bundle_url), populate
+    ) as local_path:
+        # The open file stays readable even if the entry is evicted once the context exits.
+        return open(local_path, "rb")
+
+
+def load_predict_fn_or_cls(artifact_cache: Optional[NodeArtifactCache] = None):
+    """
+    Loads the bundle of the endpoint. Bundles are looked up in the node's artifact cache first,
+    if there is one.
+    """
     bundle_url = os.getenv(BUNDLE_URL_KEY)
     load_predict_fn_module_path = os.getenv(LOAD_PREDICT_FN_MODULE_PATH_KEY, "")
     load_model_fn_module_path = os.getenv(LOAD_MODEL_FN_MODULE_PATH_KEY, "")
@@ -72,7 +119,9 @@ def load_predict_fn_or_cls():
         base_path, "user_config"
     )  # Keep in sync with the volumeMount in the deployment yaml
     user_config_location = os.getenv(USER_CONFIG_LOCATION_KEY, default_user_config_location)
-    with open_wrapper(user_config_location, "r") as f:
+    with timer(logger=logger, name="read_user_config"), open_wrapper(
+        user_config_location, "r"
+    ) as f:
         b64text = f.read().strip("\n")
         deserialized_config = b64_to_python_json(b64text)
         logger.info(f"Read in config {deserialized_config}")
@@ -84,22 +133,22 @@ def load_predict_fn_or_cls():
         )
 
     if load_predict_fn_module_path and load_model_fn_module_path:
-        if local_bundle_path:
+        with timer(logger=logger, name="check_bundle_manifest"):
+            bundle_manifest = read_bundle_manifest(base_path)
+            bundle_is_extracted = (
+                bundle_manifest_matches(bundle_manifest, base_path, bundle_url)
+                if bundle_manifest is not None
+                # Images built before the manifest was written only have the bundle path.
+                else bool(local_bundle_path)
+            )
+        if bundle_is_extracted:
             logger.info("Bundle has already been loaded into container")
         else:
             logger.info(f"Loading bundle from inside the container {bundle_url}")
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                local_zip_path = os.path.join(tmpdir, "bundle.zip")
-                with timer(logger=logger, name="download_zip_bundle"):
-                    with open_wrapper(bundle_url, "rb") as remote_zip_f, open(
-                        local_zip_path, "wb"
-                    ) as local_zip_f:
-                        local_zip_f.write(remote_zip_f.read())
-
-                with timer(logger=logger, name="unzip_bundle"):
-                    shutil.unpack_archive(local_zip_path, base_path, "zip")
-                    # TODO might be bugged with some zip files? I tried absolute paths and it failed for me
+            # The bundle is unzipped while it's downloaded, so both are timed together.
+            with timer(logger=logger, name="download_and_unzip_bundle"):
+                _download_and_unzip_bundle(bundle_url, base_path, artifact_cache)
 
         with timer(logger=logger, name="load_model_fn_from_module"):
             load_model_fn = _load_fn_from_module(load_model_fn_module_path)
@@ -120,7 +169,7 @@ def load_predict_fn_or_cls():
         # e.g. s3://scale-ml/hosted-model-inference/predict_fns/abc123
 
         with timer(logger=logger, name="download_and_deserialize_cloudpickle_bundle"):
-            with open_wrapper(bundle_url, "rb") as f:
+            with _open_bundle(bundle_url, artifact_cache) as f:
                 with timer(logger=logger, name="deserialize_cloudpickle_bundle"):
                     bundle = cloudpickle.load(f)
 
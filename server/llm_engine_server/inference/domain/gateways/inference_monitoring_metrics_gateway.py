@@ -30,3 +30,15 @@ class InferenceMonitoringMetricsGateway(ABC):
         Args:
             hook: The name of the hook
         """
+
+    @abstractmethod
+    def emit_artifact_cache_hit(self):
+        """
+        Node-local artifact cache hit metric
+        """
+
+    @abstractmethod
+    def emit_artifact_cache_miss(self):
+        """
+        Node-local artifact cache miss metric
+        """
@@ -1,12 +1,17 @@
+import compileall
 import importlib
 import os
 import shutil
+import zipfile
 
 from llm_engine_server.core.loggers import make_logger
+from llm_engine_server.core.utils.timer import timer
+from llm_engine_server.inference.bundle_manifest import write_bundle_manifest
 
 logger = make_logger(__name__)
 
 LOCAL_BUNDLE_PATH = os.getenv("LOCAL_BUNDLE_PATH", "")
+BUNDLE_URL = os.getenv("BUNDLE_URL", "")
 LOAD_MODEL_MODULE_PATH = os.getenv("LOAD_MODEL_MODULE_PATH", "")
 LOAD_PREDICT_MODULE_PATH = os.getenv("LOAD_PREDICT_MODULE_PATH", "")
 
@@ -25,13 +30,22 @@ def load_module(module_path):
 
 def download_and_inject_bundle():
     logger.info(f"Unzipping bundle from location {LOCAL_BUNDLE_PATH} to {BASE_PATH_IN_ENDPOINT}")
-    shutil.unpack_archive(LOCAL_BUNDLE_PATH, BASE_PATH_IN_ENDPOINT, "zip")
-
-    # Load in functions to create *.pyc files in the __pycache__ in the image which
-    # should make loading faster at worker startup time
-    # TODO(sh763059): renable this if it becomes a bottleneck
-    # load_model_fn = load_module(LOAD_MODEL_MODULE_PATH)
-    # load_predict_fn = load_module(LOAD_PREDICT_MODULE_PATH)
+    with timer(logger=logger, name="unzip_bundle"):
+        with zipfile.ZipFile(LOCAL_BUNDLE_PATH) as zip_file:
+            files = [name for name in zip_file.namelist() if not name.endswith("/")]
+        shutil.unpack_archive(LOCAL_BUNDLE_PATH, BASE_PATH_IN_ENDPOINT, "zip")
+
+    # Create the *.pyc files in the __pycache__ in the image, which makes loading the bundle faster
+    # at worker startup time. The modules are compiled rather than imported, since importing them
+    # may need e.g. GPUs that aren't there at build time.
+    with timer(logger=logger, name="compile_bundle"):
+        for file in files:
+            if file.endswith(".py"):
+                compileall.compile_file(os.path.join(BASE_PATH_IN_ENDPOINT, file), quiet=1)
+
+    # Lets the workers know that they don't need to download and unzip the bundle themselves.
+    if BUNDLE_URL:
+        write_bundle_manifest(BASE_PATH_IN_ENDPOINT, BUNDLE_URL, files)
 
     # Clean up serialized bundle file to save storage
     if os.path.exists(LOCAL_BUNDLE_PATH):
@@ -10,3 +10,9 @@ class DatadogInferenceMonitoringMetricsGateway(InferenceMonitoringMetricsGateway
 
     def emit_successful_post_inference_hook(self, hook: str):
         statsd.increment(f"scale_llm_engine_server.post_inference_hook.{hook}.success")
+
+    def emit_artifact_cache_hit(self):
+        statsd.increment("scale_llm_engine_server.artifact_cache.hit")
+
+    def emit_artifact_cache_miss(self):
+        statsd.increment("scale_llm_engine_server.artifact_cache.miss")
@@ -7,6 +7,7 @@ from typing import Optional
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Response, status
 from llm_engine_server.common.dtos.tasks import EndpointPredictV1Request
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
+from llm_engine_server.inference.artifact_cache import get_artifact_cache
 from llm_engine_server.inference.common import (
     get_endpoint_config,
     load_predict_fn_or_cls,
@@ -71,7 +72,8 @@ concurrency_limiter = MultiprocessingConcurrencyLimiter(CONCURRENCY, FAIL_ON_CON
 
 # How does this interact with threads?
 # Analogous to init_worker() inside async_inference
-predict_fn = load_predict_fn_or_cls()
+monitoring_metrics_gateway = DatadogInferenceMonitoringMetricsGateway()
+predict_fn = load_predict_fn_or_cls(get_artifact_cache(monitoring_metrics_gateway))
 endpoint_config = get_endpoint_config()
 hooks = PostInferenceHooksHandler(
     endpoint_name=endpoint_config.endpoint_name,
@@ -80,7 +82,7 @@ hooks = PostInferenceHooksHandler(
     user_id=endpoint_config.user_id,
     default_callback_url=endpoint_config.default_callback_url,
     default_callback_auth=endpoint_config.default_callback_auth,
-    monitoring_metrics_gateway=DatadogInferenceMonitoringMetricsGateway(),
+    monitoring_metrics_gateway=monitoring_metrics_gateway,
 )
 
 
@@ -17,6 +17,7 @@ from .live_streaming_model_endpoint_inference_gateway import (
 )
 from .live_sync_model_endpoint_inference_gateway import LiveSyncModelEndpointInferenceGateway
 from .model_endpoint_infra_gateway import ModelEndpointInfraGateway
+from .redis_task_completion_gateway import RedisTaskCompletionGateway
 from .s3_filesystem_gateway import S3FilesystemGateway
 
 __all__: Sequence[str] = [
@@ -35,5 +36,6 @@ __all__: Sequence[str] = [
     "LiveStreamingModelEndpointInferenceGateway",
     "LiveSyncModelEndpointInferenceGateway",
     "ModelEndpointInfraGateway",
+    "RedisTaskCompletionGateway",
     "S3FilesystemGateway",
 ]
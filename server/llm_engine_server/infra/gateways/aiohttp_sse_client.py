@@ -4,7 +4,8 @@
 """Main module."""
 # import asyncio
 # import logging
-from datetime import timedelta
+from collections import deque
+from typing import AsyncIterator, Deque, List, Optional
 
 import attr
 
@@ -39,13 +40,126 @@ class MessageEvent:
     .. seealso:: https://developer.mozilla.org/en-US/docs/Web/API/MessageEvent
     """
 
-    type = attr.ib(type=str)
+    type = attr.ib(type=Optional[str])
     message = attr.ib(type=str)
-    data = attr.ib(type=str)
-    origin = attr.ib(type=str)
+    # [katie] data is left as raw bytes so it can be handed straight to orjson.loads.
+    data = attr.ib(type=bytes)
+    origin = attr.ib(type=Optional[str])
     last_event_id = attr.ib(type=str)
 
 
+# [katie] bytes-level replacement for the per-line str handling of the upstream EventSource.
+_LF = b"\n"
+_CR = 13  # ord("\r")
+_SPACE = 32  # ord(" ")
+_DATA_PREFIX = b"data:"
+
+
+class SSEParser:
+    """Incremental, bytes-level parser for a ``text/event-stream`` body.
+
+    Chunks can be fed in exactly as they come off the socket, split at arbitrary byte boundaries;
+    a trailing partial line is buffered until the next chunk. Lines are never decoded to ``str``,
+    and ``data`` payloads are sliced directly out of the received bytes, so the common case of a
+    single ``data:`` line per event costs one allocation per token.
+
+    As with the line iterator of ``aiohttp.StreamReader`` that this replaces, lines are terminated
+    by ``\\n`` or ``\\r\\n``.
+
+    .. seealso:: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_data",
+        "_event_type",
+        "_event_id",
+        "_origin",
+        "last_event_id",
+        "retry",
+    )
+
+    def __init__(self, origin: Optional[str] = None):
+        self._buffer = b""
+        self._data: List[bytes] = []
+        self._event_type = ""
+        self._event_id = ""
+        self._origin = origin
+        self.last_event_id = ""
+        self.retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[MessageEvent]:
+        """Consumes a chunk of the stream and returns the events completed by it, in order."""
+        buffer = self._buffer + chunk if self._buffer else chunk
+        events: List[MessageEvent] = []
+        find = buffer.find
+        startswith = buffer.startswith
+        start = 0
+        while True:
+            end = find(_LF, start)
+            if end == -1:
+                break
+            line_end = end - 1 if end > start and buffer[end - 1] == _CR else end
+            if line_end == start:
+                # empty line
+                event = self._dispatch_event()
+                if event is not None:
+                    events.append(event)
+            elif startswith(_DATA_PREFIX, start, line_end):
+                # Fast path: nearly every line of a token stream is a data line.
+                value_start = start + 5
+                if value_start < line_end and buffer[value_start] == _SPACE:
+                    value_start += 1
+                self._data.append(buffer[value_start:line_end])
+            elif buffer[start] != 0x3A:  # ":" starts a comment line, which is ignored
+                self._process_line(buffer[start:line_end])
+            start = end + 1
+        self._buffer = buffer[start:] if start else buffer
+        return events
+
+    def _process_line(self, line: bytes) -> None:
+        field_name, sep, field_value = line.partition(b":")
+        if sep and field_value[:1] == b" ":
+            field_value = field_value[1:]
+
+        if field_name == b"event":
+            self._event_type = field_value.decode("utf8")
+
+        elif field_name == b"data":
+            self._data.append(field_value)
+
+        elif field_name == b"id" and b"\x00" not in field_value:
+            self._event_id = field_value.decode("utf8")
+
+        elif field_name == b"retry":
+            try:
+                self.retry = int(field_value)
+            except ValueError:
+                # _LOGGER.warning('Received invalid retry value %s, ignore it',
+                #                 field_value)
+                pass
+
+    def _dispatch_event(self) -> Optional[MessageEvent]:
+        self.last_event_id = self._event_id
+
+        data = self._data
+        if not data:
+            self._event_type = ""
+            return None
+
+        message = MessageEvent(
+            type=self._event_type if self._event_type != "" else None,
+            message=self._event_type,
+            data=data[0] if len(data) == 1 else _LF.join(data),
+            origin=self._origin,
+            last_event_id=self.last_event_id,
+        )
+
+        self._event_type = ""
+        self._data = []
+        return message
+
+
 class EventSource:
     """Represent EventSource Interface as an async context manager.
 
@@ -117,12 +231,11 @@ class EventSource:
         # if 'headers' not in self._kwargs:
         #     self._kwargs['headers'] = MultiDict()
 
-        self._event_id = ""
-        self._event_type = ""
-        self._event_data = ""
-
         self._origin = None
         self._response = response  # [katie]
+        self._parser = SSEParser(origin=self._origin)  # [katie]
+        self._pending: Deque[MessageEvent] = deque()  # [katie]
+        self._chunks: Optional[AsyncIterator[bytes]] = None  # [katie]
 
         # self._method = 'GET' if option is None else option.get('method', 'GET')
 
@@ -167,42 +280,19 @@ class EventSource:
         if not self._response:
             raise ValueError
 
-        # async for ... in StreamReader only split line by \n
-        # while self._response.status != 204: [katie]
-        async for line_in_bytes in self._response.content:
-            line = line_in_bytes.decode("utf8")  # type: str
-            line = line.rstrip("\n").rstrip("\r")
-
-            if line == "":
-                # empty line
-                event = self._dispatch_event()
-                if event is not None:
-                    return event
-                continue
-
-            if line[0] == ":":
-                # comment line, ignore
-                continue
-
-            if ":" in line:
-                # contains ':'
-                fields = line.split(":", 1)
-                field_name = fields[0]
-                field_value = fields[1].lstrip(" ")
-                self._process_field(field_name, field_value)
-            else:
-                self._process_field(line, "")
-            # [katie] remove aiohttp
-            # self._ready_state = READY_STATE_CONNECTING
-            # if self._on_error:
-            #     self._on_error()
-            # self._reconnection_time *= 2
-            # _LOGGER.debug('wait %s seconds for retry',
-            #               self._reconnection_time.total_seconds())
-            # await asyncio.sleep(
-            #     self._reconnection_time.total_seconds())
-            # await self.connect()
-        raise StopAsyncIteration
+        # [katie] Parse raw chunks with SSEParser instead of decoding and splitting every line
+        # in Python; this is on the hot path for every streamed token.
+        while not self._pending:
+            if self._chunks is None:
+                self._chunks = self._response.content.iter_any().__aiter__()
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._last_event_id = self._parser.last_event_id
+                raise
+            self._pending.extend(self._parser.feed(chunk))
+        self._last_event_id = self._parser.last_event_id
+        return self._pending.popleft()
 
     # async def connect(self, retry=0):
     #     """Connect to resource."""
@@ -304,51 +394,3 @@ class EventSource:
     #         if self._on_error:
     #             self._on_error()
     #     pass
-
-    def _dispatch_event(self):
-        """Dispatch event."""
-        self._last_event_id = self._event_id
-
-        if self._event_data == "":
-            self._event_type = ""
-            return
-
-        self._event_data = self._event_data.rstrip("\n")
-
-        message = MessageEvent(
-            type=self._event_type if self._event_type != "" else None,
-            message=self._event_type,
-            data=self._event_data,
-            origin=self._origin,
-            last_event_id=self._last_event_id,
-        )
-        # _LOGGER.debug(message)
-        # if self._on_message:
-        #     self._on_message(message)
-
-        self._event_type = ""
-        self._event_data = ""
-        return message
-
-    def _process_field(self, field_name, field_value):
-        """Process field."""
-        if field_name == "event":
-            self._event_type = field_value
-
-        elif field_name == "data":
-            self._event_data += field_value
-            self._event_data += "\n"
-
-        elif field_name == "id" and field_value not in ("\u0000", "\x00\x00"):
-            self._event_id = field_value
-
-        elif field_name == "retry":
-            try:
-                retry_in_ms = int(field_value)
-                self._reconnection_time = timedelta(milliseconds=retry_in_ms)
-            except ValueError:
-                # _LOGGER.warning('Received invalid retry value %s, ignore it',
-                #                 field_value)
-                pass
-
-        pass
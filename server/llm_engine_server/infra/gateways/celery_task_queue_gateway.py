@@ -1,4 +1,7 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
 from llm_engine_server.common.dtos.model_endpoints import BrokerType
 from llm_engine_server.common.dtos.tasks import (
@@ -6,9 +9,14 @@ from llm_engine_server.common.dtos.tasks import (
     GetAsyncTaskV1Response,
     TaskStatus,
 )
+from llm_engine_server.common.env_vars import (
+    CELERY_PUBLISHER_MAX_PENDING,
+    CELERY_PUBLISHER_POOL_SIZE,
+)
 from llm_engine_server.core.celery import TaskVisibility, celery_app
 from llm_engine_server.core.config import ml_infra_config
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
+from llm_engine_server.domain.exceptions import TooManyRequestsException
 from llm_engine_server.domain.gateways.task_queue_gateway import TaskQueueGateway
 
 logger = make_logger(filename_wo_ext(__file__))
@@ -28,6 +36,16 @@ celery_sqs = celery_app(
     None, s3_bucket=ml_infra_config().s3_bucket, broker_type=str(BrokerType.SQS.value)
 )
 
+# Publishing to the broker is a blocking network call, so async callers hand it off to this pool
+# instead of stalling the event loop. Celery draws a producer from its own pool for each publish,
+# and that pool holds broker_pool_limit (10 by default) connections, so more threads than that would
+# only wait on it. The pool's own work queue is unbounded, so the publishes it holds are bounded
+# separately, and rejected beyond that.
+_publisher_pool = ThreadPoolExecutor(
+    max_workers=CELERY_PUBLISHER_POOL_SIZE, thread_name_prefix="celery-publisher"
+)
+_publisher_slots = threading.BoundedSemaphore(CELERY_PUBLISHER_MAX_PENDING)
+
 
 class CeleryTaskQueueGateway(TaskQueueGateway):
     def __init__(self, broker_type: BrokerType):
@@ -67,28 +85,92 @@ class CeleryTaskQueueGateway(TaskQueueGateway):
         logger.info(f"Response from sending task {task_name}: {res}")
         return CreateAsyncTaskV1Response(task_id=res.id)
 
+    async def send_task_async(
+        self,
+        task_name: str,
+        queue_name: str,
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        expires: Optional[int] = None,
+    ) -> CreateAsyncTaskV1Response:
+        # Bound here, so that the release matches the acquire even if _publisher_slots is replaced.
+        publisher_slots = _publisher_slots
+        if not publisher_slots.acquire(blocking=False):
+            raise TooManyRequestsException(
+                f"More than {CELERY_PUBLISHER_MAX_PENDING} tasks are waiting to be published"
+            )
+        try:
+            future = _publisher_pool.submit(
+                self.send_task,
+                task_name=task_name,
+                queue_name=queue_name,
+                args=args,
+                kwargs=kwargs,
+                expires=expires,
+            )
+        except BaseException:
+            publisher_slots.release()
+            raise
+        # The slot is held until the publish is done, not until the caller stops waiting for it,
+        # since a cancelled caller (e.g. when the client disconnects) leaves the publish pending.
+        future.add_done_callback(lambda _: publisher_slots.release())
+        return await asyncio.wrap_future(future)
+
     def get_task(self, task_id: str) -> GetAsyncTaskV1Response:
         celery_dest = self._get_celery_dest()
         res = celery_dest.AsyncResult(task_id)
+        # Each access to res.state reads the result backend until the task is done.
         response_state = res.state
-        if response_state == "SUCCESS":
+        return self._to_get_task_response(
+            task_id=task_id,
+            state=response_state,
+            result=res.result if response_state == "SUCCESS" else None,
+            traceback=res.traceback if response_state == "FAILURE" else None,
+        )
+
+    def get_tasks(self, task_ids: Sequence[str]) -> List[GetAsyncTaskV1Response]:
+        if not task_ids:
+            return []
+        backend = self._get_celery_dest().backend
+        keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+        values = backend.mget(keys)
+        if hasattr(values, "items"):
+            # Some backends return a mapping of the keys that exist, instead of a list.
+            values = [values.get(key) for key in keys]
+        responses = []
+        for task_id, value in zip(task_ids, values):
+            # Same as what AsyncResult reads, but for all the tasks at once.
+            meta = backend.decode_result(value) if value else {"status": "PENDING"}
+            responses.append(
+                self._to_get_task_response(
+                    task_id=task_id,
+                    state=meta["status"],
+                    result=meta.get("result"),
+                    traceback=meta.get("traceback"),
+                )
+            )
+        return responses
+
+    @staticmethod
+    def _to_get_task_response(
+        task_id: str, state: str, result: Any, traceback: Optional[str]
+    ) -> GetAsyncTaskV1Response:
+        if state == "SUCCESS":
             # No longer wrapping things in the result itself, since the DTO already has a 'result' key:
             # result_dict = (
             #    response_result if type(response_result) is dict else {"result": response_result}
             # )
-            return GetAsyncTaskV1Response(
-                task_id=task_id, status=TaskStatus.SUCCESS, result=res.result
-            )
+            return GetAsyncTaskV1Response(task_id=task_id, status=TaskStatus.SUCCESS, result=result)
 
-        elif response_state == "FAILURE":
+        elif state == "FAILURE":
             return GetAsyncTaskV1Response(
                 task_id=task_id,
                 status=TaskStatus.FAILURE,
-                traceback=res.traceback,
+                traceback=traceback,
             )
 
         try:
-            task_status = TaskStatus(response_state)
+            task_status = TaskStatus(state)
             return GetAsyncTaskV1Response(task_id=task_id, status=task_status)
         except ValueError:
             return GetAsyncTaskV1Response(task_id=task_id, status=TaskStatus.UNDEFINED)
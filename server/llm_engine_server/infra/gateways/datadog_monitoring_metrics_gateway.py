@@ -21,3 +21,37 @@ class DatadogMonitoringMetricsGateway(MonitoringMetricsGateway):
 
     def emit_database_cache_miss_metric(self):
         statsd.increment("scale_llm_engine_server.database_cache.miss", tags=self.tags)
+
+    def emit_database_cache_eviction_metric(self, num_evicted: int):
+        statsd.increment(
+            "scale_llm_engine_server.database_cache.eviction", value=num_evicted, tags=self.tags
+        )
+
+    def emit_database_lock_contention_metric(self, acquired: bool, wait_seconds: float):
+        tags = self.tags + [f"acquired:{str(acquired).lower()}"]
+        statsd.increment("scale_llm_engine_server.database_lock.contended", tags=tags)
+        statsd.histogram(
+            "scale_llm_engine_server.database_lock.wait_seconds", wait_seconds, tags=tags
+        )
+
+    def emit_database_pool_checkout_metric(
+        self, engine_name: str, wait_seconds: float, checked_out: int, pool_size: int
+    ):
+        tags = self.tags + [f"engine:{engine_name}"]
+        statsd.histogram(
+            "scale_llm_engine_server.database_pool.checkout_wait_seconds", wait_seconds, tags=tags
+        )
+        statsd.gauge("scale_llm_engine_server.database_pool.checked_out", checked_out, tags=tags)
+        statsd.gauge("scale_llm_engine_server.database_pool.size", pool_size, tags=tags)
+
+    def emit_database_pool_pre_ping_metric(self, engine_name: str, duration_seconds: float):
+        tags = self.tags + [f"engine:{engine_name}"]
+        statsd.histogram(
+            "scale_llm_engine_server.database_pool.pre_ping_seconds", duration_seconds, tags=tags
+        )
+
+    def emit_database_slow_query_metric(self, engine_name: str, duration_seconds: float):
+        tags = self.tags + [f"engine:{engine_name}"]
+        statsd.histogram(
+            "scale_llm_engine_server.database.slow_query_seconds", duration_seconds, tags=tags
+        )
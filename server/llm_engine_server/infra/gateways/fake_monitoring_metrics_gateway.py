@@ -12,6 +12,12 @@ class FakeMonitoringMetricsGateway(MonitoringMetricsGateway):
         self.successful_hook = defaultdict(int)
         self.database_cache_hit = 0
         self.database_cache_miss = 0
+        self.database_cache_eviction = 0
+        self.database_lock_contended = 0
+        self.database_lock_not_acquired = 0
+        self.database_pool_checkout = 0
+        self.database_pool_pre_ping = 0
+        self.database_slow_query = 0
 
     def reset(self):
         self.attempted_build = 0
@@ -21,6 +27,12 @@ class FakeMonitoringMetricsGateway(MonitoringMetricsGateway):
         self.successful_hook = defaultdict(int)
         self.database_cache_hit = 0
         self.database_cache_miss = 0
+        self.database_cache_eviction = 0
+        self.database_lock_contended = 0
+        self.database_lock_not_acquired = 0
+        self.database_pool_checkout = 0
+        self.database_pool_pre_ping = 0
+        self.database_slow_query = 0
 
     def emit_attempted_build_metric(self):
         self.attempted_build += 1
@@ -42,3 +54,22 @@ class FakeMonitoringMetricsGateway(MonitoringMetricsGateway):
 
     def emit_database_cache_miss_metric(self):
         self.database_cache_miss += 1
+
+    def emit_database_cache_eviction_metric(self, num_evicted: int):
+        self.database_cache_eviction += num_evicted
+
+    def emit_database_lock_contention_metric(self, acquired: bool, wait_seconds: float):
+        self.database_lock_contended += 1
+        if not acquired:
+            self.database_lock_not_acquired += 1
+
+    def emit_database_pool_checkout_metric(
+        self, engine_name: str, wait_seconds: float, checked_out: int, pool_size: int
+    ):
+        self.database_pool_checkout += 1
+
+    def emit_database_pool_pre_ping_metric(self, engine_name: str, duration_seconds: float):
+        self.database_pool_pre_ping += 1
+
+    def emit_database_slow_query_metric(self, engine_name: str, duration_seconds: float):
+        self.database_slow_query += 1
@@ -1,26 +1,45 @@
+import asyncio
 import json
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncContextManager, AsyncIterator, List, Optional, Sequence
 
 from llm_engine_server.common.constants import DEFAULT_CELERY_TASK_NAME
 from llm_engine_server.common.dtos.tasks import (
     CreateAsyncTaskV1Response,
     EndpointPredictV1Request,
     GetAsyncTaskV1Response,
+    TaskStatus,
 )
 from llm_engine_server.domain.gateways.async_model_endpoint_inference_gateway import (
     AsyncModelEndpointInferenceGateway,
 )
+from llm_engine_server.domain.gateways.task_completion_gateway import TaskCompletionGateway
 from llm_engine_server.domain.gateways.task_queue_gateway import TaskQueueGateway
 
+# How often to read the status of a task that is being waited on, when completion notifications
+# are not available.
+POLL_INTERVAL_SECONDS = 2.0
+# How often to read it when they are, in case a notification is lost.
+NOTIFIED_POLL_INTERVAL_SECONDS = 15.0
+
 
 class LiveAsyncModelEndpointInferenceGateway(AsyncModelEndpointInferenceGateway):
     """
     Concrete implementation for an AsyncModelEndpointInferenceGateway.
 
-    This particular implementation utilizes a TaskQueueGateway.
+    This particular implementation utilizes a TaskQueueGateway, and a TaskCompletionGateway if given
+    to wait for tasks without polling the result backend.
     """
 
-    def __init__(self, task_queue_gateway: TaskQueueGateway):
+    def __init__(
+        self,
+        task_queue_gateway: TaskQueueGateway,
+        task_completion_gateway: Optional[TaskCompletionGateway] = None,
+    ):
         self.task_queue_gateway = task_queue_gateway
+        self.task_completion_gateway = task_completion_gateway
 
     def create_task(
         self,
@@ -42,7 +61,70 @@ class LiveAsyncModelEndpointInferenceGateway(AsyncModelEndpointInferenceGateway)
         )
         return CreateAsyncTaskV1Response(task_id=send_task_response.task_id)
 
+    async def create_task_async(
+        self,
+        topic: str,
+        predict_request: EndpointPredictV1Request,
+        task_timeout_seconds: int,
+        *,
+        task_name: str = DEFAULT_CELERY_TASK_NAME,
+    ) -> CreateAsyncTaskV1Response:
+        predict_args = json.loads(predict_request.json())
+
+        send_task_response = await self.task_queue_gateway.send_task_async(
+            task_name=task_name,
+            queue_name=topic,
+            args=[predict_args, predict_request.return_pickled],
+            expires=task_timeout_seconds,
+        )
+        return CreateAsyncTaskV1Response(task_id=send_task_response.task_id)
+
     def get_task(self, task_id: str) -> GetAsyncTaskV1Response:
         # TODO: Deconstruct instead of wrapping?
         get_task_response = self.task_queue_gateway.get_task(task_id=task_id)
         return get_task_response
+
+    def get_tasks(self, task_ids: Sequence[str]) -> List[GetAsyncTaskV1Response]:
+        return self.task_queue_gateway.get_tasks(task_ids=task_ids)
+
+    async def wait_for_task(self, task_id: str, timeout_seconds: float) -> GetAsyncTaskV1Response:
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            # Subscribe before reading the status, so that a completion in between isn't missed.
+            async with self._subscribe(task_id) as completed:
+                response = await self._get_task_async(task_id)
+                remaining_seconds = deadline - time.monotonic()
+                if _is_finished(response) or remaining_seconds <= 0:
+                    return response
+                if completed is None:
+                    await asyncio.sleep(min(POLL_INTERVAL_SECONDS, remaining_seconds))
+                else:
+                    try:
+                        await asyncio.wait_for(
+                            completed.wait(),
+                            min(NOTIFIED_POLL_INTERVAL_SECONDS, remaining_seconds),
+                        )
+                    except asyncio.TimeoutError:
+                        # Read the status again anyway, in case the notification was lost.
+                        pass
+                if time.monotonic() >= deadline:
+                    return await self._get_task_async(task_id)
+
+    def _subscribe(self, task_id: str) -> AsyncContextManager[Optional[asyncio.Event]]:
+        if self.task_completion_gateway is None:
+            return _no_notifications()
+        return self.task_completion_gateway.subscribe(task_id)
+
+    async def _get_task_async(self, task_id: str) -> GetAsyncTaskV1Response:
+        # Reading the result backend is blocking.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.get_task, task_id=task_id))
+
+
+@asynccontextmanager
+async def _no_notifications() -> AsyncIterator[Optional[asyncio.Event]]:
+    yield None
+
+
+def _is_finished(response: GetAsyncTaskV1Response) -> bool:
+    return response.status in (TaskStatus.SUCCESS, TaskStatus.FAILURE)
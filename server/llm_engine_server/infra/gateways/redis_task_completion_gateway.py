@@ -0,0 +1,164 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+import aioredis
+from llm_engine_server.common.constants import ASYNC_TASK_COMPLETION_CHANNEL_PREFIX
+from llm_engine_server.core.loggers import filename_wo_ext, make_logger
+from llm_engine_server.domain.gateways.task_completion_gateway import TaskCompletionGateway
+
+logger = make_logger(filename_wo_ext(__file__))
+
+READ_TIMEOUT_SECONDS = 1.0
+# How long to wait before connecting again after Redis couldn't be reached. Subscriptions in the
+# meantime get no notifications, so that their callers poll instead.
+RECONNECT_BACKOFF_SECONDS = 30.0
+
+
+class _Subscription:
+    """The subscribers to a channel, and the SUBSCRIBE that they all wait for."""
+
+    def __init__(self, subscribed: "asyncio.Task[bool]"):
+        self.subscribed = subscribed
+        self.waiters: Set[asyncio.Event] = set()
+
+
+class RedisTaskCompletionGateway(TaskCompletionGateway):
+    """
+    Listens to the completion notifications that async inference workers publish to Redis.
+
+    All the subscriptions of a process share a single pub/sub connection, which is only subscribed
+    to the channels of the tasks that are currently being waited on. An instance should therefore
+    be long-lived, and only used from one event loop at a time.
+    """
+
+    def __init__(self, redis_url: str):
+        self.redis_url = redis_url
+        self._redis: Optional[aioredis.Redis] = None
+        self._pubsub: Optional[aioredis.client.PubSub] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._unavailable_until = 0.0
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: str) -> AsyncIterator[Optional[asyncio.Event]]:
+        self._check_loop()
+        channel = f"{ASYNC_TASK_COMPLETION_CHANNEL_PREFIX}{task_id}"
+        subscription = self._subscriptions.get(channel)
+        if subscription is None:
+            subscription = _Subscription(asyncio.create_task(self._subscribe(channel)))
+            self._subscriptions[channel] = subscription
+        event = asyncio.Event()
+        subscription.waiters.add(event)
+        try:
+            # Every subscriber waits for the SUBSCRIBE to take effect, not only the first one, so
+            # that none of them reads the task's status before completions are being listened to.
+            subscribed = await asyncio.shield(subscription.subscribed)
+            # The subscription may also have been dropped in the meantime, if the connection was lost.
+            if subscribed and self._subscriptions.get(channel) is subscription:
+                yield event
+            else:
+                yield None
+        finally:
+            subscription.waiters.discard(event)
+            if not subscription.waiters and self._subscriptions.get(channel) is subscription:
+                del self._subscriptions[channel]
+                if await asyncio.shield(subscription.subscribed):
+                    await self._unsubscribe(channel)
+
+    def _check_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections can't be shared across event loops, e.g. between tests.
+            self._redis = None
+            self._pubsub = None
+            self._reader = None
+            self._subscriptions = {}
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+    async def _subscribe(self, channel: str) -> bool:
+        """Subscribes to the channel, and returns whether notifications are available."""
+        assert self._lock is not None
+        if time.monotonic() < self._unavailable_until:
+            return False
+        try:
+            # The pub/sub object only gets its connection on its first command, so concurrent first
+            # subscriptions would each open one.
+            async with self._lock:
+                # A concurrent subscription may have failed to connect while this one waited.
+                if time.monotonic() < self._unavailable_until:
+                    return False
+                if self._pubsub is None:
+                    if self._redis is None:
+                        self._redis = aioredis.Redis.from_url(self.redis_url)
+                    self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                await self._pubsub.subscribe(channel)
+        except Exception:
+            self._set_unavailable("Failed to subscribe to task completion notifications")
+            self._reset()
+            return False
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read_messages(self._pubsub))
+        return True
+
+    async def _unsubscribe(self, channel: str) -> None:
+        assert self._lock is not None
+        if self._pubsub is None:
+            return
+        try:
+            async with self._lock:
+                await self._pubsub.unsubscribe(channel)
+        except Exception:
+            self._set_unavailable("Failed to unsubscribe from task completion notifications")
+            self._reset()
+
+    async def _read_messages(self, pubsub: aioredis.client.PubSub) -> None:
+        try:
+            while self._subscriptions and pubsub is self._pubsub:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=READ_TIMEOUT_SECONDS
+                )
+                if message is None or message["type"] != "message":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                subscription = self._subscriptions.get(channel)
+                for event in subscription.waiters if subscription is not None else ():
+                    event.set()
+        except Exception:
+            if pubsub is self._pubsub:
+                self._set_unavailable("Lost the task completion notifications connection")
+                self._reset()
+
+    def _set_unavailable(self, message: str) -> None:
+        # Logged once per outage, rather than once per subscription.
+        if time.monotonic() >= self._unavailable_until:
+            logger.exception(
+                f"{message}, polling task statuses for the next {RECONNECT_BACKOFF_SECONDS}s"
+            )
+        self._unavailable_until = time.monotonic() + RECONNECT_BACKOFF_SECONDS
+
+    def _reset(self) -> None:
+        """
+        Drops the pub/sub connection, and wakes up all the subscribers, since they may have missed
+        their notification. Later subscriptions reconnect.
+        """
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            asyncio.create_task(self._close(pubsub))
+        subscriptions, self._subscriptions = self._subscriptions, {}
+        for subscription in subscriptions.values():
+            for event in subscription.waiters:
+                event.set()
+
+    @staticmethod
+    async def _close(pubsub: aioredis.client.PubSub) -> None:
+        try:
+            await pubsub.close()
+        except Exception:
+            pass
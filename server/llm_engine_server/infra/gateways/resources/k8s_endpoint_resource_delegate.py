@@ -1,6 +1,10 @@
+import asyncio
+import json
 import os
+import threading
+import weakref
 from string import Template
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 import kubernetes_asyncio
 import yaml
@@ -50,7 +54,6 @@ from llm_engine_server.infra.gateways.resources.k8s_resource_types import (
     get_endpoint_resource_arguments_from_request,
 )
 from packaging import version
-from pydantic.utils import deep_update
 
 logger = make_logger(filename_wo_ext(__file__))
 
@@ -68,98 +71,147 @@ DATADOG_ENV_VAR = {
     "DD_AGENT_HOST",
 }
 
-_lazy_load_kubernetes_clients = True
-_kubernetes_apps_api = None
-_kubernetes_core_api = None
-_kubernetes_autoscaling_api = None
-_kubernetes_batch_api = None
-_kubernetes_custom_objects_api = None
-_kubernetes_cluster_version = None
+# Owns the fields of the k8s resources that LLMEngine server-side applies.
+FIELD_MANAGER = "llm-engine"
+APPLY_PATCH_CONTENT_TYPE = "application/apply-patch+yaml"
+
+# How often the cached version of the k8s cluster is refreshed in the background.
+KUBERNETES_CLUSTER_VERSION_REFRESH_INTERVAL_SECONDS = 3600.0
 
 
 # --- K8s client caching functions
-# IMPORTANT: set lazy load to False if running the k8s resource manager gateway in synchronous code
-# using asyncio.run (or equivalents). This is because the API clients initialize
-# aiohttp.ClientSession objects in their constructor, and wrapping the async code in asyncio.run et
-# al. results in these ClientSessions being shared across event loops, which causes the error
-# `RuntimeError: Event loop is closed`.
-def set_lazy_load_kubernetes_clients(
-    should_lazy_load: bool,
-) -> bool:  # pragma: no cover
-    global _lazy_load_kubernetes_clients
-    former = _lazy_load_kubernetes_clients
-    _lazy_load_kubernetes_clients = should_lazy_load
-    return former
-
-
-def get_kubernetes_cluster_version():  # pragma: no cover
-    if _lazy_load_kubernetes_clients:
-        global _kubernetes_cluster_version
-    else:
-        _kubernetes_cluster_version = None
-    if not _kubernetes_cluster_version:
-        version_info = kube_client_sync.VersionApi().get_code()
-        # kubernetes will use `+` instead of specifying a patch version. This confuses version comparisons so we remove it.
-        minor_version = version_info.minor.replace("+", "")
-        major_version = version_info.major
-        _kubernetes_cluster_version = f"{major_version}.{minor_version}"
-    return _kubernetes_cluster_version
+# The API clients are cached per event loop, since they initialize aiohttp.ClientSession objects
+# in their constructor, and sharing these across event loops (e.g. across the asyncio.run calls
+# of the endpoint builder) results in the error `RuntimeError: Event loop is closed`. All the API
+# clients of an event loop share one ApiClient, and thus one connection pool.
+class _KubernetesClients:
+    def __init__(self):
+        self.api_client = kubernetes_asyncio.client.ApiClient()
+        self._apis: Dict[type, Any] = {}
+
+    def get(self, api_type: type) -> Any:
+        if api_type not in self._apis:
+            self._apis[api_type] = api_type(self.api_client)
+        return self._apis[api_type]
+
+
+_kubernetes_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _KubernetesClients]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_kubernetes_client(api_type: type) -> Any:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return api_type()
+    clients = _kubernetes_clients.get(loop)
+    if clients is None:
+        clients = _kubernetes_clients[loop] = _KubernetesClients()
+    return clients.get(api_type)
+
+
+async def close_kubernetes_clients() -> None:
+    """
+    Closes the API clients of the running event loop, e.g. before an `asyncio.run` call that used
+    them returns, since their connections can't be used from other loops.
+    """
+    clients = _kubernetes_clients.pop(asyncio.get_running_loop(), None)
+    if clients is not None:
+        await clients.api_client.close()
+
+
+def _format_cluster_version(version_info: Any) -> str:
+    # kubernetes will use `+` instead of specifying a patch version. This confuses version comparisons so we remove it.
+    minor_version = version_info.minor.replace("+", "")
+    major_version = version_info.major
+    return f"{major_version}.{minor_version}"
+
+
+def _fetch_cluster_version() -> str:  # pragma: no cover
+    return _format_cluster_version(kube_client_sync.VersionApi().get_code())
+
+
+async def _fetch_cluster_version_async() -> str:  # pragma: no cover
+    async with kubernetes_asyncio.client.ApiClient() as api_client:
+        version_info = await kubernetes_asyncio.client.VersionApi(api_client).get_code()
+    return _format_cluster_version(version_info)
+
+
+class KubernetesClusterVersionCache:
+    """
+    The version of the k8s cluster, fetched once per process and then refreshed in a daemon
+    thread, so that creating endpoints doesn't make a request to k8s for it.
+    """
+
+    def __init__(self, refresh_interval_seconds: float):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._version: Optional[str] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    async def load_async(self) -> str:
+        """Returns the cached version, fetching it without blocking the event loop if needed."""
+        if self._version is None:
+            self._version = await _fetch_cluster_version_async()
+            self._start_refreshes()
+        return self._version
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _start_refreshes(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_refreshes, name="k8s-cluster-version-refreshes", daemon=True
+                )
+                self._thread.start()
+
+    def _run_refreshes(self) -> None:
+        while not self._stopped.wait(self.refresh_interval_seconds):
+            try:
+                self._version = _fetch_cluster_version()
+            except Exception:
+                logger.exception("Could not refresh the k8s cluster version")
+
+
+_kubernetes_cluster_version_cache = KubernetesClusterVersionCache(
+    KUBERNETES_CLUSTER_VERSION_REFRESH_INTERVAL_SECONDS
+)
+
+
+async def get_kubernetes_cluster_version() -> str:  # pragma: no cover
+    return await _kubernetes_cluster_version_cache.load_async()
 
 
 def get_kubernetes_apps_client():  # pragma: no cover
-    if _lazy_load_kubernetes_clients:
-        global _kubernetes_apps_api
-    else:
-        _kubernetes_apps_api = None
-    if not _kubernetes_apps_api:
-        _kubernetes_apps_api = kubernetes_asyncio.client.AppsV1Api()
-    return _kubernetes_apps_api
+    return _get_kubernetes_client(kubernetes_asyncio.client.AppsV1Api)
 
 
 def get_kubernetes_core_client():  # pragma: no cover
-    if _lazy_load_kubernetes_clients:
-        global _kubernetes_core_api
-    else:
-        _kubernetes_core_api = None
-    if not _kubernetes_core_api:
-        _kubernetes_core_api = kubernetes_asyncio.client.CoreV1Api()
-    return _kubernetes_core_api
+    return _get_kubernetes_client(kubernetes_asyncio.client.CoreV1Api)
 
 
-def get_kubernetes_autoscaling_client():  # pragma: no cover
-    if _lazy_load_kubernetes_clients:
-        global _kubernetes_autoscaling_api
+async def get_kubernetes_autoscaling_client():  # pragma: no cover
+    cluster_version = await get_kubernetes_cluster_version() if not CIRCLECI else "1.26"
+    # For k8s cluster versions 1.23 - 1.25 we need to use the v2beta2 api
+    # For 1.26+ v2beta2 has been deperecated and merged into v2
+    if version.parse(cluster_version) >= version.parse("1.26"):
+        return _get_kubernetes_client(kubernetes_asyncio.client.AutoscalingV2Api)
     else:
-        _kubernetes_autoscaling_api = None
-    if not _kubernetes_autoscaling_api:
-        cluster_version = get_kubernetes_cluster_version() if not CIRCLECI else "1.26"
-        # For k8s cluster versions 1.23 - 1.25 we need to use the v2beta2 api
-        # For 1.26+ v2beta2 has been deperecated and merged into v2
-        if version.parse(cluster_version) >= version.parse("1.26"):
-            _kubernetes_autoscaling_api = kubernetes_asyncio.client.AutoscalingV2Api()
-        else:
-            _kubernetes_autoscaling_api = kubernetes_asyncio.client.AutoscalingV2beta2Api()
-    return _kubernetes_autoscaling_api
+        return _get_kubernetes_client(kubernetes_asyncio.client.AutoscalingV2beta2Api)
 
 
 def get_kubernetes_batch_client():  # pragma: no cover
-    if _lazy_load_kubernetes_clients:
-        global _kubernetes_batch_api
-    else:
-        _kubernetes_batch_api = None
-    if not _kubernetes_batch_api:
-        _kubernetes_batch_api = kubernetes_asyncio.client.BatchV1Api()
-    return _kubernetes_batch_api
+    return _get_kubernetes_client(kubernetes_asyncio.client.BatchV1Api)
 
 
 def get_kubernetes_custom_objects_client():  # pragma: no cover
-    if _lazy_load_kubernetes_clients:
-        global _kubernetes_custom_objects_api
-    else:
-        _kubernetes_custom_objects_api = None
-    if not _kubernetes_custom_objects_api:
-        _kubernetes_custom_objects_api = kubernetes_asyncio.client.CustomObjectsApi()
-    return _kubernetes_custom_objects_api
+    return _get_kubernetes_client(kubernetes_asyncio.client.CustomObjectsApi)
 
 
 def _endpoint_id_to_k8s_resource_group_name(endpoint_id: str) -> str:
@@ -187,20 +239,69 @@ async def maybe_load_kube_config():
         except:  # noqa: E722
             logger.warning("Could not load kube config.")
     _kube_config_loaded = True
+    if not CIRCLECI:
+        # Loads the cluster version up front, so that later calls to
+        # `get_kubernetes_cluster_version` (e.g. to pick the autoscaling API) hit the cache.
+        try:
+            await _kubernetes_cluster_version_cache.load_async()
+        except Exception:
+            logger.warning("Could not load the k8s cluster version.")
 
 
-def load_k8s_yaml(key: str, substitution_kwargs: ResourceArguments) -> Dict[str, Any]:
-    if LLM_ENGINE_SERVICE_TEMPLATE_FOLDER is not None:
-        with open(os.path.join(LLM_ENGINE_SERVICE_TEMPLATE_FOLDER, key), "r") as f:
-            template_str = f.read()
-    else:
-        with open(LLM_ENGINE_SERVICE_TEMPLATE_CONFIG_MAP_PATH, "r") as f:
-            config_map_str = yaml.safe_load(f.read())
-        template_str = config_map_str["data"][key]
+# libyaml's loader is several times faster than the pure Python one, when it's available.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
-    yaml_str = Template(template_str).substitute(**substitution_kwargs)
+class K8sTemplateRegistry:
+    """
+    Compiled k8s resource templates, keyed by resource name (e.g. "service.yaml").
+
+    The templates are read from the service template config map, or from one file per template if
+    a template folder is given. The config map is parsed once, rather than on every
+    `load_k8s_yaml` call, and is parsed again only when its modification time changes (e.g.
+    when k8s updates the mounted config map).
+    """
+
+    def __init__(self, config_map_path: str, template_folder: Optional[str] = None):
+        self.config_map_path = config_map_path
+        self.template_folder = template_folder
+        # Maps a template source file to its modification time and its templates.
+        self._templates_by_path: Dict[str, Tuple[int, Dict[str, Template]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Template:
+        if self.template_folder is not None:
+            path = os.path.join(self.template_folder, key)
+        else:
+            path = self.config_map_path
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._templates_by_path.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            with self._lock:
+                cached = self._templates_by_path.get(path)
+                if cached is None or cached[0] != mtime_ns:
+                    cached = (mtime_ns, self._load_templates(path, key))
+                    self._templates_by_path[path] = cached
+        return cached[1][key]
+
+    def _load_templates(self, path: str, key: str) -> Dict[str, Template]:
+        with open(path, "r") as f:
+            contents = f.read()
+        if self.template_folder is not None:
+            return {key: Template(contents)}
+        config_map = yaml.load(contents, Loader=_YamlSafeLoader)
+        return {name: Template(template_str) for name, template_str in config_map["data"].items()}
+
+
+_k8s_template_registry = K8sTemplateRegistry(
+    LLM_ENGINE_SERVICE_TEMPLATE_CONFIG_MAP_PATH, LLM_ENGINE_SERVICE_TEMPLATE_FOLDER
+)
+
+
+def load_k8s_yaml(key: str, substitution_kwargs: ResourceArguments) -> Dict[str, Any]:
+    yaml_str = _k8s_template_registry.get(key).substitute(**substitution_kwargs)
     try:
-        yaml_obj = yaml.safe_load(yaml_str)
+        yaml_obj = yaml.load(yaml_str, Loader=_YamlSafeLoader)
     except:
         logger.exception("Could not load yaml string: %s", yaml_str)
         raise
@@ -256,6 +357,34 @@ def add_datadog_env_to_main_container(deployment_template: Dict[str, Any]) -> No
     user_container["env"] = user_container_envs
 
 
+def _get_apply_kwargs(resource: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the arguments of a k8s client patch call that server-side applies the resource, i.e.
+    that creates it, or updates the fields that LLMEngine sets, in a single request. Conflicts
+    with the other field managers (e.g. with the create and patch calls of older LLMEngine
+    versions) are resolved in favor of the resource.
+    """
+    return dict(
+        # JSON is YAML, and the client sends bytes bodies as is.
+        body=json.dumps(resource).encode(),
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type=APPLY_PATCH_CONTENT_TYPE,
+    )
+
+
+async def _gather_all(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Like asyncio.gather, but lets all the awaitables finish before raising the first exception,
+    so that no k8s request is left running in the background.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
 class K8SEndpointResourceDelegate:
     async def create_or_update_resources(
         self,
@@ -417,7 +546,7 @@ class K8SEndpointResourceDelegate:
     @staticmethod
     async def _create_deployment(deployment: Dict[str, Any], name: str) -> None:
         """
-        Lower-level function to create/patch a k8s deployment
+        Lower-level function to create/apply a k8s deployment
         Args:
             deployment: Deployment body (a nested Dict in the format specified by Kubernetes)
             name: The name of the deployment on K8s
@@ -436,32 +565,21 @@ class K8SEndpointResourceDelegate:
             )
         except ApiException as exc:
             if exc.status == 409:
-                logger.info(f"Deployment {name} already exists, patching")
+                logger.info(f"Deployment {name} already exists, applying")
 
+                # Unlike the other resources, a deployment is created before it's applied, so
+                # that replicas can be set only on creation: on updates, we want to just let the
+                # autoscaler do its thing.
                 if "replicas" in deployment["spec"]:
-                    # Don't pass in replicas if we're doing an update, because we want to just
-                    # let the autoscaler do its thing.
                     del deployment["spec"]["replicas"]
 
                 logger.info(f"Deployment {name} contents: {deployment}")
 
-                try:
-                    await apps_client.patch_namespaced_deployment(
-                        name=name,
-                        namespace=hmi_config.endpoint_namespace,
-                        body=deployment,
-                    )
-                except ApiException as exc2:
-                    if exc2.status in [409, 422]:
-                        logger.info(f"Deployment {name} failed to patch, falling back to replacing")
-                        await apps_client.replace_namespaced_deployment(
-                            name=name,
-                            namespace=hmi_config.endpoint_namespace,
-                            body=deployment,
-                        )
-                    else:
-                        logger.exception("Got an exception when trying to patch the Deployment")
-                        raise
+                await apps_client.patch_namespaced_deployment(
+                    name=name,
+                    namespace=hmi_config.endpoint_namespace,
+                    **_get_apply_kwargs(deployment),
+                )
             else:
                 logger.exception("Got an exception when trying to apply the Deployment")
                 raise
@@ -469,7 +587,7 @@ class K8SEndpointResourceDelegate:
     @staticmethod
     async def _create_config_map(config_map: Dict[str, Any], name: str) -> None:
         """
-        Creates a k8s ConfigMap from a config_map body
+        Creates or applies a k8s ConfigMap from a config_map body
         Args:
             config_map: ConfigMap body (nested Dict in K8s-specified format)
             name: Name of config_map on K8s
@@ -479,25 +597,19 @@ class K8SEndpointResourceDelegate:
         """
         core_api = get_kubernetes_core_client()
         try:
-            await core_api.create_namespaced_config_map(
-                hmi_config.endpoint_namespace, body=config_map
+            await core_api.patch_namespaced_config_map(
+                name=name,
+                namespace=hmi_config.endpoint_namespace,
+                **_get_apply_kwargs(config_map),
             )
-        except ApiException as exc:
-            if exc.status == 409:
-                logger.info(f"ConfigMap {name} already exists, replacing")
-                await core_api.patch_namespaced_config_map(
-                    name=name,
-                    namespace=hmi_config.endpoint_namespace,
-                    body=config_map,
-                )
-            else:
-                logger.exception("Got an exception when trying to apply the ConfigMap")
-                raise
+        except ApiException:
+            logger.exception("Got an exception when trying to apply the ConfigMap")
+            raise
 
     @staticmethod
     async def _create_hpa(hpa: Dict[str, Any], name: str) -> None:
         """
-        Lower-level function to create/patch a k8s HorizontalPodAutoscaler (hpa)
+        Lower-level function to create/apply a k8s HorizontalPodAutoscaler (hpa)
         Args:
             hpa: HPA body (a nested Dict in the format specified by Kubernetes)
             name: The name of the hpa on K8s
@@ -506,31 +618,18 @@ class K8SEndpointResourceDelegate:
             Nothing; raises a k8s ApiException if failure
 
         """
-        autoscaling_api = get_kubernetes_autoscaling_client()
+        autoscaling_api = await get_kubernetes_autoscaling_client()
         try:
-            await autoscaling_api.create_namespaced_horizontal_pod_autoscaler(
-                namespace=hmi_config.endpoint_namespace, body=hpa
+            await autoscaling_api.patch_namespaced_horizontal_pod_autoscaler(
+                name=name,
+                namespace=hmi_config.endpoint_namespace,
+                **_get_apply_kwargs(hpa),
             )
-        except ApiException as exc:
-            if exc.status == 409:
-                logger.info(f"HorizontalPodAutoscaler {name} already exists, replacing")
-                try:
-                    await autoscaling_api.patch_namespaced_horizontal_pod_autoscaler(
-                        name=name, namespace=hmi_config.endpoint_namespace, body=hpa
-                    )
-                except ValueError as exc2:
-                    # The k8s api has a bug where a ValueError is thrown. This catches and drops it.
-                    if str(exc2) == "Invalid value for `conditions`, must not be `None`":
-                        # Workaround from https://github.com/kubernetes-client/python/issues/1098#issuecomment-663031331
-                        logger.info("Skipping invalid 'conditions' value...")
-                    else:
-                        raise exc2
-            else:
-                logger.exception(
-                    "Got an exception when trying to apply the HorizontalPodAutoscaler"
-                )
-                raise
+        except ApiException:
+            logger.exception("Got an exception when trying to apply the HorizontalPodAutoscaler")
+            raise
         except ValueError as exc2:
+            # The k8s api has a bug where a ValueError is thrown. This catches and drops it.
             if str(exc2) == "Invalid value for `conditions`, must not be `None`":
                 # Workaround from https://github.com/kubernetes-client/python/issues/1098#issuecomment-663031331
                 logger.info("Skipping invalid 'conditions' value...")
@@ -538,151 +637,74 @@ class K8SEndpointResourceDelegate:
                 raise exc2
 
     @staticmethod
-    async def _create_vpa(vpa: Dict[str, Any], name: str) -> None:
+    async def _create_custom_object(
+        custom_object: Dict[str, Any], name: str, group: str, version: str, plural: str
+    ) -> None:
         """
-        Lower-level function to create/patch a k8s VerticalPodAutoscaler (vpa)
+        Lower-level function to create/apply a custom object, e.g. a VerticalPodAutoscaler.
         Args:
-            vpa: VPA body (a nested Dict in the format specified by Kubernetes)
-            name: The name of the vpa on K8s
+            custom_object: Custom object body (a nested Dict in the format specified by Kubernetes)
+            name: The name of the custom object on K8s
+            group: The API group of the custom object's resource
+            version: The API version of the custom object's resource
+            plural: The plural name of the custom object's resource
 
         Returns:
             Nothing; raises a k8s ApiException if failure
 
         """
+        # The async k8s client can't merge patch custom objects (it sends them as strategic merge
+        # patches, which custom resources don't support), but it can apply them.
         custom_objects_api = get_kubernetes_custom_objects_client()
         try:
-            await custom_objects_api.create_namespaced_custom_object(
-                group="autoscaling.k8s.io",
-                version="v1",
+            await custom_objects_api.patch_namespaced_custom_object(
+                group=group,
+                version=version,
                 namespace=hmi_config.endpoint_namespace,
-                plural="verticalpodautoscalers",
-                body=vpa,
+                plural=plural,
+                name=name,
+                **_get_apply_kwargs(custom_object),
             )
-        except ApiException as exc:
-            if exc.status == 409:
-                logger.info(f"VerticalPodAutoscaler {name} already exists, replacing")
-
-                # The async k8s client has a bug with patching custom objects, so we manually
-                # merge the new VPA with the old one and then replace the old one with the merged
-                # one.
-                existing_vpa = await custom_objects_api.get_namespaced_custom_object(
-                    group="autoscaling.k8s.io",
-                    version="v1",
-                    namespace=hmi_config.endpoint_namespace,
-                    plural="verticalpodautoscalers",
-                    name=name,
-                )
-                new_vpa = deep_update(existing_vpa, vpa)
-                await custom_objects_api.replace_namespaced_custom_object(
-                    group="autoscaling.k8s.io",
-                    version="v1",
-                    namespace=hmi_config.endpoint_namespace,
-                    plural="verticalpodautoscalers",
-                    name=name,
-                    body=new_vpa,
-                )
-            else:
-                logger.exception("Got an exception when trying to apply the VerticalPodAutoscaler")
-                raise
-
-    @staticmethod
-    async def _create_destination_rule(destination_rule: Dict[str, Any], name: str) -> None:
-        """
-        Lower-level function to create/patch an Istio DestinationRule. This is only created for sync endpoints.
-        Args:
-            destination_rule: DestinationRule body (a nested Dict in the format specified by Kubernetes)
-            name: The name of the DestinationRule resource.
+        except ApiException:
+            logger.exception(f"Got an exception when trying to apply the {custom_object['kind']}")
+            raise
 
-        Returns:
-            Nothing; raises a k8s ApiException if failure
-        pass
-        """
-        custom_objects_api = get_kubernetes_custom_objects_client()
-        try:
-            await custom_objects_api.create_namespaced_custom_object(
-                group="networking.istio.io",
-                version="v1beta1",
-                namespace=hmi_config.endpoint_namespace,
-                plural="destinationrules",
-                body=destination_rule,
-            )
-        except ApiException as exc:
-            if exc.status == 409:
-                logger.info(f"DestinationRule {name} already exists, replacing")
-                # The async k8s client has a bug with patching custom objects, so we manually
-                # merge the new DestinationRule with the old one and then replace the old one with the merged
-                # one.
-                existing_destination_rule = await custom_objects_api.get_namespaced_custom_object(
-                    group="networking.istio.io",
-                    version="v1beta1",
-                    namespace=hmi_config.endpoint_namespace,
-                    plural="destinationrules",
-                    name=name,
-                )
-                new_destination_rule = deep_update(existing_destination_rule, destination_rule)
-                await custom_objects_api.replace_namespaced_custom_object(
-                    group="networking.istio.io",
-                    version="v1beta1",
-                    namespace=hmi_config.endpoint_namespace,
-                    plural="destinationrules",
-                    name=name,
-                    body=new_destination_rule,
-                )
-            else:
-                logger.exception("Got an exception when trying to apply the DestinationRule")
-                raise
+    @classmethod
+    async def _create_vpa(cls, vpa: Dict[str, Any], name: str) -> None:
+        await cls._create_custom_object(
+            vpa,
+            name=name,
+            group="autoscaling.k8s.io",
+            version="v1",
+            plural="verticalpodautoscalers",
+        )
 
-    @staticmethod
-    async def _create_virtual_service(virtual_service: Dict[str, Any], name: str) -> None:
-        """
-        Lower-level function to create/patch an Istio VirtualService. This is only created for sync endpoints.
-        Args:
-            virtual_service: VirtualService body (a nested Dict in the format specified by Kubernetes)
-            name: The name of the VirtualService resource.
+    @classmethod
+    async def _create_destination_rule(cls, destination_rule: Dict[str, Any], name: str) -> None:
+        """Istio DestinationRules are only created for sync endpoints."""
+        await cls._create_custom_object(
+            destination_rule,
+            name=name,
+            group="networking.istio.io",
+            version="v1beta1",
+            plural="destinationrules",
+        )
 
-        Returns:
-            Nothing; raises a k8s ApiException if failure
-        pass
-        """
-        custom_objects_api = get_kubernetes_custom_objects_client()
-        try:
-            await custom_objects_api.create_namespaced_custom_object(
-                group="networking.istio.io",
-                version="v1alpha3",
-                namespace=hmi_config.endpoint_namespace,
-                plural="virtualservices",
-                body=virtual_service,
-            )
-        except ApiException as exc:
-            if exc.status == 409:
-                logger.info(f"VirtualService {name} already exists, replacing")
-                # The async k8s client has a bug with patching custom objects, so we manually
-                # merge the new VirtualService with the old one and then replace the old one with the merged
-                # one.
-                existing_virtual_service = await custom_objects_api.get_namespaced_custom_object(
-                    group="networking.istio.io",
-                    version="v1alpha3",
-                    namespace=hmi_config.endpoint_namespace,
-                    plural="virtualservices",
-                    name=name,
-                )
-                new_virtual_service = deep_update(existing_virtual_service, virtual_service)
-                await custom_objects_api.replace_namespaced_custom_object(
-                    group="networking.istio.io",
-                    version="v1alpha3",
-                    namespace=hmi_config.endpoint_namespace,
-                    plural="virtualservices",
-                    name=name,
-                    body=new_virtual_service,
-                )
-            else:
-                logger.exception("Got an exception when trying to apply the VirtualService")
-                raise
+    @classmethod
+    async def _create_virtual_service(cls, virtual_service: Dict[str, Any], name: str) -> None:
+        """Istio VirtualServices are only created for sync endpoints."""
+        await cls._create_custom_object(
+            virtual_service,
+            name=name,
+            group="networking.istio.io",
+            version="v1alpha3",
+            plural="virtualservices",
+        )
 
     @staticmethod
     async def _create_service(service, name: str) -> None:
         """
-        Lower-level function to create/patch a k8s Service
+        Lower-level function to create/apply a k8s Service
         Args:
             service: Service body (a nested Dict in the format specified by Kubernetes)
             name: The name of the service on K8s
@@ -693,20 +715,14 @@ class K8SEndpointResourceDelegate:
         """
         core_api = get_kubernetes_core_client()
         try:
-            await core_api.create_namespaced_service(
-                namespace=hmi_config.endpoint_namespace, body=service
+            await core_api.patch_namespaced_service(
+                name=name,
+                namespace=hmi_config.endpoint_namespace,
+                **_get_apply_kwargs(service),
             )
-        except ApiException as exc:
-            if exc.status in [409, 422]:
-                logger.info(f"Service {name} already exists, replacing")
-                await core_api.patch_namespaced_service(
-                    name=name,
-                    namespace=hmi_config.endpoint_namespace,
-                    body=service,
-                )
-            else:
-                logger.exception("Got an exception when trying to apply the Service")
-                raise
+        except ApiException:
+            logger.exception("Got an exception when trying to apply the Service")
+            raise
 
     @staticmethod
     async def _get_config_maps(
@@ -822,26 +838,30 @@ class K8SEndpointResourceDelegate:
         return True
 
     async def _delete_config_maps(self, endpoint_id: str, deployment_name: str) -> bool:
-        core_client = get_kubernetes_core_client()
         config_map_names = [
             config_map.metadata.name
             for config_map in await self._get_config_maps(
                 endpoint_id=endpoint_id, deployment_name=deployment_name
             )
         ]
-        for config_map_name in config_map_names:
-            try:
-                await core_client.delete_namespaced_config_map(
-                    config_map_name, hmi_config.endpoint_namespace
-                )
-            except ApiException as e:
-                if e.status == 404:
-                    logger.warning(f"Trying to delete nonexistent ConfigMap {config_map_name}")
-                else:
-                    logger.error(
-                        f"Deletion of ConfigMap {config_map_name} failed with error" f" {e}"
-                    )
-                    return False
+        config_map_delete_succeeded = await _gather_all(
+            *[self._delete_config_map(config_map_name) for config_map_name in config_map_names]
+        )
+        return all(config_map_delete_succeeded)
+
+    @staticmethod
+    async def _delete_config_map(config_map_name: str) -> bool:
+        core_client = get_kubernetes_core_client()
+        try:
+            await core_client.delete_namespaced_config_map(
+                config_map_name, hmi_config.endpoint_namespace
+            )
+        except ApiException as e:
+            if e.status == 404:
+                logger.warning(f"Trying to delete nonexistent ConfigMap {config_map_name}")
+            else:
+                logger.error(f"Deletion of ConfigMap {config_map_name} failed with error" f" {e}")
+                return False
         return True
 
     @staticmethod
@@ -945,7 +965,7 @@ class K8SEndpointResourceDelegate:
 
     @staticmethod
     async def _delete_hpa(endpoint_id: str, deployment_name: str) -> bool:
-        autoscaling_client = get_kubernetes_autoscaling_client()
+        autoscaling_client = await get_kubernetes_autoscaling_client()
         k8s_resource_group_name = _endpoint_id_to_k8s_resource_group_name(endpoint_id)
         try:
             await autoscaling_client.delete_namespaced_horizontal_pod_autoscaler(
@@ -1032,10 +1052,6 @@ class K8SEndpointResourceDelegate:
             RunnableImageLike,
         ):
             add_datadog_env_to_main_container(deployment_template)
-        await self._create_deployment(
-            deployment=deployment_template,
-            name=k8s_resource_group_name,
-        )
 
         user_config_arguments = get_endpoint_resource_arguments_from_request(
             k8s_resource_group_name=k8s_resource_group_name,
@@ -1045,10 +1061,6 @@ class K8SEndpointResourceDelegate:
             endpoint_resource_name="user-config",
         )
         user_config_template = load_k8s_yaml("user-config.yaml", user_config_arguments)
-        await self._create_config_map(
-            config_map=user_config_template,
-            name=k8s_resource_group_name,
-        )
 
         endpoint_config_arguments = get_endpoint_resource_arguments_from_request(
             k8s_resource_group_name=k8s_resource_group_name,
@@ -1058,10 +1070,25 @@ class K8SEndpointResourceDelegate:
             endpoint_resource_name="endpoint-config",
         )
         endpoint_config_template = load_k8s_yaml("endpoint-config.yaml", endpoint_config_arguments)
-        await self._create_config_map(
-            config_map=endpoint_config_template,
-            name=f"{k8s_resource_group_name}-endpoint-config",
+
+        # The pods of the deployment mount the config maps, so those are applied first. The other
+        # resources don't depend on each other, and are applied concurrently.
+        await _gather_all(
+            self._create_config_map(
+                config_map=user_config_template,
+                name=k8s_resource_group_name,
+            ),
+            self._create_config_map(
+                config_map=endpoint_config_template,
+                name=f"{k8s_resource_group_name}-endpoint-config",
+            ),
         )
+        applies: List[Awaitable[None]] = [
+            self._create_deployment(
+                deployment=deployment_template,
+                name=k8s_resource_group_name,
+            )
+        ]
 
         if request.build_endpoint_request.optimize_costs:
             vpa_arguments = get_endpoint_resource_arguments_from_request(
@@ -1072,16 +1099,18 @@ class K8SEndpointResourceDelegate:
                 endpoint_resource_name="vertical-pod-autoscaler",
             )
             vpa_template = load_k8s_yaml("vertical-pod-autoscaler.yaml", vpa_arguments)
-            await self._create_vpa(
-                vpa=vpa_template,
-                name=k8s_resource_group_name,
+            applies.append(
+                self._create_vpa(
+                    vpa=vpa_template,
+                    name=k8s_resource_group_name,
+                )
             )
 
         if model_endpoint_record.endpoint_type in {
             ModelEndpointType.SYNC,
             ModelEndpointType.STREAMING,
         }:
-            cluster_version = get_kubernetes_cluster_version() if not CIRCLECI else "1.26"
+            cluster_version = await get_kubernetes_cluster_version() if not CIRCLECI else "1.26"
             # For k8s cluster versions 1.23 - 1.25 we need to use the v2beta2 api
             # For 1.26+ v2beta2 has been deperecated and merged into v2
             if version.parse(cluster_version) >= version.parse("1.26"):
@@ -1098,9 +1127,11 @@ class K8SEndpointResourceDelegate:
                 api_version=api_version,
             )
             hpa_template = load_k8s_yaml("horizontal-pod-autoscaler.yaml", hpa_arguments)
-            await self._create_hpa(
-                hpa=hpa_template,
-                name=k8s_resource_group_name,
+            applies.append(
+                self._create_hpa(
+                    hpa=hpa_template,
+                    name=k8s_resource_group_name,
+                )
             )
 
             service_arguments = get_endpoint_resource_arguments_from_request(
@@ -1111,11 +1142,15 @@ class K8SEndpointResourceDelegate:
                 endpoint_resource_name="service",
             )
             service_template = load_k8s_yaml("service.yaml", service_arguments)
-            await self._create_service(
-                service=service_template,
-                name=k8s_resource_group_name,
+            applies.append(
+                self._create_service(
+                    service=service_template,
+                    name=k8s_resource_group_name,
+                )
             )
 
+        await _gather_all(*applies)
+
     @staticmethod
     def _get_vertical_autoscaling_params(
         vpa_config,
@@ -1186,7 +1221,7 @@ class K8SEndpointResourceDelegate:
         if endpoint_type == ModelEndpointType.ASYNC:
             horizontal_autoscaling_params = self._get_async_autoscaling_params(deployment_config)
         elif endpoint_type in {ModelEndpointType.SYNC, ModelEndpointType.STREAMING}:
-            autoscaling_client = get_kubernetes_autoscaling_client()
+            autoscaling_client = await get_kubernetes_autoscaling_client()
             hpa_config = await autoscaling_client.read_namespaced_horizontal_pod_autoscaler(
                 k8s_resource_group_name, hmi_config.endpoint_namespace
             )
@@ -1258,7 +1293,7 @@ class K8SEndpointResourceDelegate:
         self,
     ) -> Dict[str, Tuple[bool, ModelEndpointInfraState]]:
         apps_client = get_kubernetes_apps_client()
-        autoscaling_client = get_kubernetes_autoscaling_client()
+        autoscaling_client = await get_kubernetes_autoscaling_client()
         custom_objects_client = get_kubernetes_custom_objects_client()
         deployments = (
             await apps_client.list_namespaced_deployment(namespace=hmi_config.endpoint_namespace)
@@ -1363,36 +1398,30 @@ class K8SEndpointResourceDelegate:
         return infra_states
 
     async def _delete_resources_async(self, endpoint_id: str, deployment_name: str) -> bool:
-        deployment_delete_succeeded = await self._delete_deployment(
-            endpoint_id=endpoint_id, deployment_name=deployment_name
-        )
-        config_map_delete_succeeded = await self._delete_config_maps(
-            endpoint_id=endpoint_id, deployment_name=deployment_name
+        deployment_delete_succeeded, config_map_delete_succeeded, _ = await _gather_all(
+            self._delete_deployment(endpoint_id=endpoint_id, deployment_name=deployment_name),
+            self._delete_config_maps(endpoint_id=endpoint_id, deployment_name=deployment_name),
+            self._delete_vpa(endpoint_id=endpoint_id),
         )
-        await self._delete_vpa(endpoint_id=endpoint_id)
         return deployment_delete_succeeded and config_map_delete_succeeded
 
     async def _delete_resources_sync(self, endpoint_id: str, deployment_name: str) -> bool:
-        deployment_delete_succeeded = await self._delete_deployment(
-            endpoint_id=endpoint_id,
-            deployment_name=deployment_name,
-        )
-        config_map_delete_succeeded = await self._delete_config_maps(
-            endpoint_id=endpoint_id, deployment_name=deployment_name
-        )
-        service_delete_succeeded = await self._delete_service(
-            endpoint_id=endpoint_id, deployment_name=deployment_name
-        )
-        hpa_delete_succeeded = await self._delete_hpa(
-            endpoint_id=endpoint_id, deployment_name=deployment_name
-        )
-        await self._delete_vpa(endpoint_id=endpoint_id)
-
-        destination_rule_delete_succeeded = await self._delete_destination_rule(
-            endpoint_id=endpoint_id
-        )
-        virtual_service_delete_succeeded = await self._delete_virtual_service(
-            endpoint_id=endpoint_id
+        (
+            deployment_delete_succeeded,
+            config_map_delete_succeeded,
+            service_delete_succeeded,
+            hpa_delete_succeeded,
+            _,
+            destination_rule_delete_succeeded,
+            virtual_service_delete_succeeded,
+        ) = await _gather_all(
+            self._delete_deployment(endpoint_id=endpoint_id, deployment_name=deployment_name),
+            self._delete_config_maps(endpoint_id=endpoint_id, deployment_name=deployment_name),
+            self._delete_service(endpoint_id=endpoint_id, deployment_name=deployment_name),
+            self._delete_hpa(endpoint_id=endpoint_id, deployment_name=deployment_name),
+            self._delete_vpa(endpoint_id=endpoint_id),
+            self._delete_destination_rule(endpoint_id=endpoint_id),
+            self._delete_virtual_service(endpoint_id=endpoint_id),
         )
 
         return (
@@ -7,10 +7,12 @@ from .db_model_bundle_repository import DbModelBundleRepository
 from .db_model_endpoint_record_repository import DbModelEndpointRecordRepository
 from .ecr_docker_repository import ECRDockerRepository
 from .feature_flag_repository import FeatureFlagRepository
+from .image_build_repository import ImageBuildRepository
 from .llm_fine_tuning_job_repository import LLMFineTuningJobRepository
 from .model_endpoint_cache_repository import ModelEndpointCacheRepository
 from .model_endpoint_record_repository import ModelEndpointRecordRepository
 from .redis_feature_flag_repository import RedisFeatureFlagRepository
+from .redis_image_build_repository import RedisImageBuildRepository
 from .redis_model_endpoint_cache_repository import RedisModelEndpointCacheRepository
 from .s3_file_llm_fine_tuning_job_repository import S3FileLLMFineTuningJobRepository
 
@@ -22,10 +24,12 @@ __all__: Sequence[str] = [
     "DbModelEndpointRecordRepository",
     "ECRDockerRepository",
     "FeatureFlagRepository",
+    "ImageBuildRepository",
     "LLMFineTuningJobRepository",
     "ModelEndpointRecordRepository",
     "ModelEndpointCacheRepository",
     "RedisFeatureFlagRepository",
+    "RedisImageBuildRepository",
     "RedisModelEndpointCacheRepository",
     "S3FileLLMFineTuningJobRepository",
 ]
@@ -11,6 +11,7 @@ from llm_engine_server.domain.entities import (
 from llm_engine_server.domain.repositories import ModelBundleRepository
 from llm_engine_server.infra.repositories.db_repository_mixin import (
     DbRepositoryMixin,
+    get_keyset_page_clauses,
     raise_if_read_only,
 )
 
@@ -63,28 +64,35 @@ class DbModelBundleRepository(ModelBundleRepository, DbRepositoryMixin):
         return translate_model_bundle_orm_to_model_bundle(model_bundle_record)
 
     async def list_model_bundles(
-        self, owner: str, name: Optional[str], order_by: Optional[ModelBundleOrderBy]
+        self,
+        owner: str,
+        name: Optional[str],
+        order_by: Optional[ModelBundleOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> Sequence[ModelBundle]:
+        filters: List[Any] = []
+        if name is not None:
+            filters.append(OrmModelBundle.name == name)
+        order_by_clauses = None
+        if order_by is not None or limit is not None or page_token is not None:
+            # Pages are only well-defined for a given ordering, so default to the newest first.
+            page_filters, order_by_clauses = get_keyset_page_clauses(
+                created_at=OrmModelBundle.created_at,
+                id=OrmModelBundle.id,
+                newest_first=order_by != ModelBundleOrderBy.OLDEST,
+                page_token=page_token,
+            )
+            filters.extend(page_filters)
         async with self.session() as session:
-            if name is not None:
-                model_bundle_records = await OrmModelBundle.select_all_by_name_owner(
-                    session=session, name=name, owner=owner
-                )
-            else:
-                model_bundle_records = await OrmModelBundle.select_all_by_owner(
-                    session=session, owner=owner
-                )
-        model_bundles = [
-            translate_model_bundle_orm_to_model_bundle(mb) for mb in model_bundle_records
-        ]
-
-        # TODO(phil): we could use an ORDER_BY operation in the DB instead.
-        if order_by == ModelBundleOrderBy.NEWEST:
-            model_bundles.sort(key=lambda x: x.created_at, reverse=True)
-        elif order_by == ModelBundleOrderBy.OLDEST:
-            model_bundles.sort(key=lambda x: x.created_at, reverse=False)
-
-        return model_bundles
+            model_bundle_records = await OrmModelBundle.select_all_by_filters_owner(
+                session=session,
+                filters=filters,
+                owner=owner,
+                order_by=order_by_clauses,
+                limit=limit,
+            )
+        return [translate_model_bundle_orm_to_model_bundle(mb) for mb in model_bundle_records]
 
     async def get_model_bundle(self, model_bundle_id: str) -> Optional[ModelBundle]:
         async with self.session() as session:
@@ -1,8 +1,8 @@
 from contextlib import AsyncExitStack
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from cachetools import TTLCache
+import aioredis
 from llm_engine_server.common import dict_not_none
 from llm_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
 from llm_engine_server.core.loggers import filename_wo_ext, make_logger
@@ -15,8 +15,12 @@ from llm_engine_server.infra.repositories.db_model_bundle_repository import (
 )
 from llm_engine_server.infra.repositories.db_repository_mixin import (
     DbRepositoryMixin,
+    get_keyset_page_clauses,
     raise_if_read_only,
 )
+from llm_engine_server.infra.repositories.model_endpoint_record_cache import (
+    ModelEndpointRecordCache,
+)
 from llm_engine_server.infra.repositories.model_endpoint_record_repository import (
     ModelEndpointRecordRepository,
 )
@@ -26,11 +30,39 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = make_logger(filename_wo_ext(__file__))
 
 CACHE_SIZE = 512
-CACHE_TTL_SECONDS = 15.0  # Kubernetes caching is 15 seconds as well
+# Writes invalidate the cache of every replica, so this only bounds how stale records can get when
+# the invalidations can't be delivered, or when the DB is written to without this repository.
+CACHE_TTL_SECONDS = 60.0
+
+cache = ModelEndpointRecordCache(maxsize=CACHE_SIZE, ttl_seconds=CACHE_TTL_SECONDS)
+
+# Listings without an owner, e.g. the ones of internal jobs, may contain the records of any owner.
+ALL_OWNERS_TAG = ("owner", None)
+LLM_LISTINGS_TAG = ("llm",)
+
+
+def _get_record_tags(model_endpoint_id: str, owner: Optional[str]) -> List[Tuple[Any, ...]]:
+    """
+    Returns the tags of all the cache entries that may contain the given record. LLM listings
+    contain the public endpoints of any owner, so they are all invalidated.
+    """
+    return [("endpoint", model_endpoint_id), ("owner", owner), ALL_OWNERS_TAG, LLM_LISTINGS_TAG]
 
-# The cache is not thread-safe, but for now that is not an issue because we
-# use only 1 thread per process in production.
-cache: TTLCache = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL_SECONDS)
+
+def get_llm_model_endpoint_filters(owner: Optional[str], name: Optional[str]) -> List[Any]:
+    """
+    Returns the filters of the LLM endpoints that are public, or owned by `owner`. These match the
+    predicates of the partial indexes on LLM endpoints, so keep them in sync.
+    """
+    filters: List[Any] = []
+    filters.append(text("endpoint_metadata ? '_llm'"))
+    if name:
+        filters.append(OrmModelEndpoint.name == name)
+    ownership_filters = []
+    if owner:
+        ownership_filters.append(OrmModelEndpoint.owner == owner)
+    filters.append(or_(*ownership_filters, OrmModelEndpoint.public_inference == True))  # noqa
+    return filters
 
 
 def translate_model_endpoint_orm_to_model_endpoint_record(
@@ -66,26 +98,41 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
         monitoring_metrics_gateway: MonitoringMetricsGateway,
         session: Callable[[], AsyncSession],
         read_only: bool,
+        redis_client: Optional[aioredis.Redis] = None,
     ):
         super().__init__(session=session, read_only=read_only)
         self.monitoring_metrics_gateway = monitoring_metrics_gateway
+        self.redis_client = redis_client
 
     class DbLockContext(ModelEndpointRecordRepository.LockContext):
         """
         Implementation of a LockContext that is backed by a relational database.
         """
 
-        def __init__(self, lock_id: int, session: Callable[[], AsyncSession]):
+        def __init__(
+            self,
+            lock_id: int,
+            session: Callable[[], AsyncSession],
+            blocking: bool = False,
+            monitoring_metrics_gateway: Optional[MonitoringMetricsGateway] = None,
+        ):
             self._session = session
             self._exit_stack = AsyncExitStack()
             self._lock_id = lock_id
+            self._blocking = blocking
+            self._monitoring_metrics_gateway = monitoring_metrics_gateway
             self._lock_context_manager: Optional[AdvisoryLockContextManager] = None
 
         async def __aenter__(self):
             lock_session = await self._exit_stack.enter_async_context(self._session())
             self._lock_context_manager = await self._exit_stack.enter_async_context(
-                AdvisoryLockContextManager(lock_session, self._lock_id)
+                AdvisoryLockContextManager(lock_session, self._lock_id, blocking=self._blocking)
             )
+            if self._lock_context_manager.contended and self._monitoring_metrics_gateway:
+                self._monitoring_metrics_gateway.emit_database_lock_contention_metric(
+                    acquired=self._lock_context_manager.lock_acquired(),
+                    wait_seconds=self._lock_context_manager.wait_seconds,
+                )
             return self
 
         async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -98,13 +145,18 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
 
     @raise_if_read_only
     def get_lock_context(
-        self, model_endpoint_record: ModelEndpointRecord
+        self, model_endpoint_record: ModelEndpointRecord, blocking: bool = False
     ) -> ModelEndpointRecordRepository.LockContext:
         lock_id = get_lock_key(
             user_id=model_endpoint_record.created_by,
             endpoint_name=model_endpoint_record.name,
         )
-        return self.DbLockContext(lock_id=lock_id, session=self.session)
+        return self.DbLockContext(
+            lock_id=lock_id,
+            session=self.session,
+            blocking=blocking,
+            monitoring_metrics_gateway=self.monitoring_metrics_gateway,
+        )
 
     @raise_if_read_only
     async def create_model_endpoint_record(
@@ -147,6 +199,7 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
                 session=session,
                 endpoint_id=model_endpoint_record.id,
             )
+        await self._invalidate_cache(model_endpoint_record.id, owner)
         return translate_model_endpoint_orm_to_model_endpoint_record(model_endpoint_record)
 
     async def list_model_endpoint_records(
@@ -154,84 +207,82 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpointRecord]:
-        model_endpoints = cache.get((owner, name, order_by))
-        if model_endpoints is None:
-            self.monitoring_metrics_gateway.emit_database_cache_miss_metric()
-            filters = []
-            if owner:
-                filters.append(OrmModelEndpoint.owner == owner)
-            if name:
-                filters.append(OrmModelEndpoint.name == name)
-
-            async with self.session() as session:
-                model_endpoints_orm = await OrmModelEndpoint._select_all_by_filters(
-                    session=session, filters=filters
-                )
-
-            model_endpoints = [
-                translate_model_endpoint_orm_to_model_endpoint_record(m)
-                for m in model_endpoints_orm
-            ]
-
-            # TODO(phil): we could use an ORDER_BY operation in the DB instead.
-            if order_by == ModelEndpointOrderBy.NEWEST:
-                model_endpoints.sort(key=lambda x: x.created_at, reverse=True)
-            elif order_by == ModelEndpointOrderBy.OLDEST:
-                model_endpoints.sort(key=lambda x: x.created_at, reverse=False)
-            cache[(owner, name, order_by)] = model_endpoints
-        else:
-            self.monitoring_metrics_gateway.emit_database_cache_hit_metric()
-
-        return model_endpoints
+        filters: List[Any] = []
+        if owner:
+            filters.append(OrmModelEndpoint.owner == owner)
+        if name:
+            filters.append(OrmModelEndpoint.name == name)
+        return await self._list_model_endpoint_records(
+            cache_key=(owner, name, order_by, limit, page_token),
+            cache_tags=[("owner", owner)],
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            page_token=page_token,
+        )
 
     async def list_llm_model_endpoint_records(
         self,
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> List[ModelEndpointRecord]:
+        return await self._list_model_endpoint_records(
+            cache_key=("llm", owner, name, order_by, limit, page_token),
+            cache_tags=[LLM_LISTINGS_TAG],
+            filters=get_llm_model_endpoint_filters(owner=owner, name=name),
+            order_by=order_by,
+            limit=limit,
+            page_token=page_token,
+        )
+
+    async def _list_model_endpoint_records(
+        self,
+        cache_key: Tuple[Any, ...],
+        cache_tags: List[Tuple[Any, ...]],
+        filters: List[Any],
+        order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int],
+        page_token: Optional[str],
     ) -> List[ModelEndpointRecord]:
-        model_endpoints = cache.get(("llm", owner, name, order_by))
+        model_endpoints = self._get_cached(cache_key)
         if model_endpoints is None:
-            self.monitoring_metrics_gateway.emit_database_cache_miss_metric()
-            filters: List[Any] = []
-            filters.append(text("endpoint_metadata ? '_llm'"))
-            if name:
-                filters.append(OrmModelEndpoint.name == name)
-            ownership_filters = []
-            if owner:
-                ownership_filters.append(OrmModelEndpoint.owner == owner)
-            filters.append(
-                or_(*ownership_filters, OrmModelEndpoint.public_inference == True)  # noqa
-            )
+            generation = cache.generation
+            order_by_clauses = None
+            if order_by is not None or limit is not None or page_token is not None:
+                # Pages are only well-defined for a given ordering, so default to the newest first.
+                page_filters, order_by_clauses = get_keyset_page_clauses(
+                    created_at=OrmModelEndpoint.created_at,
+                    id=OrmModelEndpoint.id,
+                    newest_first=order_by != ModelEndpointOrderBy.OLDEST,
+                    page_token=page_token,
+                )
+                filters = filters + page_filters
 
             async with self.session() as session:
                 model_endpoints_orm = await OrmModelEndpoint._select_all_by_filters(
-                    session=session, filters=filters
+                    session=session, filters=filters, limit=limit, order_by=order_by_clauses
                 )
 
             model_endpoints = [
                 translate_model_endpoint_orm_to_model_endpoint_record(m)
                 for m in model_endpoints_orm
             ]
-
-            # TODO(phil): we could use an ORDER_BY operation in the DB instead.
-            if order_by == ModelEndpointOrderBy.NEWEST:
-                model_endpoints.sort(key=lambda x: x.created_at, reverse=True)
-            elif order_by == ModelEndpointOrderBy.OLDEST:
-                model_endpoints.sort(key=lambda x: x.created_at, reverse=False)
-            cache[("llm", owner, name, order_by)] = model_endpoints
-        else:
-            self.monitoring_metrics_gateway.emit_database_cache_hit_metric()
+            self._set_cached(cache_key, model_endpoints, cache_tags, generation)
 
         return model_endpoints
 
     async def get_model_endpoint_record(
         self, model_endpoint_id: str
     ) -> Optional[ModelEndpointRecord]:
-        model_endpoint = cache.get(model_endpoint_id)
+        model_endpoint = self._get_cached(model_endpoint_id)
         if model_endpoint is None:
-            self.monitoring_metrics_gateway.emit_database_cache_miss_metric()
+            generation = cache.generation
             async with self.session() as session:
                 model_endpoint_orm = await OrmModelEndpoint.select_by_id(
                     session=session, endpoint_id=model_endpoint_id
@@ -242,18 +293,18 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
             model_endpoint = translate_model_endpoint_orm_to_model_endpoint_record(
                 model_endpoint_orm
             )
-            cache[model_endpoint_id] = model_endpoint
-        else:
-            self.monitoring_metrics_gateway.emit_database_cache_hit_metric()
+            self._set_cached(
+                model_endpoint_id, model_endpoint, [("endpoint", model_endpoint.id)], generation
+            )
 
         return model_endpoint
 
     async def get_llm_model_endpoint_record(
         self, model_endpoint_name: str
     ) -> Optional[ModelEndpointRecord]:
-        model_endpoint = cache.get(("llm", model_endpoint_name))
+        model_endpoint = self._get_cached(("llm", model_endpoint_name))
         if model_endpoint is None:
-            self.monitoring_metrics_gateway.emit_database_cache_miss_metric()
+            generation = cache.generation
             async with self.session() as session:
                 model_endpoints_orm = await OrmModelEndpoint._select_all_by_filters(
                     session=session,
@@ -272,9 +323,12 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
             model_endpoint = translate_model_endpoint_orm_to_model_endpoint_record(
                 model_endpoints_orm[0]
             )
-            cache[("llm", model_endpoint_name)] = model_endpoint
-        else:
-            self.monitoring_metrics_gateway.emit_database_cache_hit_metric()
+            self._set_cached(
+                ("llm", model_endpoint_name),
+                model_endpoint,
+                [("endpoint", model_endpoint.id)],
+                generation,
+            )
 
         return model_endpoint
 
@@ -289,9 +343,7 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
 
             await OrmModelEndpoint.delete(session=session, endpoint=model_endpoint_orm)
 
-        if model_endpoint_id in cache:
-            del cache[model_endpoint_id]
-
+        await self._invalidate_cache(model_endpoint_id, model_endpoint_orm.owner)
         return True
 
     @raise_if_read_only
@@ -338,5 +390,31 @@ class DbModelEndpointRecordRepository(ModelEndpointRecordRepository, DbRepositor
         model_endpoint = translate_model_endpoint_orm_to_model_endpoint_record(
             updated_model_endpoint_orm
         )
-        cache[model_endpoint_id] = model_endpoint
+        await self._invalidate_cache(model_endpoint_id, model_endpoint.owner)
         return model_endpoint
+
+    def _get_cached(self, key: Any) -> Optional[Any]:
+        value = cache.get(key)
+        if value is None:
+            self.monitoring_metrics_gateway.emit_database_cache_miss_metric()
+        else:
+            self.monitoring_metrics_gateway.emit_database_cache_hit_metric()
+        return value
+
+    def _set_cached(
+        self, key: Any, value: Any, tags: List[Tuple[Any, ...]], generation: int
+    ) -> None:
+        num_evicted = cache.set(key, value, tags=tags, generation=generation)
+        if num_evicted:
+            self.monitoring_metrics_gateway.emit_database_cache_eviction_metric(num_evicted)
+
+    async def _invalidate_cache(self, model_endpoint_id: str, owner: Optional[str]) -> None:
+        tags = _get_record_tags(model_endpoint_id, owner)
+        cache.invalidate(tags)
+        if self.redis_client is None:
+            return
+        try:
+            await cache.publish_invalidation(self.redis_client, tags)
+        except Exception:
+            # The other replicas will catch up when their entries expire.
+            logger.exception(f"Failed to publish the cache invalidation of {model_endpoint_id}")
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 from functools import wraps
-from typing import Callable
+from typing import Any, Callable, List, Optional, Tuple
 
+from llm_engine_server.common.pagination import decode_page_token
 from llm_engine_server.core.domain_exceptions import ReadOnlyDatabaseException
+from llm_engine_server.db.base import stick_reads_to_primary
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -11,11 +14,32 @@ def raise_if_read_only(func: Callable):
     def inner(repo: DbRepositoryMixin, *args, **kwargs):
         if repo.read_only:
             raise ReadOnlyDatabaseException
+        # So that the rest of the request reads what it's about to write.
+        stick_reads_to_primary()
         return func(repo, *args, **kwargs)
 
     return inner
 
 
+def get_keyset_page_clauses(
+    created_at: Any, id: Any, newest_first: bool, page_token: Optional[str]
+) -> Tuple[List[Any], List[Any]]:
+    """
+    Returns the filters and the ORDER BY clauses that select the rows after `page_token`, ordered
+    by creation time. The ID breaks ties, so that no row is skipped or repeated across pages.
+    """
+    if newest_first:
+        order_by = [created_at.desc(), id.desc()]
+    else:
+        order_by = [created_at.asc(), id.asc()]
+    filters = []
+    if page_token is not None:
+        key = tuple_(*decode_page_token(page_token))
+        columns = tuple_(created_at, id)
+        filters.append(columns < key if newest_first else columns > key)
+    return filters, order_by
+
+
 @dataclass
 class DbRepositoryMixin:
     session: Callable[[], AsyncSession]
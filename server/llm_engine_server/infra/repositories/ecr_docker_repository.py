@@ -1,26 +1,161 @@
-from typing import Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
 from llm_engine_server.common.dtos.docker_repository import BuildImageRequest, BuildImageResponse
 from llm_engine_server.core.config import ml_infra_config
 from llm_engine_server.core.docker.ecr import image_exists as ecr_image_exists
-from llm_engine_server.core.docker.remote_build import build_remote_block
+from llm_engine_server.core.docker.ecr import image_exists_async as ecr_image_exists_async
+from llm_engine_server.core.docker.ecr import list_image_tags as ecr_list_image_tags
+from llm_engine_server.core.docker.remote_build import build_remote_block, build_remote_block_async
+from llm_engine_server.core.loggers import filename_wo_ext, make_logger
 from llm_engine_server.domain.repositories import DockerRepository
 
+logger = make_logger(filename_wo_ext(__file__))
+
+# How stale the index of a repository's images can get. Images that are deleted from ECR (e.g. by
+# a lifecycle policy) may be reported as existing for this long.
+IMAGE_INDEX_REFRESH_INTERVAL_SECONDS = 300.0
+
+_RepositoryKey = Tuple[str, Optional[str]]
+
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ecr-image-index")
+
+
+class _ImageIndex:
+    """
+    The tags of the images of each ECR repository, by repository name and aws profile. A
+    repository's tags are all listed at once, so that checking whether one of its images exists is
+    a set lookup rather than an ECR request.
+
+    Indexes are listed, and refreshed when they're stale, in the background, so lookups never wait
+    for them. Concurrent lookups share a single refresh.
+    """
+
+    def __init__(self, refresh_interval_seconds: float):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._image_tags: Dict[_RepositoryKey, Set[str]] = {}
+        self._refreshed_at: Dict[_RepositoryKey, float] = {}
+        self._refreshes: Dict[_RepositoryKey, "Future[None]"] = {}
+        # The tags added while a refresh is in flight, which its listing may have missed.
+        self._added_during_refresh: Dict[_RepositoryKey, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def contains(self, key: _RepositoryKey, image_tag: str) -> bool:
+        """
+        Returns whether the index has the image. Misses aren't authoritative, since the image may
+        have been pushed since the index was listed. Starts refreshing the index if it's stale.
+        """
+        with self._lock:
+            refreshed_at = self._refreshed_at.get(key)
+            contains = image_tag in self._image_tags.get(key, ())
+            if (
+                refreshed_at is None
+                or time.monotonic() - refreshed_at >= self.refresh_interval_seconds
+            ) and key not in self._refreshes:
+                self._added_during_refresh[key] = set()
+                self._refreshes[key] = _refresh_executor.submit(self._list_image_tags, key)
+        return contains
+
+    def add(self, key: _RepositoryKey, image_tag: str) -> None:
+        with self._lock:
+            self._image_tags.setdefault(key, set()).add(image_tag)
+            if key in self._refreshes:
+                self._added_during_refresh[key].add(image_tag)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._image_tags = {}
+            self._refreshed_at = {}
+
+    def _list_image_tags(self, key: _RepositoryKey) -> None:
+        repository_name, aws_profile = key
+        try:
+            image_tags = ecr_list_image_tags(
+                repository_name=repository_name, aws_profile=aws_profile
+            )
+        except Exception:
+            # The next lookup retries the refresh.
+            logger.exception(f"Failed to list the images of the {repository_name} repository")
+            with self._lock:
+                del self._refreshes[key]
+                del self._added_during_refresh[key]
+            return
+        with self._lock:
+            self._image_tags[key] = set(image_tags) | self._added_during_refresh.pop(key)
+            self._refreshed_at[key] = time.monotonic()
+            del self._refreshes[key]
+
+
+# Shared by the repositories of a process, since e.g. the endpoint builder creates one per build.
+_image_index = _ImageIndex(IMAGE_INDEX_REFRESH_INTERVAL_SECONDS)
+
 
 class ECRDockerRepository(DockerRepository):
     def image_exists(
         self, image_tag: str, repository_name: str, aws_profile: Optional[str] = None
     ) -> bool:
-        return ecr_image_exists(
+        key = (repository_name, aws_profile)
+        if _image_index.contains(key, image_tag):
+            return True
+        # The image may have been pushed since the index was listed.
+        exists = ecr_image_exists(
             image_tag=image_tag,
             repository_name=repository_name,
             aws_profile=aws_profile,
         )
+        if exists:
+            _image_index.add(key, image_tag)
+        return exists
+
+    async def image_exists_async(
+        self, image_tag: str, repository_name: str, aws_profile: Optional[str] = None
+    ) -> bool:
+        key = (repository_name, aws_profile)
+        if _image_index.contains(key, image_tag):
+            return True
+        # The image may have been pushed since the index was listed.
+        exists = await ecr_image_exists_async(
+            image_tag=image_tag,
+            repository_name=repository_name,
+            aws_profile=aws_profile,
+        )
+        if exists:
+            _image_index.add(key, image_tag)
+        return exists
 
     def get_image_url(self, image_tag: str, repository_name: str) -> str:
         return f"{ml_infra_config().docker_repo_prefix}/{repository_name}:{image_tag}"
 
     def build_image(self, image_params: BuildImageRequest) -> BuildImageResponse:
+        folders_to_include, build_args = self._get_build_args(image_params)
+        build_result = build_remote_block(
+            context=image_params.base_path,
+            dockerfile=image_params.dockerfile,
+            repotags=[f"{image_params.repo}:{image_params.image_tag}"],
+            folders_to_include=folders_to_include,
+            build_args=build_args,
+        )
+        if build_result.status:
+            _image_index.add((image_params.repo, image_params.aws_profile), image_params.image_tag)
+        return BuildImageResponse(status=build_result.status, logs=build_result.logs)
+
+    async def build_image_async(self, image_params: BuildImageRequest) -> BuildImageResponse:
+        folders_to_include, build_args = self._get_build_args(image_params)
+        build_result = await build_remote_block_async(
+            context=image_params.base_path,
+            dockerfile=image_params.dockerfile,
+            repotags=[f"{image_params.repo}:{image_params.image_tag}"],
+            folders_to_include=folders_to_include,
+            build_args=build_args,
+        )
+        if build_result.status:
+            _image_index.add((image_params.repo, image_params.aws_profile), image_params.image_tag)
+        return BuildImageResponse(status=build_result.status, logs=build_result.logs)
+
+    @staticmethod
+    def _get_build_args(image_params: BuildImageRequest) -> Tuple[List[str], Dict[str, str]]:
         folders_to_include = [
             "llm_engine",
         ]
@@ -34,11 +169,4 @@ class ECRDockerRepository(DockerRepository):
         if image_params.substitution_args:
             build_args.update(image_params.substitution_args)
 
-        build_result = build_remote_block(
-            context=image_params.base_path,
-            dockerfile=image_params.dockerfile,
-            repotags=[f"{image_params.repo}:{image_params.image_tag}"],
-            folders_to_include=folders_to_include,
-            build_args=build_args,
-        )
-        return BuildImageResponse(status=build_result.status, logs=build_result.logs)
+        return folders_to_include, build_args
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+
+
+class ImageBuildRepository(ABC):
+    """
+    Registry of the docker image builds in progress, shared by all the endpoint builders, so that
+    an image that many endpoints need at once (e.g. a common base image) is only built once.
+    """
+
+    @abstractmethod
+    async def claim_build(self, image: str, builder_id: str, ttl_seconds: float) -> bool:
+        """
+        Claims the build of an image, unless another builder already has.
+        Args:
+            image: The repository and tag of the image
+            builder_id: Identifies the build that makes the claim
+            ttl_seconds: How long the claim lasts, if it isn't released, e.g. because the
+                builder died
+        Returns:
+            Whether the build was claimed
+        """
+        pass
+
+    @abstractmethod
+    async def release_build(self, image: str, builder_id: str, succeeded: bool) -> None:
+        """
+        Releases the claim on the build of an image, and records whether the build succeeded, for
+        the builders that wait for it.
+        Args:
+            image: The repository and tag of the image
+            builder_id: Identifies the build that made the claim
+            succeeded: Whether the image was built
+        Returns:
+            None
+        """
+        pass
+
+    @abstractmethod
+    async def wait_for_build(self, image: str, timeout_seconds: float) -> bool:
+        """
+        Waits for the build of an image that another builder claimed.
+        Args:
+            image: The repository and tag of the image
+            timeout_seconds: How long to wait for at most
+        Returns:
+            Whether the build succeeded. False if it failed, if its claim expired, or if it took
+            longer than the timeout; the image may then need to be built by the caller.
+        """
+        pass
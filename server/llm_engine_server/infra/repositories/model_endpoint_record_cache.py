@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, NamedTuple, Optional, Set, Tuple
+
+import aioredis
+from llm_engine_server.common.constants import MODEL_ENDPOINT_RECORD_CACHE_INVALIDATION_CHANNEL
+from llm_engine_server.core.loggers import filename_wo_ext, make_logger
+
+logger = make_logger(filename_wo_ext(__file__))
+
+RECONNECT_DELAY_SECONDS = 5.0
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    tags: Tuple[Hashable, ...]
+
+
+class ModelEndpointRecordCache:
+    """
+    In-process cache of model endpoint records, and of listings of them.
+
+    Entries are tagged (e.g. with the ID and the owner of the records they contain), so that a
+    write to a record can drop every entry that may contain it. Reads don't take any lock; writes
+    and invalidations are serialized, so the cache can be shared by threads. Invalidations can be
+    broadcast to the caches of the other replicas over Redis pub/sub.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._keys_by_tag: Dict[Hashable, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Changes on every invalidation. Read it before loading a value, and pass it to `set`, so
+        that values loaded from before an invalidation aren't cached.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[Hashable], generation: int) -> int:
+        """
+        Caches a value, unless the cache was invalidated since `generation`.
+
+        Returns:
+            The number of unexpired entries that were evicted to make room for the value.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return 0
+            now = time.monotonic()
+            self._remove(key)
+            evicted = 0
+            if len(self._entries) >= self.maxsize:
+                for expired_key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+                    self._remove(expired_key)
+                while len(self._entries) >= self.maxsize:
+                    # Dicts are ordered by insertion, so this is the oldest entry.
+                    self._remove(next(iter(self._entries)))
+                    evicted += 1
+            entry = _Entry(value=value, expires_at=now + self.ttl_seconds, tags=tuple(tags))
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            self._entries[key] = entry
+            return evicted
+
+    def invalidate(self, tags: Iterable[Hashable]) -> None:
+        """Drops all the entries that have any of the given tags."""
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries = {}
+            self._keys_by_tag = {}
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    @staticmethod
+    async def publish_invalidation(redis_client: aioredis.Redis, tags: Iterable[Hashable]) -> None:
+        """Asks the caches of all the replicas that listen for invalidations to drop the tags."""
+        message = json.dumps([list(tag) if isinstance(tag, tuple) else tag for tag in tags])
+        await redis_client.publish(MODEL_ENDPOINT_RECORD_CACHE_INVALIDATION_CHANNEL, message)
+
+    def handle_invalidation_message(self, data: Any) -> None:
+        try:
+            tags = [tuple(tag) if isinstance(tag, list) else tag for tag in json.loads(data)]
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid cache invalidation message: {data!r}")
+            return
+        self.invalidate(tags)
+
+    async def listen_for_invalidations(self, redis_client: aioredis.Redis) -> None:
+        """
+        Applies the invalidations published by other replicas, until cancelled. The whole cache
+        is cleared whenever the subscription is (re)established, since messages may have been
+        missed while it was down.
+        """
+        while True:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(MODEL_ENDPOINT_RECORD_CACHE_INVALIDATION_CHANNEL)
+                self.clear()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        self.handle_invalidation_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Lost the model endpoint record cache invalidations connection")
+                self.clear()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
@@ -25,12 +25,15 @@ class ModelEndpointRecordRepository(ABC):
             """
 
     @abstractmethod
-    def get_lock_context(self, model_endpoint_record: ModelEndpointRecord) -> LockContext:
+    def get_lock_context(
+        self, model_endpoint_record: ModelEndpointRecord, blocking: bool = False
+    ) -> LockContext:
         """
         Returns a Context Manager object for locking the model endpoint record.
 
         Args:
             model_endpoint_record: The model endpoint record to lock.
+            blocking: Whether to wait for the lock, if it is taken, rather than give up at once.
 
         Returns:
             Context manager object for the lock.
@@ -105,6 +108,8 @@ class ModelEndpointRecordRepository(ABC):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpointRecord]:
         """
         Lists all the records of model endpoints given the filters.
@@ -113,6 +118,9 @@ class ModelEndpointRecordRepository(ABC):
             owner: The user ID of the creator of the endpoints.
             name: An optional name of the endpoint used for filtering endpoints.
             order_by: The ordering to output the Model Endpoints.
+            limit: An optional maximum number of records to return.
+            page_token: An optional token of the last record of the previous page, to return the
+                records that come after it. Pages are ordered by newest first by default.
 
         Returns:
             A list of Model Endpoint Record domain entities.
@@ -124,6 +132,8 @@ class ModelEndpointRecordRepository(ABC):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpointRecord]:
         """
         Lists all the records of LLM model endpoints given the filters.
@@ -132,6 +142,9 @@ class ModelEndpointRecordRepository(ABC):
             owner: The user ID of the creator of the endpoints.
             name: An optional name of the endpoint used for filtering endpoints.
             order_by: The ordering to output the Model Endpoints.
+            limit: An optional maximum number of records to return.
+            page_token: An optional token of the last record of the previous page, to return the
+                records that come after it. Pages are ordered by newest first by default.
 
         Returns:
             A list of LLM Model Endpoint Record domain entities.
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import aioredis
+from llm_engine_server.infra.repositories.image_build_repository import ImageBuildRepository
+
+# How long a successful build is remembered for the builders that wait for it. After that, they
+# find the image in the docker repository.
+BUILD_SUCCEEDED_TTL_SECONDS = 600
+DEFAULT_POLL_INTERVAL_SECONDS = 5.0
+
+# Deletes a claim only if it's held by the given builder, in one step, since the claim may expire
+# and be claimed by another builder between a GET and a DEL.
+RELEASE_CLAIM_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisImageBuildRepository(ImageBuildRepository):
+    """
+    Builds are claimed with `SET NX`, so that exactly one builder claims each image. Builds take
+    minutes, so the builders that wait for one poll for its outcome.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ):
+        self._redis = redis_client
+        self.poll_interval_seconds = poll_interval_seconds
+
+    @staticmethod
+    def _to_claim_key(image: str) -> str:
+        return f"llm-engine-image-build-claim:{image}"
+
+    @staticmethod
+    def _to_succeeded_key(image: str) -> str:
+        return f"llm-engine-image-build-succeeded:{image}"
+
+    async def claim_build(self, image: str, builder_id: str, ttl_seconds: float) -> bool:
+        claimed = await self._redis.set(
+            self._to_claim_key(image), builder_id, ex=int(ttl_seconds), nx=True
+        )
+        return bool(claimed)
+
+    async def release_build(self, image: str, builder_id: str, succeeded: bool) -> None:
+        # Record the outcome before releasing the claim, so that the waiters see it.
+        if succeeded:
+            await self._redis.set(
+                self._to_succeeded_key(image), "True", ex=BUILD_SUCCEEDED_TTL_SECONDS
+            )
+        # Only release our own claim: it may have expired, and been claimed by another builder.
+        await self._redis.eval(RELEASE_CLAIM_SCRIPT, 1, self._to_claim_key(image), builder_id)
+
+    async def wait_for_build(self, image: str, timeout_seconds: float) -> bool:
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            if await self._redis.get(self._to_succeeded_key(image)) is not None:
+                return True
+            if await self._redis.get(self._to_claim_key(image)) is None:
+                # The claim may have been released after a success since the first check.
+                return await self._redis.get(self._to_succeeded_key(image)) is not None
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.poll_interval_seconds)
@@ -79,7 +79,7 @@ class ImageCacheService:
                     or last_updated_at
                     > images_to_cache_priority["cpu"][state.image].last_updated_at
                 )
-                and self.docker_repository.image_exists(image_tag, repository_name)
+                and await self.docker_repository.image_exists_async(image_tag, repository_name)
             ):
                 images_to_cache_priority["cpu"][state.image] = cache_priority
             elif state.resource_state.gpus > 0:
@@ -94,7 +94,9 @@ class ImageCacheService:
                             or last_updated_at
                             > images_to_cache_priority[key][state.image].last_updated_at
                         )
-                        and self.docker_repository.image_exists(image_tag, repository_name)
+                        and await self.docker_repository.image_exists_async(
+                            image_tag, repository_name
+                        )
                     ):
                         images_to_cache_priority[key][state.image] = cache_priority
 
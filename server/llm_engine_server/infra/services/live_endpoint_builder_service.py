@@ -5,6 +5,7 @@ import tempfile
 from contextlib import AsyncExitStack
 from logging import LoggerAdapter
 from typing import List, Optional, Sequence
+from uuid import uuid4
 
 from datadog import statsd
 from llm_engine_server.common.constants import (
@@ -54,7 +55,11 @@ from llm_engine_server.infra.gateways.resources.endpoint_resource_gateway import
     EndpointResourceGateway,
 )
 from llm_engine_server.infra.infra_utils import make_exception_log
-from llm_engine_server.infra.repositories import FeatureFlagRepository, ModelEndpointCacheRepository
+from llm_engine_server.infra.repositories import (
+    FeatureFlagRepository,
+    ImageBuildRepository,
+    ModelEndpointCacheRepository,
+)
 from llm_engine_server.infra.repositories.model_endpoint_record_repository import (
     ModelEndpointRecordRepository,
 )
@@ -77,6 +82,8 @@ ENV: str = os.getenv("DD_ENV")  # type: ignore
 
 INITIAL_K8S_CACHE_TTL_SECONDS: int = 60
 MAX_IMAGE_TAG_LEN = 128
+# Longer than a Kaniko build can take, so that claims only expire if their builder died.
+IMAGE_BUILD_CLAIM_TTL_SECONDS = 3600
 
 
 class LiveEndpointBuilderService(EndpointBuilderService):
@@ -90,6 +97,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
         filesystem_gateway: FilesystemGateway,
         notification_gateway: NotificationGateway,
         feature_flag_repo: FeatureFlagRepository,
+        image_build_repository: ImageBuildRepository,
     ) -> None:
         self.docker_repository = docker_repository
         self.resource_gateway = resource_gateway
@@ -99,6 +107,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
         self.filesystem_gateway = filesystem_gateway
         self.notification_gateway = notification_gateway
         self.feature_flag_repo = feature_flag_repo
+        self.image_build_repository = image_build_repository
 
     async def build_endpoint(
         self, build_endpoint_request: BuildEndpointRequest
@@ -125,10 +134,14 @@ class LiveEndpointBuilderService(EndpointBuilderService):
         )
 
         async with AsyncExitStack() as stack:
-            lock_ctx = self.model_endpoint_record_repository.get_lock_context(model_endpoint_record)
+            lock_ctx = self.model_endpoint_record_repository.get_lock_context(
+                model_endpoint_record, blocking=True
+            )
             lock = await stack.enter_async_context(lock_ctx)
-            # If this can't acquire the lock by the timeout it'll happily keep on going and create
-            # the requisite resources. Not sure this makes complete sense?
+            # If the lock is taken, this waits for it on the server for up to
+            # BLOCKING_LOCK_TIMEOUT_SECONDS, holding a DB connection in the meantime. If it still
+            # can't acquire the lock by then, it keeps on going and creates the requisite resources
+            # anyway. Not sure this makes complete sense?
             logger_adapter.info(f"Acquiring lock on endpoint {endpoint_id}")
             if not lock.lock_acquired():  # pragma: no cover
                 logger_adapter.warning(
@@ -583,6 +596,7 @@ class LiveEndpointBuilderService(EndpointBuilderService):
 
         substitution_args = {
             "LOCAL_BUNDLE_PATH": model_bundle_path,
+            "BUNDLE_URL": bundle_url,
             "LOAD_MODEL_MODULE_PATH": model_bundle.flavor.load_model_fn_module_path,  # type: ignore
             "LOAD_PREDICT_MODULE_PATH": model_bundle.flavor.load_predict_fn_module_path,  # type: ignore
         }
@@ -619,109 +633,151 @@ class LiveEndpointBuilderService(EndpointBuilderService):
 
         log_error = make_exception_log(logger_adapter)
 
-        # image_exists hardcodes the ML ECR account, which needs to change for external self-hosted
-        if not self.docker_repository.image_exists(
-            repository_name=image_params.repo,
-            image_tag=image_params.image_tag,
-            aws_profile=ECR_AWS_PROFILE,
+        image = f"{image_params.repo}:{image_params.image_tag}"
+        builder_id = str(uuid4())
+        if not await self._image_exists(image_params) and await self._claim_image_build(
+            image_params, builder_id, logger_adapter
         ):
-            tags = [
-                f"kube_deployment:{build_endpoint_request.deployment_name}",
-                f"user_id:{user_id}",
-            ]
-            with statsd.timed("kaniko.build_time", tags=tags):
-                try:
-                    build_result: BuildImageResponse = self.docker_repository.build_image(
-                        image_params,
-                    )
-                    build_result_status = build_result.status
-                    build_result_logs: str = build_result.logs
-                except Exception:  # noqa
-                    build_result_status = False
-                    s3_logs_location: Optional[str] = None
-                    log_error(
-                        "Unknown error encountered on image build"
-                        f"No logs to write for {model_endpoint_name}, since docker build threw exception"
-                    )
-                else:
-                    # Write builder logs into a remote file
-                    s3_logs_location = self._get_service_builder_logs_location(
-                        user_id=user_id,
-                        endpoint_name=model_endpoint_name,
-                    )
+            build_succeeded = False
+            try:
+                tags = [
+                    f"kube_deployment:{build_endpoint_request.deployment_name}",
+                    f"user_id:{user_id}",
+                ]
+                with statsd.timed("kaniko.build_time", tags=tags):
                     try:
-                        with self.filesystem_gateway.open(
-                            s3_logs_location,
-                            "w",
-                            aws_profile=ml_infra_config().profile_ml_worker,
-                        ) as file_out:
-                            file_out.write(build_result_logs)
+                        build_result: BuildImageResponse = (
+                            await self.docker_repository.build_image_async(image_params)
+                        )
+                        build_result_status = build_result.status
+                        build_result_logs: str = build_result.logs
                     except Exception:  # noqa
+                        build_result_status = False
+                        s3_logs_location: Optional[str] = None
                         log_error(
-                            f"Unable to publish service builder logs for {model_endpoint_name}"
+                            "Unknown error encountered on image build"
+                            f"No logs to write for {model_endpoint_name}, since docker build threw exception"
                         )
+                    else:
+                        # Write builder logs into a remote file
+                        s3_logs_location = self._get_service_builder_logs_location(
+                            user_id=user_id,
+                            endpoint_name=model_endpoint_name,
+                        )
+                        try:
+                            with self.filesystem_gateway.open(
+                                s3_logs_location,
+                                "w",
+                                aws_profile=ml_infra_config().profile_ml_worker,
+                            ) as file_out:
+                                file_out.write(build_result_logs)
+                        except Exception:  # noqa
+                            log_error(
+                                f"Unable to publish service builder logs for {model_endpoint_name}"
+                            )
 
-                # Check that the build didn't succeed and the image doesn't exist.
-                # There's a race condition where if another simultaneous build is started,
-                # then one of the builds will not succeed, but the docker image ends up built.
-                if not build_result_status and not self.docker_repository.image_exists(
-                    repository_name=image_params.repo,
-                    image_tag=image_params.image_tag,
-                    aws_profile=ECR_AWS_PROFILE,
-                ):
-                    log_error(
-                        f"Image build failed for endpoint {model_endpoint_name}, user {user_id}"
-                    )
-
-                    await self.model_endpoint_record_repository.update_model_endpoint_record(
-                        model_endpoint_id=build_endpoint_request.model_endpoint_record.id,
-                        status=ModelEndpointStatus.UPDATE_FAILED,
-                    )
-
-                    if s3_logs_location is not None:
-                        help_url = self.filesystem_gateway.generate_signed_url(
-                            s3_logs_location,
-                            expiration=43200,  # 12 hours
-                            aws_profile=ml_infra_config().profile_ml_worker,
+                    # Check that the build didn't succeed and the image doesn't exist.
+                    # There's a race condition where if another simultaneous build is started,
+                    # then one of the builds will not succeed, but the docker image ends up built.
+                    if (
+                        not build_result_status
+                        and not await self.docker_repository.image_exists_async(
+                            repository_name=image_params.repo,
+                            image_tag=image_params.image_tag,
+                            aws_profile=ECR_AWS_PROFILE,
                         )
-                    else:
-                        help_url = (
-                            "https://app.datadoghq.com/logs?query=service%3Allm-engine-"
-                            f"endpoint-builder%20env%3A{ENV}&cols=host%2Cservice&"
-                            "index=%2A&messageDisplay=inline&stream_sort=time%2C"
-                            "desc&viz=stream&live=true"
+                    ):
+                        log_error(
+                            f"Image build failed for endpoint {model_endpoint_name}, user {user_id}"
                         )
 
-                    user_id = build_endpoint_request.model_endpoint_record.created_by
+                        await self.model_endpoint_record_repository.update_model_endpoint_record(
+                            model_endpoint_id=build_endpoint_request.model_endpoint_record.id,
+                            status=ModelEndpointStatus.UPDATE_FAILED,
+                        )
 
-                    endpoint_name = build_endpoint_request.model_endpoint_record.name
-                    bundle_id = build_endpoint_request.model_endpoint_record.current_model_bundle.id
-                    message = (
-                        f"Your endpoint '{endpoint_name}' failed to build! "
-                        f"Endpoint ID: {endpoint_id}. Bundle ID: {bundle_id}."
-                    )
+                        if s3_logs_location is not None:
+                            help_url = self.filesystem_gateway.generate_signed_url(
+                                s3_logs_location,
+                                expiration=43200,  # 12 hours
+                                aws_profile=ml_infra_config().profile_ml_worker,
+                            )
+                        else:
+                            help_url = (
+                                "https://app.datadoghq.com/logs?query=service%3Allm-engine-"
+                                f"endpoint-builder%20env%3A{ENV}&cols=host%2Cservice&"
+                                "index=%2A&messageDisplay=inline&stream_sort=time%2C"
+                                "desc&viz=stream&live=true"
+                            )
 
-                    self.notification_gateway.send_notification(
-                        title="LLMEngine Endpoint Build Failed",
-                        description=message,
-                        help_url=help_url,
-                        notification_apps=[
-                            NotificationApp.SLACK,
-                            NotificationApp.EMAIL,
-                        ],
-                        users=[user_id],
-                    )
+                        user_id = build_endpoint_request.model_endpoint_record.created_by
+
+                        endpoint_name = build_endpoint_request.model_endpoint_record.name
+                        bundle_id = (
+                            build_endpoint_request.model_endpoint_record.current_model_bundle.id
+                        )
+                        message = (
+                            f"Your endpoint '{endpoint_name}' failed to build! "
+                            f"Endpoint ID: {endpoint_id}. Bundle ID: {bundle_id}."
+                        )
 
-                    raise DockerBuildFailedException(f"Image build failed ({endpoint_id=})")
+                        self.notification_gateway.send_notification(
+                            title="LLMEngine Endpoint Build Failed",
+                            description=message,
+                            help_url=help_url,
+                            notification_apps=[
+                                NotificationApp.SLACK,
+                                NotificationApp.EMAIL,
+                            ],
+                            users=[user_id],
+                        )
 
+                        raise DockerBuildFailedException(f"Image build failed ({endpoint_id=})")
+                build_succeeded = True
+            finally:
+                await self.image_build_repository.release_build(
+                    image, builder_id, succeeded=build_succeeded
+                )
         else:
-            logger_adapter.info(
-                f"Image {image_params.repo}:{image_params.image_tag} already exists, "
-                f"skipping build for {endpoint_id=}"
-            )
+            logger_adapter.info(f"Image {image} already exists, skipping build for {endpoint_id=}")
 
         return self.docker_repository.get_image_url(image_params.image_tag, image_params.repo)
 
+    async def _image_exists(self, image_params: BuildImageRequest) -> bool:
+        # image_exists hardcodes the ML ECR account, which needs to change for external self-hosted
+        return await self.docker_repository.image_exists_async(
+            repository_name=image_params.repo,
+            image_tag=image_params.image_tag,
+            aws_profile=ECR_AWS_PROFILE,
+        )
+
+    async def _claim_image_build(
+        self, image_params: BuildImageRequest, builder_id: str, logger_adapter: LoggerAdapter
+    ) -> bool:
+        """
+        Claims the build of an image, so that the endpoints that need the same image at the same
+        time don't all build it. If another builder is building it, waits for that build instead.
+
+        Returns:
+            Whether the build was claimed. False if another builder built the image.
+        """
+        image = f"{image_params.repo}:{image_params.image_tag}"
+        while not await self.image_build_repository.claim_build(
+            image, builder_id, ttl_seconds=IMAGE_BUILD_CLAIM_TTL_SECONDS
+        ):
+            logger_adapter.info(f"Image {image} is being built by another builder, waiting for it")
+            if await self.image_build_repository.wait_for_build(
+                image, timeout_seconds=IMAGE_BUILD_CLAIM_TTL_SECONDS
+            ):
+                return False
+            # The other build failed, or its builder died: try to build the image here.
+
+        # The image may have been built between the existence check and the claim.
+        if await self._image_exists(image_params):
+            await self.image_build_repository.release_build(image, builder_id, succeeded=True)
+            return False
+        return True
+
     @staticmethod
     def _validate_build_endpoint_request(
         build_endpoint_request: BuildEndpointRequest,
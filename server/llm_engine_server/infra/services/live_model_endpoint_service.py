@@ -237,10 +237,12 @@ class LiveModelEndpointService(ModelEndpointService):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpoint]:
         # Will read from cache at first
         records = await self.model_endpoint_record_repository.list_model_endpoint_records(
-            owner=owner, name=name, order_by=order_by
+            owner=owner, name=name, order_by=order_by, limit=limit, page_token=page_token
         )
         endpoints: List[ModelEndpoint] = []
         for record in records:
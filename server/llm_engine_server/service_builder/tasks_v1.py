@@ -13,14 +13,14 @@ from llm_engine_server.common.dtos.endpoint_builder import (
 from llm_engine_server.common.env_vars import CIRCLECI
 from llm_engine_server.core.fake_notification_gateway import FakeNotificationGateway
 from llm_engine_server.core.notification_gateway import NotificationGateway
-from llm_engine_server.db.base import SessionAsyncNullPool
+from llm_engine_server.db.base import SessionAsyncNullPool, set_engine_monitoring_metrics_gateway
 from llm_engine_server.domain.gateways.monitoring_metrics_gateway import MonitoringMetricsGateway
-from llm_engine_server.infra.gateways import FakeMonitoringMetricsGateway, S3FilesystemGateway
+from llm_engine_server.infra.gateways import DatadogMonitoringMetricsGateway, S3FilesystemGateway
 from llm_engine_server.infra.gateways.resources.fake_sqs_endpoint_resource_delegate import (
     FakeSQSEndpointResourceDelegate,
 )
 from llm_engine_server.infra.gateways.resources.k8s_endpoint_resource_delegate import (
-    set_lazy_load_kubernetes_clients,
+    close_kubernetes_clients,
 )
 from llm_engine_server.infra.gateways.resources.live_endpoint_resource_gateway import (
     LiveEndpointResourceGateway,
@@ -35,15 +35,12 @@ from llm_engine_server.infra.repositories import (
     DbModelEndpointRecordRepository,
     ECRDockerRepository,
     RedisFeatureFlagRepository,
+    RedisImageBuildRepository,
     RedisModelEndpointCacheRepository,
 )
 from llm_engine_server.infra.services import LiveEndpointBuilderService
 from llm_engine_server.service_builder.celery import service_builder_service
 
-# Need to disable lazy loading of k8s clients because each event loop should contain its own k8s
-# client, which constructs the aiohttp.ClientSession in the event loop.
-set_lazy_load_kubernetes_clients(False)
-
 
 async def _build_endpoint(
     build_endpoint_request: BuildEndpointRequest,
@@ -60,7 +57,8 @@ async def _build_endpoint(
             sqs_profile=os.getenv("SQS_PROFILE", hmi_config.sqs_profile)
         )
     monitoring_metrics_gateway: MonitoringMetricsGateway
-    monitoring_metrics_gateway = FakeMonitoringMetricsGateway()
+    monitoring_metrics_gateway = DatadogMonitoringMetricsGateway()
+    set_engine_monitoring_metrics_gateway(monitoring_metrics_gateway)
     notification_gateway = FakeNotificationGateway()
 
     service = LiveEndpointBuilderService(
@@ -71,16 +69,21 @@ async def _build_endpoint(
             monitoring_metrics_gateway=monitoring_metrics_gateway,
             session=session,
             read_only=False,
+            redis_client=redis,
         ),
         model_endpoint_cache_repository=RedisModelEndpointCacheRepository(redis_client=redis),
         filesystem_gateway=S3FilesystemGateway(),
         notification_gateway=notification_gateway,
         feature_flag_repo=RedisFeatureFlagRepository(redis_client=redis),
+        image_build_repository=RedisImageBuildRepository(redis_client=redis),
     )
-    response = await service.build_endpoint(build_endpoint_request)
-    await redis.close()
-    await pool.disconnect()
-    return response
+    try:
+        return await service.build_endpoint(build_endpoint_request)
+    finally:
+        await redis.close()
+        await pool.disconnect()
+        # Each build runs in an event loop of its own.
+        await close_kubernetes_clients()
 
 
 @worker_process_init.connect
@@ -45,6 +45,7 @@ from llm_engine_server.domain.entities.batch_job_entity import DockerImageBatchJ
 from llm_engine_server.domain.entities.docker_image_batch_job_bundle_entity import (
     DockerImageBatchJobBundle,
 )
+from sse_starlette.sse import AppStatus
 
 USER_TEAM_OVERRIDE = dict(
     test_user_id_on_other_team="test_team", test_user_id_on_other_team_2="test_team"
@@ -87,6 +88,13 @@ def fake_auth():
         app.dependency_overrides[verify_authentication] = {}
 
 
+@pytest.fixture(autouse=True)
+def reset_sse_app_status():
+    # sse_starlette keeps an event bound to the event loop of the first streaming response, but each
+    # TestClient request may run in a different loop.
+    AppStatus.should_exit_event = None
+
+
 @pytest.fixture
 def get_test_client_wrapper(get_repositories_generator_wrapper):
     def get_test_client(
@@ -1125,3 +1133,8 @@ def completion_sync_request_temperature_zero() -> Dict[str, Any]:
 @pytest.fixture
 def completion_stream_request() -> Dict[str, Any]:
     return {"prompt": "what is 1+1?", "max_new_tokens": 10, "temperature": 0.1}
+
+
+@pytest.fixture
+def completion_batch_stream_request() -> Dict[str, Any]:
+    return {"prompts": ["what is 1+1?", "what is 2+2?"], "max_new_tokens": 10, "temperature": 0.1}
@@ -2,7 +2,10 @@ import json
 from typing import Any, Dict, Tuple
 
 import pytest
-from llm_engine_server.common.dtos.llms import GetLLMModelEndpointV1Response
+from llm_engine_server.common.dtos.llms import (
+    MAX_COMPLETION_BATCH_STREAM_PROMPTS,
+    GetLLMModelEndpointV1Response,
+)
 from llm_engine_server.domain.entities import ModelEndpoint
 
 
@@ -52,7 +55,10 @@ def test_list_model_endpoints_success(
         GetLLMModelEndpointV1Response.parse_obj(llm_model_endpoint_async[1]).json()
     )
     assert response_1.status_code == 200
-    assert response_1.json() == {"model_endpoints": [expected_model_endpoint_1]}
+    assert response_1.json() == {
+        "model_endpoints": [expected_model_endpoint_1],
+        "next_page_token": None,
+    }
 
 
 def test_get_llm_model_endpoint_success(
@@ -169,3 +175,68 @@ def test_completion_stream_success(
         assert message == b'data: {"status": "SUCCESS", "output": null, "traceback": null}\r\n\r\n'
         count += 1
     assert count == 1
+
+
+def test_completion_batch_stream_endpoint_not_found_returns_404(
+    completion_batch_stream_request: Dict[str, Any],
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_model_endpoint_record_repository_contents={},
+        fake_model_endpoint_infra_gateway_contents={},
+    )
+    response_1 = client.post(
+        "/v1/llm/completions-batch-stream?model_endpoint_name=nonexistent_endpoint",
+        auth=(test_api_key, ""),
+        json=completion_batch_stream_request,
+    )
+    assert response_1.status_code == 404
+
+
+def test_completion_batch_stream_non_streaming_endpoint_returns_400(
+    llm_model_endpoint_async: Tuple[ModelEndpoint, Any],
+    completion_batch_stream_request: Dict[str, Any],
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_model_endpoint_record_repository_contents={
+            llm_model_endpoint_async[0].record.id: llm_model_endpoint_async[0].record,
+        },
+        fake_model_endpoint_infra_gateway_contents={
+            llm_model_endpoint_async[0]
+            .infra_state.deployment_name: llm_model_endpoint_async[0]
+            .infra_state,
+        },
+    )
+    response_1 = client.post(
+        f"/v1/llm/completions-batch-stream?model_endpoint_name={llm_model_endpoint_async[0].record.name}",
+        auth=(test_api_key, ""),
+        json=completion_batch_stream_request,
+    )
+    assert response_1.status_code == 400
+
+
+def test_completion_batch_stream_too_many_prompts_returns_422(
+    llm_model_endpoint_streaming: ModelEndpoint,
+    completion_batch_stream_request: Dict[str, Any],
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_model_endpoint_record_repository_contents={
+            llm_model_endpoint_streaming.record.id: llm_model_endpoint_streaming.record,
+        },
+        fake_model_endpoint_infra_gateway_contents={
+            llm_model_endpoint_streaming.infra_state.deployment_name: llm_model_endpoint_streaming.infra_state,
+        },
+    )
+    completion_batch_stream_request["prompts"] = ["what is 1+1?"] * (
+        MAX_COMPLETION_BATCH_STREAM_PROMPTS + 1
+    )
+    response_1 = client.post(
+        f"/v1/llm/completions-batch-stream?model_endpoint_name={llm_model_endpoint_streaming.record.name}",
+        auth=(llm_model_endpoint_streaming.record.created_by, ""),
+        json=completion_batch_stream_request,
+    )
+    assert response_1.status_code == 422
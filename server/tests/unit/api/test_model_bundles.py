@@ -183,14 +183,20 @@ def test_list_model_bundles(
     model_bundle_1_v1_json = model_bundle_1_v1[1][version]
     model_bundle_1_v2_json = model_bundle_1_v2[1][version]
     assert response_1.status_code == 200
-    assert response_1.json() == {"model_bundles": [model_bundle_1_v2_json, model_bundle_1_v1_json]}
+    assert response_1.json() == {
+        "model_bundles": [model_bundle_1_v2_json, model_bundle_1_v1_json],
+        "next_page_token": None,
+    }
 
     response_2 = client.get(
         f"/{version}/model-bundles?model_name=test_model_bundle_name_1&order_by=oldest",
         auth=(test_api_key, ""),
     )
     assert response_2.status_code == 200
-    assert response_2.json() == {"model_bundles": [model_bundle_1_v1_json, model_bundle_1_v2_json]}
+    assert response_2.json() == {
+        "model_bundles": [model_bundle_1_v1_json, model_bundle_1_v2_json],
+        "next_page_token": None,
+    }
 
 
 @pytest.mark.parametrize("version", ["v1", "v2"])
@@ -227,7 +227,8 @@ def test_list_model_endpoints(
     )
     assert response_1.status_code == 200
     assert response_1.json() == {
-        "model_endpoints": [expected_model_endpoint_1, expected_model_endpoint_2]
+        "model_endpoints": [expected_model_endpoint_1, expected_model_endpoint_2],
+        "next_page_token": None,
     }
 
     response_2 = client.get(
@@ -235,7 +236,55 @@ def test_list_model_endpoints(
         auth=(test_api_key_2, ""),
     )
     assert response_2.status_code == 200
-    assert response_2.json() == {"model_endpoints": []}
+    assert response_2.json() == {"model_endpoints": [], "next_page_token": None}
+
+
+def test_list_model_endpoints_paginated(
+    model_bundle_1_v1: Tuple[ModelBundle, Any],
+    model_endpoint_1: Tuple[ModelEndpoint, Any],
+    model_endpoint_2: Tuple[ModelEndpoint, Any],
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    assert model_endpoint_1[0].infra_state is not None
+    assert model_endpoint_2[0].infra_state is not None
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={
+            model_bundle_1_v1[0].id: model_bundle_1_v1[0],
+        },
+        fake_model_endpoint_record_repository_contents={
+            model_endpoint_1[0].record.id: model_endpoint_1[0].record,
+            model_endpoint_2[0].record.id: model_endpoint_2[0].record,
+        },
+        fake_model_endpoint_infra_gateway_contents={
+            model_endpoint_1[0].infra_state.deployment_name: model_endpoint_1[0].infra_state,
+            model_endpoint_2[0].infra_state.deployment_name: model_endpoint_2[0].infra_state,
+        },
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    model_endpoint_ids = []
+    page_token = None
+    for _ in range(3):
+        url = "/v1/model-endpoints?order_by=newest&limit=1"
+        if page_token is not None:
+            url += f"&page_token={page_token}"
+        response = client.get(url, auth=(test_api_key, ""))
+        assert response.status_code == 200
+        model_endpoint_ids.extend(m["id"] for m in response.json()["model_endpoints"])
+        page_token = response.json()["next_page_token"]
+        if page_token is None:
+            break
+    # Endpoints created at the same time are ordered by ID.
+    assert model_endpoint_ids == [model_endpoint_2[0].record.id, model_endpoint_1[0].record.id]
+
+    response = client.get("/v1/model-endpoints?page_token=invalid", auth=(test_api_key, ""))
+    assert response.status_code == 400
+
+    response = client.get("/v1/model-endpoints?limit=0", auth=(test_api_key, ""))
+    assert response.status_code == 422
 
 
 def test_get_model_endpoint_by_id_success(
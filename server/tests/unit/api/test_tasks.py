@@ -1,7 +1,11 @@
 from typing import Any, Dict, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from llm_engine_server.common.dtos.tasks import EndpointPredictV1Request
+from llm_engine_server.common.dtos.tasks import (
+    MAX_ASYNC_TASK_STATUS_BATCH_SIZE,
+    MAX_ASYNC_TASK_WAIT_SECONDS,
+    EndpointPredictV1Request,
+)
 from llm_engine_server.core.domain_exceptions import (
     ObjectNotAuthorizedException,
     ObjectNotFoundException,
@@ -133,6 +137,61 @@ def test_get_async_task_success(
     assert response.status_code == 200
 
 
+def test_get_async_task_with_wait_seconds_success(
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={},
+        fake_model_endpoint_record_repository_contents={},
+        fake_model_endpoint_infra_gateway_contents={},
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    response = client.get(
+        "/v1/async-tasks/test_task_id?wait_seconds=30",
+        auth=(test_api_key, ""),
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "SUCCESS"
+
+    response = client.get(
+        f"/v1/async-tasks/test_task_id?wait_seconds={MAX_ASYNC_TASK_WAIT_SECONDS + 1}",
+        auth=(test_api_key, ""),
+    )
+    assert response.status_code == 422
+
+
+def test_get_async_task_events_success(
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={},
+        fake_model_endpoint_record_repository_contents={},
+        fake_model_endpoint_infra_gateway_contents={},
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    response = client.get(
+        "/v1/async-tasks/test_task_id/events",
+        auth=(test_api_key, ""),
+    )
+    assert response.status_code == 200
+    count = 0
+    for message in response:
+        assert message == (
+            b'data: {"task_id": "test_task_id", "status": "SUCCESS", "result": null, '
+            b'"traceback": null}\r\n\r\n'
+        )
+        count += 1
+    assert count == 1
+
+
 def test_get_async_task_raises_404_object_not_found(
     model_bundle_1_v1: Tuple[ModelBundle, Any],
     model_endpoint_1: Tuple[ModelEndpoint, Any],
@@ -371,3 +430,76 @@ def test_create_streaming_task_success(
         assert message == b'data: {"status": "SUCCESS", "result": null, "traceback": null}\r\n\r\n'
         count += 1
     assert count == 1
+
+
+def test_get_async_tasks_status_success(
+    model_bundle_1_v1: Tuple[ModelBundle, Any],
+    model_endpoint_1: Tuple[ModelEndpoint, Any],
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    assert model_endpoint_1[0].infra_state is not None
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={
+            model_bundle_1_v1[0].id: model_bundle_1_v1[0],
+        },
+        fake_model_endpoint_record_repository_contents={
+            model_endpoint_1[0].record.id: model_endpoint_1[0].record,
+        },
+        fake_model_endpoint_infra_gateway_contents={
+            model_endpoint_1[0].infra_state.deployment_name: model_endpoint_1[0].infra_state,
+        },
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    response = client.post(
+        "/v1/async-tasks/status",
+        auth=(test_api_key, ""),
+        json={"task_ids": ["test_task_id_1", "test_task_id_2"]},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "tasks": [
+            {"task_id": "test_task_id_1", "status": "SUCCESS"},
+            {"task_id": "test_task_id_2", "status": "SUCCESS"},
+        ]
+    }
+
+    response = client.post(
+        "/v1/async-tasks/status",
+        auth=(test_api_key, ""),
+        json={"task_ids": ["test_task_id_1"], "include_results": True},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "tasks": [
+            {
+                "task_id": "test_task_id_1",
+                "status": "SUCCESS",
+                "result": {"task_id": "test_task_id_1"},
+            },
+        ]
+    }
+
+
+def test_get_async_tasks_status_too_many_task_ids_returns_422(
+    test_api_key: str,
+    get_test_client_wrapper,
+):
+    client = get_test_client_wrapper(
+        fake_docker_repository_image_always_exists=True,
+        fake_model_bundle_repository_contents={},
+        fake_model_endpoint_record_repository_contents={},
+        fake_model_endpoint_infra_gateway_contents={},
+        fake_batch_job_record_repository_contents={},
+        fake_batch_job_progress_gateway_contents={},
+        fake_docker_image_batch_job_bundle_repository_contents={},
+    )
+    response = client.post(
+        "/v1/async-tasks/status",
+        auth=(test_api_key, ""),
+        json={"task_ids": [f"task_{i}" for i in range(MAX_ASYNC_TASK_STATUS_BATCH_SIZE + 1)]},
+    )
+    assert response.status_code == 422
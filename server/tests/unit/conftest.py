@@ -1,16 +1,21 @@
+import asyncio
 from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     IO,
     Any,
     AsyncIterable,
+    AsyncIterator,
+    Callable,
     DefaultDict,
     Dict,
     Iterator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
 )
 from unittest.mock import mock_open
@@ -38,6 +43,7 @@ from llm_engine_server.common.dtos.tasks import (
     SyncEndpointPredictV1Response,
     TaskStatus,
 )
+from llm_engine_server.common.pagination import decode_page_token
 from llm_engine_server.common.settings import generate_destination
 from llm_engine_server.core.domain_exceptions import ObjectNotFoundException
 from llm_engine_server.core.fake_notification_gateway import FakeNotificationGateway
@@ -86,6 +92,7 @@ from llm_engine_server.domain.gateways import (
     DockerImageBatchJobGateway,
     StreamingModelEndpointInferenceGateway,
     SyncModelEndpointInferenceGateway,
+    TaskCompletionGateway,
     TaskQueueGateway,
 )
 from llm_engine_server.domain.repositories import (
@@ -118,6 +125,7 @@ from llm_engine_server.infra.gateways.resources.image_cache_gateway import (
 from llm_engine_server.infra.repositories import (
     BatchJobRecordRepository,
     FeatureFlagRepository,
+    ImageBuildRepository,
     ModelEndpointCacheRepository,
     ModelEndpointRecordRepository,
 )
@@ -132,6 +140,24 @@ from llm_engine_server.infra.services.live_llm_model_endpoint_service import (
 )
 
 
+def _paginate(
+    items: List[Any],
+    get_key: Callable[[Any], Tuple[datetime, str]],
+    order_by: Optional[str],
+    limit: Optional[int],
+    page_token: Optional[str],
+) -> List[Any]:
+    """Keyset pagination of sorted items, as done in SQL by the DB repositories."""
+    if limit is None and page_token is None:
+        return items
+    newest_first = order_by != "oldest"
+    items = sorted(items, key=get_key, reverse=newest_first)
+    if page_token is not None:
+        key = decode_page_token(page_token)
+        items = [x for x in items if (get_key(x) < key if newest_first else get_key(x) > key)]
+    return items[:limit] if limit is not None else items
+
+
 def _translate_fake_model_endpoint_orm_to_model_endpoint_record(
     model_endpoint_orm: OrmModelEndpoint, current_model_bundle: ModelBundle
 ) -> ModelEndpointRecord:
@@ -221,7 +247,12 @@ class FakeModelBundleRepository(ModelBundleRepository):
         return self.db[model_bundle.id]
 
     async def list_model_bundles(
-        self, owner: str, name: Optional[str], order_by: Optional[ModelBundleOrderBy]
+        self,
+        owner: str,
+        name: Optional[str],
+        order_by: Optional[ModelBundleOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> Sequence[ModelBundle]:
         model_bundles = [
             mb for mb in self.db.values() if mb.owner == owner and (not name or mb.name == name)
@@ -232,7 +263,7 @@ class FakeModelBundleRepository(ModelBundleRepository):
         elif order_by == ModelBundleOrderBy.OLDEST:
             model_bundles.sort(key=lambda x: x.created_at, reverse=False)
 
-        return model_bundles
+        return _paginate(model_bundles, lambda x: (x.created_at, x.id), order_by, limit, page_token)
 
     async def get_latest_model_bundle_by_name(self, owner: str, name: str) -> Optional[ModelBundle]:
         model_bundles = await self.list_model_bundles(owner, name, ModelBundleOrderBy.NEWEST)
@@ -392,7 +423,7 @@ class FakeModelEndpointRecordRepository(ModelEndpointRecordRepository):
         self._lock_db[lock_id] = False
 
     def get_lock_context(
-        self, model_endpoint_record: ModelEndpointRecord
+        self, model_endpoint_record: ModelEndpointRecord, blocking: bool = False
     ) -> ModelEndpointRecordRepository.LockContext:
         lock_id = get_lock_key(
             user_id=model_endpoint_record.created_by,
@@ -499,6 +530,8 @@ class FakeModelEndpointRecordRepository(ModelEndpointRecordRepository):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpointRecord]:
         def filter_fn(m: ModelEndpointRecord) -> bool:
             return (not owner or m.owner == owner) and (not name or m.name == name)
@@ -510,13 +543,17 @@ class FakeModelEndpointRecordRepository(ModelEndpointRecordRepository):
         elif order_by == ModelEndpointOrderBy.OLDEST:
             model_endpoints.sort(key=lambda x: x.created_at, reverse=False)
 
-        return model_endpoints
+        return _paginate(
+            model_endpoints, lambda x: (x.created_at, x.id), order_by, limit, page_token
+        )
 
     async def list_llm_model_endpoint_records(
         self,
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpointRecord]:
         def filter_fn(m: ModelEndpointRecord) -> bool:
             return ("_llm" in m.metadata) and (
@@ -531,7 +568,9 @@ class FakeModelEndpointRecordRepository(ModelEndpointRecordRepository):
         elif order_by == ModelEndpointOrderBy.OLDEST:
             model_endpoints.sort(key=lambda x: x.created_at, reverse=False)
 
-        return model_endpoints
+        return _paginate(
+            model_endpoints, lambda x: (x.created_at, x.id), order_by, limit, page_token
+        )
 
     async def delete_model_endpoint_record(self, model_endpoint_id: str) -> bool:
         if model_endpoint_id not in self.db:
@@ -649,6 +688,14 @@ class FakeDockerRepository(DockerRepository):
             raise Exception("I hope you're handling this!")
         return BuildImageResponse(status=True, logs="")
 
+    async def image_exists_async(
+        self, image_tag: str, repository_name: str, aws_profile: Optional[str] = None
+    ) -> bool:
+        return self.image_exists(image_tag, repository_name, aws_profile)
+
+    async def build_image_async(self, image_params: BuildImageRequest) -> BuildImageResponse:
+        return self.build_image(image_params)
+
 
 class FakeModelEndpointCacheRepository(ModelEndpointCacheRepository):
     def __init__(self):
@@ -693,6 +740,27 @@ class FakeFeatureFlagRepository(FeatureFlagRepository):
         return self.db.get(key, None)
 
 
+class FakeImageBuildRepository(ImageBuildRepository):
+    def __init__(self):
+        self.claims: Dict[str, str] = {}
+        self.succeeded: Set[str] = set()
+
+    async def claim_build(self, image: str, builder_id: str, ttl_seconds: float) -> bool:
+        if image in self.claims:
+            return False
+        self.claims[image] = builder_id
+        return True
+
+    async def release_build(self, image: str, builder_id: str, succeeded: bool) -> None:
+        if succeeded:
+            self.succeeded.add(image)
+        if self.claims.get(image) == builder_id:
+            del self.claims[image]
+
+    async def wait_for_build(self, image: str, timeout_seconds: float) -> bool:
+        return image in self.succeeded
+
+
 class FakeImageCacheGateway(ImageCacheGateway):
     def __init__(self):
         self.cached_images = CachedImages(cpu=[], a10=[], a100=[], t4=[])
@@ -766,6 +834,22 @@ class FakeTaskQueueGateway(TaskQueueGateway):
         self.queue[task_id] = task
         return CreateAsyncTaskV1Response(task_id=task_id)
 
+    async def send_task_async(
+        self,
+        task_name: str,
+        queue_name: str,
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        expires: Optional[int] = None,
+    ) -> CreateAsyncTaskV1Response:
+        return self.send_task(
+            task_name=task_name,
+            queue_name=queue_name,
+            args=args,
+            kwargs=kwargs,
+            expires=expires,
+        )
+
     def do_task(self, result: Any = 42, status: str = "success"):
         task_id, task = self.queue.popitem(last=False)
         self.completed[task_id] = result
@@ -790,12 +874,37 @@ class FakeTaskQueueGateway(TaskQueueGateway):
             traceback=None,
         )
 
+    def get_tasks(self, task_ids: Sequence[str]) -> List[GetAsyncTaskV1Response]:
+        return [self.get_task(task_id) for task_id in task_ids]
+
     def clear_queue(self, queue_name: str) -> bool:
         queue = {k: v for k, v in self.queue.items() if v["queue_name"] != queue_name}
         self.queue = queue
         return True
 
 
+class FakeTaskCompletionGateway(TaskCompletionGateway):
+    def __init__(self):
+        self.waiters: DefaultDict[str, List[asyncio.Event]] = defaultdict(list)
+        self.available = True
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: str) -> AsyncIterator[Optional[asyncio.Event]]:
+        if not self.available:
+            yield None
+            return
+        event = asyncio.Event()
+        self.waiters[task_id].append(event)
+        try:
+            yield event
+        finally:
+            self.waiters[task_id].remove(event)
+
+    def notify(self, task_id: str):
+        for event in self.waiters[task_id]:
+            event.set()
+
+
 class FakeModelEndpointInfraGateway(ModelEndpointInfraGateway):
     db: Dict[str, ModelEndpointInfraState]
     in_flight_infra: Dict[str, ModelEndpointInfraState]
@@ -1236,6 +1345,21 @@ class FakeAsyncModelEndpointInferenceGateway(AsyncModelEndpointInferenceGateway)
             task_id="test_task_id"
         )  # can return distinct task ids if we need
 
+    async def create_task_async(
+        self,
+        topic: str,
+        predict_request: EndpointPredictV1Request,
+        task_timeout_seconds: int,
+        *,
+        task_name: str = DEFAULT_CELERY_TASK_NAME,
+    ) -> CreateAsyncTaskV1Response:
+        return self.create_task(
+            topic=topic,
+            predict_request=predict_request,
+            task_timeout_seconds=task_timeout_seconds,
+            task_name=task_name,
+        )
+
     def get_task(self, task_id: str) -> GetAsyncTaskV1Response:
         return GetAsyncTaskV1Response(
             task_id=task_id,
@@ -1244,6 +1368,20 @@ class FakeAsyncModelEndpointInferenceGateway(AsyncModelEndpointInferenceGateway)
             traceback=None,
         )
 
+    async def wait_for_task(self, task_id: str, timeout_seconds: float) -> GetAsyncTaskV1Response:
+        return self.get_task(task_id)
+
+    def get_tasks(self, task_ids: Sequence[str]) -> List[GetAsyncTaskV1Response]:
+        return [
+            GetAsyncTaskV1Response(
+                task_id=task_id,
+                status=TaskStatus.SUCCESS,
+                result={"task_id": task_id},
+                traceback=None,
+            )
+            for task_id in task_ids
+        ]
+
     def get_last_request(self):
         #  For validating service inputs are correct
         assert len(self.tasks) > 0, "No async tasks have been created"
@@ -1484,6 +1622,8 @@ class FakeModelEndpointService(ModelEndpointService):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpoint]:
         def filter_fn(m: ModelEndpoint) -> bool:
             return self._filter_by_name_owner(m.record, owner, name)
@@ -1494,7 +1634,13 @@ class FakeModelEndpointService(ModelEndpointService):
         elif order_by == ModelEndpointOrderBy.OLDEST:
             model_endpoints.sort(key=lambda x: x.record.created_at, reverse=False)
 
-        return model_endpoints
+        return _paginate(
+            model_endpoints,
+            lambda x: (x.record.created_at, x.record.id),
+            order_by,
+            limit,
+            page_token,
+        )
 
     async def delete_model_endpoint(self, model_endpoint_id: str) -> None:
         if model_endpoint_id not in self.db:
@@ -1538,6 +1684,8 @@ class FakeLLMModelEndpointService(LLMModelEndpointService):
         owner: Optional[str],
         name: Optional[str],
         order_by: Optional[ModelEndpointOrderBy],
+        limit: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> List[ModelEndpoint]:
         def filter_fn(m: ModelEndpoint) -> bool:
             return self._filter_by_name_owner(m.record, owner, name)
@@ -1548,7 +1696,13 @@ class FakeLLMModelEndpointService(LLMModelEndpointService):
         elif order_by == ModelEndpointOrderBy.OLDEST:
             model_endpoints.sort(key=lambda x: x.record.created_at, reverse=False)
 
-        return model_endpoints
+        return _paginate(
+            model_endpoints,
+            lambda x: (x.record.created_at, x.record.id),
+            order_by,
+            limit,
+            page_token,
+        )
 
     async def get_llm_model_endpoint(self, endpoint_name: str) -> List[ModelEndpoint]:
         def filter_fn(m: ModelEndpoint) -> bool:
@@ -1597,6 +1751,12 @@ def fake_model_endpoint_cache_repository() -> FakeModelEndpointCacheRepository:
     return repo
 
 
+@pytest.fixture
+def fake_image_build_repository() -> FakeImageBuildRepository:
+    repo = FakeImageBuildRepository()
+    return repo
+
+
 @pytest.fixture
 def fake_feature_flag_repository() -> FakeFeatureFlagRepository:
     repo = FakeFeatureFlagRepository()
@@ -1651,6 +1811,12 @@ def fake_task_queue_gateway() -> FakeTaskQueueGateway:
     return gateway
 
 
+@pytest.fixture
+def fake_task_completion_gateway() -> FakeTaskCompletionGateway:
+    gateway = FakeTaskCompletionGateway()
+    return gateway
+
+
 @pytest.fixture
 def fake_resource_gateway() -> FakeEndpointResourceGateway:
     gateway = FakeEndpointResourceGateway()
@@ -0,0 +1,46 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from llm_engine_server.core.docker import remote_build
+
+MODULE_PATH = "llm_engine_server.core.docker.remote_build"
+
+
+@pytest.fixture
+def context_dir(tmp_path):
+    (tmp_path / "project").mkdir()
+    (tmp_path / "project" / "a.py").write_text("a = 1\n")
+    (tmp_path / "project" / "b.py").write_text("b = 2\n")
+    return tmp_path
+
+
+def _get_content_hash(context_dir) -> str:
+    tar_command = remote_build._build_tar_cmd(str(context_dir), None, ["project"])
+    with open(os.devnull, "wb") as archive:
+        return remote_build._write_archive(tar_command, archive)
+
+
+def test_context_archive_only_depends_on_file_contents(context_dir):
+    content_hash = _get_content_hash(context_dir)
+    os.utime(context_dir / "project" / "a.py", (0, 0))
+    assert _get_content_hash(context_dir) == content_hash
+
+    (context_dir / "project" / "a.py").write_text("a = 3\n")
+    assert _get_content_hash(context_dir) != content_hash
+
+
+def test_upload_context_skips_existing_archives(context_dir):
+    storage_client = MagicMock()
+    storage_client.s3_fileobj_exists.return_value = False
+    with patch(f"{MODULE_PATH}.storage_client", storage_client):
+        s3_file_name = remote_build.upload_context(str(context_dir), ["project"])
+        assert s3_file_name.startswith(f"{remote_build.SUB_BUCKET}/")
+        assert s3_file_name.endswith(".tar.gz")
+        storage_client.open.assert_called_once_with(
+            f"s3://{remote_build.S3_BUCKET}/{s3_file_name}", "wb"
+        )
+
+        storage_client.s3_fileobj_exists.return_value = True
+        assert remote_build.upload_context(str(context_dir), ["project"]) == s3_file_name
+        assert storage_client.open.call_count == 1
@@ -0,0 +1,156 @@
+import contextvars
+from unittest.mock import Mock, patch
+
+import pytest
+from llm_engine_server.common.config import hmi_config
+from llm_engine_server.db import base
+from llm_engine_server.db.base import (
+    EngineConfig,
+    get_engine,
+    get_engine_config,
+    set_engine_monitoring_metrics_gateway,
+)
+from llm_engine_server.infra.gateways.fake_monitoring_metrics_gateway import (
+    FakeMonitoringMetricsGateway,
+)
+from sqlalchemy import text
+
+
+@pytest.fixture
+def fake_monitoring_metrics_gateway() -> FakeMonitoringMetricsGateway:
+    gateway = FakeMonitoringMetricsGateway()
+    with patch.object(base, "_monitoring_metrics_gateway", None):
+        set_engine_monitoring_metrics_gateway(gateway)
+        yield gateway
+
+
+def test_get_engine_config_defaults():
+    with patch.object(hmi_config, "db_engine_configs", {}):
+        assert get_engine_config("async") == EngineConfig()
+        assert get_engine_config("async_read_only") == EngineConfig(max_overflow=5)
+
+
+def test_get_engine_config_role_overrides_default(monkeypatch):
+    monkeypatch.setenv("LLM_ENGINE_PROCESS_ROLE", "gateway")
+    engine_configs = {
+        "default": {"async": {"pool_size": 10, "pool_recycle": 300}},
+        "gateway": {"async": {"pool_size": 20}},
+        "builder": {"async": {"pool_size": 1}},
+    }
+    with patch.object(hmi_config, "db_engine_configs", engine_configs):
+        assert get_engine_config("async") == EngineConfig(pool_size=20, pool_recycle=300)
+        assert get_engine_config("sync") == EngineConfig()
+
+
+def test_get_engine_config_invalid():
+    engine_configs = {"default": {"async": {"pool_sizes": 10}}}
+    with patch.object(hmi_config, "db_engine_configs", engine_configs):
+        with pytest.raises(ValueError):
+            get_engine_config("async")
+
+
+def test_engine_emits_pool_and_slow_query_metrics(
+    fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
+):
+    engine_configs = {"default": {"sync": {"pool_size": 1, "slow_query_threshold_seconds": 0}}}
+    with patch.object(hmi_config, "db_engine_configs", engine_configs):
+        engine = base._create_engine("sync", read_only=False)
+    try:
+        assert engine.pool.size() == 1
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert fake_monitoring_metrics_gateway.database_pool_checkout == 1
+        assert fake_monitoring_metrics_gateway.database_slow_query >= 1
+        # New connections aren't pinged, but pooled ones are.
+        assert fake_monitoring_metrics_gateway.database_pool_pre_ping == 0
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert fake_monitoring_metrics_gateway.database_pool_checkout == 2
+        assert fake_monitoring_metrics_gateway.database_pool_pre_ping == 1
+
+        # Pools are recreated on dispose, and stay instrumented.
+        engine.dispose()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert fake_monitoring_metrics_gateway.database_pool_checkout == 3
+    finally:
+        engine.dispose()
+
+
+def test_session_factory_is_created_on_first_use():
+    session_factory = Mock(return_value="session")
+    create_session_factory = Mock(return_value=session_factory)
+    lazy_session_factory = base._LazySessionFactory(create_session_factory)
+    create_session_factory.assert_not_called()
+
+    assert lazy_session_factory(bind="connection") == "session"
+    assert lazy_session_factory() == "session"
+    create_session_factory.assert_called_once()
+    session_factory.assert_called_with()
+
+
+def test_engines_are_created_once():
+    assert get_engine("sync") is get_engine("sync")
+    assert base.ml_infra_pg_engine is get_engine("sync")
+    with pytest.raises(AttributeError):
+        base.ml_infra_pg_engine_nonexistent
+
+
+@pytest.fixture
+def read_replicas(monkeypatch):
+    # Two "replicas" that are the primary itself, which is never behind.
+    url = base.get_engine_url(read_only=False)
+    monkeypatch.setenv(base.READ_REPLICA_URLS_ENV_VAR, f"{url},{url}")
+    with patch.object(base, "_read_replica_set", None), patch.dict(base._engines):
+        read_replica_set = base._get_read_replica_set()
+        assert read_replica_set is not None
+        read_replica_set.check_health()
+        yield
+        if base._read_replica_set is not None:
+            base._read_replica_set.stop()
+        for key, engine in base._engines.items():
+            if "replica" in key:
+                getattr(engine, "sync_engine", engine).dispose()
+
+
+def test_read_only_sessions_use_the_primary_without_replicas():
+    assert base._get_read_only_engine("sync_read_only", "sync") is get_engine("sync_read_only")
+
+
+def test_read_only_sessions_round_robin_over_replicas(read_replicas):
+    engines = [base._get_read_only_engine("sync_read_only", "sync") for _ in range(4)]
+    assert engines[0] is engines[2]
+    assert engines[1] is engines[3]
+    assert engines[0] is not engines[1]
+    assert engines[0] is not get_engine("sync_read_only")
+
+    session = base.SessionReadOnly()
+    try:
+        assert session.execute(text("SELECT 1")).scalar() == 1
+        assert session.get_bind() in engines
+    finally:
+        session.close()
+
+
+def test_read_only_sessions_fall_back_to_the_primary(read_replicas):
+    read_replica_set = base._get_read_replica_set()
+    assert read_replica_set is not None
+    read_replica_set.check_health()
+    assert base._get_read_replica_lag_seconds(0) == 0.0
+    assert read_replica_set.pick() is not None
+
+    read_replica_set.mark_unhealthy(0)
+    read_replica_set.mark_unhealthy(1)
+    assert base._get_read_only_engine("sync_read_only", "sync") is get_engine("sync")
+
+
+def test_read_only_sessions_stick_to_the_primary_after_a_write(read_replicas):
+    def read_after_write():
+        base.stick_reads_to_primary()
+        return base._get_read_only_engine("async_read_only", "async")
+
+    assert contextvars.copy_context().run(read_after_write) is base.get_async_engine("async")
+    # Other contexts, e.g. other requests, still read from the replicas.
+    assert base._get_read_only_engine("async_read_only", "async") is not base.get_async_engine(
+        "async"
+    )
@@ -1,8 +1,15 @@
 # Since the bulk of the file involves actually connecting to postgres, we're only gonna test that the
 # `get_lock_key` function doesn't error and returns nonnegative ints from 0 to 2**64-1
 
+import threading
+from unittest.mock import patch
+
+import pytest
+from llm_engine_server.db import endpoint_row_lock
 from llm_engine_server.db.base import Session
 from llm_engine_server.db.endpoint_row_lock import AdvisoryLockContextManager, get_lock_key
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
 
 
 def test_get_lock_key():
@@ -20,3 +27,63 @@ def test_get_lock_key():
 def test_lock_context_manager(dbsession: Session):
     with AdvisoryLockContextManager(session=dbsession, lock_id=10) as lock:
         assert lock.lock_acquired()
+
+
+@pytest.fixture
+def other_dbsession(engine: Engine) -> Session:
+    """A session on another connection, which contends for the locks of `dbsession`."""
+    connection = engine.connect()
+    session = Session(bind=connection)
+    yield session
+    session.close()
+    connection.close()
+
+
+def test_lock_context_manager_non_blocking_contended(dbsession: Session, other_dbsession: Session):
+    with AdvisoryLockContextManager(session=dbsession, lock_id=11):
+        with AdvisoryLockContextManager(session=other_dbsession, lock_id=11) as lock:
+            assert not lock.lock_acquired()
+            assert lock.contended
+
+
+def test_lock_context_manager_blocking_times_out(dbsession: Session, other_dbsession: Session):
+    with patch.object(endpoint_row_lock, "BLOCKING_LOCK_TIMEOUT_SECONDS", 0.2):
+        with AdvisoryLockContextManager(session=dbsession, lock_id=12):
+            with AdvisoryLockContextManager(
+                session=other_dbsession, lock_id=12, blocking=True
+            ) as lock:
+                assert not lock.lock_acquired()
+                assert lock.contended
+                assert lock.wait_seconds >= 0.2
+
+
+def test_lock_context_manager_blocking_waits_for_release(
+    dbsession: Session, other_dbsession: Session
+):
+    holder = AdvisoryLockContextManager(session=dbsession, lock_id=13).__enter__()
+    timer = threading.Timer(0.2, holder.__exit__, args=(None, None, None))
+    timer.start()
+    try:
+        with AdvisoryLockContextManager(session=other_dbsession, lock_id=13, blocking=True) as lock:
+            assert lock.lock_acquired()
+            assert lock.contended
+    finally:
+        timer.join()
+
+
+def test_lock_context_manager_blocking_falls_back_to_polling(
+    dbsession: Session, other_dbsession: Session
+):
+    other_dbsession.execute(text("SET statement_timeout = 50"))
+    holder = AdvisoryLockContextManager(session=dbsession, lock_id=14).__enter__()
+    timer = threading.Timer(0.3, holder.__exit__, args=(None, None, None))
+    timer.start()
+    try:
+        with patch.object(endpoint_row_lock, "FALLBACK_POLL_MIN_DELAY_SECONDS", 0.05):
+            with AdvisoryLockContextManager(
+                session=other_dbsession, lock_id=14, blocking=True
+            ) as lock:
+                assert lock.lock_acquired()
+                assert lock.wait_seconds >= 0.3
+    finally:
+        timer.join()
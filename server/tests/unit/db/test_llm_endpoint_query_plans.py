@@ -0,0 +1,63 @@
+from typing import Any, List
+
+import pytest
+from llm_engine_server.db.base import Session
+from llm_engine_server.db.models import Endpoint
+from llm_engine_server.infra.repositories.db_model_endpoint_record_repository import (
+    get_llm_model_endpoint_filters,
+)
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+
+@pytest.fixture
+def llm_endpoints(dbsession: Session) -> None:
+    """
+    Fills the endpoints table with enough rows, half of them LLMs and a few of them public, for
+    the planner's choices to be the ones it would make on a real table.
+    """
+    dbsession.execute(
+        text(
+            """
+            INSERT INTO llm_engine.endpoints
+                (id, name, created_by, owner, endpoint_metadata, public_inference)
+            SELECT
+                'end_test_' || i,
+                'test_llm_' || i,
+                'test_user_' || (i % 100),
+                'test_user_' || (i % 100),
+                CASE WHEN i % 2 = 0 THEN '{"_llm": {}}'::jsonb ELSE '{}'::jsonb END,
+                i % 100 = 0
+            FROM generate_series(1, 2000) AS i
+            """
+        )
+    )
+    dbsession.execute(text("ANALYZE llm_engine.endpoints"))
+
+
+def _explain(dbsession: Session, filters: List[Any]) -> str:
+    query = select(Endpoint).where(*filters)
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    rows = dbsession.execute(text(f"EXPLAIN {compiled}")).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def test_llm_endpoint_routing_uses_index(dbsession: Session, llm_endpoints: None):
+    plan = _explain(
+        dbsession, get_llm_model_endpoint_filters(owner="test_user_2", name="test_llm_2")
+    )
+    assert "Seq Scan" not in plan
+    assert "endpoint_name_llm_uc" in plan
+
+
+def test_llm_endpoint_listing_uses_index(dbsession: Session, llm_endpoints: None):
+    plan = _explain(dbsession, get_llm_model_endpoint_filters(owner="test_user_2", name=None))
+    assert "Seq Scan" not in plan
+    assert "endpoint_llm_owner_created_at_idx" in plan
+    assert "endpoint_llm_public_created_at_idx" in plan
+
+
+def test_public_llm_endpoint_listing_uses_index(dbsession: Session, llm_endpoints: None):
+    plan = _explain(dbsession, get_llm_model_endpoint_filters(owner=None, name=None))
+    assert "Seq Scan" not in plan
+    assert "endpoint_llm_public_created_at_idx" in plan
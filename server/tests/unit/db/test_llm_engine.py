@@ -2,8 +2,10 @@ from datetime import datetime
 from typing import List
 
 import pytest
+from llm_engine_server.common.pagination import encode_page_token
 from llm_engine_server.db.base import SessionAsync
 from llm_engine_server.db.models import BatchJob, Bundle, DockerImageBatchJobBundle, Endpoint
+from llm_engine_server.infra.repositories.db_repository_mixin import get_keyset_page_clauses
 
 
 @pytest.mark.asyncio
@@ -76,6 +78,51 @@ async def test_endpoint_select(
     assert len(endpoints_by_bundle_owner) == 2
 
 
+@pytest.mark.asyncio
+async def test_endpoint_select_keyset_pages(
+    dbsession_async: SessionAsync, bundles: List[Bundle], endpoints: List[Endpoint]
+):
+    for newest_first in [True, False]:
+        page_token = None
+        pages = []
+        while True:
+            filters, order_by = get_keyset_page_clauses(
+                created_at=Endpoint.created_at,
+                id=Endpoint.id,
+                newest_first=newest_first,
+                page_token=page_token,
+            )
+            page = await Endpoint._select_all_by_filters(
+                dbsession_async,
+                filters=[Endpoint.owner == "test_user_1", *filters],
+                limit=2,
+                order_by=order_by,
+            )
+            if not page:
+                break
+            pages.append(page)
+            page_token = encode_page_token(page[-1].created_at, page[-1].id)
+
+        assert [len(page) for page in pages] == [2, 1]
+        keys = [(e.created_at, e.id) for page in pages for e in page]
+        assert keys == sorted(keys, reverse=newest_first)
+
+
+@pytest.mark.asyncio
+async def test_bundle_select_ordered_by_owner(dbsession_async: SessionAsync, bundles: List[Bundle]):
+    _, order_by = get_keyset_page_clauses(
+        created_at=Bundle.created_at, id=Bundle.id, newest_first=True, page_token=None
+    )
+    bundles_by_owner = await Bundle.select_all_by_filters_owner(
+        dbsession_async, filters=[], owner="test_user_1", order_by=order_by, limit=1
+    )
+    assert len(bundles_by_owner) == 1
+    newest = max(
+        (b for b in bundles if b.owner == "test_user_1"), key=lambda b: (b.created_at, b.id)
+    )
+    assert bundles_by_owner[0].id == newest.id
+
+
 @pytest.mark.asyncio
 async def test_endpoint_select_delete(
     dbsession_async: SessionAsync, bundles: List[Bundle], endpoints: List[Endpoint]
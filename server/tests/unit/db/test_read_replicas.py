@@ -0,0 +1,73 @@
+import threading
+import time
+from unittest.mock import Mock
+
+from llm_engine_server.db.read_replicas import ReadReplicaSet
+
+
+def test_pick_round_robins_over_replicas():
+    read_replica_set = ReadReplicaSet(num_replicas=3, get_lag_seconds=Mock(return_value=0.0))
+    read_replica_set.stop()
+    read_replica_set.check_health()
+    assert [read_replica_set.pick() for _ in range(6)] == [0, 1, 2, 0, 1, 2]
+
+
+def test_pick_skips_unhealthy_replicas():
+    read_replica_set = ReadReplicaSet(num_replicas=3, get_lag_seconds=Mock(return_value=0.0))
+    read_replica_set.stop()
+    read_replica_set.check_health()
+    read_replica_set.mark_unhealthy(1)
+    assert [read_replica_set.pick() for _ in range(4)] == [0, 2, 0, 2]
+
+    read_replica_set.mark_unhealthy(0)
+    read_replica_set.mark_unhealthy(2)
+    assert read_replica_set.pick() is None
+
+
+def test_check_health():
+    lags = {0: 0.0, 1: 60.0}
+
+    def get_lag_seconds(index: int) -> float:
+        if index == 2:
+            raise ConnectionError
+        return lags[index]
+
+    read_replica_set = ReadReplicaSet(
+        num_replicas=3, get_lag_seconds=get_lag_seconds, max_lag_seconds=10.0
+    )
+    read_replica_set.stop()
+    read_replica_set.check_health()
+    assert [read_replica_set.pick() for _ in range(3)] == [0, 0, 0]
+
+    # Replicas that catch up serve reads again.
+    lags[1] = 1.0
+    read_replica_set.check_health()
+    assert {read_replica_set.pick() for _ in range(3)} == {0, 1}
+
+
+def test_replicas_serve_reads_after_their_first_check():
+    check_started = threading.Event()
+    check_released = threading.Event()
+
+    def get_lag_seconds(index: int) -> float:
+        check_started.set()
+        check_released.wait(5)
+        return 0.0
+
+    read_replica_set = ReadReplicaSet(
+        num_replicas=2, get_lag_seconds=get_lag_seconds, health_check_interval_seconds=60.0
+    )
+    try:
+        assert read_replica_set.pick() is None
+        # The first check starts with the first pick, without waiting for the interval.
+        assert check_started.wait(5)
+        assert read_replica_set.pick() is None
+
+        check_released.set()
+        for _ in range(500):
+            if read_replica_set.pick() is not None:
+                break
+            time.sleep(0.01)
+        assert {read_replica_set.pick() for _ in range(2)} == {0, 1}
+    finally:
+        read_replica_set.stop()
@@ -4,6 +4,7 @@ from llm_engine_server.common.dtos.batch_jobs import (
     CreateDockerImageBatchJobResourceRequests,
 )
 from llm_engine_server.common.dtos.llms import (
+    CompletionBatchStreamV1Request,
     CompletionStreamV1Request,
     CompletionSyncV1Request,
     CreateLLMModelEndpointV1Request,
@@ -346,3 +347,12 @@ def completion_stream_request() -> CompletionStreamV1Request:
         max_new_tokens=10,
         temperature=0.5,
     )
+
+
+@pytest.fixture
+def completion_batch_stream_request() -> CompletionBatchStreamV1Request:
+    return CompletionBatchStreamV1Request(
+        prompts=["test_prompt_1", "test_prompt_2"],
+        max_new_tokens=10,
+        temperature=0.5,
+    )
@@ -1,7 +1,11 @@
 from typing import Any, Dict, Tuple
 
 import pytest
-from llm_engine_server.common.dtos.tasks import EndpointPredictV1Request, TaskStatus
+from llm_engine_server.common.dtos.tasks import (
+    EndpointPredictV1Request,
+    GetAsyncTasksStatusV1Request,
+    TaskStatus,
+)
 from llm_engine_server.core.auth.authentication_repository import User
 from llm_engine_server.core.domain_exceptions import (
     ObjectNotAuthorizedException,
@@ -10,7 +14,10 @@ from llm_engine_server.core.domain_exceptions import (
 from llm_engine_server.domain.entities import ModelEndpoint
 from llm_engine_server.domain.use_cases.async_inference_use_cases import (
     CreateAsyncInferenceTaskV1UseCase,
+    GetAsyncInferenceTasksStatusV1UseCase,
     GetAsyncInferenceTaskV1UseCase,
+    StreamAsyncInferenceTaskV1UseCase,
+    WaitForAsyncInferenceTaskV1UseCase,
 )
 
 
@@ -95,3 +102,57 @@ def test_get_async_inference_task_use_case_success(
     user = User(user_id=user_id, team_id=user_id, is_privileged_user=True)
     response = use_case.execute(user=user, task_id="test_task_id")
     assert response.status == TaskStatus.SUCCESS
+
+
+def test_get_async_inference_tasks_status_use_case_success(
+    fake_model_endpoint_service,
+    model_endpoint_1: ModelEndpoint,
+):
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_1)
+    use_case = GetAsyncInferenceTasksStatusV1UseCase(
+        model_endpoint_service=fake_model_endpoint_service
+    )
+    user_id = model_endpoint_1.record.created_by
+    user = User(user_id=user_id, team_id=user_id, is_privileged_user=True)
+
+    response = use_case.execute(
+        user=user, request=GetAsyncTasksStatusV1Request(task_ids=["task_1", "task_2"])
+    )
+    assert [task.task_id for task in response.tasks] == ["task_1", "task_2"]
+    assert all(task.status == TaskStatus.SUCCESS for task in response.tasks)
+    assert all(task.result is None for task in response.tasks)
+
+    response = use_case.execute(
+        user=user,
+        request=GetAsyncTasksStatusV1Request(task_ids=["task_1"], include_results=True),
+    )
+    assert response.tasks[0].result is not None
+
+
+@pytest.mark.asyncio
+async def test_wait_for_async_inference_task_use_case_success(
+    fake_model_endpoint_service,
+    model_endpoint_1: ModelEndpoint,
+):
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_1)
+    use_case = WaitForAsyncInferenceTaskV1UseCase(
+        model_endpoint_service=fake_model_endpoint_service
+    )
+    user_id = model_endpoint_1.record.created_by
+    user = User(user_id=user_id, team_id=user_id, is_privileged_user=True)
+    response = await use_case.execute(user=user, task_id="test_task_id", wait_seconds=10)
+    assert response.status == TaskStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_stream_async_inference_task_use_case_success(
+    fake_model_endpoint_service,
+    model_endpoint_1: ModelEndpoint,
+):
+    fake_model_endpoint_service.add_model_endpoint(model_endpoint_1)
+    use_case = StreamAsyncInferenceTaskV1UseCase(model_endpoint_service=fake_model_endpoint_service)
+    user_id = model_endpoint_1.record.created_by
+    user = User(user_id=user_id, team_id=user_id, is_privileged_user=True)
+    responses = [response async for response in use_case.execute(user=user, task_id="test_task_id")]
+    assert len(responses) == 1
+    assert responses[0].status == TaskStatus.SUCCESS
@@ -2,6 +2,7 @@ from typing import Any, Tuple
 
 import pytest
 from llm_engine_server.common.dtos.llms import (
+    CompletionBatchStreamV1Request,
     CompletionOutput,
     CompletionStreamV1Request,
     CompletionSyncV1Request,
@@ -18,6 +19,7 @@ from llm_engine_server.core.domain_exceptions import (
 from llm_engine_server.domain.entities import ModelEndpoint, ModelEndpointType
 from llm_engine_server.domain.exceptions import EndpointUnsupportedInferenceTypeException
 from llm_engine_server.domain.use_cases.llm_model_endpoint_use_cases import (
+    CompletionBatchStreamV1UseCase,
     CompletionStreamV1UseCase,
     CompletionSyncV1UseCase,
     CreateLLMModelEndpointV1UseCase,
@@ -585,3 +587,72 @@ async def test_completion_stream_text_generation_inference_use_case_success(
         if i == 5:
             assert message.dict()["output"]["num_completion_tokens"] == 6
         i += 1
+
+
+@pytest.mark.asyncio
+async def test_completion_batch_stream_use_case_success(
+    test_api_key: str,
+    fake_model_endpoint_service,
+    fake_llm_model_endpoint_service,
+    llm_model_endpoint_text_generation_inference: ModelEndpoint,
+    completion_batch_stream_request: CompletionBatchStreamV1Request,
+):
+    fake_llm_model_endpoint_service.add_model_endpoint(llm_model_endpoint_text_generation_inference)
+    fake_model_endpoint_service.streaming_model_endpoint_inference_gateway.responses = [
+        SyncEndpointPredictV1Response(
+            status=TaskStatus.SUCCESS,
+            result={"result": {"token": {"text": "I"}}},
+            traceback=None,
+        ),
+        SyncEndpointPredictV1Response(
+            status=TaskStatus.SUCCESS,
+            result={"result": {"token": {"text": " am"}}},
+            traceback=None,
+        ),
+        SyncEndpointPredictV1Response(
+            status=TaskStatus.SUCCESS,
+            result={"result": {"token": {"text": "."}, "generated_text": "I am."}},
+            traceback=None,
+        ),
+    ]
+    use_case = CompletionBatchStreamV1UseCase(
+        completion_stream_use_case=CompletionStreamV1UseCase(
+            model_endpoint_service=fake_model_endpoint_service,
+            llm_model_endpoint_service=fake_llm_model_endpoint_service,
+        ),
+    )
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+    response_1 = await use_case.execute(
+        user=user,
+        model_endpoint_name=llm_model_endpoint_text_generation_inference.record.name,
+        request=completion_batch_stream_request,
+    )
+    output_texts = {0: [], 1: []}
+    async for message in response_1:
+        assert message.dict()["status"] == "SUCCESS"
+        output_texts[message.prompt_index].append(message.dict()["output"]["text"])
+        if message.dict()["output"]["finished"]:
+            assert message.dict()["output"]["num_completion_tokens"] == 3
+    assert output_texts == {0: ["I", " am", "."], 1: ["I", " am", "."]}
+
+
+@pytest.mark.asyncio
+async def test_completion_batch_stream_use_case_raises_not_found(
+    test_api_key: str,
+    fake_model_endpoint_service,
+    fake_llm_model_endpoint_service,
+    completion_batch_stream_request: CompletionBatchStreamV1Request,
+):
+    use_case = CompletionBatchStreamV1UseCase(
+        completion_stream_use_case=CompletionStreamV1UseCase(
+            model_endpoint_service=fake_model_endpoint_service,
+            llm_model_endpoint_service=fake_llm_model_endpoint_service,
+        ),
+    )
+    user = User(user_id=test_api_key, team_id=test_api_key, is_privileged_user=True)
+    with pytest.raises(ObjectNotFoundException):
+        await use_case.execute(
+            user=user,
+            model_endpoint_name="nonexistent_endpoint",
+            request=completion_batch_stream_request,
+        )
@@ -0,0 +1,116 @@
+import os
+import stat
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from llm_engine_server.inference.artifact_cache import NodeArtifactCache
+
+
+def _populate_with(data: bytes):
+    def populate(path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(data)
+
+    return Mock(side_effect=populate)
+
+
+def _get_path(cache: NodeArtifactCache, url: str, version: str, populate) -> str:
+    with cache.get_or_populate(url, version, populate) as path:
+        return path
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_artifact_cache_hit_and_miss(tmp_path):
+    monitoring_metrics_gateway = Mock()
+    cache = NodeArtifactCache(str(tmp_path), 1000, monitoring_metrics_gateway)
+    populate = _populate_with(b"bundle")
+
+    path = _get_path(cache, "s3://bucket/bundle", "etag", populate)
+    assert _read(path) == b"bundle"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o444
+    assert _get_path(cache, "s3://bucket/bundle", "etag", populate) == path
+    assert populate.call_count == 1
+    assert monitoring_metrics_gateway.emit_artifact_cache_miss.call_count == 1
+    assert monitoring_metrics_gateway.emit_artifact_cache_hit.call_count == 1
+
+    # A new version of the artifact is a new entry.
+    new_path = _get_path(cache, "s3://bucket/bundle", "new_etag", _populate_with(b"new"))
+    assert new_path != path
+    assert _read(new_path) == b"new"
+
+
+def test_artifact_cache_populates_each_entry_once(tmp_path):
+    cache = NodeArtifactCache(str(tmp_path), 1000)
+
+    def populate(path: str) -> None:
+        time.sleep(0.1)
+        with open(path, "wb") as f:
+            f.write(b"bundle")
+
+    populate_mock = Mock(side_effect=populate)
+    paths = []
+    threads = [
+        threading.Thread(
+            target=lambda: paths.append(
+                _get_path(cache, "s3://bucket/bundle", "etag", populate_mock)
+            )
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert populate_mock.call_count == 1
+    assert len(set(paths)) == 1
+    assert _read(paths[0]) == b"bundle"
+
+
+def test_artifact_cache_failed_population(tmp_path):
+    cache = NodeArtifactCache(str(tmp_path), 1000)
+    with pytest.raises(ValueError):
+        _get_path(cache, "s3://bucket/bundle", "etag", Mock(side_effect=ValueError))
+    assert os.listdir(tmp_path / "objects") == []
+
+    path = _get_path(cache, "s3://bucket/bundle", "etag", _populate_with(b"bundle"))
+    assert _read(path) == b"bundle"
+
+
+def test_artifact_cache_evicts_least_recently_used(tmp_path):
+    cache = NodeArtifactCache(str(tmp_path), 250)
+    path_a = _get_path(cache, "s3://bucket/a", "etag", _populate_with(b"a" * 100))
+    path_b = _get_path(cache, "s3://bucket/b", "etag", _populate_with(b"b" * 100))
+    os.utime(path_a, (1, 1))
+    os.utime(path_b, (2, 2))
+    # a is used again, so b is the least recently used.
+    _get_path(cache, "s3://bucket/a", "etag", _populate_with(b""))
+
+    path_c = _get_path(cache, "s3://bucket/c", "etag", _populate_with(b"c" * 100))
+    assert os.path.exists(path_a)
+    assert not os.path.exists(path_b)
+    assert os.path.exists(path_c)
+
+    # Entries larger than the budget are kept until the next entry is added.
+    path_d = _get_path(cache, "s3://bucket/d", "etag", _populate_with(b"d" * 300))
+    assert os.listdir(tmp_path / "objects") == [os.path.basename(path_d)]
+
+
+def test_artifact_cache_keeps_entries_in_use(tmp_path):
+    cache = NodeArtifactCache(str(tmp_path), 150)
+    with cache.get_or_populate("s3://bucket/a", "etag", _populate_with(b"a" * 100)) as path_a:
+        os.utime(path_a, (1, 1))
+        path_b = _get_path(cache, "s3://bucket/b", "etag", _populate_with(b"b" * 100))
+        # a is the least recently used, but is still being read.
+        assert _read(path_a) == b"a" * 100
+        assert os.path.exists(path_b)
+
+    cache.evict()
+    assert not os.path.exists(path_a)
+    assert os.path.exists(path_b)
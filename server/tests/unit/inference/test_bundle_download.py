@@ -0,0 +1,231 @@
+import hashlib
+import io
+import os
+import random
+import time
+import zipfile
+from typing import Dict, List
+
+import pytest
+from botocore.exceptions import ClientError, ResponseStreamingError
+from llm_engine_server.inference import bundle_download
+from llm_engine_server.inference.bundle_download import (
+    BundleChecksumError,
+    download_and_unzip_bundle,
+)
+
+BUNDLE_URL = "s3://bucket/bundle.zip"
+
+
+class _FailingBody:
+    def __init__(self, data: bytes, fail_after: int):
+        self._body = io.BytesIO(data)
+        self._fail_after = fail_after
+
+    def read(self, size: int) -> bytes:
+        if self._body.tell() >= self._fail_after:
+            raise ResponseStreamingError(error="Connection reset")
+        return self._body.read(min(size, self._fail_after - self._body.tell()))
+
+
+class FakeS3Client:
+    """Serves one object from memory, like s3 would with ranged GETs."""
+
+    def __init__(self, data: bytes, etag: str):
+        self.data = data
+        self.etag = etag
+        self.ranges: List[str] = []
+        self.encryption: Dict[str, str] = {}
+        self.fail_after: Dict[str, int] = {}
+        self.on_get_object = lambda: None
+
+    def head_object(self, Bucket: str, Key: str):
+        return {"ContentLength": len(self.data), "ETag": self.etag, **self.encryption}
+
+    def get_object(self, Bucket: str, Key: str, Range: str, IfMatch: str):
+        self.on_get_object()
+        self.ranges.append(Range)
+        if IfMatch != self.etag:
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "GetObject")
+        start, end = (int(value) for value in Range[len("bytes=") :].split("-"))
+        data = self.data[start : end + 1]
+        if Range in self.fail_after:
+            return {"Body": _FailingBody(data, self.fail_after.pop(Range))}
+        return {"Body": io.BytesIO(data)}
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff():
+    backoff_seconds = bundle_download.PART_RETRY_BACKOFF_SECONDS
+    bundle_download.PART_RETRY_BACKOFF_SECONDS = 0
+    yield
+    bundle_download.PART_RETRY_BACKOFF_SECONDS = backoff_seconds
+
+
+@pytest.fixture
+def bundle_files() -> Dict[str, bytes]:
+    rng = random.Random(0)
+    return {
+        f"model/file_{i}.bin": bytes(rng.getrandbits(8) for _ in range(rng.randint(100, 3000)))
+        for i in range(20)
+    }
+
+
+def _zip(files: Dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zip_file:
+        for name, data in files.items():
+            zip_file.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _md5_etag(data: bytes) -> str:
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+def _assert_extracted(extract_path, files: Dict[str, bytes]) -> None:
+    for name, data in files.items():
+        with open(os.path.join(extract_path, name), "rb") as f:
+            assert f.read() == data
+
+
+def test_download_and_unzip_bundle_extracts_while_downloading(tmp_path, bundle_files):
+    data = _zip(bundle_files)
+    s3_client = FakeS3Client(data, _md5_etag(data))
+    extract_path = tmp_path / "extracted"
+    num_parts = (len(data) + 4095) // 4096
+    extracted_during_download = []
+
+    def wait_for_extraction() -> None:
+        # Before the last part is requested, the members of the first parts should be extracted.
+        if len(s3_client.ranges) == num_parts - 1:
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline and not (
+                extract_path.exists() and any(extract_path.rglob("*.bin"))
+            ):
+                time.sleep(0.01)
+            extracted_during_download.append(any(extract_path.rglob("*.bin")))
+
+    s3_client.on_get_object = wait_for_extraction
+
+    download_and_unzip_bundle(
+        BUNDLE_URL,
+        str(tmp_path / "bundle.zip"),
+        str(extract_path),
+        s3_client=s3_client,
+        part_size=4096,
+        num_workers=1,
+    )
+
+    _assert_extracted(extract_path, bundle_files)
+    # The last part is downloaded first, for the central directory.
+    assert s3_client.ranges[0] == f"bytes={len(data) // 4096 * 4096}-{len(data) - 1}"
+    assert len(s3_client.ranges) == num_parts
+    assert extracted_during_download == [True]
+
+
+def test_download_and_unzip_bundle_resumes_failed_parts(tmp_path, bundle_files):
+    data = _zip(bundle_files)
+    s3_client = FakeS3Client(data, _md5_etag(data))
+    s3_client.fail_after["bytes=0-4095"] = 1000
+
+    download_and_unzip_bundle(
+        BUNDLE_URL,
+        str(tmp_path / "bundle.zip"),
+        str(tmp_path / "extracted"),
+        s3_client=s3_client,
+        part_size=4096,
+    )
+
+    _assert_extracted(tmp_path / "extracted", bundle_files)
+    assert "bytes=1000-4095" in s3_client.ranges
+
+
+def test_download_and_unzip_bundle_with_large_central_directory(tmp_path, bundle_files):
+    data = _zip(bundle_files)
+    s3_client = FakeS3Client(data, _md5_etag(data))
+
+    # Parts that are smaller than the central directory, which has to be all downloaded first.
+    download_and_unzip_bundle(
+        BUNDLE_URL,
+        str(tmp_path / "bundle.zip"),
+        str(tmp_path / "extracted"),
+        s3_client=s3_client,
+        part_size=256,
+    )
+
+    _assert_extracted(tmp_path / "extracted", bundle_files)
+
+
+def test_download_and_unzip_bundle_checks_md5(tmp_path, bundle_files):
+    data = _zip(bundle_files)
+    s3_client = FakeS3Client(data, _md5_etag(b"other data"))
+
+    with pytest.raises(BundleChecksumError):
+        download_and_unzip_bundle(
+            BUNDLE_URL,
+            str(tmp_path / "bundle.zip"),
+            str(tmp_path / "extracted"),
+            s3_client=s3_client,
+            part_size=4096,
+        )
+
+    # The ETags of multipart uploads aren't checksums.
+    s3_client.etag = '"abc-2"'
+    download_and_unzip_bundle(
+        BUNDLE_URL,
+        str(tmp_path / "bundle.zip"),
+        str(tmp_path / "extracted"),
+        s3_client=s3_client,
+        part_size=4096,
+    )
+    _assert_extracted(tmp_path / "extracted", bundle_files)
+
+
+@pytest.mark.parametrize(
+    "encryption",
+    [
+        {"ServerSideEncryption": "aws:kms"},
+        {"ServerSideEncryption": "aws:kms:dsse"},
+        {"SSECustomerAlgorithm": "AES256"},
+    ],
+)
+def test_download_and_unzip_encrypted_bundle_skips_md5(tmp_path, bundle_files, encryption):
+    data = _zip(bundle_files)
+    # The ETags of objects encrypted with SSE-KMS or SSE-C aren't checksums.
+    s3_client = FakeS3Client(data, _md5_etag(b"other data"))
+    s3_client.encryption = encryption
+
+    download_and_unzip_bundle(
+        BUNDLE_URL,
+        str(tmp_path / "bundle.zip"),
+        str(tmp_path / "extracted"),
+        s3_client=s3_client,
+        part_size=4096,
+    )
+    _assert_extracted(tmp_path / "extracted", bundle_files)
+
+
+def test_download_and_unzip_empty_bundle(tmp_path):
+    s3_client = FakeS3Client(b"", _md5_etag(b""))
+
+    with pytest.raises(zipfile.BadZipFile, match="is empty"):
+        download_and_unzip_bundle(
+            BUNDLE_URL,
+            str(tmp_path / "bundle.zip"),
+            str(tmp_path / "extracted"),
+            s3_client=s3_client,
+        )
+    assert s3_client.ranges == []
+
+
+def test_download_and_unzip_local_bundle(tmp_path, bundle_files):
+    (tmp_path / "bundle.zip").write_bytes(_zip(bundle_files))
+
+    download_and_unzip_bundle(
+        str(tmp_path / "bundle.zip"),
+        str(tmp_path / "local_bundle.zip"),
+        str(tmp_path / "extracted"),
+    )
+
+    _assert_extracted(tmp_path / "extracted", bundle_files)
@@ -0,0 +1,20 @@
+from llm_engine_server.inference.bundle_manifest import (
+    bundle_manifest_matches,
+    read_bundle_manifest,
+    write_bundle_manifest,
+)
+
+
+def test_bundle_manifest(tmp_path):
+    assert read_bundle_manifest(str(tmp_path)) is None
+
+    (tmp_path / "model").mkdir()
+    (tmp_path / "model" / "predict.py").write_text("")
+    write_bundle_manifest(str(tmp_path), "s3://bucket/bundle.zip", ["model/predict.py"])
+    manifest = read_bundle_manifest(str(tmp_path))
+    assert manifest is not None
+    assert bundle_manifest_matches(manifest, str(tmp_path), "s3://bucket/bundle.zip")
+    assert not bundle_manifest_matches(manifest, str(tmp_path), "s3://bucket/other_bundle.zip")
+
+    (tmp_path / "model" / "predict.py").unlink()
+    assert not bundle_manifest_matches(manifest, str(tmp_path), "s3://bucket/bundle.zip")
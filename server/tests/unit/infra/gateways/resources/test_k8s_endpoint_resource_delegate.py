@@ -1,3 +1,6 @@
+import asyncio
+import json
+import os
 from dataclasses import dataclass
 from typing import Any, Dict, List
 from unittest.mock import AsyncMock, Mock, patch
@@ -15,7 +18,12 @@ from llm_engine_server.domain.exceptions import EndpointResourceInfraException
 from llm_engine_server.infra.gateways.resources.k8s_endpoint_resource_delegate import (
     DATADOG_ENV_VAR,
     K8SEndpointResourceDelegate,
+    K8sTemplateRegistry,
+    KubernetesClusterVersionCache,
     add_datadog_env_to_main_container,
+    close_kubernetes_clients,
+    get_kubernetes_apps_client,
+    get_kubernetes_core_client,
     get_main_container_from_deployment_template,
     load_k8s_yaml,
 )
@@ -168,6 +176,30 @@ def test_resource_arguments_type_and_add_datadog_env_to_main_container(
         assert len(datadog_env) == 0
 
 
+def test_k8s_template_registry_reloads_config_map_on_change(tmp_path):
+    config_map_path = tmp_path / "config_map.yaml"
+    config_map_path.write_text("data:\n  service.yaml: 'name: ${NAME}'\n")
+    registry = K8sTemplateRegistry(str(config_map_path))
+    assert registry.get("service.yaml").substitute(NAME="foo") == "name: foo"
+
+    with patch(f"{MODULE_PATH}.yaml.load", side_effect=AssertionError("parsed again")):
+        assert registry.get("service.yaml").substitute(NAME="bar") == "name: bar"
+
+    config_map_path.write_text("data:\n  service.yaml: 'new-name: ${NAME}'\n")
+    os.utime(config_map_path, ns=(0, config_map_path.stat().st_mtime_ns + 1))
+    assert registry.get("service.yaml").substitute(NAME="foo") == "new-name: foo"
+
+
+def test_k8s_template_registry_reads_template_folder(tmp_path):
+    (tmp_path / "service.yaml").write_text("name: ${NAME}")
+    (tmp_path / "user-config.yaml").write_text("config: ${CONFIG}")
+    registry = K8sTemplateRegistry("unused", template_folder=str(tmp_path))
+    assert registry.get("service.yaml").substitute(NAME="foo") == "name: foo"
+    assert registry.get("user-config.yaml").substitute(CONFIG="bar") == "config: bar"
+    with pytest.raises(FileNotFoundError):
+        registry.get("missing.yaml")
+
+
 def _verify_deployment_labels(
     body: Dict[str, Any],
     create_resources_request: CreateOrUpdateResourcesRequest,
@@ -263,6 +295,12 @@ def _verify_non_deployment_labels(
     assert body["metadata"]["labels"] == expected_labels
 
 
+def _get_applied_body(call) -> Dict[str, Any]:
+    assert call.kwargs["_content_type"] == "application/apply-patch+yaml"
+    assert call.kwargs["force"]
+    return json.loads(call.kwargs["body"])
+
+
 def _verify_custom_object_plurals(call_args_list, expected_plurals: List[str]) -> None:
     for plural in expected_plurals:
         for call in call_args_list:
@@ -270,10 +308,53 @@ def _verify_custom_object_plurals(call_args_list, expected_plurals: List[str]) -
                 break
         else:
             pytest.fail(
-                f"Expecting to find plural {plural} in calls to create_namespaced_custom_object"
+                f"Expecting to find plural {plural} in calls to patch_namespaced_custom_object"
             )
 
 
+def test_kubernetes_clients_are_cached_per_event_loop():
+    async def get_clients():
+        apps_client = get_kubernetes_apps_client()
+        core_client = get_kubernetes_core_client()
+        assert get_kubernetes_apps_client() is apps_client
+        # The clients of an event loop share a connection pool.
+        assert core_client.api_client is apps_client.api_client
+
+        await close_kubernetes_clients()
+        assert apps_client.api_client.rest_client.pool_manager.closed
+        # Clients are created again after they're closed.
+        assert get_kubernetes_apps_client() is not apps_client
+        await close_kubernetes_clients()
+        return apps_client
+
+    assert asyncio.run(get_clients()) is not asyncio.run(get_clients())
+
+
+@pytest.mark.asyncio
+async def test_kubernetes_cluster_version_cache():
+    cache = KubernetesClusterVersionCache(refresh_interval_seconds=0.01)
+    try:
+        with patch(
+            f"{MODULE_PATH}._fetch_cluster_version_async", AsyncMock(return_value="1.25")
+        ) as mock_fetch_async, patch(
+            f"{MODULE_PATH}._fetch_cluster_version", Mock(return_value="1.26")
+        ) as mock_fetch:
+            assert await cache.load_async() == "1.25"
+            assert await cache.load_async() == "1.25"
+            assert mock_fetch_async.await_count == 1
+
+            # The version is refreshed in the background.
+            for _ in range(100):
+                if await cache.load_async() == "1.26":
+                    break
+                await asyncio.sleep(0.01)
+            assert await cache.load_async() == "1.26"
+            assert mock_fetch_async.await_count == 1
+            assert mock_fetch.call_count >= 1
+    finally:
+        cache.stop()
+
+
 @pytest.mark.asyncio
 async def test_create_async_endpoint_has_correct_labels(
     k8s_endpoint_resource_delegate,
@@ -298,17 +379,17 @@ async def test_create_async_endpoint_has_correct_labels(
         _verify_deployment_labels(deployment_body, request)
 
         # Make sure that a Service is *not* created for async endpoints.
-        create_service_call_args = mock_core_client.create_namespaced_service.call_args
+        create_service_call_args = mock_core_client.patch_namespaced_service.call_args
         assert create_service_call_args is None
 
         # Verify config_map labels
-        create_config_map_call_args = mock_core_client.create_namespaced_config_map.call_args
-        config_map_body = create_config_map_call_args.kwargs["body"]
+        create_config_map_call_args = mock_core_client.patch_namespaced_config_map.call_args
+        config_map_body = _get_applied_body(create_config_map_call_args)
         _verify_non_deployment_labels(config_map_body, request)
 
         # Make sure that an HPA is *not* created for async endpoints.
         create_hpa_call_args = (
-            mock_autoscaling_client.create_namespaced_horizontal_pod_autoscaler.call_args
+            mock_autoscaling_client.patch_namespaced_horizontal_pod_autoscaler.call_args
         )
         assert create_hpa_call_args is None
 
@@ -316,7 +397,7 @@ async def test_create_async_endpoint_has_correct_labels(
         build_endpoint_request = request.build_endpoint_request
         optimize_costs = build_endpoint_request.optimize_costs
         create_custom_object_call_args_list = (
-            mock_custom_objects_client.create_namespaced_custom_object.call_args_list
+            mock_custom_objects_client.patch_namespaced_custom_object.call_args_list
         )
         delete_custom_object_call_args_list = (
             mock_custom_objects_client.delete_namespaced_custom_object.call_args_list
@@ -360,27 +441,27 @@ async def test_create_streaming_endpoint_has_correct_labels(
     _verify_deployment_labels(deployment_body, request)
 
     # Verify service labels
-    create_service_call_args = mock_core_client.create_namespaced_service.call_args
-    service_body = create_service_call_args.kwargs["body"]
+    create_service_call_args = mock_core_client.patch_namespaced_service.call_args
+    service_body = _get_applied_body(create_service_call_args)
     _verify_non_deployment_labels(service_body, request)
 
     # Verify config_map labels
-    create_config_map_call_args = mock_core_client.create_namespaced_config_map.call_args
-    config_map_body = create_config_map_call_args.kwargs["body"]
+    create_config_map_call_args = mock_core_client.patch_namespaced_config_map.call_args
+    config_map_body = _get_applied_body(create_config_map_call_args)
     _verify_non_deployment_labels(config_map_body, request)
 
     # Verify HPA labels
     create_hpa_call_args = (
-        mock_autoscaling_client.create_namespaced_horizontal_pod_autoscaler.call_args
+        mock_autoscaling_client.patch_namespaced_horizontal_pod_autoscaler.call_args
     )
-    hpa_body = create_hpa_call_args.kwargs["body"]
+    hpa_body = _get_applied_body(create_hpa_call_args)
     _verify_non_deployment_labels(hpa_body, request)
 
     # Make sure that an VPA is created if optimize_costs is True.
     build_endpoint_request = request.build_endpoint_request
     optimize_costs = build_endpoint_request.optimize_costs
     create_custom_object_call_args_list = (
-        mock_custom_objects_client.create_namespaced_custom_object.call_args_list
+        mock_custom_objects_client.patch_namespaced_custom_object.call_args_list
     )
     if optimize_costs:
         _verify_custom_object_plurals(
@@ -425,27 +506,27 @@ async def test_create_sync_endpoint_has_correct_labels(
         _verify_deployment_labels(deployment_body, request)
 
         # Verify service labels
-        create_service_call_args = mock_core_client.create_namespaced_service.call_args
-        service_body = create_service_call_args.kwargs["body"]
+        create_service_call_args = mock_core_client.patch_namespaced_service.call_args
+        service_body = _get_applied_body(create_service_call_args)
         _verify_non_deployment_labels(service_body, request)
 
         # Verify config_map labels
-        create_config_map_call_args = mock_core_client.create_namespaced_config_map.call_args
-        config_map_body = create_config_map_call_args.kwargs["body"]
+        create_config_map_call_args = mock_core_client.patch_namespaced_config_map.call_args
+        config_map_body = _get_applied_body(create_config_map_call_args)
         _verify_non_deployment_labels(config_map_body, request)
 
         # Verify HPA labels
         create_hpa_call_args = (
-            mock_autoscaling_client.create_namespaced_horizontal_pod_autoscaler.call_args
+            mock_autoscaling_client.patch_namespaced_horizontal_pod_autoscaler.call_args
         )
-        hpa_body = create_hpa_call_args.kwargs["body"]
+        hpa_body = _get_applied_body(create_hpa_call_args)
         _verify_non_deployment_labels(hpa_body, request)
 
         # Make sure that an VPA is created if optimize_costs is True.
         build_endpoint_request = request.build_endpoint_request
         optimize_costs = build_endpoint_request.optimize_costs
         create_custom_object_call_args_list = (
-            mock_custom_objects_client.create_namespaced_custom_object.call_args_list
+            mock_custom_objects_client.patch_namespaced_custom_object.call_args_list
         )
         if optimize_costs:
             _verify_custom_object_plurals(
@@ -480,12 +561,70 @@ async def test_create_sync_endpoint_has_correct_k8s_service_type(
     )
 
     # Verify service labels
-    create_service_call_args = mock_core_client.create_namespaced_service.call_args
-    service_body = create_service_call_args.kwargs["body"]
+    create_service_call_args = mock_core_client.patch_namespaced_service.call_args
+    service_body = _get_applied_body(create_service_call_args)
 
     assert service_body["spec"] is not None
 
 
+@pytest.mark.asyncio
+async def test_create_endpoint_applies_config_maps_before_deployment(
+    k8s_endpoint_resource_delegate,
+    mock_apps_client,
+    mock_core_client,
+    mock_autoscaling_client,
+    mock_custom_objects_client,
+    create_resources_request_async_custom: CreateOrUpdateResourcesRequest,
+):
+    applied = []
+    mock_core_client.patch_namespaced_config_map.side_effect = lambda **kwargs: applied.append(
+        kwargs["name"]
+    )
+    mock_apps_client.create_namespaced_deployment.side_effect = lambda **kwargs: applied.append(
+        "deployment"
+    )
+    await k8s_endpoint_resource_delegate.create_or_update_resources(
+        create_resources_request_async_custom,
+        sqs_queue_name="my_queue",
+        sqs_queue_url="https://my_queue",
+    )
+    assert len(applied) == 3
+    assert applied[-1] == "deployment"
+
+    mock_apps_client.reset_mock()
+    mock_core_client.patch_namespaced_config_map.side_effect = ApiException(status=500)
+    with pytest.raises(EndpointResourceInfraException):
+        await k8s_endpoint_resource_delegate.create_or_update_resources(
+            create_resources_request_async_custom,
+            sqs_queue_name="my_queue",
+            sqs_queue_url="https://my_queue",
+        )
+    mock_apps_client.create_namespaced_deployment.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_existing_deployment_applies_it_without_replicas(
+    k8s_endpoint_resource_delegate,
+    mock_apps_client,
+    mock_core_client,
+    mock_autoscaling_client,
+    mock_custom_objects_client,
+    create_resources_request_async_custom: CreateOrUpdateResourcesRequest,
+):
+    mock_apps_client.create_namespaced_deployment.side_effect = ApiException(status=409)
+    await k8s_endpoint_resource_delegate.create_or_update_resources(
+        create_resources_request_async_custom,
+        sqs_queue_name="my_queue",
+        sqs_queue_url="https://my_queue",
+    )
+
+    apply_deployment_call_args = mock_apps_client.patch_namespaced_deployment.call_args
+    deployment_body = _get_applied_body(apply_deployment_call_args)
+    assert apply_deployment_call_args.kwargs["name"] == deployment_body["metadata"]["name"]
+    assert "replicas" not in deployment_body["spec"]
+    _verify_deployment_labels(deployment_body, create_resources_request_async_custom)
+
+
 @pytest.mark.asyncio
 async def test_create_endpoint_raises_k8s_endpoint_resource_delegate(
     k8s_endpoint_resource_delegate,
@@ -666,3 +805,28 @@ async def test_delete_resources_sync_success(
         endpoint_id="", deployment_name="", endpoint_type=ModelEndpointType.SYNC
     )
     assert deleted
+
+
+@pytest.mark.asyncio
+async def test_delete_resources_sync_deletes_concurrently(
+    k8s_endpoint_resource_delegate,
+    mock_apps_client,
+    mock_core_client,
+    mock_autoscaling_client,
+    mock_custom_objects_client,
+):
+    service_delete_started = asyncio.Event()
+
+    async def delete_deployment(**kwargs):
+        # Deleting the resources one after the other would time out here.
+        await asyncio.wait_for(service_delete_started.wait(), timeout=1)
+
+    async def delete_service(**kwargs):
+        service_delete_started.set()
+
+    mock_apps_client.delete_namespaced_deployment.side_effect = delete_deployment
+    mock_core_client.delete_namespaced_service.side_effect = delete_service
+    deleted = await k8s_endpoint_resource_delegate.delete_resources(
+        endpoint_id="", deployment_name="", endpoint_type=ModelEndpointType.SYNC
+    )
+    assert deleted
@@ -0,0 +1,81 @@
+from typing import List
+
+import pytest
+from llm_engine_server.infra.gateways.aiohttp_sse_client import EventSource, SSEParser
+
+
+class FakeStreamReader:
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+
+    async def _iter(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    def iter_any(self):
+        return self._iter()
+
+
+class FakeResponse:
+    def __init__(self, chunks: List[bytes]):
+        self.content = FakeStreamReader(chunks)
+
+
+def test_sse_parser_single_data_line():
+    parser = SSEParser()
+    events = parser.feed(b'data: {"token": "a"}\r\n\r\n')
+    assert len(events) == 1
+    assert events[0].data == b'{"token": "a"}'
+    assert events[0].type is None
+
+
+def test_sse_parser_chunk_boundaries():
+    stream = b'data: {"token": "a"}\r\n\r\ndata: {"token": "b"}\r\n\r\ndata: {"token": "c"}\n\n'
+    expected = [b'{"token": "a"}', b'{"token": "b"}', b'{"token": "c"}']
+    for chunk_size in range(1, len(stream) + 1):
+        parser = SSEParser()
+        events = []
+        for i in range(0, len(stream), chunk_size):
+            events.extend(parser.feed(stream[i : i + chunk_size]))
+        assert [e.data for e in events] == expected
+
+
+def test_sse_parser_fields():
+    parser = SSEParser()
+    events = parser.feed(
+        b": this is a comment\n"
+        b"event: token\n"
+        b"id: 7\n"
+        b"retry: 1000\n"
+        b"data:first\n"
+        b"data:  second\n"
+        b"data\n"
+        b"\n"
+        b"\n"
+    )
+    assert len(events) == 1
+    assert events[0].type == "token"
+    assert events[0].message == "token"
+    assert events[0].last_event_id == "7"
+    assert events[0].data == b"first\n second\n"
+    assert parser.retry == 1000
+    assert parser.last_event_id == "7"
+
+
+def test_sse_parser_ignores_events_without_data_and_incomplete_events():
+    parser = SSEParser()
+    assert parser.feed(b"event: ping\n\n") == []
+    assert parser.feed(b"data: partial") == []
+    assert parser.feed(b"\n") == []
+    events = parser.feed(b"\n")
+    assert len(events) == 1
+    assert events[0].type is None
+    assert events[0].data == b"partial"
+
+
+@pytest.mark.asyncio
+async def test_event_source_yields_events_across_chunks():
+    response = FakeResponse([b"data: 1\r\n", b"\r\ndata", b": 2\r\n\r\nda", b"ta: 3\r\n\r\n"])
+    async with EventSource(response=response) as event_source:  # type: ignore
+        data = [event.data async for event in event_source]
+    assert data == [b"1", b"2", b"3"]
@@ -0,0 +1,135 @@
+import asyncio
+import io
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from llm_engine_server.common.dtos.model_endpoints import BrokerType
+from llm_engine_server.common.dtos.tasks import GetAsyncTaskV1Response, TaskStatus
+from llm_engine_server.domain.exceptions import TooManyRequestsException
+from llm_engine_server.infra.gateways import celery_task_queue_gateway
+from llm_engine_server.infra.gateways.celery_task_queue_gateway import CeleryTaskQueueGateway
+
+MODULE_PATH = "llm_engine_server.infra.gateways.celery_task_queue_gateway"
+
+
+@pytest.mark.asyncio
+async def test_send_task_async():
+    gateway = CeleryTaskQueueGateway(broker_type=BrokerType.REDIS)
+    with patch.object(
+        celery_task_queue_gateway.celery_redis, "send_task", Mock(return_value=Mock(id="task_1"))
+    ) as mock_send_task:
+        response = await gateway.send_task_async(
+            task_name="test_task", queue_name="test_queue", args=[1, 2]
+        )
+
+    assert response.task_id == "task_1"
+    mock_send_task.assert_called_once_with(
+        name="test_task", args=[1, 2], kwargs=None, queue="test_queue"
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_task_async_rejects_tasks_beyond_max_pending():
+    gateway = CeleryTaskQueueGateway(broker_type=BrokerType.REDIS)
+    broker_stalled = threading.Event()
+
+    def send_task(**kwargs):
+        broker_stalled.wait(5)
+        return Mock(id="task_1")
+
+    with patch(f"{MODULE_PATH}._publisher_slots", threading.BoundedSemaphore(1)), patch.object(
+        celery_task_queue_gateway.celery_redis, "send_task", Mock(side_effect=send_task)
+    ):
+        pending_task = asyncio.create_task(
+            gateway.send_task_async(task_name="test_task", queue_name="test_queue")
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(TooManyRequestsException):
+            await gateway.send_task_async(task_name="test_task", queue_name="test_queue")
+
+        broker_stalled.set()
+        assert (await pending_task).task_id == "task_1"
+        # The slot is released once the pending task is published.
+        response = await gateway.send_task_async(task_name="test_task", queue_name="test_queue")
+        assert response.task_id == "task_1"
+
+
+@pytest.mark.asyncio
+async def test_send_task_async_holds_the_slot_of_cancelled_callers_until_published():
+    gateway = CeleryTaskQueueGateway(broker_type=BrokerType.REDIS)
+    broker_stalled = threading.Event()
+    published = threading.Event()
+
+    def send_task(**kwargs):
+        broker_stalled.wait(5)
+        published.set()
+        return Mock(id="task_1")
+
+    with patch(f"{MODULE_PATH}._publisher_slots", threading.BoundedSemaphore(1)), patch.object(
+        celery_task_queue_gateway.celery_redis, "send_task", Mock(side_effect=send_task)
+    ):
+        pending_task = asyncio.create_task(
+            gateway.send_task_async(task_name="test_task", queue_name="test_queue")
+        )
+        await asyncio.sleep(0)
+        pending_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending_task
+
+        # The cancelled caller's publish is still pending, so it still holds the slot.
+        with pytest.raises(TooManyRequestsException):
+            await gateway.send_task_async(task_name="test_task", queue_name="test_queue")
+
+        broker_stalled.set()
+        published.wait(5)
+        await asyncio.sleep(0.05)
+        response = await gateway.send_task_async(task_name="test_task", queue_name="test_queue")
+        assert response.task_id == "task_1"
+
+
+class _FakeS3Client:
+    def __init__(self, objects):
+        self.objects = objects
+
+    def get_object(self, Bucket: str, Key: str):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+
+def test_get_tasks():
+    gateway = CeleryTaskQueueGateway(broker_type=BrokerType.REDIS)
+    backend = celery_task_queue_gateway.celery_redis.backend
+
+    def encode_meta(meta):
+        value = backend.encode(meta)
+        return value if isinstance(value, bytes) else value.encode("utf-8")
+
+    def get_s3_key(task_id):
+        return (backend.base_path or "") + backend.get_key_for_task(task_id).decode()
+
+    s3_client = _FakeS3Client(
+        {
+            get_s3_key("task_1"): encode_meta(
+                {"status": "SUCCESS", "result": {"y": 42}, "traceback": None}
+            ),
+            get_s3_key("task_2"): encode_meta(
+                {"status": "FAILURE", "result": None, "traceback": "Traceback"}
+            ),
+            get_s3_key("task_3"): encode_meta(
+                {"status": "STARTED", "result": None, "traceback": None}
+            ),
+        }
+    )
+    with patch.object(backend, "_get_s3_client", Mock(return_value=s3_client)):
+        responses = gateway.get_tasks(["task_1", "task_2", "task_3", "task_4"])
+
+    assert responses == [
+        GetAsyncTaskV1Response(task_id="task_1", status=TaskStatus.SUCCESS, result={"y": 42}),
+        GetAsyncTaskV1Response(task_id="task_2", status=TaskStatus.FAILURE, traceback="Traceback"),
+        GetAsyncTaskV1Response(task_id="task_3", status=TaskStatus.STARTED),
+        GetAsyncTaskV1Response(task_id="task_4", status=TaskStatus.PENDING),
+    ]
+    assert gateway.get_tasks([]) == []
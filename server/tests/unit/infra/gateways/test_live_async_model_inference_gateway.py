@@ -1,5 +1,7 @@
+import asyncio
 import json
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from llm_engine_server.common.dtos.tasks import GetAsyncTaskV1Response, TaskStatus
@@ -11,6 +13,16 @@ def fake_live_async_model_inference_gateway(fake_task_queue_gateway):
     return LiveAsyncModelEndpointInferenceGateway(task_queue_gateway=fake_task_queue_gateway)
 
 
+@pytest.fixture
+def fake_live_async_model_inference_gateway_with_notifications(
+    fake_task_queue_gateway, fake_task_completion_gateway
+):
+    return LiveAsyncModelEndpointInferenceGateway(
+        task_queue_gateway=fake_task_queue_gateway,
+        task_completion_gateway=fake_task_completion_gateway,
+    )
+
+
 @pytest.mark.asyncio
 def test_task_create_get_url(
     fake_live_async_model_inference_gateway: LiveAsyncModelEndpointInferenceGateway,
@@ -70,3 +82,141 @@ def test_task_create_get_args_callback(
     assert get_response_2 == GetAsyncTaskV1Response(
         task_id=task_id, status=TaskStatus.SUCCESS, result=42
     )
+
+
+@pytest.mark.asyncio
+async def test_task_create_async(
+    fake_live_async_model_inference_gateway: LiveAsyncModelEndpointInferenceGateway,
+    endpoint_predict_request_1,
+):
+    create_response = await fake_live_async_model_inference_gateway.create_task_async(
+        "test_topic", endpoint_predict_request_1[0], 60, task_name="test_task_name"
+    )
+    task_id = create_response.task_id
+    task_queue_gateway: Any = fake_live_async_model_inference_gateway.task_queue_gateway
+    assert len(task_queue_gateway.queue) == 1
+    assert task_queue_gateway.queue[task_id]["task_name"] == "test_task_name"
+    assert task_queue_gateway.queue[task_id]["queue_name"] == "test_topic"
+    assert task_queue_gateway.queue[task_id]["expires"] == 60
+    assert task_queue_gateway.queue[task_id]["args"] == [
+        endpoint_predict_request_1[0].dict(),
+        endpoint_predict_request_1[0].return_pickled,
+    ]
+
+
+def test_task_get_tasks(
+    fake_live_async_model_inference_gateway: LiveAsyncModelEndpointInferenceGateway,
+    endpoint_predict_request_1,
+):
+    task_id_1 = fake_live_async_model_inference_gateway.create_task(
+        "test_topic", endpoint_predict_request_1[0], 60
+    ).task_id
+    task_id_2 = fake_live_async_model_inference_gateway.create_task(
+        "test_topic", endpoint_predict_request_1[0], 60
+    ).task_id
+    task_queue_gateway: Any = fake_live_async_model_inference_gateway.task_queue_gateway
+    task_queue_gateway.do_task(result=42, status="success")
+
+    get_responses = fake_live_async_model_inference_gateway.get_tasks(
+        [task_id_2, task_id_1, "unknown_task_id"]
+    )
+    assert get_responses == [
+        GetAsyncTaskV1Response(task_id=task_id_2, status=TaskStatus.PENDING),
+        GetAsyncTaskV1Response(task_id=task_id_1, status=TaskStatus.SUCCESS, result=42),
+        GetAsyncTaskV1Response(task_id="unknown_task_id", status=TaskStatus.UNDEFINED),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_returns_when_notified(
+    fake_live_async_model_inference_gateway_with_notifications: LiveAsyncModelEndpointInferenceGateway,
+    fake_task_completion_gateway,
+    endpoint_predict_request_1,
+):
+    gateway = fake_live_async_model_inference_gateway_with_notifications
+    task_id = gateway.create_task("test_topic", endpoint_predict_request_1[0], 60).task_id
+    task_queue_gateway: Any = gateway.task_queue_gateway
+
+    wait = asyncio.create_task(gateway.wait_for_task(task_id, timeout_seconds=10))
+    await asyncio.sleep(0.1)
+    assert not wait.done()
+    assert len(fake_task_completion_gateway.waiters[task_id]) == 1
+
+    task_queue_gateway.do_task(result=42, status="success")
+    fake_task_completion_gateway.notify(task_id)
+    response = await asyncio.wait_for(wait, timeout=1)
+    assert response == GetAsyncTaskV1Response(task_id=task_id, status=TaskStatus.SUCCESS, result=42)
+    assert len(fake_task_completion_gateway.waiters[task_id]) == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_returns_finished_task_immediately(
+    fake_live_async_model_inference_gateway_with_notifications: LiveAsyncModelEndpointInferenceGateway,
+    endpoint_predict_request_1,
+):
+    gateway = fake_live_async_model_inference_gateway_with_notifications
+    task_id = gateway.create_task("test_topic", endpoint_predict_request_1[0], 60).task_id
+    task_queue_gateway: Any = gateway.task_queue_gateway
+    task_queue_gateway.do_task(result=42, status="success")
+
+    response = await asyncio.wait_for(gateway.wait_for_task(task_id, timeout_seconds=10), 1)
+    assert response.status == TaskStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_times_out(
+    fake_live_async_model_inference_gateway_with_notifications: LiveAsyncModelEndpointInferenceGateway,
+    endpoint_predict_request_1,
+):
+    gateway = fake_live_async_model_inference_gateway_with_notifications
+    task_id = gateway.create_task("test_topic", endpoint_predict_request_1[0], 60).task_id
+
+    response = await gateway.wait_for_task(task_id, timeout_seconds=0.1)
+    assert response == GetAsyncTaskV1Response(task_id=task_id, status=TaskStatus.PENDING)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_polls_without_notifications(
+    fake_live_async_model_inference_gateway: LiveAsyncModelEndpointInferenceGateway,
+    endpoint_predict_request_1,
+):
+    gateway = fake_live_async_model_inference_gateway
+    task_id = gateway.create_task("test_topic", endpoint_predict_request_1[0], 60).task_id
+    task_queue_gateway: Any = gateway.task_queue_gateway
+
+    with patch(
+        "llm_engine_server.infra.gateways.live_async_model_endpoint_inference_gateway."
+        "POLL_INTERVAL_SECONDS",
+        0.01,
+    ):
+        wait = asyncio.create_task(gateway.wait_for_task(task_id, timeout_seconds=10))
+        await asyncio.sleep(0.1)
+        assert not wait.done()
+        task_queue_gateway.do_task(result=42, status="success")
+        response = await asyncio.wait_for(wait, timeout=1)
+    assert response.status == TaskStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_polls_when_notifications_are_unavailable(
+    fake_live_async_model_inference_gateway_with_notifications: LiveAsyncModelEndpointInferenceGateway,
+    fake_task_completion_gateway,
+    endpoint_predict_request_1,
+):
+    gateway = fake_live_async_model_inference_gateway_with_notifications
+    task_id = gateway.create_task("test_topic", endpoint_predict_request_1[0], 60).task_id
+    task_queue_gateway: Any = gateway.task_queue_gateway
+    fake_task_completion_gateway.available = False
+
+    with patch(
+        "llm_engine_server.infra.gateways.live_async_model_endpoint_inference_gateway."
+        "POLL_INTERVAL_SECONDS",
+        0.01,
+    ):
+        wait = asyncio.create_task(gateway.wait_for_task(task_id, timeout_seconds=10))
+        await asyncio.sleep(0.1)
+        assert not wait.done()
+        # Completed without a notification.
+        task_queue_gateway.do_task(result=42, status="success")
+        response = await asyncio.wait_for(wait, timeout=1)
+    assert response.status == TaskStatus.SUCCESS
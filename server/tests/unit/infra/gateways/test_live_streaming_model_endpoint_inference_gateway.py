@@ -22,6 +22,9 @@ class FakeIterator:
     def __aiter__(self):
         return self
 
+    def iter_any(self):
+        return self
+
     async def __anext__(self):
         self.count = self.count + 1
         if self.count == 1:
@@ -0,0 +1,25 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from llm_engine_server.infra.gateways import redis_task_completion_gateway
+from llm_engine_server.infra.gateways.redis_task_completion_gateway import (
+    RedisTaskCompletionGateway,
+)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_without_redis_yields_none_and_logs_once():
+    # Nothing listens on this port, so connecting fails.
+    gateway = RedisTaskCompletionGateway("redis://127.0.0.1:1")
+    with patch.object(redis_task_completion_gateway, "logger") as mock_logger:
+
+        async def subscribe(task_id: str):
+            async with gateway.subscribe(task_id) as completed:
+                return completed
+
+        assert await asyncio.gather(*(subscribe(f"task_{i}") for i in range(3))) == [None] * 3
+        assert await subscribe("task_3") is None
+
+    assert mock_logger.exception.call_count == 1
+    assert gateway._subscriptions == {}
@@ -17,6 +17,7 @@ from llm_engine_server.domain.entities import (
     ModelEndpointType,
     ModelEndpointUserConfigState,
 )
+from llm_engine_server.infra.repositories.redis_image_build_repository import RELEASE_CLAIM_SCRIPT
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -24,7 +25,13 @@ class FakeRedis:
     def __init__(self):
         self.db = {}
 
-    async def set(self, key: str, value: Union[str, bytes, int, float], ex: float = None):
+    async def set(
+        self,
+        key: str,
+        value: Union[str, bytes, int, float],
+        ex: float = None,
+        nx: bool = False,
+    ) -> Optional[bool]:
         if not (
             isinstance(value, str)
             or isinstance(value, bytes)
@@ -34,11 +41,26 @@ class FakeRedis:
             raise TypeError(
                 f"value must of type str, bytes, int, or float, got {value=}, type={type(value)}"
             )
-        self.db[key] = str(value).encode()
+        if nx and key in self.db:
+            return None
+        self.db[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
 
     async def get(self, key: str) -> Optional[bytes]:
         return self.db.get(key, None)
 
+    async def delete(self, key: str) -> int:
+        return 1 if self.db.pop(key, None) is not None else 0
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: str) -> int:
+        # Only the scripts of the repositories are supported.
+        if script == RELEASE_CLAIM_SCRIPT:
+            key, builder_id = keys_and_args
+            if self.db.get(key) == builder_id.encode():
+                return await self.delete(key)
+            return 0
+        raise NotImplementedError(script)
+
     def force_expire_all(self):
         self.db = {}
 
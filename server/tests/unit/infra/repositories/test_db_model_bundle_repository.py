@@ -1,5 +1,5 @@
 import datetime
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional
 from unittest.mock import AsyncMock
 
 import pytest
@@ -114,22 +114,14 @@ async def test_list_model_bundles(
     orm_model_bundle: Bundle,
     model_bundle_1: ModelBundle,
 ):
-    def mock_model_bundle_select_all_by_name_owner(
-        session: AsyncSession, owner: str, name: str
+    def mock_model_bundle_select_all_by_filters_owner(
+        session: AsyncSession, filters: List[Any], owner: str, **kwargs: Any
     ) -> List[Bundle]:
-        orm_model_bundle.name = name
         orm_model_bundle.owner = owner
         return [orm_model_bundle]
 
-    def mock_model_bundle_select_all_by_owner(session: AsyncSession, owner: str) -> List[Bundle]:
-        orm_model_bundle.created_by = owner
-        return [orm_model_bundle]
-
-    OrmModelBundle.select_all_by_name_owner = AsyncMock(
-        side_effect=mock_model_bundle_select_all_by_name_owner
-    )
-    OrmModelBundle.select_all_by_owner = AsyncMock(
-        side_effect=mock_model_bundle_select_all_by_owner
+    OrmModelBundle.select_all_by_filters_owner = AsyncMock(
+        side_effect=mock_model_bundle_select_all_by_filters_owner
     )
 
     repo = DbModelBundleRepository(session=dbsession, read_only=True)
@@ -188,40 +180,24 @@ async def test_list_model_bundles_team(
     model_bundle_5.created_by = test_api_key_user_on_other_team_2
     model_bundle_5.owner = test_api_key_team
 
-    def mock_model_bundle_select_all_by_name_owner(
-        session: AsyncSession, owner: str, name: str
+    orm_model_bundles = [
+        orm_model_bundle,
+        orm_model_bundle_2,
+        orm_model_bundle_3,
+        orm_model_bundle_4,
+        orm_model_bundle_5,
+    ]
+
+    def mock_model_bundle_select_all_by_filters_owner(
+        session: AsyncSession, filters: List[Any], owner: str, **kwargs: Any
     ) -> List[Bundle]:
         if owner != test_api_key_team:
             return []
-        if name == model_bundle_1.name:
-            return [orm_model_bundle]
-        elif name == model_bundle_2.name:
-            return [orm_model_bundle_2]
-        elif name == model_bundle_3.name:
-            return [orm_model_bundle_3]
-        elif name == model_bundle_4.name:
-            return [orm_model_bundle_4]
-        elif name == model_bundle_5.name:
-            return [orm_model_bundle_5]
-        else:
-            return []
+        names = [f.right.value for f in filters if getattr(f, "left", None) is not None]
+        return [mb for mb in orm_model_bundles if not names or mb.name in names]
 
-    def mock_model_bundle_select_all_by_owner(session: AsyncSession, owner: str) -> List[Bundle]:
-        if owner != test_api_key_team:
-            return []
-        return [
-            orm_model_bundle,
-            orm_model_bundle_2,
-            orm_model_bundle_3,
-            orm_model_bundle_4,
-            orm_model_bundle_5,
-        ]
-
-    OrmModelBundle.select_all_by_name_owner = AsyncMock(
-        side_effect=mock_model_bundle_select_all_by_name_owner
-    )
-    OrmModelBundle.select_all_by_owner = AsyncMock(
-        side_effect=mock_model_bundle_select_all_by_owner
+    OrmModelBundle.select_all_by_filters_owner = AsyncMock(
+        side_effect=mock_model_bundle_select_all_by_filters_owner
     )
 
     repo = DbModelBundleRepository(session=dbsession, read_only=True)
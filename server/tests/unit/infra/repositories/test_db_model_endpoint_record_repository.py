@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 from llm_engine_server.common.dtos.model_endpoints import ModelEndpointOrderBy
-from llm_engine_server.core.domain_exceptions import ReadOnlyDatabaseException
+from llm_engine_server.common.pagination import encode_page_token
+from llm_engine_server.core.domain_exceptions import (
+    ObjectHasInvalidValueException,
+    ReadOnlyDatabaseException,
+)
 from llm_engine_server.db.models import Bundle, Endpoint
 from llm_engine_server.domain.entities import ModelEndpointRecord
 from llm_engine_server.infra.gateways import FakeMonitoringMetricsGateway
@@ -104,7 +108,7 @@ async def test_list_model_endpoint_records(
     fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
 ):
     def mock_model_endpoint_select_all_by_filters(
-        session: AsyncSession, filters: Any
+        session: AsyncSession, filters: Any, **kwargs: Any
     ) -> List[Endpoint]:
         orm_model_endpoint.created_at = datetime.datetime(2022, 1, 3)
         orm_model_endpoint.last_updated_at = datetime.datetime(2022, 1, 3)
@@ -143,7 +147,7 @@ async def test_list_llm_model_endpoint_records(
     filter_content = "endpoint_metadata ? '_llm' AND llm_engine.endpoints.name = :name_1 AND (llm_engine.endpoints.owner = :owner_1 OR llm_engine.endpoints.public_inference = true)"
 
     def mock_llm_model_endpoint_select_all_by_filters(
-        session: AsyncSession, filters: Any
+        session: AsyncSession, filters: Any, **kwargs: Any
     ) -> List[Endpoint]:
         q = select(Endpoint)
         for f in filters:
@@ -177,6 +181,60 @@ async def test_list_llm_model_endpoint_records(
     )
 
 
+@pytest.mark.asyncio
+async def test_list_model_endpoint_records_paginates_in_sql(
+    dbsession: Callable[[], AsyncSession],
+    orm_model_endpoint: Endpoint,
+    orm_model_bundle: Bundle,
+    fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
+):
+    queries = []
+
+    def mock_model_endpoint_select_all_by_filters(
+        session: AsyncSession, filters: Any, limit: Any = None, order_by: Any = None, **kwargs: Any
+    ) -> List[Endpoint]:
+        q = select(Endpoint)
+        for f in filters:
+            q = q.filter(f)
+        queries.append(str(q.order_by(*order_by).limit(limit)))
+        orm_model_endpoint.created_at = datetime.datetime(2022, 1, 3)
+        orm_model_endpoint.last_updated_at = datetime.datetime(2022, 1, 3)
+        orm_model_endpoint.current_bundle = orm_model_bundle
+        return [orm_model_endpoint]
+
+    OrmModelEndpoint._select_all_by_filters = AsyncMock(
+        side_effect=mock_model_endpoint_select_all_by_filters
+    )
+
+    repo = DbModelEndpointRecordRepository(
+        monitoring_metrics_gateway=fake_monitoring_metrics_gateway,
+        session=dbsession,
+        read_only=False,
+    )
+    await repo.list_model_endpoint_records(
+        owner="test_paginated_user_id", name=None, order_by=None, limit=1
+    )
+    await repo.list_model_endpoint_records(
+        owner="test_paginated_user_id",
+        name=None,
+        order_by=ModelEndpointOrderBy.OLDEST,
+        limit=1,
+        page_token=encode_page_token(datetime.datetime(2022, 1, 3), "test_model_endpoint_id"),
+    )
+
+    assert (
+        "ORDER BY llm_engine.endpoints.created_at DESC, llm_engine.endpoints.id DESC" in queries[0]
+    )
+    assert "LIMIT" in queries[0]
+    assert "(llm_engine.endpoints.created_at, llm_engine.endpoints.id) > (" in queries[1]
+    assert "ORDER BY llm_engine.endpoints.created_at ASC, llm_engine.endpoints.id ASC" in queries[1]
+
+    with pytest.raises(ObjectHasInvalidValueException):
+        await repo.list_model_endpoint_records(
+            owner="test_paginated_user_id", name=None, order_by=None, page_token="invalid"
+        )
+
+
 @pytest.mark.asyncio
 async def test_list_model_endpoint_records_team(
     dbsession: Callable[[], AsyncSession],
@@ -201,7 +259,7 @@ async def test_list_model_endpoint_records_team(
     entity_model_endpoint_record.current_model_bundle.owner = test_api_key_team
 
     def mock_model_endpoint_select_all_by_filters(
-        session: AsyncSession, filters: Any
+        session: AsyncSession, filters: Any, **kwargs: Any
     ) -> List[Endpoint]:
         # we could check which filters are here but that seems brittle
         # correct filters are "owner = 'test_api_key_team'" and "name = 'test_model_endpoint_name'"
@@ -457,6 +515,67 @@ async def test_update_model_endpoint_record_success(
         assert model_endpoint.__getattribute__(key) == value
 
 
+@pytest.mark.asyncio
+async def test_update_model_endpoint_record_invalidates_cache(
+    dbsession: Callable[[], AsyncSession],
+    orm_model_endpoint: Endpoint,
+    orm_model_bundle: Bundle,
+    fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
+):
+    def mock_model_endpoint_select_by_id(
+        session: AsyncSession, endpoint_id: str
+    ) -> Optional[Endpoint]:
+        orm_model_endpoint.id = endpoint_id
+        orm_model_endpoint.created_at = datetime.datetime(2022, 1, 3)
+        orm_model_endpoint.last_updated_at = datetime.datetime(2022, 1, 3)
+        orm_model_endpoint.current_bundle = orm_model_bundle
+        return orm_model_endpoint
+
+    def mock_model_endpoint_update_by_name_owner(
+        session: AsyncSession, name: str, owner: str, kwargs: Dict[str, Any]
+    ) -> None:
+        for key, value in kwargs.items():
+            orm_model_endpoint.__setattr__(key, value)
+
+    OrmModelEndpoint.select_by_id = AsyncMock(side_effect=mock_model_endpoint_select_by_id)
+    OrmModelEndpoint.update_by_name_owner = AsyncMock(
+        side_effect=mock_model_endpoint_update_by_name_owner
+    )
+    OrmModelEndpoint._select_all_by_filters = AsyncMock(return_value=[orm_model_endpoint])
+    db_model_endpoint_record_repository.cache.clear()
+
+    redis_client = AsyncMock()
+    repo = DbModelEndpointRecordRepository(
+        monitoring_metrics_gateway=fake_monitoring_metrics_gateway,
+        session=dbsession,
+        read_only=False,
+        redis_client=redis_client,
+    )
+    model_endpoint = await repo.get_model_endpoint_record("test_model_endpoint_id")
+    assert model_endpoint is not None
+    model_endpoints = await repo.list_model_endpoint_records(
+        owner=model_endpoint.owner, name=None, order_by=None
+    )
+    assert model_endpoints[0].status == model_endpoint.status
+    fake_monitoring_metrics_gateway.reset()
+    await repo.get_model_endpoint_record("test_model_endpoint_id")
+    assert fake_monitoring_metrics_gateway.database_cache_hit == 1
+
+    await repo.update_model_endpoint_record(
+        model_endpoint_id="test_model_endpoint_id", status="UPDATE_IN_PROGRESS"
+    )
+    redis_client.publish.assert_awaited_once()
+
+    model_endpoint = await repo.get_model_endpoint_record("test_model_endpoint_id")
+    assert model_endpoint is not None
+    assert model_endpoint.status == "UPDATE_IN_PROGRESS"
+    model_endpoints = await repo.list_model_endpoint_records(
+        owner=model_endpoint.owner, name=None, order_by=None
+    )
+    assert model_endpoints[0].status == "UPDATE_IN_PROGRESS"
+    assert fake_monitoring_metrics_gateway.database_cache_miss == 2
+
+
 @pytest.mark.asyncio
 async def test_update_model_endpoint_record_returns_none(
     dbsession: Callable[[], AsyncSession],
@@ -507,6 +626,42 @@ async def test_db_lock_context(
     mock_lock_context.__aexit__.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_db_lock_context_emits_contention_metric(
+    dbsession: Callable[[], AsyncSession],
+    fake_monitoring_metrics_gateway: FakeMonitoringMetricsGateway,
+):
+    mock_lock_context = AsyncMock()
+    mock_lock_context.__aenter__ = AsyncMock(return_value=mock_lock_context)
+    mock_lock_context.lock_acquired = Mock(return_value=False)
+    mock_lock_context.contended = True
+    mock_lock_context.wait_seconds = 120.0
+    db_model_endpoint_record_repository.AdvisoryLockContextManager = Mock(
+        return_value=mock_lock_context
+    )
+    mock_session = AsyncMock()
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_sessionmaker = Mock(return_value=mock_session)
+    repo = DbModelEndpointRecordRepository(
+        monitoring_metrics_gateway=fake_monitoring_metrics_gateway,
+        session=dbsession,
+        read_only=False,
+    )
+
+    async with repo.DbLockContext(
+        lock_id=0,
+        session=mock_sessionmaker,
+        blocking=True,
+        monitoring_metrics_gateway=fake_monitoring_metrics_gateway,
+    ) as lock:
+        assert not lock.lock_acquired()
+    db_model_endpoint_record_repository.AdvisoryLockContextManager.assert_called_once_with(
+        mock_session, 0, blocking=True
+    )
+    assert fake_monitoring_metrics_gateway.database_lock_contended == 1
+    assert fake_monitoring_metrics_gateway.database_lock_not_acquired == 1
+
+
 def test_get_lock_context(
     dbsession: Callable[[], AsyncSession],
     entity_model_endpoint_record: ModelEndpointRecord,
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from llm_engine_server.common.dtos.docker_repository import BuildImageRequest
+from llm_engine_server.core.docker.remote_build import BuildResult
+from llm_engine_server.infra.repositories import ecr_docker_repository
+from llm_engine_server.infra.repositories.ecr_docker_repository import ECRDockerRepository
+
+MODULE_PATH = "llm_engine_server.infra.repositories.ecr_docker_repository"
+
+
+@pytest.fixture(autouse=True)
+def clear_image_index():
+    ecr_docker_repository._image_index.clear()
+    yield
+    ecr_docker_repository._image_index.clear()
+
+
+def _wait_for_refreshes():
+    for refresh in list(ecr_docker_repository._image_index._refreshes.values()):
+        refresh.result()
+
+
+@pytest.mark.asyncio
+async def test_image_exists_async_looks_up_the_image_index():
+    repo = ECRDockerRepository()
+    with patch(
+        f"{MODULE_PATH}.ecr_list_image_tags", Mock(return_value={"a", "b"})
+    ) as mock_list, patch(
+        f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock(return_value=False)
+    ) as mock_describe:
+        # Lookups in a repository that was never listed don't wait for its listing.
+        assert not await repo.image_exists_async("a", "repo")
+        _wait_for_refreshes()
+        assert await repo.image_exists_async("a", "repo")
+        assert await repo.image_exists_async("b", "repo")
+        assert mock_list.call_count == 1
+        assert mock_describe.call_count == 1
+
+        # Each repository and aws profile has its own index.
+        await repo.image_exists_async("a", "repo", aws_profile="other")
+        _wait_for_refreshes()
+        assert mock_list.call_count == 2
+
+        # The sync and async checks share the index.
+        assert repo.image_exists("a", "repo")
+        assert mock_list.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_image_index_misses_are_looked_up_in_ecr():
+    repo = ECRDockerRepository()
+    with patch(f"{MODULE_PATH}.ecr_list_image_tags", Mock(return_value={"a"})), patch(
+        f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock(return_value=True)
+    ):
+        await repo.image_exists_async("a", "repo")
+        _wait_for_refreshes()
+
+    with patch(
+        f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock(side_effect=[False, True])
+    ) as mock_describe:
+        assert not await repo.image_exists_async("b", "repo")
+        # Pushed since the index was listed.
+        assert await repo.image_exists_async("b", "repo")
+        assert await repo.image_exists_async("b", "repo")
+        assert mock_describe.call_count == 2
+
+    with patch(f"{MODULE_PATH}.ecr_image_exists", Mock(return_value=True)) as mock_describe:
+        assert repo.image_exists("c", "repo")
+        assert repo.image_exists("c", "repo")
+        assert mock_describe.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_a_refresh():
+    repo = ECRDockerRepository()
+    listed = threading.Event()
+
+    def list_image_tags(**kwargs):
+        listed.wait(5)
+        return {"a"}
+
+    with patch(
+        f"{MODULE_PATH}.ecr_list_image_tags", Mock(side_effect=list_image_tags)
+    ) as mock_list, patch(f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock(return_value=True)):
+        assert await asyncio.gather(*(repo.image_exists_async("a", "repo") for _ in range(5)))
+        listed.set()
+        _wait_for_refreshes()
+        assert mock_list.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_image_index_is_refreshed_in_the_background_when_stale():
+    repo = ECRDockerRepository()
+    listed = threading.Event()
+    listed.set()
+
+    def list_image_tags(**kwargs):
+        listed.wait(5)
+        return image_tags
+
+    image_tags = {"a"}
+    with patch(
+        f"{MODULE_PATH}.ecr_list_image_tags", Mock(side_effect=list_image_tags)
+    ) as mock_list, patch(
+        f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock(return_value=False)
+    ) as mock_describe:
+        await repo.image_exists_async("a", "repo")
+        _wait_for_refreshes()
+
+        image_tags = {"b"}
+        listed.clear()
+        with patch.object(ecr_docker_repository._image_index, "refresh_interval_seconds", 0.0):
+            # Lookups against a stale index don't wait for the refresh.
+            assert await repo.image_exists_async("a", "repo")
+            assert not await repo.image_exists_async("b", "repo")
+            listed.set()
+            _wait_for_refreshes()
+            assert mock_list.call_count == 2
+        assert await repo.image_exists_async("b", "repo")
+        assert not await repo.image_exists_async("a", "repo")
+        assert mock_describe.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_refreshes_are_retried():
+    repo = ECRDockerRepository()
+    with patch(f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock(return_value=False)):
+        with patch(f"{MODULE_PATH}.ecr_list_image_tags", Mock(side_effect=ConnectionError)):
+            await repo.image_exists_async("a", "repo")
+            _wait_for_refreshes()
+        with patch(f"{MODULE_PATH}.ecr_list_image_tags", Mock(return_value={"a"})):
+            await repo.image_exists_async("a", "repo")
+            _wait_for_refreshes()
+            assert await repo.image_exists_async("a", "repo")
+
+
+@pytest.mark.asyncio
+async def test_build_image_async_adds_the_image_to_the_index():
+    repo = ECRDockerRepository()
+    image_params = BuildImageRequest(
+        repo="repo",
+        image_tag="tag",
+        aws_profile="profile",
+        base_path="base_path",
+        dockerfile="Dockerfile",
+        base_image="base_image",
+    )
+    with patch(f"{MODULE_PATH}.ecr_list_image_tags", Mock(return_value=set())), patch(
+        f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock(return_value=False)
+    ):
+        await repo.image_exists_async("other", "repo", aws_profile="profile")
+        _wait_for_refreshes()
+
+    with patch(
+        f"{MODULE_PATH}.build_remote_block_async",
+        AsyncMock(return_value=BuildResult(status=True, logs="")),
+    ):
+        await repo.build_image_async(image_params)
+    with patch(f"{MODULE_PATH}.ecr_image_exists_async", AsyncMock()) as mock_describe:
+        assert await repo.image_exists_async("tag", "repo", aws_profile="profile")
+        mock_describe.assert_not_called()
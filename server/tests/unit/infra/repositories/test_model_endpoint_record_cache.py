@@ -0,0 +1,78 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from llm_engine_server.common.constants import MODEL_ENDPOINT_RECORD_CACHE_INVALIDATION_CHANNEL
+from llm_engine_server.infra.repositories.model_endpoint_record_cache import (
+    ModelEndpointRecordCache,
+)
+
+
+def test_get_set():
+    cache = ModelEndpointRecordCache(maxsize=2, ttl_seconds=10)
+    assert cache.get("a") is None
+    assert cache.set("a", 1, tags=[("owner", "x")], generation=cache.generation) == 0
+    assert cache.get("a") == 1
+
+
+def test_expiry():
+    cache = ModelEndpointRecordCache(maxsize=2, ttl_seconds=10)
+    with patch("time.monotonic", return_value=100.0):
+        cache.set("a", 1, tags=[], generation=cache.generation)
+    with patch("time.monotonic", return_value=109.0):
+        assert cache.get("a") == 1
+    with patch("time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+        # Expired entries are dropped before evicting unexpired ones.
+        cache.set("b", 2, tags=[], generation=cache.generation)
+        assert cache.set("c", 3, tags=[], generation=cache.generation) == 0
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+
+def test_eviction_of_oldest_entries():
+    cache = ModelEndpointRecordCache(maxsize=2, ttl_seconds=10)
+    cache.set("a", 1, tags=[("owner", "x")], generation=cache.generation)
+    cache.set("b", 2, tags=[("owner", "x")], generation=cache.generation)
+    assert cache.set("c", 3, tags=[("owner", "y")], generation=cache.generation) == 1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_invalidate_by_tag():
+    cache = ModelEndpointRecordCache(maxsize=10, ttl_seconds=10)
+    cache.set("a", 1, tags=[("endpoint", "1")], generation=cache.generation)
+    cache.set("b", [1, 2], tags=[("owner", "x")], generation=cache.generation)
+    cache.set("c", [3], tags=[("owner", "y")], generation=cache.generation)
+    cache.invalidate([("endpoint", "1"), ("owner", "x")])
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == [3]
+
+
+def test_set_ignores_values_loaded_before_an_invalidation():
+    cache = ModelEndpointRecordCache(maxsize=10, ttl_seconds=10)
+    generation = cache.generation
+    cache.invalidate([("endpoint", "1")])
+    cache.set("a", 1, tags=[("endpoint", "1")], generation=generation)
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_publish_and_handle_invalidation_message():
+    cache = ModelEndpointRecordCache(maxsize=10, ttl_seconds=10)
+    cache.set("a", 1, tags=[("endpoint", "1")], generation=cache.generation)
+    cache.set("b", 2, tags=[("owner", None)], generation=cache.generation)
+    redis_client = AsyncMock()
+    await cache.publish_invalidation(redis_client, [("endpoint", "1"), ("owner", None)])
+
+    channel, message = redis_client.publish.call_args.args
+    assert channel == MODEL_ENDPOINT_RECORD_CACHE_INVALIDATION_CHANNEL
+    assert json.loads(message) == [["endpoint", "1"], ["owner", None]]
+
+    cache.handle_invalidation_message(message.encode())
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+    cache.handle_invalidation_message(b"invalid")
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from llm_engine_server.infra.repositories.redis_image_build_repository import (
+    RedisImageBuildRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_claim_and_release_build(fake_redis):
+    repo = RedisImageBuildRepository(redis_client=fake_redis, poll_interval_seconds=0.01)
+
+    assert await repo.claim_build("repo:tag", "builder-1", ttl_seconds=60)
+    assert not await repo.claim_build("repo:tag", "builder-2", ttl_seconds=60)
+    assert await repo.claim_build("repo:other-tag", "builder-2", ttl_seconds=60)
+
+    # Only the claimant releases a claim.
+    await repo.release_build("repo:tag", "builder-2", succeeded=False)
+    assert not await repo.claim_build("repo:tag", "builder-2", ttl_seconds=60)
+    await repo.release_build("repo:tag", "builder-1", succeeded=False)
+    assert await repo.claim_build("repo:tag", "builder-2", ttl_seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_build(fake_redis):
+    repo = RedisImageBuildRepository(redis_client=fake_redis, poll_interval_seconds=0.01)
+    await repo.claim_build("repo:tag", "builder-1", ttl_seconds=60)
+
+    waiter = asyncio.create_task(repo.wait_for_build("repo:tag", timeout_seconds=10))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    await repo.release_build("repo:tag", "builder-1", succeeded=True)
+    assert await waiter
+
+
+@pytest.mark.asyncio
+async def test_wait_for_failed_or_expired_build(fake_redis):
+    repo = RedisImageBuildRepository(redis_client=fake_redis, poll_interval_seconds=0.01)
+    await repo.claim_build("repo:tag", "builder-1", ttl_seconds=60)
+    assert not await repo.wait_for_build("repo:tag", timeout_seconds=0.05)
+
+    waiter = asyncio.create_task(repo.wait_for_build("repo:tag", timeout_seconds=10))
+    await repo.release_build("repo:tag", "builder-1", succeeded=False)
+    assert not await waiter
+
+    await repo.claim_build("repo:tag", "builder-1", ttl_seconds=60)
+    fake_redis.force_expire_all()
+    assert not await repo.wait_for_build("repo:tag", timeout_seconds=10)
@@ -1,5 +1,5 @@
 from typing import Any
-from unittest.mock import Mock, mock_open
+from unittest.mock import AsyncMock, Mock, mock_open
 
 import pytest
 from llm_engine_server.common.dtos.docker_repository import BuildImageResponse
@@ -33,6 +33,7 @@ def endpoint_builder_service_empty_docker_built(
     fake_filesystem_gateway,
     fake_notification_gateway,
     fake_feature_flag_repository,
+    fake_image_build_repository,
 ) -> LiveEndpointBuilderService:
     return LiveEndpointBuilderService(
         docker_repository=fake_docker_repository_image_always_exists,
@@ -43,6 +44,7 @@ def endpoint_builder_service_empty_docker_built(
         filesystem_gateway=fake_filesystem_gateway,
         notification_gateway=fake_notification_gateway,
         feature_flag_repo=fake_feature_flag_repository,
+        image_build_repository=fake_image_build_repository,
     )
 
 
@@ -56,6 +58,7 @@ def endpoint_builder_service_empty_docker_not_built(
     fake_filesystem_gateway,
     fake_notification_gateway,
     fake_feature_flag_repository,
+    fake_image_build_repository,
 ) -> LiveEndpointBuilderService:
     return LiveEndpointBuilderService(
         docker_repository=fake_docker_repository_image_never_exists,
@@ -66,6 +69,7 @@ def endpoint_builder_service_empty_docker_not_built(
         filesystem_gateway=fake_filesystem_gateway,
         notification_gateway=fake_notification_gateway,
         feature_flag_repo=fake_feature_flag_repository,
+        image_build_repository=fake_image_build_repository,
     )
 
 
@@ -79,6 +83,7 @@ def endpoint_builder_service_empty_docker_builds_dont_work(
     fake_filesystem_gateway,
     fake_notification_gateway,
     fake_feature_flag_repository,
+    fake_image_build_repository,
 ) -> LiveEndpointBuilderService:
     return LiveEndpointBuilderService(
         docker_repository=fake_docker_repository_image_never_exists_and_builds_dont_work,
@@ -89,6 +94,7 @@ def endpoint_builder_service_empty_docker_builds_dont_work(
         filesystem_gateway=fake_filesystem_gateway,
         notification_gateway=fake_notification_gateway,
         feature_flag_repo=fake_feature_flag_repository,
+        image_build_repository=fake_image_build_repository,
     )
 
 
@@ -238,6 +244,57 @@ async def test_build_endpoint_build_result_throws_error_yields_docker_build_fail
     assert len(fake_notification_gateway.notifications_sent[NotificationApp.EMAIL]) == 1
 
 
+@pytest.mark.asyncio
+async def test_build_endpoint_releases_image_build_claims(
+    build_endpoint_request_sync_pytorch: BuildEndpointRequest,
+    endpoint_builder_service_empty_docker_not_built: LiveEndpointBuilderService,
+    endpoint_builder_service_empty_docker_builds_dont_work: LiveEndpointBuilderService,
+    fake_image_build_repository,
+):
+    repo: Any = endpoint_builder_service_empty_docker_not_built.model_endpoint_record_repository
+    repo.add_model_endpoint_record(build_endpoint_request_sync_pytorch.model_endpoint_record)
+    await endpoint_builder_service_empty_docker_not_built.build_endpoint(
+        build_endpoint_request_sync_pytorch
+    )
+    assert fake_image_build_repository.claims == {}
+    assert len(fake_image_build_repository.succeeded) > 0
+
+    fake_image_build_repository.succeeded.clear()
+    with pytest.raises(DockerBuildFailedException):
+        await endpoint_builder_service_empty_docker_builds_dont_work.build_endpoint(
+            build_endpoint_request_sync_pytorch
+        )
+    assert fake_image_build_repository.claims == {}
+    assert fake_image_build_repository.succeeded == set()
+
+
+@pytest.mark.asyncio
+async def test_build_endpoint_waits_for_image_builds_of_other_builders(
+    build_endpoint_request_sync_pytorch: BuildEndpointRequest,
+    endpoint_builder_service_empty_docker_not_built: LiveEndpointBuilderService,
+    fake_image_build_repository,
+):
+    service = endpoint_builder_service_empty_docker_not_built
+    repo: Any = service.model_endpoint_record_repository
+    repo.add_model_endpoint_record(build_endpoint_request_sync_pytorch.model_endpoint_record)
+    build_image = Mock(return_value=BuildImageResponse(status=True, logs=""))
+    service.docker_repository.__setattr__("build_image", build_image)
+
+    # Another builder is building the images, and succeeds.
+    fake_image_build_repository.claim_build = AsyncMock(return_value=False)
+    fake_image_build_repository.wait_for_build = AsyncMock(return_value=True)
+    response = await service.build_endpoint(build_endpoint_request_sync_pytorch)
+    assert response == BuildEndpointResponse(status=BuildEndpointStatus.OK)
+    build_image.assert_not_called()
+
+    # Another builder's build fails, after which this builder claims the images and builds them.
+    fake_image_build_repository.claim_build = AsyncMock(side_effect=[False, True, False, True])
+    fake_image_build_repository.wait_for_build = AsyncMock(return_value=False)
+    response = await service.build_endpoint(build_endpoint_request_sync_pytorch)
+    assert response == BuildEndpointResponse(status=BuildEndpointStatus.OK)
+    assert build_image.call_count == 2
+
+
 def test_convert_artifact_like_bundle_to_runnable_image(
     build_endpoint_request_sync_custom: BuildEndpointRequest,
     endpoint_builder_service_empty_docker_built: LiveEndpointBuilderService,